@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Compare full parsing and streaming key extraction on a large ~/.claude.json.
+
+Generates a synthetic config (project history plus a few MCP servers) and
+reads its mcpServers with JSONFileReader.read() and read_keys(). Every step
+runs in a fresh subprocess: Linux carries ru_maxrss across fork/exec, so the
+driver itself must never hold a large document.
+
+    python scripts/benchmark-config-read.py --size-mb 50
+"""
+
+import argparse
+import json
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+MODES = ("read", "read_keys")
+
+
+def generate(path: Path, size_mb: int) -> None:
+    """Write a synthetic config of roughly ``size_mb`` megabytes."""
+    rng = random.Random(0)
+    projects = {}
+    size = 0
+    while size < size_mb * 1_000_000:
+        history = [
+            {
+                "display": f'fix "bug" #{i} in C:\\src\\mod{i}.py\n'
+                + "x" * rng.randint(20, 400),
+                "pastedContents": {},
+            }
+            for i in range(50)
+        ]
+        project = {
+            "allowedTools": [],
+            "history": history,
+            "mcpServers": {},
+            "hasTrustDialogAccepted": True,
+            "lastCost": 0.12,
+        }
+        projects[f"/home/user/project{len(projects)}"] = project
+        size += len(json.dumps(project))
+
+    config = {
+        "numStartups": 42,
+        "projects": projects,
+        "mcpServers": {
+            f"server{i}": {"command": "npx", "args": ["-y", f"pkg{i}"]}
+            for i in range(20)
+        },
+    }
+    path.write_text(json.dumps(config, indent=2))
+
+
+def measure(path: Path, mode: str) -> None:
+    """Read the config once in the current process and print the result."""
+    from mcpi.clients.file_based import JSONFileReader
+
+    reader = JSONFileReader(stream_threshold=0)
+    start = time.perf_counter()
+    data = reader.read(path) if mode == "read" else reader.read_keys(path)
+    elapsed = time.perf_counter() - start
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":
+        peak *= 1024  # Linux reports KiB
+    result = {"seconds": elapsed, "peak_rss": peak, "servers": len(data["mcpServers"])}
+    print(json.dumps(result))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=50)
+    parser.add_argument("--generate", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--measure", choices=MODES, help=argparse.SUPPRESS)
+    parser.add_argument("--path", type=Path, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.generate:
+        generate(args.path, args.size_mb)
+        return
+    if args.measure:
+        measure(args.path, args.measure)
+        return
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "claude.json"
+        subprocess.run(
+            [sys.executable, __file__, "--generate", "--path", str(path)]
+            + ["--size-mb", str(args.size_mb)],
+            check=True,
+        )
+        print(f"{path.stat().st_size / 1e6:.1f} MB config")
+        for mode in MODES:
+            output = subprocess.run(
+                [sys.executable, __file__, "--measure", mode, "--path", str(path)],
+                capture_output=True,
+                text=True,
+                check=True,
+            ).stdout
+            result = json.loads(output)
+            print(
+                f"{mode:>10}: {result['seconds'] * 1000:7.0f} ms, "
+                f"peak RSS {result['peak_rss'] / 2**20:6.0f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Compare indexed catalog search with the previous linear substring scan.
+
+Generates a synthetic catalog, builds a SearchIndex once and times a set of
+top-20 queries against the in-memory index, the index stored in a compiled
+catalog artifact, and a scan that lowercases and substring-matches every
+server's ID and description (the old search_servers).
+
+    python scripts/benchmark-search.py --servers 50000
+"""
+
+import argparse
+import json
+import random
+import string
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+
+from mcpi.registry.catalog import MCPServer, ServerCatalog
+from mcpi.registry.catalog_artifact import compile_catalog
+from mcpi.registry.search_index import SearchIndex
+
+# Common words, each in a large share of descriptions
+COMMON = (
+    "access manage query database files git issues pull requests cache search "
+    "browser automation cloud storage metrics logs deploy container secrets"
+).split()
+
+
+def make_vocabulary(size: int) -> List[str]:
+    """Random lowercase words, most frequent first (Zipf rank order)."""
+    rng = random.Random(1)
+    words: List[str] = []
+    seen = set(COMMON)
+    while len(words) < size:
+        word = "".join(rng.choices(string.ascii_lowercase, k=rng.randint(4, 10)))
+        if word not in seen:
+            seen.add(word)
+            words.append(word)
+    return words
+
+
+VOCABULARY = make_vocabulary(5000)
+
+QUERIES = (
+    "postgres",
+    VOCABULARY[2000],
+    f"{VOCABULARY[10]} {VOCABULARY[40]}",
+    "database query",
+    "cache OR secrets",
+    f"{VOCABULARY[3]} OR {VOCABULARY[4]}",
+    "vendor42",
+    "git",
+    VOCABULARY[50][:3],
+    # Typos, answered by the trigram index
+    "postgress",
+    VOCABULARY[300][1] + VOCABULARY[300][0] + VOCABULARY[300][2:],
+)
+
+
+def generate(count: int) -> Dict[str, MCPServer]:
+    """Build a synthetic catalog of ``count`` servers.
+
+    Descriptions mix common words with words drawn from a Zipf-distributed
+    vocabulary, as in natural text.
+    """
+    rng = random.Random(0)
+    zipf = [1 / (rank + 1) for rank in range(len(VOCABULARY))]
+    servers = {}
+    for i in range(count):
+        name = f"{rng.choice(COMMON)}-{i}"
+        words = rng.sample(COMMON, 2)
+        words += rng.choices(VOCABULARY, zipf, k=rng.randint(3, 15))
+        servers[f"vendor{i % 1000}/{name}"] = MCPServer.model_construct(
+            description=" ".join(words),
+            command=rng.choice(("npx", "uvx", "docker")),
+            args=["-y", f"@vendor{i % 1000}/mcp-{name}"],
+            repository=f"https://github.com/vendor{i % 1000}/{name}",
+            categories=rng.sample(COMMON, 2),
+        )
+    servers["modelcontextprotocol/postgres"] = MCPServer(
+        description="Query and manage PostgreSQL databases", command="npx"
+    )
+    return servers
+
+
+def linear_scan(servers: Dict[str, MCPServer], query: str) -> list:
+    """The search_servers implementation before the index."""
+    query_lower = query.lower()
+    return [
+        (server_id, server)
+        for server_id, server in servers.items()
+        if query_lower in server_id.lower() or query_lower in server.description.lower()
+    ]
+
+
+def best_of(runs: int, operation: Callable[[], object]) -> float:
+    """Fastest of several runs, in seconds."""
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        operation()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--servers", type=int, default=50000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    servers = generate(args.servers)
+    start = time.perf_counter()
+    index = SearchIndex(servers)
+    print(f"{len(index)} servers, index built in {time.perf_counter() - start:.2f} s")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        catalog_path = Path(tmp) / "catalog.json"
+        catalog_path.write_text(
+            json.dumps({k: v.model_dump(mode="json") for k, v in servers.items()})
+        )
+        compile_catalog(catalog_path)
+        start = time.perf_counter()
+        catalog = ServerCatalog(catalog_path, validate_with_cue=False)
+        catalog.search("postgres", limit=20)
+        opened = time.perf_counter() - start
+        print(f"Catalog artifact loaded and first query run in {opened * 1000:.1f} ms")
+
+        print(f"{'query':>22}  {'scan':>9}  {'index':>9}  {'artifact':>9}  hits")
+        for query in QUERIES:
+            scan = best_of(args.runs, lambda q=query: linear_scan(servers, q))
+            indexed = best_of(args.runs, lambda q=query: index.search(q, limit=20))
+            stored = best_of(args.runs, lambda q=query: catalog.search(q, limit=20))
+            hits = len(index.search(query))
+            print(
+                f"{query!r:>22}  {scan * 1000:6.2f} ms  {indexed * 1000:6.3f} ms  "
+                f"{stored * 1000:6.3f} ms  {hits}"
+            )
+
+
+if __name__ == "__main__":
+    main()
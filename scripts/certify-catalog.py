@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""Validate the packaged catalog with CUE and write its validation certificate.
+
+Run before building a release (requires the ``cue`` binary):
+
+    python scripts/certify-catalog.py
+
+Installed copies of mcpi accept the certificate for these exact catalog and
+schema bytes and skip ``cue vet`` when loading the official catalog.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+from mcpi.registry.catalog_schema import CatalogSchemaValidator
+from mcpi.registry.cue_validator import DEFAULT_SCHEMA_PATH, CUEValidator
+from mcpi.registry.validation_cache import (
+    PACKAGED_CERTIFICATE_PATH,
+    certificate_record,
+)
+
+CATALOG_PATH = Path(__file__).parent.parent / "src" / "mcpi" / "data" / "catalog.json"
+
+
+def main() -> None:
+    validator = CUEValidator()
+    is_valid, error = validator.validate_file(CATALOG_PATH)
+    if not is_valid:
+        sys.exit(f"Catalog validation failed: {error}")
+
+    # The in-process rules must agree with CUE on the catalog being shipped
+    is_valid, error = CatalogSchemaValidator().validate_file(CATALOG_PATH)
+    if not is_valid:
+        sys.exit(f"CatalogSchemaValidator disagrees with cue vet: {error}")
+
+    record = certificate_record(
+        CATALOG_PATH.read_bytes(), DEFAULT_SCHEMA_PATH.read_bytes(), validator.version
+    )
+    PACKAGED_CERTIFICATE_PATH.write_text(json.dumps(record, indent=2) + "\n")
+    print(f"Wrote {PACKAGED_CERTIFICATE_PATH} ({validator.version})")
+
+
+if __name__ == "__main__":
+    main()
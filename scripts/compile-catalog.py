@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""Regenerate the compiled binary form of the official catalog.
+
+Run after editing src/mcpi/data/catalog.json:
+
+    python scripts/compile-catalog.py
+"""
+
+from pathlib import Path
+
+from mcpi.registry.catalog_artifact import compile_catalog
+
+CATALOG_PATH = Path(__file__).parent.parent / "src" / "mcpi" / "data" / "catalog.json"
+
+
+def main() -> None:
+    print(f"Compiled {compile_catalog(CATALOG_PATH)}")
+
+
+if __name__ == "__main__":
+    main()
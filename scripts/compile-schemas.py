@@ -0,0 +1,22 @@
+#!/usr/bin/env python3
+"""Regenerate the precompiled JSON forms of the client config schemas.
+
+Run after editing any YAML file in src/mcpi/clients/schemas/:
+
+    python scripts/compile-schemas.py
+"""
+
+from pathlib import Path
+
+from mcpi.clients.file_based import compile_schema
+
+SCHEMAS_DIR = Path(__file__).parent.parent / "src" / "mcpi" / "clients" / "schemas"
+
+
+def main() -> None:
+    for schema_path in sorted(SCHEMAS_DIR.glob("*.yaml")):
+        print(f"Compiled {compile_schema(schema_path)}")
+
+
+if __name__ == "__main__":
+    main()
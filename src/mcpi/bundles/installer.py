@@ -45,69 +45,71 @@ class BundleInstaller:
         """
         results: List[OperationResult] = []
 
-        for bundle_server in bundle.servers:
-            server_id = bundle_server.id
+        # One session: each touched config file is validated and written once
+        with self.manager.session() as session:
+            for bundle_server in bundle.servers:
+                server_id = bundle_server.id
+
+                # In dry-run mode, just report what would be done
+                if dry_run:
+                    # Check if server exists in catalog
+                    catalog_server = self.catalog.get_server(server_id)
+                    if catalog_server is None:
+                        results.append(
+                            OperationResult.failure_result(
+                                f"Server '{server_id}' not found in catalog"
+                            )
+                        )
+                    else:
+                        results.append(
+                            OperationResult.success_result(
+                                f"Would install server '{server_id}' to {scope}"
+                            )
+                        )
+                    continue
 
-            # In dry-run mode, just report what would be done
-            if dry_run:
-                # Check if server exists in catalog
+                # Look up server in catalog
                 catalog_server = self.catalog.get_server(server_id)
                 if catalog_server is None:
+                    # Server not in catalog - record failure and continue with others
                     results.append(
                         OperationResult.failure_result(
                             f"Server '{server_id}' not found in catalog"
                         )
                     )
-                else:
-                    results.append(
-                        OperationResult.success_result(
-                            f"Would install server '{server_id}' to {scope}"
-                        )
-                    )
-                continue
-
-            # Look up server in catalog
-            catalog_server = self.catalog.get_server(server_id)
-            if catalog_server is None:
-                # Server not in catalog - record failure and continue with others
-                results.append(
-                    OperationResult.failure_result(
-                        f"Server '{server_id}' not found in catalog"
-                    )
+                    continue
+
+                # Build server configuration
+                # Start with catalog defaults
+                base_config = catalog_server.get_run_command()
+
+                # Apply bundle-specific config overrides if provided
+                if bundle_server.config:
+                    # Merge bundle config with base config
+                    if "args" in bundle_server.config:
+                        base_config["args"] = bundle_server.config["args"]
+                    if "env" in bundle_server.config:
+                        base_config["env"] = bundle_server.config["env"]
+                    if "command" in bundle_server.config:
+                        base_config["command"] = bundle_server.config["command"]
+
+                # Create ServerConfig from merged config
+                server_config = ServerConfig(
+                    command=base_config.get("command", ""),
+                    args=base_config.get("args", []),
+                    env=base_config.get("env", {}),
+                    type=base_config.get("type", "stdio"),
+                )
+
+                # Install server via the session
+                result = session.add_server(
+                    server_id=server_id,
+                    config=server_config,
+                    scope=scope,
+                    client_name=client_name,
                 )
-                continue
-
-            # Build server configuration
-            # Start with catalog defaults
-            base_config = catalog_server.get_run_command()
-
-            # Apply bundle-specific config overrides if provided
-            if bundle_server.config:
-                # Merge bundle config with base config
-                if "args" in bundle_server.config:
-                    base_config["args"] = bundle_server.config["args"]
-                if "env" in bundle_server.config:
-                    base_config["env"] = bundle_server.config["env"]
-                if "command" in bundle_server.config:
-                    base_config["command"] = bundle_server.config["command"]
-
-            # Create ServerConfig from merged config
-            server_config = ServerConfig(
-                command=base_config.get("command", ""),
-                args=base_config.get("args", []),
-                env=base_config.get("env", {}),
-                type=base_config.get("type", "stdio"),
-            )
-
-            # Install server via manager
-            result = self.manager.add_server(
-                server_id=server_id,
-                config=server_config,
-                scope=scope,
-                client_name=client_name,
-            )
-
-            results.append(result)
+
+                results.append(result)
 
         return results
 
@@ -127,18 +129,12 @@ class BundleInstaller:
         Returns:
             List of operation results (one per server in bundle)
         """
-        results: List[OperationResult] = []
-
-        for bundle_server in bundle.servers:
-            server_id = bundle_server.id
-
-            # Remove server via manager
-            result = self.manager.remove_server(
-                server_id=server_id,
-                scope=scope,
-                client_name=client_name,
-            )
-
-            results.append(result)
+        with self.manager.session() as session:
+            for bundle_server in bundle.servers:
+                session.remove_server(
+                    server_id=bundle_server.id,
+                    scope=scope,
+                    client_name=client_name,
+                )
 
-        return results
+        return session.results
@@ -1,26 +1,92 @@
-"""New CLI implementation using the plugin architecture."""
+"""New CLI implementation using the plugin architecture.
+
+Modules that only some commands need (rich, the client plugins, the
+catalogs, bundles) are imported by those commands rather than here, and the
+shared console creates its rich Console on first output, so ``mcpi --help``
+loads none of them. The names this module used to import at the top stay
+available as its attributes (see __getattr__).
+"""
 
 import sys
 from collections import defaultdict
+from importlib import import_module
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
-from rich.prompt import Prompt
-from rich.table import Table
-from rich.text import Text
 
-from mcpi.bundles import create_default_bundle_catalog
-from mcpi.bundles.catalog import BundleCatalog
-from mcpi.bundles.installer import BundleInstaller
-from mcpi.clients import ServerConfig, ServerState
-from mcpi.clients.manager import MCPManager, create_default_manager
-from mcpi.registry.catalog import ServerCatalog, create_default_catalog
-from mcpi.registry.catalog_manager import CatalogManager, create_default_catalog_manager
+from mcpi.fast_completion import catalog_help, installed_help
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+    from mcpi.clients import ServerInfo
+    from mcpi.clients.manager import MCPManager
+    from mcpi.registry.catalog import MCPServer, ServerCatalog
+    from mcpi.registry.catalog_manager import CatalogManager
+
+# Former top-level imports, loaded on first access as attributes of this module
+_LAZY_ATTRIBUTES = {
+    "Console": "rich.console",
+    "Panel": "rich.panel",
+    "Prompt": "rich.prompt",
+    "Table": "rich.table",
+    "Text": "rich.text",
+    "create_default_bundle_catalog": "mcpi.bundles",
+    "BundleCatalog": "mcpi.bundles.catalog",
+    "BundleInstaller": "mcpi.bundles.installer",
+    "ServerConfig": "mcpi.clients",
+    "ServerInfo": "mcpi.clients",
+    "ServerState": "mcpi.clients",
+    "MCPManager": "mcpi.clients.manager",
+    "MCPServer": "mcpi.registry.catalog",
+    "ServerCatalog": "mcpi.registry.catalog",
+    "create_default_catalog": "mcpi.registry.catalog",
+    "CatalogManager": "mcpi.registry.catalog_manager",
+    "create_default_catalog_manager": "mcpi.registry.catalog_manager",
+    "highlight_spans": "mcpi.registry.search_index",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a former top-level name on first access."""
+    module = _LAZY_ATTRIBUTES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+class _LazyConsole:
+    """Shared rich Console, created on first use (rich takes ~40 ms to import)."""
+
+    def __init__(self) -> None:
+        self._console = None
+
+    def __getattr__(self, name: str) -> Any:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
+
 
-console = Console()
+def create_default_manager(default_client: Optional[str] = None) -> "MCPManager":
+    """Create the default MCPManager (imports the client plugins).
+
+    Args:
+        default_client: Default client name (auto-detected if not provided)
+
+    Returns:
+        MCPManager instance
+    """
+    from mcpi.clients import manager
+
+    return manager.create_default_manager(default_client)
 
 
 def shorten_path(path: Optional[str]) -> str:
@@ -116,12 +182,14 @@ def get_mcp_manager(ctx: click.Context):
     return ctx.obj["mcp_manager"]
 
 
-def get_catalog_manager(ctx: click.Context) -> CatalogManager:
+def get_catalog_manager(ctx: click.Context) -> "CatalogManager":
     """Lazy initialization of CatalogManager using factory function.
 
     Returns:
         CatalogManager instance for managing multiple catalogs
     """
+    from mcpi.registry.catalog_manager import create_default_catalog_manager
+
     if "catalog_manager" not in ctx.obj:
         try:
             ctx.obj["catalog_manager"] = create_default_catalog_manager()
@@ -139,12 +207,13 @@ def get_catalog_manager(ctx: click.Context) -> CatalogManager:
 
 def get_catalog(
     ctx: click.Context, catalog_name: Optional[str] = None
-) -> ServerCatalog:
+) -> "ServerCatalog":
     """Get catalog by name (defaults to official catalog).
 
     Args:
         ctx: Click context
-        catalog_name: Catalog name ("official" or "local"), or None for default
+        catalog_name: Catalog name ("official", "local" or a catalog configured
+            in mcpi.toml), or None for default
 
     Returns:
         ServerCatalog instance
@@ -162,7 +231,8 @@ def get_catalog(
     catalog = manager.get_catalog(catalog_name)
     if catalog is None:
         raise click.ClickException(
-            f"Unknown catalog: '{catalog_name}'. Available catalogs: official, local"
+            f"Unknown catalog: '{catalog_name}'. "
+            f"Available catalogs: {', '.join(manager.catalog_names())}"
         )
 
     return catalog
@@ -170,6 +240,8 @@ def get_catalog(
 
 def get_bundle_catalog(ctx: click.Context):
     """Lazy initialization of BundleCatalog using factory function."""
+    from mcpi.bundles import create_default_bundle_catalog
+
     if "bundle_catalog" not in ctx.obj:
         try:
             # Use factory function for default bundles directory
@@ -471,13 +543,45 @@ def complete_client_names(
         ]
 
 
+def complete_catalog_names(
+    ctx: click.Context, param: click.Parameter, incomplete: str
+) -> List:
+    """Complete catalog names, including catalogs configured in mcpi.toml.
+
+    Args:
+        ctx: Click context
+        param: Parameter being completed
+        incomplete: Partial text entered by user
+
+    Returns:
+        List of CompletionItem objects matching the prefix
+    """
+    from click.shell_completion import CompletionItem
+
+    from mcpi.registry.catalog_manager import create_default_catalog_manager
+
+    try:
+        if ctx and ctx.obj and "catalog_manager" in ctx.obj:
+            manager = ctx.obj["catalog_manager"]
+        else:
+            manager = create_default_catalog_manager()
+        names = manager.catalog_names()
+    except Exception:
+        names = ["official", "local"]
+
+    return [
+        CompletionItem(name) for name in names if name.startswith(incomplete.lower())
+    ]
+
+
 def complete_server_ids(
     ctx: click.Context, param: click.Parameter, incomplete: str
 ) -> List:
     """Complete server IDs from registry or installed servers.
 
     This function provides context-aware completion:
-    - For 'add' command: shows servers from registry
+    - For 'add' command: shows servers from registry, tolerating typos and
+      matching package names
     - For 'remove', 'enable', 'disable' commands: shows installed servers filtered by state
     - Other commands: shows all registry servers
 
@@ -491,6 +595,8 @@ def complete_server_ids(
     """
     from click.shell_completion import CompletionItem
 
+    from mcpi.clients import ServerState
+
     # Initialize context object if needed
     if not ctx:
         return []
@@ -544,39 +650,16 @@ def complete_server_ids(
             # Note: If a server is in multiple scopes, it will appear multiple times
             # IMPORTANT: Include server ID in help text to make each entry unique and prevent
             # zsh from grouping multiple servers together
-            completions = []
-            for qualified_id, info in servers.items():
-                if info.id.startswith(incomplete):
-                    # Use qualified ID format to ensure uniqueness
-                    # Format: server-name in client:scope (enabled/disabled/unapproved)
-                    # Add colors for better readability:
-                    # - Dim gray for server name (to de-emphasize since it's already in the completion)
-                    # - Cyan for scope (most important for user to see)
-                    # - Green for enabled, Yellow for disabled, Cyan for unapproved
-                    state_labels = {
-                        ServerState.ENABLED: "enabled",
-                        ServerState.DISABLED: "disabled",
-                        ServerState.UNAPPROVED: "unapproved",
-                        ServerState.NOT_INSTALLED: "not installed",
-                    }
-                    state_colors = {
-                        ServerState.ENABLED: "\033[32m",    # green
-                        ServerState.DISABLED: "\033[33m",   # yellow
-                        ServerState.UNAPPROVED: "\033[36m", # cyan
-                        ServerState.NOT_INSTALLED: "\033[31m",  # red
-                    }
-                    state_label = state_labels.get(info.state, info.state.name.lower())
-                    state_color = state_colors.get(info.state, "\033[37m")  # default white
-                    reset = "\033[0m"
-                    dim = "\033[2m"
-                    cyan = "\033[36m"
-
-                    help_text = (
-                        f"{dim}{info.id}{reset} in "
-                        f"{cyan}{info.client}:{info.scope}{reset} "
-                        f"({state_color}{state_label}{reset})"
-                    )
-                    completions.append(CompletionItem(info.id, help=help_text))
+            completions = [
+                CompletionItem(
+                    info.id,
+                    help=installed_help(
+                        info.id, info.client, info.scope, info.state.name
+                    ),
+                )
+                for info in servers.values()
+                if info.id.startswith(incomplete)
+            ]
 
             # Sort by server ID, then by scope for consistent ordering
             completions.sort(key=lambda c: (c.value, c.help or ""))
@@ -593,24 +676,13 @@ def complete_server_ids(
         # For add and other commands, show servers from registry
         # Initialize catalog manager if not present (use new multi-catalog context)
         catalog = get_catalog(ctx)
-        servers = catalog.list_servers()
-
-        # Filter and limit results
-        matches = [
-            CompletionItem(
-                server_id,
-                help=(
-                    server.description[:50] + "..."
-                    if len(server.description) > 50
-                    else server.description
-                ),
-            )
-            for server_id, server in servers
-            if server_id.startswith(incomplete)
-        ]
 
-        # Limit to 50 results to avoid overwhelming user
-        return matches[:50]
+        # Prefix matches first, then matching package names and typo
+        # corrections; limit to 50 results to avoid overwhelming user
+        return [
+            CompletionItem(server_id, help=catalog_help(server.description))
+            for server_id, server in catalog.complete_server_ids(incomplete, limit=50)
+        ]
     except Exception as e:
         from mcpi.utils.completion_debug import CompletionLogger
 
@@ -719,7 +791,7 @@ def complete_rescope_server_name(
     is_flag=True,
     help="Enable debug logging (writes to ~/.mcpi_completion_debug.log)",
 )
-@click.version_option()
+@click.version_option(package_name="mcp-installer")
 @click.pass_context
 def main(ctx: click.Context, verbose: bool, dry_run: bool, debug: bool) -> None:
     """MCPI - MCP Server Package Installer (New Plugin Architecture)."""
@@ -752,6 +824,8 @@ def client(ctx: click.Context) -> None:
 @click.pass_context
 def list_clients(ctx: click.Context) -> None:
     """List available MCP clients."""
+    from rich.table import Table
+
     try:
         manager = get_mcp_manager(ctx)
         client_info = manager.get_client_info()
@@ -793,6 +867,8 @@ def list_clients(ctx: click.Context) -> None:
 @click.pass_context
 def client_info(ctx: click.Context, client_name: Optional[str]) -> None:
     """Show detailed information about a client."""
+    from rich.panel import Panel
+
     try:
         manager = get_mcp_manager(ctx)
 
@@ -876,6 +952,9 @@ def scope(ctx: click.Context) -> None:
 @click.pass_context
 def list_scopes(ctx: click.Context, client: Optional[str]) -> None:
     """List available configuration scopes."""
+    from rich.table import Table
+    from rich.text import Text
+
     try:
         manager = get_mcp_manager(ctx)
         scopes = manager.get_scopes_for_client(client)
@@ -939,6 +1018,8 @@ def config(ctx: click.Context) -> None:
 @click.pass_context
 def config_show(ctx: click.Context) -> None:
     """Show current configuration."""
+    from rich.console import Console
+
     from mcpi.user_config import create_default_config
 
     console = Console()
@@ -971,6 +1052,8 @@ def config_get(ctx: click.Context, key: str) -> None:
 
     KEY format: section.key (e.g., defaults.scope)
     """
+    from rich.console import Console
+
     from mcpi.user_config import create_default_config
 
     console = Console()
@@ -1003,6 +1086,8 @@ def config_set(ctx: click.Context, key: str, value: str) -> None:
         mcpi config set defaults.scope user-global
         mcpi config set defaults.client claude-code
     """
+    from rich.console import Console
+
     from mcpi.user_config import create_default_config
 
     console = Console()
@@ -1053,6 +1138,11 @@ def list(
 
     By default, shows servers from all scopes. Use --scope to filter to a specific scope.
     """
+    from rich.panel import Panel
+    from rich.table import Table
+
+    from mcpi.clients import ServerState
+
     try:
         manager = get_mcp_manager(ctx)
 
@@ -1125,7 +1215,7 @@ def list(
 @click.argument("server_id", shell_complete=complete_server_ids)
 @click.option(
     "--catalog",
-    type=click.Choice(["official", "local"], case_sensitive=False),
+    shell_complete=complete_catalog_names,
     help="Search in specific catalog (default: official)",
 )
 @click.option(
@@ -1170,6 +1260,11 @@ def add(
         mcpi add postgres --list-templates
         mcpi add postgres --template production
     """
+    from rich.prompt import Prompt
+    from rich.table import Table
+
+    from mcpi.clients import ServerConfig
+
     verbose = ctx.obj.get("verbose", False)
 
     # Update dry_run if passed as command option
@@ -1468,14 +1563,25 @@ def remove(
     shell_complete=complete_client_names,
     help="Target client (uses default if not specified)",
 )
+@click.option(
+    "--scope",
+    type=DynamicScopeType(),
+    help="Scope of the installation to enable (default: highest-priority one)",
+)
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be done without making changes"
 )
 @click.pass_context
 def enable(
-    ctx: click.Context, server_id: str, client: Optional[str], dry_run: bool
+    ctx: click.Context,
+    server_id: str,
+    client: Optional[str],
+    scope: Optional[str],
+    dry_run: bool,
 ) -> None:
     """Enable a disabled MCP server."""
+    from mcpi.clients import ServerState
+
     verbose = ctx.obj.get("verbose", False)
 
     # Update dry_run if passed as command option
@@ -1486,9 +1592,10 @@ def enable(
         manager = get_mcp_manager(ctx)
 
         # Check current state
-        current_state = manager.get_server_state(server_id, client)
+        current_state = manager.get_server_state(server_id, client, scope)
         if current_state == ServerState.NOT_INSTALLED:
-            console.print(f"[red]Server '{server_id}' is not installed[/red]")
+            where = f" in scope '{scope}'" if scope else ""
+            console.print(f"[red]Server '{server_id}' is not installed{where}[/red]")
             return
 
         if current_state == ServerState.ENABLED:
@@ -1500,7 +1607,7 @@ def enable(
             console.print(f"[blue]Would enable: {server_id}[/blue]")
         else:
             console.print(f"[blue]Enabling {server_id}...[/blue]")
-            result = manager.enable_server(server_id, client)
+            result = manager.enable_server(server_id, scope, client)
 
             if result.success:
                 console.print(f"[green]✓ Successfully enabled {server_id}[/green]")
@@ -1511,7 +1618,7 @@ def enable(
                 server_info = manager.get_server_info(server_id, client)
                 if server_info:
                     enabled, enable_msg = enable_server_in_config(
-                        server_id, server_info.scope
+                        server_id, scope or server_info.scope
                     )
                     if enabled:
                         console.print(f"[dim]  {enable_msg}[/dim]")
@@ -1537,14 +1644,25 @@ def enable(
     shell_complete=complete_client_names,
     help="Target client (uses default if not specified)",
 )
+@click.option(
+    "--scope",
+    type=DynamicScopeType(),
+    help="Scope of the installation to disable (default: highest-priority one)",
+)
 @click.option(
     "--dry-run", is_flag=True, help="Show what would be done without making changes"
 )
 @click.pass_context
 def disable(
-    ctx: click.Context, server_id: str, client: Optional[str], dry_run: bool
+    ctx: click.Context,
+    server_id: str,
+    client: Optional[str],
+    scope: Optional[str],
+    dry_run: bool,
 ) -> None:
     """Disable an enabled MCP server."""
+    from mcpi.clients import ServerState
+
     verbose = ctx.obj.get("verbose", False)
 
     # Update dry_run if passed as command option
@@ -1555,9 +1673,10 @@ def disable(
         manager = get_mcp_manager(ctx)
 
         # Check current state
-        current_state = manager.get_server_state(server_id, client)
+        current_state = manager.get_server_state(server_id, client, scope)
         if current_state == ServerState.NOT_INSTALLED:
-            console.print(f"[red]Server '{server_id}' is not installed[/red]")
+            where = f" in scope '{scope}'" if scope else ""
+            console.print(f"[red]Server '{server_id}' is not installed{where}[/red]")
             return
 
         if current_state == ServerState.DISABLED:
@@ -1572,7 +1691,7 @@ def disable(
             console.print(f"[blue]Would disable: {server_id}[/blue]")
         else:
             console.print(f"[blue]Disabling {server_id}...[/blue]")
-            result = manager.disable_server(server_id, client)
+            result = manager.disable_server(server_id, scope, client)
 
             if result.success:
                 console.print(f"[green]✓ Successfully disabled {server_id}[/green]")
@@ -1582,7 +1701,7 @@ def disable(
 
                 if server_info:
                     disabled, disable_msg = disable_server_in_config(
-                        server_id, server_info.scope
+                        server_id, scope or server_info.scope
                     )
                     if disabled:
                         console.print(f"[dim]  {disable_msg}[/dim]")
@@ -1643,6 +1762,8 @@ def rescope(
 
         mcpi rescope my-server --to user-global --dry-run
     """
+    from mcpi.clients import ServerConfig
+
     verbose = ctx.obj.get("verbose", False)
 
     # Update dry_run if passed as command option
@@ -1726,44 +1847,67 @@ def rescope(
             ctx.exit(0)
 
         # Step 7: Execute rescope with ADD-FIRST, REMOVE-SECOND ordering
-        # This is the critical safety property: if add fails, sources remain unchanged
+        # This is the critical safety property: if add fails, sources remain unchanged.
+        # All edits run in one session, which writes each file once on exit,
+        # destination first; if that write fails the sources are not written.
         try:
-            # ADD to destination first (even if it might already be there)
-            # If it's already there, add will fail with "already exists" which we handle below
-            add_result = dest_handler.add_server(server_name, server_config)
-
-            # Determine which scopes to remove from
-            scopes_to_remove_from = []
-
-            if add_result.success:
-                # Add succeeded - remove from ALL source scopes (they're all "old" now)
-                scopes_to_remove_from = source_scope_names
-            elif "already exists" in add_result.message.lower():
-                # Idempotent case: server already in destination
-                # Remove from all OTHER scopes (not the destination)
-                scopes_to_remove_from = [s for s in source_scope_names if s != to_scope]
-
-                # If server is ONLY in target scope, we're done
-                if not scopes_to_remove_from:
-                    # No scopes to remove from, just skip to success output
-                    pass
-            else:
-                # Real failure: abort without touching sources
+            failed_removals = []
+            with manager.session() as session:
+                # ADD to destination first (even if it might already be there)
+                # If it's already there, add will fail with "already exists" which we handle below
+                add_result = session.run(
+                    dest_handler.add_server, server_name, server_config
+                )
+                already_exists = (
+                    not add_result.success
+                    and "already exists" in add_result.message.lower()
+                )
+
+                # Determine which scopes to remove from
+                scopes_to_remove_from = []
+
+                if add_result.success:
+                    # Add succeeded - remove from ALL source scopes (they're all "old" now)
+                    scopes_to_remove_from = source_scope_names
+                elif already_exists:
+                    # Idempotent case: server already in destination
+                    # Remove from all OTHER scopes (not the destination)
+                    # (if the server is ONLY in the target scope, we're done)
+                    scopes_to_remove_from = [
+                        s for s in source_scope_names if s != to_scope
+                    ]
+                else:
+                    # Real failure: abort without touching sources
+                    console.print(
+                        f"[red]Error: Failed to add server to '{to_scope}': {add_result.message}[/red]"
+                    )
+                    ctx.exit(1)
+
+                # REMOVE from determined scopes (only after successful add or idempotent case)
+                removals = []
+                for source_scope in scopes_to_remove_from:
+                    try:
+                        source_handler = client_plugin.get_scope_handler(source_scope)
+                        removals.append(
+                            (
+                                source_scope,
+                                session.run(source_handler.remove_server, server_name),
+                            )
+                        )
+                    except Exception as e:
+                        failed_removals.append((source_scope, str(e)))
+
+            # The session has committed; results now reflect what was written
+            if not add_result.success and not already_exists:
                 console.print(
                     f"[red]Error: Failed to add server to '{to_scope}': {add_result.message}[/red]"
                 )
                 ctx.exit(1)
-
-            # REMOVE from determined scopes (only after successful add or idempotent case)
-            failed_removals = []
-            for source_scope in scopes_to_remove_from:
-                try:
-                    source_handler = client_plugin.get_scope_handler(source_scope)
-                    remove_result = source_handler.remove_server(server_name)
-                    if not remove_result.success:
-                        failed_removals.append((source_scope, remove_result.message))
-                except Exception as e:
-                    failed_removals.append((source_scope, str(e)))
+            failed_removals.extend(
+                (scope, result.message)
+                for scope, result in removals
+                if not result.success
+            )
 
             # Check if any removals failed
             if failed_removals:
@@ -1808,11 +1952,52 @@ def rescope(
         ctx.exit(1)
 
 
+def plain_server_info(
+    server_id: str,
+    registry_info: "MCPServer",
+    server_info: Optional["ServerInfo"],
+) -> str:
+    """Format server information as ``mcpi info --plain`` prints it.
+
+    Also used to pre-render the fzf preview pane.
+
+    Args:
+        server_id: Server identifier
+        registry_info: Catalog entry
+        server_info: Installation in the target client, or None
+
+    Returns:
+        Text to print (may contain Rich markup from catalog fields)
+    """
+    info_text = "Registry Information:\n"
+    info_text += f"ID: {server_id}\n"
+    info_text += f"Description: {registry_info.description}\n"
+    info_text += f"Command: {registry_info.command}\n"
+    if registry_info.args:
+        info_text += f"Arguments: {' '.join(registry_info.args)}\n"
+    if registry_info.repository:
+        info_text += f"Repository: {registry_info.repository}\n"
+
+    info_text += "\nLocal Installation:\n"
+    if server_info:
+        info_text += "Status: Installed\n"
+        info_text += f"Client: {server_info.client}\n"
+        info_text += f"Scope: {server_info.scope}\n"
+        info_text += f"State: {server_info.state.name}\n"
+        if server_info.env:
+            info_text += "Environment Variables:\n"
+            for key, value in server_info.env.items():
+                info_text += f"  {key}={value}\n"
+    else:
+        info_text += "Status: Not Installed\n"
+    return info_text
+
+
 @main.command()
 @click.argument("server_id", required=False, shell_complete=complete_server_ids)
 @click.option(
     "--catalog",
-    type=click.Choice(["official", "local"], case_sensitive=False),
+    shell_complete=complete_catalog_names,
     help="Search in specific catalog (default: search official first, then local)",
 )
 @click.option(
@@ -1842,6 +2027,8 @@ def info(
         mcpi info my-server --catalog local
         mcpi info
     """
+    from rich.panel import Panel
+
     try:
         if server_id:
             # Get registry info
@@ -1865,79 +2052,43 @@ def info(
                 print(json.dumps(registry_info.model_dump(), indent=2, default=str))
                 return
 
-            # Build registry section
+            manager = get_mcp_manager(ctx)
+            server_info = manager.get_server_info(server_id, client)
+
             if plain:
-                # Plain text output (no Rich markup)
-                info_text = "Registry Information:\n"
-                info_text += f"ID: {server_id}\n"
-                info_text += f"Description: {registry_info.description}\n"
-                info_text += f"Command: {registry_info.command}\n"
-            else:
-                # Rich formatted output
-                info_text = "[bold cyan]Registry Information:[/bold cyan]\n"
-                info_text += f"[bold]ID:[/bold] {server_id}\n"
-                info_text += f"[bold]Description:[/bold] {registry_info.description}\n"
-                info_text += f"[bold]Command:[/bold] {registry_info.command}\n"
+                console.print(plain_server_info(server_id, registry_info, server_info))
+                return
+
+            # Build registry section
+            info_text = "[bold cyan]Registry Information:[/bold cyan]\n"
+            info_text += f"[bold]ID:[/bold] {server_id}\n"
+            info_text += f"[bold]Description:[/bold] {registry_info.description}\n"
+            info_text += f"[bold]Command:[/bold] {registry_info.command}\n"
 
             if registry_info.args:
-                if plain:
-                    info_text += f"Arguments: {' '.join(registry_info.args)}\n"
-                else:
-                    info_text += (
-                        f"[bold]Arguments:[/bold] {' '.join(registry_info.args)}\n"
-                    )
+                info_text += f"[bold]Arguments:[/bold] {' '.join(registry_info.args)}\n"
 
             if registry_info.repository:
-                if plain:
-                    info_text += f"Repository: {registry_info.repository}\n"
-                else:
-                    info_text += (
-                        f"[bold]Repository:[/bold] {registry_info.repository}\n"
-                    )
+                info_text += f"[bold]Repository:[/bold] {registry_info.repository}\n"
 
             # Get installation info
-            if plain:
-                info_text += "\nLocal Installation:\n"
-            else:
-                info_text += "\n[bold cyan]Local Installation:[/bold cyan]\n"
-
-            manager = get_mcp_manager(ctx)
-            server_info = manager.get_server_info(server_id, client)
+            info_text += "\n[bold cyan]Local Installation:[/bold cyan]\n"
 
             if server_info:
-                if plain:
-                    info_text += f"Status: Installed\n"
-                    info_text += f"Client: {server_info.client}\n"
-                    info_text += f"Scope: {server_info.scope}\n"
-                    info_text += f"State: {server_info.state.name}\n"
-                else:
-                    info_text += f"[bold]Status:[/bold] [green]Installed[/green]\n"
-                    info_text += f"[bold]Client:[/bold] {server_info.client}\n"
-                    info_text += f"[bold]Scope:[/bold] {server_info.scope}\n"
-                    info_text += f"[bold]State:[/bold] {server_info.state.name}\n"
+                info_text += f"[bold]Status:[/bold] [green]Installed[/green]\n"
+                info_text += f"[bold]Client:[/bold] {server_info.client}\n"
+                info_text += f"[bold]Scope:[/bold] {server_info.scope}\n"
+                info_text += f"[bold]State:[/bold] {server_info.state.name}\n"
 
                 if server_info.env:
-                    if plain:
-                        info_text += "Environment Variables:\n"
-                    else:
-                        info_text += "[bold]Environment Variables:[/bold]\n"
+                    info_text += "[bold]Environment Variables:[/bold]\n"
                     for key, value in server_info.env.items():
                         info_text += f"  {key}={value}\n"
             else:
-                if plain:
-                    info_text += f"Status: Not Installed\n"
-                else:
-                    info_text += (
-                        f"[bold]Status:[/bold] [yellow]Not Installed[/yellow]\n"
-                    )
+                info_text += f"[bold]Status:[/bold] [yellow]Not Installed[/yellow]\n"
 
             # Output result
-            if plain:
-                console.print(info_text)
-            else:
-                console.print(
-                    Panel(info_text, title=f"Server Information: {server_id}")
-                )
+            console.print(Panel(info_text, title=f"Server Information: {server_id}"))
         else:
             # Show system status
             manager = get_mcp_manager(ctx)
@@ -1997,18 +2148,59 @@ def info(
         ctx.exit(1)
 
 
+def _highlight(text: str, terms: List[str]) -> "Text":
+    """Render text with matched search terms emphasized."""
+    from rich.text import Text
+
+    from mcpi.registry.search_index import highlight_spans
+
+    rendered = Text(text)
+    for start, end in highlight_spans(text, set(terms)):
+        rendered.stylize("bold yellow", start, end)
+    return rendered
+
+
 @main.command()
 @click.option(
     "--query",
     "-q",
-    required=True,
-    help="Search query (term to search for in server descriptions)",
+    default="",
+    help="Search query: terms must all match; use OR between alternatives",
 )
 @click.option(
     "--catalog",
-    type=click.Choice(["official", "local"], case_sensitive=False),
+    shell_complete=complete_catalog_names,
     help="Search in specific catalog (default: official)",
 )
+@click.option(
+    "--category",
+    "categories",
+    multiple=True,
+    help="Only servers in this category (repeatable: any of them)",
+)
+@click.option(
+    "--command",
+    "commands",
+    multiple=True,
+    help="Only servers run with this command, e.g. npx, uvx (repeatable)",
+)
+@click.option(
+    "--repository/--no-repository",
+    "has_repository",
+    default=None,
+    help="Only servers with (or without) a repository URL",
+)
+@click.option(
+    "--facets",
+    "show_facets",
+    is_flag=True,
+    help="Show counts per facet value (single catalog only)",
+)
+@click.option(
+    "--all-catalogs",
+    is_flag=True,
+    help="Search every catalog, ranking results across them (no --facets)",
+)
 @click.option("--limit", default=20, help="Maximum number of results to show")
 @click.option("--json", "output_json", is_flag=True, help="Output in JSON format")
 @click.pass_context
@@ -2016,31 +2208,62 @@ def search(
     ctx: click.Context,
     query: str,
     catalog: Optional[str],
+    categories: tuple,
+    commands: tuple,
+    has_repository: Optional[bool],
+    show_facets: bool,
+    all_catalogs: bool,
     limit: int,
     output_json: bool,
 ) -> None:
     """Search for MCP servers in the registry.
 
+    Matches IDs, descriptions, categories, package arguments and repository
+    URLs; results are ranked by relevance. Filters narrow the results by
+    category, command and repository; --facets shows how many matching
+    servers have each value.
+
     Examples:
         mcpi search --query filesystem
         mcpi search -q database --catalog local
-        mcpi search --query git --catalog official
+        mcpi search --query "postgres OR mysql"
+        mcpi search --category database --command uvx --facets
+        mcpi search -q github --all-catalogs
     """
+    from rich.table import Table
+
+    if all_catalogs and show_facets:
+        raise click.UsageError("--facets cannot be combined with --all-catalogs")
+
     try:
+        filters = {"category": categories, "command": commands}
+        if has_repository is not None:
+            filters["repository"] = ("yes" if has_repository else "no",)
+        if not any(filters.values()):
+            filters = None
+
+        if all_catalogs:
+            _search_all_catalogs(ctx, query, filters, limit, output_json)
+            return
+
         # Search single catalog (default: official)
         cat = get_catalog(ctx, catalog)
 
-        # Search servers (returns list of (server_id, MCPServer) tuples)
-        servers = cat.search_servers(query)
-
-        # Limit results
-        servers = servers[:limit]
+        # Search servers, best match first
+        # ((server_id, MCPServer, score, matches) tuples)
+        servers = cat.search_servers(
+            query, with_scores=True, filters=filters, limit=limit
+        )
+        facet_counts = cat.facet_counts(query, filters) if show_facets else None
 
         if not servers:
             if output_json:
                 import json
 
-                print(json.dumps([]))
+                if facet_counts is not None:
+                    print(json.dumps({"results": [], "facets": facet_counts}))
+                else:
+                    print(json.dumps([]))
             else:
                 console.print("[yellow]No servers found matching criteria[/yellow]")
             return
@@ -2052,13 +2275,13 @@ def search(
             # Build JSON output - handle both tuple and plain server results
             json_results = []
             for item in servers:
-                # Check if it's a tuple (server, score, matches) or just (server_id, server)
+                # Check if it's a tuple (server_id, server, score, matches) or just (server_id, server)
                 if isinstance(item, tuple):
-                    if len(item) == 3:
+                    if len(item) == 4:
                         # Tuple result with score and matches
-                        server, score, matches = item
-                        result = server.model_dump()
-                        result["score"] = score
+                        server_id, server, score, matches = item
+                        result = {"id": server_id, **server.model_dump()}
+                        result["score"] = round(score, 4)
                         result["matches"] = matches
                         json_results.append(result)
                     elif len(item) == 2:
@@ -2069,7 +2292,11 @@ def search(
                     # Single server object
                     json_results.append(item.model_dump())
 
-            print(json.dumps(json_results, indent=2, default=str))
+            if facet_counts is not None:
+                output = {"results": json_results, "facets": facet_counts}
+                print(json.dumps(output, indent=2, default=str))
+            else:
+                print(json.dumps(json_results, indent=2, default=str))
             return
 
         # Table output
@@ -2079,23 +2306,84 @@ def search(
         table.add_column("Command", style="magenta")
         table.add_column("Description", style="white")
 
-        for server_id, server in servers:
+        for item in servers:
+            server_id, server = item[:2]
+            matches = item[3] if len(item) == 4 else {}
+            description = (
+                server.description[:80] + "..."
+                if len(server.description) > 80
+                else server.description
+            )
             table.add_row(
-                server_id,
+                _highlight(server_id, matches.get("id", [])),
                 server.command,
-                (
-                    server.description[:80] + "..."
-                    if len(server.description) > 80
-                    else server.description
-                ),
+                _highlight(description, matches.get("description", [])),
             )
 
         console.print(table)
 
+        if facet_counts:
+            for facet, values in facet_counts.items():
+                if values:
+                    counts = ", ".join(f"{value} ({n})" for value, n in values.items())
+                    console.print(f"[bold]{facet}:[/bold] {counts}")
+
     except Exception as e:
         console.print(f"[red]Error searching registry: {e}[/red]")
 
 
+def _search_all_catalogs(
+    ctx: click.Context,
+    query: str,
+    filters: Optional[Dict[str, tuple]],
+    limit: int,
+    output_json: bool,
+) -> None:
+    """Print the best matches of a search across all catalogs.
+
+    Args:
+        ctx: Click context
+        query: Search query
+        filters: Facet name -> accepted values, or None
+        limit: Maximum number of results
+        output_json: Output in JSON format
+    """
+    from rich.table import Table
+
+    manager = get_catalog_manager(ctx)
+    results = manager.search_all(query, limit=limit, ranked=True, filters=filters)
+
+    if output_json:
+        import json
+
+        json_results = [
+            {"catalog": catalog_name, "id": server_id, **server.model_dump()}
+            for catalog_name, server_id, server in results
+        ]
+        print(json.dumps(json_results, indent=2, default=str))
+        return
+
+    if not results:
+        console.print("[yellow]No servers found matching criteria[/yellow]")
+        return
+
+    table = Table(title=f"ALL CATALOGS ({len(results)} found)")
+    table.add_column("ID", style="cyan", no_wrap=True)
+    table.add_column("Catalog", style="green")
+    table.add_column("Command", style="magenta")
+    table.add_column("Description", style="white")
+
+    for catalog_name, server_id, server in results:
+        description = (
+            server.description[:80] + "..."
+            if len(server.description) > 80
+            else server.description
+        )
+        table.add_row(server_id, catalog_name, server.command, description)
+
+    console.print(table)
+
+
 # STATUS COMMAND
 
 
@@ -2104,6 +2392,8 @@ def search(
 @click.pass_context
 def status(ctx: click.Context, output_json: bool) -> None:
     """Show system status and summary information."""
+    from rich.panel import Panel
+
     try:
         manager = get_mcp_manager(ctx)
 
@@ -2155,6 +2445,8 @@ def catalog(ctx: click.Context) -> None:
     MCPI supports multiple server catalogs:
     - official: Built-in catalog of MCP servers
     - local: Your custom servers
+    - any catalog file added as a [catalogs.<name>] table with a path to
+      mcpi.toml (global or project)
     """
     pass
 
@@ -2163,8 +2455,8 @@ def catalog(ctx: click.Context) -> None:
 @click.option(
     "--catalog",
     "-c",
-    type=click.Choice(["official", "local", "all"], case_sensitive=False),
     default="all",
+    shell_complete=complete_catalog_names,
     help="Which catalog to list servers from (default: all)",
 )
 @click.option(
@@ -2181,6 +2473,8 @@ def catalog_list(ctx: click.Context, catalog: str, summary: bool) -> None:
         mcpi catalog list -c official  # List servers from official catalog only
         mcpi catalog list --summary    # Show catalog summary
     """
+    from rich.table import Table
+
     try:
         manager = get_catalog_manager(ctx)
 
@@ -2208,17 +2502,13 @@ def catalog_list(ctx: click.Context, catalog: str, summary: bool) -> None:
         all_servers: list[tuple[str, str, str]] = []  # (id, description, catalog_name)
 
         if catalog.lower() == "all":
-            catalog_names = ["official", "local"]
+            loaded = manager.load_catalogs()
         else:
-            catalog_names = [catalog.lower()]
-
-        for cat_name in catalog_names:
-            cat = manager.get_catalog(cat_name)
-            if cat:
-                for server_id, server in cat.list_servers():
-                    all_servers.append(
-                        (server_id, server.description or "", cat_name)
-                    )
+            loaded = manager.load_catalogs([catalog])
+
+        for source, cat in loaded:
+            for server_id, server in cat.list_servers():
+                all_servers.append((server_id, server.description or "", source.name))
 
         if not all_servers:
             console.print("[yellow]No servers found in catalogs[/yellow]")
@@ -2249,7 +2539,7 @@ def catalog_list(ctx: click.Context, catalog: str, summary: bool) -> None:
 
 
 @catalog.command("info")
-@click.argument("name", type=click.Choice(["official", "local"], case_sensitive=False))
+@click.argument("name", shell_complete=complete_catalog_names)
 @click.pass_context
 def catalog_info(ctx: click.Context, name: str) -> None:
     """Show detailed information about a catalog.
@@ -2258,6 +2548,8 @@ def catalog_info(ctx: click.Context, name: str) -> None:
         mcpi catalog info official
         mcpi catalog info local
     """
+    from rich.panel import Panel
+
     try:
         manager = get_catalog_manager(ctx)
         cat = manager.get_catalog(name)
@@ -2311,6 +2603,43 @@ def catalog_info(ctx: click.Context, name: str) -> None:
         console.print(f"[red]Error getting catalog info: {e}[/red]")
 
 
+@catalog.command("migrate")
+@click.pass_context
+def catalog_migrate(ctx: click.Context) -> None:
+    """Store the local catalog as one file per server.
+
+    Adding, editing or removing a server then rewrites only that server's
+    file and a small manifest instead of the whole catalog. The old
+    catalog.json is kept as catalog.json.migrated.
+
+    Examples:
+        mcpi catalog migrate
+    """
+    from mcpi.registry.catalog_shards import ShardedCatalogStore, migrate_to_shards
+
+    manager = get_catalog_manager(ctx)
+    local_path = manager.local_path
+    if local_path.is_dir():
+        console.print(
+            f"[yellow]Local catalog is already sharded: {local_path}[/yellow]"
+        )
+        return
+
+    try:
+        directory = migrate_to_shards(local_path)
+    except (OSError, ValueError) as e:
+        console.print(f"[red]Error migrating local catalog: {e}[/red]")
+        ctx.exit(1)
+
+    # Reload with the new layout on next use
+    ctx.obj.pop("catalog_manager", None)
+    count = len(ShardedCatalogStore(directory).read_manifest())
+    console.print(
+        f"[green]✓ Migrated {count} servers to one file per server in "
+        f"{directory}[/green]"
+    )
+
+
 @catalog.command("add")
 @click.argument("source", nargs=-1, required=True)
 @click.option(
@@ -2482,6 +2811,8 @@ def bundle(ctx: click.Context) -> None:
 @click.pass_context
 def list_bundles(ctx: click.Context) -> None:
     """List available server bundles."""
+    from rich.table import Table
+
     try:
         catalog = get_bundle_catalog(ctx)
         bundles = catalog.list_bundles()
@@ -2520,6 +2851,8 @@ def list_bundles(ctx: click.Context) -> None:
 @click.pass_context
 def bundle_info(ctx: click.Context, bundle_id: str) -> None:
     """Show detailed information about a bundle."""
+    from rich.panel import Panel
+
     try:
         catalog = get_bundle_catalog(ctx)
         bundle = catalog.get_bundle(bundle_id)
@@ -2579,6 +2912,8 @@ def install_bundle(
     dry_run: bool,
 ) -> None:
     """Install all servers from a bundle."""
+    from mcpi.bundles.installer import BundleInstaller
+
     verbose = ctx.obj.get("verbose", False)
 
     try:
@@ -2,6 +2,7 @@
 
 from .base import MCPClientPlugin, ScopeHandler
 from .claude_code import ClaudeCodePlugin
+from .inventory import InventoryIndex
 from .manager import MCPManager
 from .registry import ClientRegistry
 from .types import OperationResult, ScopeConfig, ServerConfig, ServerInfo, ServerState
@@ -16,5 +17,6 @@ __all__ = [
     "ScopeHandler",
     "ClaudeCodePlugin",
     "ClientRegistry",
+    "InventoryIndex",
     "MCPManager",
 ]
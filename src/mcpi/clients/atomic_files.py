@@ -0,0 +1,194 @@
+"""Crash-safe replacement of configuration files.
+
+Every write goes to a temporary file in the target's directory, is fsynced and
+then renamed over the target, so readers such as Claude Code never see a
+half-written file and a crash leaves either the old or the new contents.
+
+Changes spanning several files (e.g. moving a server from ~/.claude.json to
+the disabled-servers file) use a small intent journal:
+
+1. The journal is written in the "prepare" state listing every target and
+   its staged temporary file.
+2. All new contents are staged and fsynced.
+3. The journal is switched to "commit"; this is the commit point.
+4. The staged files are renamed over their targets and the journal is removed.
+
+recover_journal() finishes an interrupted change on the next run: a "prepare"
+journal is rolled back (staged files are discarded), a "commit" journal is
+rolled forward (remaining staged files are renamed into place).
+"""
+
+import json
+import os
+import secrets
+import sys
+from pathlib import Path
+from typing import Dict, List, Mapping, Optional
+
+from .file_lock import check_unchanged, note_written
+
+PREPARE = "prepare"
+COMMIT = "commit"
+
+
+def atomic_write_bytes(target: Path, data: bytes) -> None:
+    """Atomically replace a file's contents.
+
+    Symlinks are followed, so a symlinked config file stays a symlink. The
+    existing file's permission bits are preserved.
+
+    Args:
+        target: File to write
+        data: New contents
+
+    Raises:
+        WriteConflict: If the file changed since the running locked
+            operation started (see file_lock)
+        OSError: If the file cannot be written
+    """
+    target = _resolve(target)
+    staged = _stage(target, data)
+    try:
+        check_unchanged(target)
+        os.replace(staged, target)
+    except OSError:
+        _unlink(staged)
+        raise
+    _fsync_dir(target.parent)
+    note_written(target)
+
+
+def commit_files(writes: Mapping[Path, bytes], journal_path: Path) -> None:
+    """Atomically replace several files, recoverable through a journal.
+
+    Args:
+        writes: New contents by target file
+        journal_path: Intent journal location (must not be in use)
+
+    Raises:
+        WriteConflict: If a target changed since the running locked operation
+            started (nothing is changed)
+        OSError: If staging fails (nothing is changed) or a rename fails (the
+            change is rolled forward by the next recover_journal())
+    """
+    targets = {_resolve(target): data for target, data in writes.items()}
+    for target in targets:
+        check_unchanged(target)
+    staged = {target: _staged_path(target) for target in targets}
+    entries = [
+        {"target": str(target), "staged": str(path)} for target, path in staged.items()
+    ]
+
+    _write_journal(journal_path, PREPARE, entries)
+    try:
+        for target, data in targets.items():
+            _stage(target, data, staged[target])
+    except OSError:
+        _rollback(entries)
+        _unlink(journal_path)
+        raise
+
+    _write_journal(journal_path, COMMIT, entries)
+    _roll_forward(entries)
+    _unlink(journal_path)
+    for target in targets:
+        note_written(target)
+
+
+def recover_journal(journal_path: Path) -> bool:
+    """Finish or undo a multi-file change interrupted by a crash.
+
+    Args:
+        journal_path: Intent journal location
+
+    Returns:
+        True if an interrupted change was found and resolved
+    """
+    try:
+        journal = json.loads(journal_path.read_bytes())
+        state = journal["state"]
+        entries = journal["files"]
+    except FileNotFoundError:
+        return False
+    except (OSError, ValueError, KeyError, TypeError):
+        # A torn journal can only come from the "prepare" write, before any
+        # target was touched; staged files (if any) are unknown and harmless
+        _unlink(journal_path)
+        return True
+
+    if state == COMMIT:
+        _roll_forward(entries)
+    else:
+        _rollback(entries)
+    _unlink(journal_path)
+    return True
+
+
+def _write_journal(
+    journal_path: Path, state: str, entries: List[Dict[str, str]]
+) -> None:
+    data = json.dumps({"state": state, "files": entries}, indent=2).encode("utf-8")
+    atomic_write_bytes(journal_path, data)
+
+
+def _roll_forward(entries: List[Dict[str, str]]) -> None:
+    for entry in entries:
+        staged = Path(entry["staged"])
+        if staged.exists():
+            os.replace(staged, entry["target"])
+            _fsync_dir(staged.parent)
+
+
+def _rollback(entries: List[Dict[str, str]]) -> None:
+    for entry in entries:
+        _unlink(Path(entry["staged"]))
+
+
+def _stage(target: Path, data: bytes, staged: Optional[Path] = None) -> Path:
+    """Write ``data`` to a fsynced temporary file next to ``target``."""
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staged = staged or _staged_path(target)
+    try:
+        with open(staged, "xb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        try:
+            os.chmod(staged, target.stat().st_mode & 0o7777)
+        except FileNotFoundError:
+            pass
+    except OSError:
+        _unlink(staged)
+        raise
+    return staged
+
+
+def _staged_path(target: Path) -> Path:
+    return target.with_name(f".{target.name}.{secrets.token_hex(6)}.tmp")
+
+
+def _resolve(target: Path) -> Path:
+    return Path(os.path.realpath(target))
+
+
+def _fsync_dir(directory: Path) -> None:
+    """Persist a rename (not supported on Windows, where it is not needed)."""
+    if sys.platform == "win32":
+        return
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _unlink(path: Path) -> None:
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
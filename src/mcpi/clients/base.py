@@ -183,6 +183,46 @@ class MCPClientPlugin(ABC):
 
         return self._scopes[scope]
 
+    def _get_server_states(
+        self, scope: str, scope_servers: Dict[str, Dict[str, Any]]
+    ) -> Dict[str, ServerState]:
+        """Get the states of all servers in a scope in one pass.
+
+        Used by list_servers() instead of checking servers one by one: the
+        scope's enable/disable handler resolves every server at once, so each
+        backing file is read once per scope instead of once per server.
+
+        Args:
+            scope: The scope the servers were listed from
+            scope_servers: Server configurations keyed by server ID
+
+        Returns:
+            Dictionary mapping server IDs to their state
+        """
+        handler = self._scopes.get(scope)
+        state_handler = getattr(handler, "enable_disable_handler", None)
+
+        if not state_handler:
+            states = dict.fromkeys(scope_servers, ServerState.ENABLED)
+        elif hasattr(state_handler, "resolve_states"):
+            states = state_handler.resolve_states(scope_servers.keys())
+        else:
+            states = {
+                server_id: (
+                    ServerState.DISABLED
+                    if state_handler.is_disabled(server_id)
+                    else ServerState.ENABLED
+                )
+                for server_id in scope_servers
+            }
+
+        # Inline "disabled" flags (legacy) take precedence
+        for server_id, config_dict in scope_servers.items():
+            if config_dict and config_dict.get("disabled") is True:
+                states[server_id] = ServerState.DISABLED
+
+        return states
+
     @abstractmethod
     def list_servers(self, scope: Optional[str] = None) -> Dict[str, ServerInfo]:
         """List all servers, optionally filtered by scope.
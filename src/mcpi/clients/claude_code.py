@@ -314,13 +314,15 @@ class ClaudeCodePlugin(MCPClientPlugin):
                 continue
 
             scope_servers = handler.get_servers()
+
+            # Determine server states using ONLY the servers' own scope,
+            # resolved in one pass per scope
+            states = self._get_server_states(scope_name, scope_servers)
+
             for server_id, config_dict in scope_servers.items():
                 # Create qualified server ID
                 qualified_id = f"{self.name}:{scope_name}:{server_id}"
-
-                # Determine server state using ONLY the server's own scope
-                # Pass config_dict to check for inline "disabled" field
-                state = self._get_server_state(server_id, scope_name, config_dict)
+                state = states[server_id]
 
                 # Create ServerInfo object
                 servers[qualified_id] = ServerInfo(
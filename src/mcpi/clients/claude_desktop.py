@@ -208,12 +208,14 @@ class ClaudeDesktopPlugin(MCPClientPlugin):
                 continue
 
             scope_servers = handler.get_servers()
+
+            # Determine server states in one pass per scope
+            states = self._get_server_states(scope_name, scope_servers)
+
             for server_id, config_dict in scope_servers.items():
                 # Create qualified server ID
                 qualified_id = f"{self.name}:{scope_name}:{server_id}"
-
-                # Determine server state
-                state = self._get_server_state(server_id, scope_name, config_dict)
+                state = states[server_id]
 
                 # Create ServerInfo object
                 servers[qualified_id] = ServerInfo(
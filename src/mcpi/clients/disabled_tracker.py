@@ -9,6 +9,10 @@ import json
 from pathlib import Path
 from typing import List, Set
 
+from .atomic_files import atomic_write_bytes
+from .document_cache import get_document_cache
+from .file_lock import locked_update
+
 
 class DisabledServersTracker:
     """Tracks disabled servers in a separate file.
@@ -38,6 +42,7 @@ class DisabledServersTracker:
         disabled = self._read_disabled_servers()
         return server_id in disabled
 
+    @locked_update("tracking_file")
     def disable(self, server_id: str) -> bool:
         """Mark a server as disabled.
 
@@ -56,6 +61,7 @@ class DisabledServersTracker:
         except Exception:
             return False
 
+    @locked_update("tracking_file")
     def enable(self, server_id: str) -> bool:
         """Remove a server from the disabled list.
 
@@ -88,20 +94,18 @@ class DisabledServersTracker:
         Returns:
             Set of disabled server IDs
         """
-        if not self.tracking_file.exists():
+        try:
+            data = get_document_cache().load(self.tracking_file, json.loads)
+        except (ValueError, OSError):
+            # Missing file (FileNotFoundError is an OSError) or bad JSON
             return set()
 
-        try:
-            with self.tracking_file.open("r", encoding="utf-8") as f:
-                data = json.load(f)
-                # Support both array format and the more verbose format
-                if isinstance(data, list):
-                    return set(data)
-                elif isinstance(data, dict) and "disabled" in data:
-                    return set(data["disabled"])
-                else:
-                    return set()
-        except (json.JSONDecodeError, OSError):
+        # Support both array format and the more verbose format
+        if isinstance(data, list):
+            return set(data)
+        elif isinstance(data, dict) and "disabled" in data:
+            return set(data["disabled"])
+        else:
             return set()
 
     def _write_disabled_servers(self, disabled: Set[str]) -> None:
@@ -110,9 +114,9 @@ class DisabledServersTracker:
         Args:
             disabled: Set of disabled server IDs
         """
-        # Ensure directory exists
-        self.tracking_file.parent.mkdir(parents=True, exist_ok=True)
-
         # Write as a simple JSON array for easy manual editing
-        with self.tracking_file.open("w", encoding="utf-8") as f:
-            json.dump(sorted(disabled), f, indent=2)
+        try:
+            data = json.dumps(sorted(disabled), indent=2).encode("utf-8")
+            atomic_write_bytes(self.tracking_file, data)
+        finally:
+            get_document_cache().invalidate(self.tracking_file)
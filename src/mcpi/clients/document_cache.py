@@ -0,0 +1,268 @@
+"""Process-wide cache of parsed configuration documents.
+
+Several scope handlers and enable/disable handlers read the same files during a
+single command (``~/.claude.json`` is read by the user-internal scope, by its
+FileMoveEnableDisableHandler and once per server while resolving states). This
+module lets all of them share a single parse per file.
+
+Entries are keyed on the file path and validated against a stat fingerprint
+(mtime_ns, size, inode). Filesystem timestamps are coarse, so a file rewritten
+within the same clock tick can keep an identical fingerprint. Entries whose
+fingerprint was captured while the file was that fresh are treated as "racy"
+(the same idea as git's racy index entries): a digest of their contents is
+kept and compared on the next lookup, which is still much cheaper than
+re-parsing.
+"""
+
+import hashlib
+import mmap
+import os
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+# Files modified less than this long before they were read are not trusted on
+# fingerprint alone (covers 1s HFS+ and 2s FAT timestamp granularity).
+RACY_WINDOW_NS = 2_000_000_000
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Stat-based identity of a file's contents."""
+
+    mtime_ns: int
+    size: int
+    ino: int
+
+    @classmethod
+    def from_stat(cls, st: os.stat_result) -> "FileFingerprint":
+        """Build a fingerprint from a stat result."""
+        return cls(mtime_ns=st.st_mtime_ns, size=st.st_size, ino=st.st_ino)
+
+    @classmethod
+    def of(cls, path: Path) -> Optional["FileFingerprint"]:
+        """Fingerprint a path.
+
+        Args:
+            path: File to fingerprint
+
+        Returns:
+            Fingerprint, or None if the file does not exist
+        """
+        try:
+            return cls.from_stat(os.stat(path))
+        except FileNotFoundError:
+            return None
+
+
+@dataclass
+class _CacheEntry:
+    """A parsed document together with the fingerprint it was parsed at."""
+
+    fingerprint: FileFingerprint
+    document: Any
+    digest: Optional[bytes] = None  # Only kept while the entry is racy
+
+
+class ParsedDocumentCache:
+    """Cache of parsed file contents shared by every reader in the process.
+
+    Documents returned by :meth:`load` are shared between callers and must be
+    treated as read-only; callers that need to mutate should copy first.
+    """
+
+    def __init__(self, racy_window_ns: int = RACY_WINDOW_NS) -> None:
+        """Initialize an empty cache.
+
+        Args:
+            racy_window_ns: Age below which a file's fingerprint is not trusted
+        """
+        self.racy_window_ns = racy_window_ns
+        self._entries: Dict[Tuple[str, str], _CacheEntry] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def load(
+        self,
+        path: Path,
+        parse: Callable[[Any], Any],
+        variant: str = "",
+        mapped: bool = False,
+    ) -> Any:
+        """Return the parsed contents of a file, parsing at most once per version.
+
+        Args:
+            path: File to load
+            parse: Function turning the file contents into a document
+            variant: Name of the view of the file that ``parse`` produces;
+                different views of one file are cached side by side
+            mapped: Pass ``parse`` a read-only mmap of the file instead of its
+                bytes (for large files of which only a part is decoded)
+
+        Returns:
+            Parsed document (shared, do not mutate)
+
+        Raises:
+            FileNotFoundError: If the file does not exist
+            OSError: If the file cannot be read
+            Exception: Whatever ``parse`` raises for malformed content
+        """
+        key = (self._key(path), variant)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self._drop(key[0])
+            raise
+        checked_at = time.time_ns()
+        fingerprint = FileFingerprint.from_stat(st)
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+        if entry is not None and entry.fingerprint == fingerprint:
+            if entry.digest is None:
+                with self._lock:
+                    self._hits += 1
+                return entry.document
+
+        racy = self._is_racy(fingerprint, checked_at)
+        with _contents(path, mapped) as contents:
+            if entry is not None and entry.fingerprint == fingerprint:
+                if _digest(contents) == entry.digest:
+                    if not racy:
+                        entry.digest = None
+                    with self._lock:
+                        self._hits += 1
+                    return entry.document
+
+            document = parse(contents)
+            digest = _digest(contents) if racy else None
+
+        with self._lock:
+            self._misses += 1
+            self._entries[key] = _CacheEntry(
+                fingerprint=fingerprint, document=document, digest=digest
+            )
+        return document
+
+    def peek(self, path: Path, variant: str = "") -> Optional[Tuple[Any, bytes]]:
+        """Get a cached document together with the bytes it was parsed from.
+
+        Never parses: if the file changed since the document was cached (or
+        nothing is cached), returns None.
+
+        Args:
+            path: File to look up
+            variant: Name of the cached view
+
+        Returns:
+            ``(document, raw)`` if ``raw`` (the file's current contents) is
+            what the cached document was parsed from, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get((self._key(path), variant))
+        if entry is None or FileFingerprint.of(path) != entry.fingerprint:
+            return None
+
+        try:
+            raw = Path(path).read_bytes()
+        except OSError:
+            return None
+        if FileFingerprint.of(path) != entry.fingerprint:
+            return None
+        if entry.digest is not None and _digest(raw) != entry.digest:
+            return None
+        return entry.document, raw
+
+    def invalidate(self, path: Optional[Path] = None) -> None:
+        """Drop cached documents.
+
+        Args:
+            path: File to forget (default: forget everything)
+        """
+        if path is None:
+            with self._lock:
+                self._invalidations += len(self._entries)
+                self._entries.clear()
+            return
+        self._drop(self._key(path))
+
+    def paths(self) -> List[Path]:
+        """Get the files that have cached documents.
+
+        Returns:
+            Absolute paths, each listed once
+        """
+        with self._lock:
+            keys = {path_key for path_key, _ in self._entries}
+        return [Path(path_key) for path_key in sorted(keys)]
+
+    def stats(self) -> Dict[str, int]:
+        """Get cache statistics.
+
+        Returns:
+            Dictionary with hit, miss, invalidation and entry counts
+        """
+        with self._lock:
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "entries": len(self._entries),
+            }
+
+    def reset_stats(self) -> None:
+        """Reset hit/miss/invalidation counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+            self._invalidations = 0
+
+    def _drop(self, path_key: str) -> None:
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path_key]:
+                del self._entries[key]
+                self._invalidations += 1
+
+    def _is_racy(self, fingerprint: FileFingerprint, checked_at: int) -> bool:
+        return checked_at - fingerprint.mtime_ns < self.racy_window_ns
+
+    @staticmethod
+    def _key(path: Union[str, Path]) -> str:
+        return os.path.abspath(os.fspath(path))
+
+
+@contextmanager
+def _contents(path: Path, mapped: bool) -> Iterator[Any]:
+    """Yield a file's contents as bytes, or as a read-only mmap if ``mapped``."""
+    if not mapped:
+        yield Path(path).read_bytes()
+        return
+
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""  # Empty files cannot be mapped
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+            yield contents
+
+
+def _digest(contents: Any) -> bytes:
+    return hashlib.blake2b(contents, digest_size=16).digest()
+
+
+_document_cache = ParsedDocumentCache()
+
+
+def get_document_cache() -> ParsedDocumentCache:
+    """Get the process-wide parsed document cache.
+
+    Returns:
+        Shared ParsedDocumentCache instance
+    """
+    return _document_cache
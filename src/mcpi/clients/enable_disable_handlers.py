@@ -1,10 +1,13 @@
 """Enable/disable handler implementations for different scope types."""
 
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from .disabled_tracker import DisabledServersTracker
+from .file_lock import locked_update
 from .protocols import ConfigReader, ConfigWriter, EnableDisableHandler
+from .session import path_exists
+from .types import ServerState
 
 
 class ArrayBasedEnableDisableHandler:
@@ -37,7 +40,7 @@ class ArrayBasedEnableDisableHandler:
         Returns:
             True if server is in disabledMcpjsonServers array
         """
-        if not self.config_path.exists():
+        if not path_exists(self.config_path):
             return False
 
         try:
@@ -47,6 +50,31 @@ class ArrayBasedEnableDisableHandler:
         except Exception:
             return False
 
+    def resolve_states(self, server_ids: Iterable[str]) -> Dict[str, ServerState]:
+        """Resolve states for many servers with a single read of the config file.
+
+        Args:
+            server_ids: Server identifiers
+
+        Returns:
+            Dictionary mapping server IDs to ENABLED or DISABLED
+        """
+        disabled: set = set()
+        if path_exists(self.config_path):
+            try:
+                data = self.reader.read(self.config_path)
+                disabled = set(data.get("disabledMcpjsonServers", []))
+            except Exception:
+                pass
+
+        return {
+            server_id: (
+                ServerState.DISABLED if server_id in disabled else ServerState.ENABLED
+            )
+            for server_id in server_ids
+        }
+
+    @locked_update("config_path")
     def disable_server(self, server_id: str) -> bool:
         """Mark a server as disabled by adding to disabledMcpjsonServers array.
 
@@ -58,7 +86,7 @@ class ArrayBasedEnableDisableHandler:
         """
         try:
             # Read current data
-            if self.config_path.exists():
+            if path_exists(self.config_path):
                 data = self.reader.read(self.config_path)
             else:
                 data = {}
@@ -86,6 +114,7 @@ class ArrayBasedEnableDisableHandler:
         except Exception:
             return False
 
+    @locked_update("config_path")
     def enable_server(self, server_id: str) -> bool:
         """Mark a server as enabled by adding to enabledMcpjsonServers array.
 
@@ -97,7 +126,7 @@ class ArrayBasedEnableDisableHandler:
         """
         try:
             # Read current data
-            if self.config_path.exists():
+            if path_exists(self.config_path):
                 data = self.reader.read(self.config_path)
             else:
                 data = {}
@@ -153,6 +182,23 @@ class FileTrackedEnableDisableHandler:
         """
         return self.tracker.is_disabled(server_id)
 
+    def resolve_states(self, server_ids: Iterable[str]) -> Dict[str, ServerState]:
+        """Resolve states for many servers with a single read of the tracking file.
+
+        Args:
+            server_ids: Server identifiers
+
+        Returns:
+            Dictionary mapping server IDs to ENABLED or DISABLED
+        """
+        disabled = set(self.tracker.get_disabled_servers())
+        return {
+            server_id: (
+                ServerState.DISABLED if server_id in disabled else ServerState.ENABLED
+            )
+            for server_id in server_ids
+        }
+
     def disable_server(self, server_id: str) -> bool:
         """Mark a server as disabled by adding to tracking file.
 
@@ -207,7 +253,7 @@ class InlineEnableDisableHandler:
         Returns:
             True if server has 'disabled' field set to true
         """
-        if not self.config_path.exists():
+        if not path_exists(self.config_path):
             return False
 
         try:
@@ -218,6 +264,32 @@ class InlineEnableDisableHandler:
         except Exception:
             return False
 
+    def resolve_states(self, server_ids: Iterable[str]) -> Dict[str, ServerState]:
+        """Resolve states for many servers with a single read of the config file.
+
+        Args:
+            server_ids: Server identifiers
+
+        Returns:
+            Dictionary mapping server IDs to ENABLED or DISABLED
+        """
+        servers: Dict[str, Any] = {}
+        if path_exists(self.config_path):
+            try:
+                servers = self.reader.read(self.config_path).get("mcpServers", {})
+            except Exception:
+                pass
+
+        return {
+            server_id: (
+                ServerState.DISABLED
+                if servers.get(server_id, {}).get("disabled") is True
+                else ServerState.ENABLED
+            )
+            for server_id in server_ids
+        }
+
+    @locked_update("config_path")
     def disable_server(self, server_id: str) -> bool:
         """Mark a server as disabled by setting 'disabled': true in config.
 
@@ -229,7 +301,7 @@ class InlineEnableDisableHandler:
         """
         try:
             # Read current data
-            if not self.config_path.exists():
+            if not path_exists(self.config_path):
                 return False  # Can't disable if config doesn't exist
 
             data = self.reader.read(self.config_path)
@@ -249,6 +321,7 @@ class InlineEnableDisableHandler:
         except Exception:
             return False
 
+    @locked_update("config_path")
     def enable_server(self, server_id: str) -> bool:
         """Mark a server as enabled by removing 'disabled' field from config.
 
@@ -260,7 +333,7 @@ class InlineEnableDisableHandler:
         """
         try:
             # Read current data
-            if not self.config_path.exists():
+            if not path_exists(self.config_path):
                 return False  # Can't enable if config doesn't exist
 
             data = self.reader.read(self.config_path)
@@ -335,7 +408,7 @@ class ApprovalRequiredEnableDisableHandler:
             True if server is disabled, False if enabled
         """
         # Step 1: Check inline disabled field in .mcp.json (highest priority)
-        if self.mcp_json_path.exists():
+        if path_exists(self.mcp_json_path):
             try:
                 mcp_data = self.reader.read(self.mcp_json_path)
                 servers = mcp_data.get("mcpServers", {})
@@ -347,7 +420,7 @@ class ApprovalRequiredEnableDisableHandler:
                 pass
 
         # Step 2-4: Check approval arrays in settings.local.json
-        if not self.settings_local_path.exists():
+        if not path_exists(self.settings_local_path):
             # No approval file = not approved = disabled (security default)
             return True
 
@@ -371,6 +444,53 @@ class ApprovalRequiredEnableDisableHandler:
             # If we can't read approval file, fail-safe to disabled
             return True
 
+    def resolve_states(self, server_ids: Iterable[str]) -> Dict[str, ServerState]:
+        """Resolve states for many servers reading each backing file once.
+
+        Applies the same priority order as is_disabled().
+
+        Args:
+            server_ids: Server identifiers
+
+        Returns:
+            Dictionary mapping server IDs to ENABLED or DISABLED
+        """
+        inline_disabled: set = set()
+        if path_exists(self.mcp_json_path):
+            try:
+                servers = self.reader.read(self.mcp_json_path).get("mcpServers", {})
+                inline_disabled = {
+                    server_id
+                    for server_id, config in servers.items()
+                    if isinstance(config, dict) and config.get("disabled") is True
+                }
+            except Exception:
+                pass
+
+        enabled: set = set()
+        disabled: set = set()
+        if path_exists(self.settings_local_path):
+            try:
+                settings_data = self.reader.read(self.settings_local_path)
+                enabled = set(settings_data.get("enabledMcpjsonServers", []))
+                disabled = set(settings_data.get("disabledMcpjsonServers", []))
+            except Exception:
+                # Can't read approval file = nothing is approved
+                pass
+
+        # Not in either array = not approved = disabled (security default)
+        return {
+            server_id: (
+                ServerState.ENABLED
+                if server_id in enabled
+                and server_id not in disabled
+                and server_id not in inline_disabled
+                else ServerState.DISABLED
+            )
+            for server_id in server_ids
+        }
+
+    @locked_update("settings_local_path")
     def enable_server(self, server_id: str) -> bool:
         """Enable a server by adding to enabledMcpjsonServers array.
 
@@ -382,7 +502,7 @@ class ApprovalRequiredEnableDisableHandler:
         """
         try:
             # Read current settings (or create empty)
-            if self.settings_local_path.exists():
+            if path_exists(self.settings_local_path):
                 data = self.reader.read(self.settings_local_path)
             else:
                 # Create parent directory if needed
@@ -412,6 +532,7 @@ class ApprovalRequiredEnableDisableHandler:
         except Exception:
             return False
 
+    @locked_update("settings_local_path")
     def disable_server(self, server_id: str) -> bool:
         """Disable a server by adding to disabledMcpjsonServers array.
 
@@ -423,7 +544,7 @@ class ApprovalRequiredEnableDisableHandler:
         """
         try:
             # Read current settings (or create empty)
-            if self.settings_local_path.exists():
+            if path_exists(self.settings_local_path):
                 data = self.reader.read(self.settings_local_path)
             else:
                 # Create parent directory if needed
@@ -463,7 +584,7 @@ class ApprovalRequiredEnableDisableHandler:
         Returns:
             List of server IDs in disabledMcpjsonServers array
         """
-        if not self.settings_local_path.exists():
+        if not path_exists(self.settings_local_path):
             return []
 
         try:
@@ -485,7 +606,7 @@ class ApprovalRequiredEnableDisableHandler:
             True if server is not in either enabledMcpjsonServers or disabledMcpjsonServers
         """
         # Check inline disabled field first - if disabled inline, it's not "unapproved"
-        if self.mcp_json_path.exists():
+        if path_exists(self.mcp_json_path):
             try:
                 mcp_data = self.reader.read(self.mcp_json_path)
                 servers = mcp_data.get("mcpServers", {})
@@ -496,7 +617,7 @@ class ApprovalRequiredEnableDisableHandler:
                 pass
 
         # Check approval arrays
-        if not self.settings_local_path.exists():
+        if not path_exists(self.settings_local_path):
             # No approval file = unapproved
             return True
 
@@ -1,15 +1,22 @@
 """File-based configuration scope handlers."""
 
+import hashlib
 import json
+import re
 import subprocess
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import yaml
-from jsonschema import ValidationError, validate
+from jsonschema import validators
+from jsonschema.exceptions import best_match
 
+from .atomic_files import atomic_write_bytes, commit_files
 from .base import ScopeHandler
+from .document_cache import FileFingerprint, ParsedDocumentCache, get_document_cache
+from .file_lock import locked_update
 from .file_move_enable_disable_handler import FileMoveEnableDisableHandler
+from .json_stream import extract_top_level, top_level_spans
 from .protocols import (
     CommandExecutor,
     ConfigReader,
@@ -17,11 +24,55 @@ from .protocols import (
     EnableDisableHandler,
     SchemaValidator,
 )
+from .session import get_active_buffer, path_exists
 from .types import OperationResult, ScopeConfig, ServerConfig
+from .validated_files import ValidatedFiles, get_validated_files, record_key
+
+# Top-level keys mcpi edits in place. Everything else in a cached document
+# (e.g. the "projects" history in ~/.claude.json) is handed out by reference.
+OWNED_KEYS = ("mcpServers", "enabledMcpjsonServers", "disabledMcpjsonServers")
+
+
+# Files this large are scanned for the keys mcpi needs rather than fully parsed
+STREAM_THRESHOLD_BYTES = 1024 * 1024
+
+
+def _copy_json(value: Any) -> Any:
+    """Copy a JSON value (much faster than copy.deepcopy for plain JSON)."""
+    if isinstance(value, dict):
+        return {k: _copy_json(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_copy_json(v) for v in value]
+    return value
 
 
 class JSONFileReader:
-    """JSON file reader implementation."""
+    """JSON file reader implementation.
+
+    Parsed documents are shared through the process-wide ParsedDocumentCache,
+    so a file is parsed at most once per version no matter how many scopes and
+    handlers read it. Each call returns a fresh top-level dict in which the
+    values of ``owned_keys`` are private copies; other values are shared with
+    the cache and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        cache: Optional[ParsedDocumentCache] = None,
+        owned_keys: Tuple[str, ...] = OWNED_KEYS,
+        stream_threshold: int = STREAM_THRESHOLD_BYTES,
+    ) -> None:
+        """Initialize reader.
+
+        Args:
+            cache: Parsed document cache (defaults to the process-wide cache)
+            owned_keys: Top-level keys whose values are copied on every read
+            stream_threshold: File size from which read_keys() scans the file
+                instead of parsing all of it
+        """
+        self.cache = cache or get_document_cache()
+        self.owned_keys = owned_keys
+        self.stream_threshold = stream_threshold
 
     def read(self, source: Path) -> Dict[str, Any]:
         """Read JSON from file.
@@ -35,18 +86,91 @@ class JSONFileReader:
         Raises:
             ValueError: If file cannot be read or parsed
         """
-        if not source.exists():
-            return {}
+        buffer = get_active_buffer()
+        document = buffer.get(source) if buffer else None
+        if document is None:
+            try:
+                document = self.cache.load(source, json.loads)
+            except FileNotFoundError:
+                return {}
+            except (OSError, ValueError) as e:
+                raise ValueError(f"Failed to read {source}: {e}") from e
+
+        if not isinstance(document, dict):
+            return _copy_json(document)
+
+        data = dict(document)
+        for key in self.owned_keys:
+            if key in data:
+                data[key] = _copy_json(data[key])
+        return data
+
+    def read_keys(
+        self, source: Path, keys: Optional[Tuple[str, ...]] = None
+    ) -> Dict[str, Any]:
+        """Read only some top-level keys of a JSON file.
+
+        Files of at least ``stream_threshold`` bytes are memory-mapped and
+        scanned with extract_top_level(), so unrelated values (such as Claude
+        Code's project history in ~/.claude.json) are never materialized.
+        Smaller files go through the regular cached full parse.
+
+        Args:
+            source: Path to JSON file
+            keys: Top-level keys to read (defaults to ``owned_keys``)
+
+        Returns:
+            Mapping of the requested keys present in the file to private
+            copies of their values
+
+        Raises:
+            ValueError: If file cannot be read or parsed
+        """
+        keys = tuple(keys or self.owned_keys)
+        buffer = get_active_buffer()
+        pending = buffer.get(source) if buffer else None
+        if pending is not None:
+            return {key: _copy_json(pending[key]) for key in keys if key in pending}
 
         try:
-            with source.open("r", encoding="utf-8") as f:
-                return json.load(f)
-        except (OSError, json.JSONDecodeError) as e:
+            if source.stat().st_size < self.stream_threshold:
+                document = self.cache.load(source, json.loads)
+            else:
+                document = self.cache.load(
+                    source,
+                    lambda contents: extract_top_level(contents, keys),
+                    variant="keys:" + ",".join(keys),
+                    mapped=True,
+                )
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
             raise ValueError(f"Failed to read {source}: {e}") from e
 
+        if not isinstance(document, dict):
+            return {}
+        return {key: _copy_json(document[key]) for key in keys if key in document}
+
 
 class JSONFileWriter:
-    """JSON file writer implementation."""
+    """JSON file writer implementation.
+
+    Files are replaced atomically (see atomic_files), so readers never see a
+    partially written config. When the target's current contents are still
+    cached from the read that produced ``data``, only the top-level values
+    that changed are re-serialized and spliced between the file's original
+    bytes; everything else (e.g. Claude Code's project history in
+    ~/.claude.json) is kept byte-for-byte, formatting included.
+    """
+
+    def __init__(self, cache: Optional[ParsedDocumentCache] = None) -> None:
+        """Initialize writer.
+
+        Args:
+            cache: Parsed document cache to invalidate on write
+                (defaults to the process-wide cache)
+        """
+        self.cache = cache or get_document_cache()
 
     def write(self, target: Path, data: Dict[str, Any]) -> bool:
         """Write JSON to file.
@@ -61,17 +185,242 @@ class JSONFileWriter:
         Raises:
             ValueError: If file cannot be written
         """
+        # Inside MCPManager.session(), files are written on commit
+        buffer = get_active_buffer()
+        if buffer is not None:
+            buffer.put(target, data, self)
+            return True
+
         try:
-            target.parent.mkdir(parents=True, exist_ok=True)
-            with target.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            contents = self.render(target, data)
+            if contents is not None:
+                atomic_write_bytes(target, contents)
             return True
         except OSError as e:
             raise ValueError(f"Failed to write {target}: {e}") from e
+        finally:
+            self.cache.invalidate(target)
+
+    def write_many(
+        self, writes: List[Tuple[Path, Dict[str, Any]]], journal_path: Path
+    ) -> bool:
+        """Write several JSON files as one crash-safe change.
+
+        Either all files are updated or (after recover_journal() on the next
+        run) none are.
+
+        Args:
+            writes: ``(target, data)`` pairs
+            journal_path: Intent journal used to recover an interrupted write
+
+        Returns:
+            True if successful
+
+        Raises:
+            ValueError: If the files cannot be written
+        """
+        buffer = get_active_buffer()
+        if buffer is not None:
+            for target, data in writes:
+                buffer.put(target, data, self, journal_path)
+            return True
+
+        try:
+            rendered: Dict[Path, bytes] = {}
+            for target, data in writes:
+                contents = self.render(target, data)
+                if contents is not None:
+                    rendered[target] = contents
+            if rendered:
+                commit_files(rendered, journal_path)
+            return True
+        except OSError as e:
+            targets = ", ".join(str(target) for target, _ in writes)
+            raise ValueError(f"Failed to write {targets}: {e}") from e
+        finally:
+            for target, _ in writes:
+                self.cache.invalidate(target)
+
+    def render(self, target: Path, data: Dict[str, Any]) -> Optional[bytes]:
+        """Encode the new contents of a file.
+
+        Args:
+            target: Path to output file
+            data: Data to write
+
+        Returns:
+            File contents, or None if the file already holds ``data``
+        """
+        chunks = self._splice(target, data)
+        if chunks is None:
+            return json.dumps(data, indent=2).encode("utf-8")
+        return b"".join(chunks) if chunks else None
+
+    def _splice(self, target: Path, data: Dict[str, Any]) -> Optional[List[bytes]]:
+        """Splice the changed top-level values into an existing file's bytes.
+
+        The splice is only done when it provably yields ``data``: the cached
+        document must match the file's current bytes, have the same top-level
+        keys as ``data`` (each appearing once in the file), and every value
+        not being replaced must be equal to the one in ``data``.
+
+        Args:
+            target: Path to output file
+            data: Data to write
+
+        Returns:
+            Chunks of the new file contents (empty if nothing changed), or
+            None if the whole document must be re-serialized
+        """
+        cached = self.cache.peek(target) if isinstance(data, dict) else None
+        if cached is None:
+            return None
+        document, raw = cached
+        if not isinstance(document, dict) or document.keys() != data.keys():
+            return None
+
+        changed = {
+            key: value
+            for key, value in data.items()
+            if value is not document[key] and value != document[key]
+        }
+        if not changed:
+            return []
+
+        try:
+            spans = top_level_spans(raw)
+        except ValueError:
+            return None
+        if len(spans) != len(document):
+            return None  # Duplicate keys
+
+        chunks: List[bytes] = []
+        pos = 0
+        for key, start, end in spans:
+            if key in changed:
+                chunks.append(raw[pos:start])
+                chunks.append(_render_member_value(raw, start, changed[key]))
+                pos = end
+        chunks.append(raw[pos:])
+        return chunks
+
+
+def _render_member_value(raw: bytes, start: int, value: Any) -> bytes:
+    """Serialize a top-level value in the layout of the file it goes into.
+
+    Args:
+        raw: Original file contents
+        start: Offset of the value being replaced
+        value: New value
+
+    Returns:
+        Encoded value, indented to match its member line in pretty-printed
+        files and on a single line otherwise
+    """
+    line = raw[raw.rfind(b"\n", 0, start) + 1 : start]
+    stripped = line.lstrip(b" \t")
+    indent = line[: len(line) - len(stripped)]
+    if not indent or not stripped.startswith(b'"'):
+        return json.dumps(value).encode("utf-8")
+
+    # A top-level member is indented by exactly one indentation unit
+    unit = indent.decode("ascii")
+    rendered = json.dumps(value, indent=unit).replace("\n", "\n" + unit)
+    return rendered.encode("utf-8")
+
+
+# Unknown keywords are ignored by JSON Schema validators
+SCHEMA_SOURCE_HASH_KEY = "x-mcpi-source-sha256"
+
+# Compiled validators keyed by (schema path, schema mtime_ns)
+_schema_validators: Dict[Tuple[str, int], Any] = {}
+
+
+def load_schema(schema_path: Path) -> Dict[str, Any]:
+    """Load a JSON schema, preferring its precompiled JSON form.
+
+    YAML schemas ship with a ``.json`` sibling generated by compile_schema().
+    The sibling records the SHA-256 of the YAML it was compiled from and is
+    only used while that still matches, so an edited YAML schema is never
+    shadowed by a stale compiled copy.
+
+    Args:
+        schema_path: Path to the schema (YAML or JSON)
+
+    Returns:
+        Parsed schema
+    """
+    if schema_path.suffix == ".json":
+        with schema_path.open("r", encoding="utf-8") as f:
+            return json.load(f)
+
+    source = schema_path.read_bytes()
+    source_hash = hashlib.sha256(source).hexdigest()
+    compiled = schema_path.with_suffix(".json")
+    try:
+        with compiled.open("r", encoding="utf-8") as f:
+            schema = json.load(f)
+        if schema.get(SCHEMA_SOURCE_HASH_KEY) == source_hash:
+            return schema
+    except (OSError, ValueError):
+        pass
+
+    return yaml.safe_load(source)
+
+
+def compile_schema(schema_path: Path) -> Path:
+    """Write the precompiled JSON form of a YAML schema next to it.
+
+    Args:
+        schema_path: Path to the YAML schema
+
+    Returns:
+        Path of the written JSON file
+    """
+    source = schema_path.read_bytes()
+    schema = yaml.safe_load(source)
+    schema[SCHEMA_SOURCE_HASH_KEY] = hashlib.sha256(source).hexdigest()
+
+    compiled = schema_path.with_suffix(".json")
+    with compiled.open("w", encoding="utf-8") as f:
+        json.dump(schema, f, indent=2)
+        f.write("\n")
+    return compiled
+
+
+def get_schema_validator(schema_path: Path) -> Any:
+    """Get a compiled validator for a schema file.
+
+    The schema is loaded, checked against its metaschema and compiled once per
+    process (and again only if the schema file changes).
+
+    Args:
+        schema_path: Path to the schema file
+
+    Returns:
+        jsonschema validator instance (e.g. Draft7Validator)
+
+    Raises:
+        OSError: If the schema cannot be read
+        jsonschema.exceptions.SchemaError: If the schema itself is invalid
+    """
+    key = (str(schema_path.resolve()), schema_path.stat().st_mtime_ns)
+    validator = _schema_validators.get(key)
+    if validator is None:
+        schema = load_schema(schema_path)
+        validator_class = validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+        _schema_validators[key] = validator
+    return validator
 
 
 class YAMLSchemaValidator:
-    """YAML-based JSON schema validator."""
+    """YAML-based JSON schema validator.
+
+    Compiled validators are shared process-wide (see get_schema_validator), so
+    repeated validations against the same schema don't re-read or re-check it.
+    """
 
     def __init__(self) -> None:
         """Initialize validator."""
@@ -94,18 +443,58 @@ class YAMLSchemaValidator:
             return False
 
         try:
-            with schema_path.open("r", encoding="utf-8") as f:
-                schema = yaml.safe_load(f)
+            validator = get_schema_validator(schema_path)
+            error = best_match(validator.iter_errors(data))
+        except Exception as e:
+            self._errors.append(f"Schema validation failed: {e}")
+            return False
 
-            validate(instance=data, schema=schema)
-            return True
-        except ValidationError as e:
-            self._errors.append(f"Validation error: {e.message}")
+        if error is not None:
+            self._errors.append(f"Validation error: {error.message}")
+            return False
+        return True
+
+    def validate_entry(
+        self,
+        collection: str,
+        entry_id: str,
+        entry: Dict[str, Any],
+        schema_path: Path,
+    ) -> bool:
+        """Validate a single collection entry against its subschema.
+
+        Constraints on the collection as a whole (e.g. maxProperties) are not
+        checked; use validate() for that.
+
+        Args:
+            collection: Top-level key holding the entry (e.g. "mcpServers")
+            entry_id: Key of the entry within the collection
+            entry: Entry data
+            schema_path: Path to YAML schema file
+
+        Returns:
+            True if validation passes, False otherwise
+        """
+        self._errors = []
+
+        if not schema_path.exists():
+            self._errors.append(f"Schema file not found: {schema_path}")
             return False
+
+        try:
+            validator = get_schema_validator(schema_path)
+            subschema = _property_subschema(validator.schema, collection)
+            entry_validator = validator.evolve(schema=subschema)
+            error = best_match(entry_validator.iter_errors({entry_id: entry}))
         except Exception as e:
             self._errors.append(f"Schema validation failed: {e}")
             return False
 
+        if error is not None:
+            self._errors.append(f"Validation error: {error.message}")
+            return False
+        return True
+
     def get_errors(self) -> List[str]:
         """Get validation errors from last validation attempt.
 
@@ -115,6 +504,30 @@ class YAMLSchemaValidator:
         return self._errors.copy()
 
 
+def _property_subschema(schema: Any, name: str) -> Any:
+    """Find the subschema that applies to a top-level property.
+
+    Args:
+        schema: Root schema
+        name: Property name
+
+    Returns:
+        Subschema (True if the property is unconstrained)
+    """
+    if not isinstance(schema, dict):
+        return schema
+
+    properties = schema.get("properties", {})
+    if name in properties:
+        return properties[name]
+
+    for pattern, subschema in schema.get("patternProperties", {}).items():
+        if re.search(pattern, name):
+            return subschema
+
+    return schema.get("additionalProperties", True)
+
+
 class CommandLineExecutor:
     """Command line executor implementation."""
 
@@ -159,6 +572,7 @@ class FileBasedScope(ScopeHandler):
         validator: Optional[SchemaValidator] = None,
         schema_path: Optional[Path] = None,
         enable_disable_handler: Optional[EnableDisableHandler] = None,
+        validated_files: Optional[ValidatedFiles] = None,
     ) -> None:
         """Initialize file-based scope handler.
 
@@ -169,6 +583,8 @@ class FileBasedScope(ScopeHandler):
             validator: Schema validator (optional)
             schema_path: Path to schema file (optional)
             enable_disable_handler: Handler for enable/disable operations (optional)
+            validated_files: Records of fully validated files (defaults to
+                the process-wide records in the user cache directory)
         """
         super().__init__(config)
 
@@ -181,14 +597,24 @@ class FileBasedScope(ScopeHandler):
         self.validator = validator
         self.schema_path = schema_path
         self.enable_disable_handler = enable_disable_handler
+        self.validated_files = validated_files or get_validated_files()
+        # Fingerprint of the file as last written after a successful full
+        # validation (also recorded in validated_files); while it still
+        # matches, edits only validate their entry
+        self._validated_fingerprint: Optional[FileFingerprint] = None
+        # Pending session document last written after validation (compared
+        # by identity; the file itself is only written on commit)
+        self._validated_pending: Optional[Dict[str, Any]] = None
+        self._record_key: Optional[str] = None
 
     def exists(self) -> bool:
         """Check if configuration file exists.
 
         Returns:
-            True if file exists, False otherwise
+            True if file exists (or is created by a pending session write),
+            False otherwise
         """
-        return self.path.exists()
+        return path_exists(self.path)
 
     def get_servers(self) -> Dict[str, Dict[str, Any]]:
         """Get all servers from this scope.
@@ -204,8 +630,13 @@ class FileBasedScope(ScopeHandler):
             return {}
 
         try:
-            # Get servers from active file
-            data = self.reader.read(self.path)
+            # Get servers from active file, decoding only the keys mcpi owns
+            # when the reader supports it
+            read_keys = getattr(self.reader, "read_keys", None)
+            if read_keys is not None:
+                data = read_keys(self.path)
+            else:
+                data = self.reader.read(self.path)
             servers = data.get("mcpServers", {})
 
             # If using FileMoveEnableDisableHandler, also include disabled servers
@@ -242,6 +673,102 @@ class FileBasedScope(ScopeHandler):
         server_data = servers[server_id]
         return server_data
 
+    def _validate_server_change(
+        self,
+        data: Dict[str, Any],
+        server_id: str,
+        fingerprint: Optional[FileFingerprint],
+    ) -> bool:
+        """Validate a document in which only one mcpServers entry changed.
+
+        If the file is unchanged since it was last fully validated (same
+        fingerprint as when mcpi last wrote it, in this process or an earlier
+        one), only the changed entry is checked against its subschema.
+        Otherwise the whole document is validated, e.g. on the first edit of
+        a file or after it was modified externally.
+
+        Args:
+            data: Updated document
+            server_id: ID of the changed server entry
+            fingerprint: Fingerprint of the file when ``data`` was read
+
+        Returns:
+            True if validation passes, False otherwise
+        """
+        validate_entry = getattr(self.validator, "validate_entry", None)
+        if validate_entry is not None and self._is_validated(fingerprint):
+            return validate_entry(
+                "mcpServers", server_id, data["mcpServers"][server_id], self.schema_path
+            )
+
+        return self.validator.validate(data, self.schema_path)
+
+    def _is_validated(self, fingerprint: Optional[FileFingerprint]) -> bool:
+        """Check whether the file is unchanged since it last passed full
+        validation.
+
+        Args:
+            fingerprint: Current fingerprint of the file
+
+        Returns:
+            True if the fingerprint matches the one remembered by this scope
+            or recorded in validated_files; inside a session with a pending
+            write to the file, True if this scope validated that write
+        """
+        buffer = get_active_buffer()
+        pending = buffer.get(self.path) if buffer else None
+        if pending is not None:
+            return pending is self._validated_pending
+        if fingerprint is None:
+            return False
+        if fingerprint == self._validated_fingerprint:
+            return True
+        key = self._validation_record_key()
+        return key is not None and fingerprint == self.validated_files.get(key)
+
+    def _validation_record_key(self) -> Optional[str]:
+        """Get the validated_files key of this scope's file and schema.
+
+        Returns:
+            Record key, or None without a readable schema
+        """
+        if self._record_key is None and self.validator and self.schema_path:
+            try:
+                schema = self.schema_path.read_bytes()
+            except OSError:
+                return None
+            validator_type = type(self.validator)
+            self._record_key = record_key(
+                self.path,
+                schema,
+                f"{validator_type.__module__}.{validator_type.__qualname__}",
+            )
+        return self._record_key
+
+    def _write_validated(self, data: Dict[str, Any]) -> None:
+        """Write a validated document and remember its new fingerprint.
+
+        Args:
+            data: Document that passed validation
+        """
+        buffer = get_active_buffer()
+        if buffer is not None:
+            # The file is only written on commit; its contents are unchanged
+            self.writer.write(self.path, data)
+            if self.validator and self.schema_path:
+                self._validated_pending = buffer.get(self.path)
+            return
+
+        self._validated_fingerprint = None
+        self.writer.write(self.path, data)
+        if self.validator and self.schema_path:
+            fingerprint = FileFingerprint.of(self.path)
+            self._validated_fingerprint = fingerprint
+            key = self._validation_record_key()
+            if fingerprint and key:
+                self.validated_files.record(key, fingerprint)
+
+    @locked_update("path")
     def add_server(self, server_id: str, config: ServerConfig) -> OperationResult:
         """Add a server to this scope.
 
@@ -254,6 +781,7 @@ class FileBasedScope(ScopeHandler):
         """
         try:
             # Load existing data or create new structure
+            fingerprint = FileFingerprint.of(self.path)
             data = self.reader.read(self.path) if self.exists() else {}
 
             if "mcpServers" not in data:
@@ -270,14 +798,14 @@ class FileBasedScope(ScopeHandler):
 
             # Validate against schema if available
             if self.validator and self.schema_path:
-                if not self.validator.validate(data, self.schema_path):
+                if not self._validate_server_change(data, server_id, fingerprint):
                     errors = self.validator.get_errors()
                     return OperationResult.failure_result(
                         f"Schema validation failed: {'; '.join(errors)}", errors=errors
                     )
 
             # Write the updated configuration
-            self.writer.write(self.path, data)
+            self._write_validated(data)
 
             return OperationResult.success_result(
                 f"Added server '{server_id}' to scope '{self.config.name}'",
@@ -291,6 +819,7 @@ class FileBasedScope(ScopeHandler):
                 f"Failed to add server: {e}", errors=[str(e)]
             )
 
+    @locked_update("path")
     def remove_server(self, server_id: str) -> OperationResult:
         """Remove a server from this scope.
 
@@ -306,6 +835,7 @@ class FileBasedScope(ScopeHandler):
             )
 
         try:
+            fingerprint = FileFingerprint.of(self.path)
             data = self.reader.read(self.path)
 
             if "mcpServers" not in data or server_id not in data["mcpServers"]:
@@ -316,8 +846,12 @@ class FileBasedScope(ScopeHandler):
             # Remove the server
             del data["mcpServers"][server_id]
 
-            # Write the updated configuration
-            self.writer.write(self.path, data)
+            # Write the updated configuration; removing an entry keeps a
+            # previously validated document valid
+            if self._is_validated(fingerprint):
+                self._write_validated(data)
+            else:
+                self.writer.write(self.path, data)
 
             return OperationResult.success_result(
                 f"Removed server '{server_id}' from scope '{self.config.name}'",
@@ -331,6 +865,7 @@ class FileBasedScope(ScopeHandler):
                 f"Failed to remove server: {e}", errors=[str(e)]
             )
 
+    @locked_update("path")
     def update_server(self, server_id: str, config: ServerConfig) -> OperationResult:
         """Update an existing server configuration.
 
@@ -347,6 +882,7 @@ class FileBasedScope(ScopeHandler):
             )
 
         try:
+            fingerprint = FileFingerprint.of(self.path)
             data = self.reader.read(self.path)
 
             if "mcpServers" not in data or server_id not in data["mcpServers"]:
@@ -359,14 +895,14 @@ class FileBasedScope(ScopeHandler):
 
             # Validate against schema if available
             if self.validator and self.schema_path:
-                if not self.validator.validate(data, self.schema_path):
+                if not self._validate_server_change(data, server_id, fingerprint):
                     errors = self.validator.get_errors()
                     return OperationResult.failure_result(
                         f"Schema validation failed: {'; '.join(errors)}", errors=errors
                     )
 
             # Write the updated configuration
-            self.writer.write(self.path, data)
+            self._write_validated(data)
 
             return OperationResult.success_result(
                 f"Updated server '{server_id}' in scope '{self.config.name}'",
@@ -0,0 +1,387 @@
+"""Advisory file locks and optimistic concurrency for config file edits.
+
+Several mcpi processes (e.g. ``mcpi sync`` run from parallel tooling hooks)
+may edit the same config file. Every read-modify-write runs under an
+exclusive ``fcntl`` lock taken for that file only, so cooperating processes
+take turns per file instead of serializing through one global lock.
+
+Writers that do not take the lock (Claude Code itself, editors) are caught by
+an optimistic check: the fingerprints of the files an operation may write
+are recorded when it starts, and atomic_files compares them right before
+every write. On a mismatch the write is refused with WriteConflict and the
+whole operation is retried on the fresh contents.
+
+Lock files live in a per-user directory rather than next to the config
+files, so project directories are not littered, and are never deleted:
+removing a lock file while another process waits on it would let two
+processes hold the lock at once. Where ``fcntl`` is unavailable (Windows),
+or the wait exceeds its bound, operations run without the lock and rely on
+the optimistic check alone.
+"""
+
+import functools
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+import time
+from contextlib import ExitStack, contextmanager
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, TypeVar
+
+from .document_cache import FileFingerprint
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+# Longest time to wait for another process to release a file's lock
+LOCK_TIMEOUT_SECONDS = 10.0
+# Attempts of an operation whose write hit a concurrent change
+MAX_ATTEMPTS = 3
+
+_POLL_INITIAL = 0.001
+_POLL_MAX = 0.05
+
+
+class WriteConflict(OSError):
+    """A file changed between the start of an operation and its write."""
+
+
+class _Expectations:
+    """Fingerprints an operation expects its files to still have."""
+
+    def __init__(
+        self,
+        fingerprints: Dict[str, Optional[FileFingerprint]],
+        parent: Optional["_Expectations"],
+    ) -> None:
+        self.fingerprints = fingerprints
+        self.parent = parent
+        self.conflicted = False
+
+
+_expectations: ContextVar[Optional[_Expectations]] = ContextVar(
+    "mcpi_write_expectations", default=None
+)
+
+
+class _LockStats:
+    """Process-wide lock counters."""
+
+    def __init__(self) -> None:
+        self._mutex = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._mutex:
+            self.acquisitions = 0
+            self.contended = 0
+            self.timeouts = 0
+            self.conflicts = 0
+            self.wait_seconds = 0.0
+            self.max_wait_seconds = 0.0
+
+    def record_wait(self, waited: float, contended: bool, acquired: bool) -> None:
+        with self._mutex:
+            if acquired:
+                self.acquisitions += 1
+            else:
+                self.timeouts += 1
+            if contended:
+                self.contended += 1
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+
+    def record_conflict(self) -> None:
+        with self._mutex:
+            self.conflicts += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._mutex:
+            return {
+                "acquisitions": self.acquisitions,
+                "contended": self.contended,
+                "timeouts": self.timeouts,
+                "conflicts": self.conflicts,
+                "wait_seconds": self.wait_seconds,
+                "max_wait_seconds": self.max_wait_seconds,
+            }
+
+
+_stats = _LockStats()
+_held = threading.local()
+
+
+def lock_stats() -> Dict[str, Any]:
+    """Get lock metrics for this process.
+
+    Returns:
+        Dictionary with ``acquisitions``, ``contended`` (acquisitions that had
+        to wait), ``timeouts`` (waits that gave up), ``conflicts`` (operations
+        retried after a concurrent change), ``wait_seconds`` (total time spent
+        waiting for locks) and ``max_wait_seconds``
+    """
+    return _stats.snapshot()
+
+
+def reset_lock_stats() -> None:
+    """Reset the lock metrics."""
+    _stats.reset()
+
+
+@contextmanager
+def file_lock(*paths: Path, timeout: float = LOCK_TIMEOUT_SECONDS) -> Iterator[None]:
+    """Hold exclusive advisory locks on files.
+
+    Locks are taken in a fixed order, so concurrent multi-file operations
+    cannot deadlock, and are re-entrant within a thread.
+
+    Args:
+        *paths: Files to lock (they need not exist)
+        timeout: Longest time to wait for each lock; after that the block
+            runs without it
+
+    Yields:
+        None while the locks are held
+    """
+    keys = sorted({_key(path) for path in paths})
+    with ExitStack() as stack:
+        for key in keys:
+            stack.enter_context(_lock_one(key, timeout))
+        yield
+
+
+def run_locked(
+    paths: Any,
+    operation: Callable[[], R],
+    attempts: int = MAX_ATTEMPTS,
+    prepare: Optional[Callable[[], Any]] = None,
+) -> R:
+    """Run a read-modify-write operation under the files' locks.
+
+    The operation is retried if one of its writes is refused because the
+    file changed since the attempt started. The last attempt's result is
+    returned even if it conflicted (the operation reports the failure).
+
+    Args:
+        paths: Files the operation reads and writes
+        operation: Callable performing the whole read-modify-write
+        attempts: Maximum number of attempts
+        prepare: Callable run once under the locks before the first
+            attempt (e.g. journal recovery); its writes are not conflicts
+
+    Returns:
+        The operation's result
+
+    Raises:
+        WriteConflict: If the last attempt let a conflict propagate
+    """
+    paths = list(paths)
+    with file_lock(*paths):
+        if prepare is not None:
+            prepare()
+        for attempt in range(1, attempts + 1):
+            with expect_unchanged(
+                {path: FileFingerprint.of(path) for path in paths}
+            ) as expectations:
+                try:
+                    result = operation()
+                except WriteConflict:
+                    if attempt == attempts:
+                        raise
+                    _retrying(paths, attempt)
+                    continue
+            if not expectations.conflicted or attempt == attempts:
+                return result
+            _retrying(paths, attempt)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def locked_update(
+    *path_attributes: str, prepare: Optional[str] = None
+) -> Callable[[Callable[..., R]], Callable[..., R]]:
+    """Decorate a read-modify-write method to run through run_locked().
+
+    Args:
+        *path_attributes: Names of the instance attributes holding the files
+            the method reads and writes
+        prepare: Name of a method to pass as run_locked()'s ``prepare``
+
+    Returns:
+        Method decorator
+    """
+
+    def decorator(method: Callable[..., R]) -> Callable[..., R]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> R:
+            paths = [getattr(self, name) for name in path_attributes]
+            return run_locked(
+                paths,
+                lambda: method(self, *args, **kwargs),
+                prepare=getattr(self, prepare) if prepare else None,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+@contextmanager
+def expect_unchanged(
+    fingerprints: Dict[Path, Optional[FileFingerprint]],
+) -> Iterator[_Expectations]:
+    """Refuse writes to files that no longer have the given fingerprints.
+
+    Args:
+        fingerprints: Expected fingerprint (None: file absent) by file
+
+    Yields:
+        The expectations; ``conflicted`` is set when a write was refused
+    """
+    expectations = _Expectations(
+        {_key(path): fingerprint for path, fingerprint in fingerprints.items()},
+        _expectations.get(),
+    )
+    token = _expectations.set(expectations)
+    try:
+        yield expectations
+    finally:
+        _expectations.reset(token)
+
+
+def check_unchanged(path: Path) -> None:
+    """Check a file against the active expectations before writing it.
+
+    Args:
+        path: File about to be written
+
+    Raises:
+        WriteConflict: If the file changed since the operation started
+    """
+    key = _key(path)
+    expectations = _expectations.get()
+    while expectations is not None:
+        if key in expectations.fingerprints:
+            if FileFingerprint.of(Path(key)) != expectations.fingerprints[key]:
+                expectations.conflicted = True
+                raise WriteConflict(f"{path} was changed by another process")
+            return
+        expectations = expectations.parent
+
+
+def note_written(path: Path) -> None:
+    """Record that the current operation wrote a file itself.
+
+    Args:
+        path: File just written
+    """
+    key = _key(path)
+    expectations = _expectations.get()
+    fingerprint = None
+    while expectations is not None:
+        if key in expectations.fingerprints:
+            if fingerprint is None:
+                fingerprint = FileFingerprint.of(Path(key))
+            expectations.fingerprints[key] = fingerprint
+        expectations = expectations.parent
+
+
+def _retrying(paths: Any, attempt: int) -> None:
+    _stats.record_conflict()
+    logger.debug(
+        "Concurrent change to %s, retrying (attempt %d)",
+        ", ".join(str(path) for path in paths),
+        attempt + 1,
+    )
+
+
+@contextmanager
+def _lock_one(key: str, timeout: float) -> Iterator[None]:
+    held: Dict[str, int] = _held.__dict__.setdefault("counts", {})
+    if held.get(key):
+        held[key] += 1
+        try:
+            yield
+        finally:
+            held[key] -= 1
+        return
+
+    fd = _acquire(key, timeout)
+    held[key] = 1
+    try:
+        yield
+    finally:
+        held[key] = 0
+        if fd is not None:
+            os.close(fd)  # Releases the lock
+
+
+def _acquire(key: str, timeout: float) -> Optional[int]:
+    """Lock a file's lock file; None if locking is unavailable or timed out."""
+    lock_dir = _lock_dir()
+    if fcntl is None or lock_dir is None:
+        return None
+
+    name = hashlib.sha256(key.encode("utf-8")).hexdigest()[:32] + ".lock"
+    try:
+        fd = os.open(lock_dir / name, os.O_RDWR | os.O_CREAT | os.O_CLOEXEC, 0o600)
+    except OSError:
+        return None
+
+    start = time.monotonic()
+    delay = _POLL_INITIAL
+    contended = False
+    while True:
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            contended = True
+            waited = time.monotonic() - start
+            if waited >= timeout:
+                os.close(fd)
+                _stats.record_wait(waited, contended, acquired=False)
+                logger.warning(
+                    "Timed out after %.1fs waiting for the lock on %s; "
+                    "continuing without it",
+                    waited,
+                    key,
+                )
+                return None
+            time.sleep(min(delay, timeout - waited))
+            delay = min(delay * 2, _POLL_MAX)
+            continue
+        except OSError:
+            os.close(fd)
+            return None
+        _stats.record_wait(time.monotonic() - start, contended, acquired=True)
+        return fd
+
+
+@functools.lru_cache(maxsize=1)
+def _lock_dir() -> Optional[Path]:
+    """Per-user lock directory, or None if it cannot be used safely."""
+    if fcntl is None:
+        return None
+    lock_dir = Path(tempfile.gettempdir()) / f"mcpi-locks-{os.getuid()}"
+    try:
+        lock_dir.mkdir(mode=0o700, exist_ok=True)
+        st = os.lstat(lock_dir)
+    except OSError:
+        return None
+    # Refuse a directory (or symlink) planted by another user
+    if st.st_uid != os.getuid() or not os.path.isdir(lock_dir) or lock_dir.is_symlink():
+        logger.warning("Not using lock directory %s: not owned by this user", lock_dir)
+        return None
+    return lock_dir
+
+
+def _key(path: Path) -> str:
+    return os.path.realpath(os.path.expanduser(path))
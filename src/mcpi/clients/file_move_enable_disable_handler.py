@@ -15,9 +15,13 @@ tracks disabled server IDs. This handler actually moves the full configuration.
 """
 
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from .atomic_files import recover_journal
+from .file_lock import file_lock, locked_update
 from .protocols import ConfigReader, ConfigWriter
+from .session import path_exists
+from .types import ServerState
 
 
 class FileMoveEnableDisableHandler:
@@ -38,6 +42,13 @@ class FileMoveEnableDisableHandler:
     2. Remove it from disabled file's mcpServers
     3. Add it to active file's mcpServers
     4. Write both files
+
+    Both files are written as one journaled change when the writer supports
+    it (JSONFileWriter.write_many), so a crash between the two writes can
+    neither lose nor duplicate the server: the move is finished or undone
+    the next time the files are read or changed. Recovery only runs under
+    both files' locks, since a journal seen without them may belong to a
+    move another process is making right now.
     """
 
     def __init__(
@@ -59,6 +70,9 @@ class FileMoveEnableDisableHandler:
         self.disabled_file_path = disabled_file_path
         self.reader = reader
         self.writer = writer
+        self.journal_path = disabled_file_path.with_name(
+            f".{disabled_file_path.name}.journal"
+        )
 
     def is_disabled(self, server_id: str) -> bool:
         """Check if a server is disabled.
@@ -71,7 +85,8 @@ class FileMoveEnableDisableHandler:
         Returns:
             True if server is in disabled file
         """
-        if not self.disabled_file_path.exists():
+        self._recover_before_read()
+        if not path_exists(self.disabled_file_path):
             return False
 
         try:
@@ -81,6 +96,24 @@ class FileMoveEnableDisableHandler:
         except Exception:
             return False
 
+    def resolve_states(self, server_ids: Iterable[str]) -> Dict[str, ServerState]:
+        """Resolve states for many servers with a single read of the disabled file.
+
+        Args:
+            server_ids: Server identifiers
+
+        Returns:
+            Dictionary mapping server IDs to ENABLED or DISABLED
+        """
+        disabled = self.get_disabled_servers()
+        return {
+            server_id: (
+                ServerState.DISABLED if server_id in disabled else ServerState.ENABLED
+            )
+            for server_id in server_ids
+        }
+
+    @locked_update("active_file_path", "disabled_file_path", prepare="_recover")
     def disable_server(self, server_id: str) -> bool:
         """Disable a server by MOVING its config from active to disabled file.
 
@@ -92,7 +125,7 @@ class FileMoveEnableDisableHandler:
         """
         try:
             # Step 1: Read active file
-            if not self.active_file_path.exists():
+            if not path_exists(self.active_file_path):
                 return False  # Can't disable if active file doesn't exist
 
             active_data = self.reader.read(self.active_file_path)
@@ -110,7 +143,7 @@ class FileMoveEnableDisableHandler:
             active_data["mcpServers"] = active_servers
 
             # Step 5: Read or create disabled file
-            if self.disabled_file_path.exists():
+            if path_exists(self.disabled_file_path):
                 disabled_data = self.reader.read(self.disabled_file_path)
             else:
                 disabled_data = {"mcpServers": {}}
@@ -122,8 +155,7 @@ class FileMoveEnableDisableHandler:
             disabled_data["mcpServers"] = disabled_servers
 
             # Step 7: Write both files
-            self.writer.write(self.active_file_path, active_data)
-            self.writer.write(self.disabled_file_path, disabled_data)
+            self._write_both(active_data, disabled_data)
 
             return True
 
@@ -132,6 +164,7 @@ class FileMoveEnableDisableHandler:
             print(f"Error disabling server '{server_id}': {e}")
             return False
 
+    @locked_update("active_file_path", "disabled_file_path", prepare="_recover")
     def enable_server(self, server_id: str) -> bool:
         """Enable a server by MOVING its config from disabled to active file.
 
@@ -143,7 +176,7 @@ class FileMoveEnableDisableHandler:
         """
         try:
             # Step 1: Read disabled file
-            if not self.disabled_file_path.exists():
+            if not path_exists(self.disabled_file_path):
                 return False  # Can't enable if disabled file doesn't exist
 
             disabled_data = self.reader.read(self.disabled_file_path)
@@ -161,7 +194,7 @@ class FileMoveEnableDisableHandler:
             disabled_data["mcpServers"] = disabled_servers
 
             # Step 5: Read active file
-            if self.active_file_path.exists():
+            if path_exists(self.active_file_path):
                 active_data = self.reader.read(self.active_file_path)
             else:
                 # Should not happen in practice, but handle gracefully
@@ -174,8 +207,7 @@ class FileMoveEnableDisableHandler:
             active_data["mcpServers"] = active_servers
 
             # Step 7: Write both files
-            self.writer.write(self.active_file_path, active_data)
-            self.writer.write(self.disabled_file_path, disabled_data)
+            self._write_both(active_data, disabled_data)
 
             return True
 
@@ -184,6 +216,40 @@ class FileMoveEnableDisableHandler:
             print(f"Error enabling server '{server_id}': {e}")
             return False
 
+    def _recover(self) -> None:
+        """Finish or undo a move interrupted by a crash.
+
+        Must only be called while holding both files' locks.
+        """
+        recover_journal(self.journal_path)
+
+    def _recover_before_read(self) -> None:
+        """Recover an interrupted move before reading the files."""
+        if self.journal_path.exists():
+            with file_lock(self.active_file_path, self.disabled_file_path):
+                self._recover()
+
+    def _write_both(
+        self, active_data: Dict[str, Any], disabled_data: Dict[str, Any]
+    ) -> None:
+        """Write the active and disabled files as a single change.
+
+        Args:
+            active_data: New contents of the active file
+            disabled_data: New contents of the disabled file
+        """
+        writes = [
+            (self.active_file_path, active_data),
+            (self.disabled_file_path, disabled_data),
+        ]
+        write_many = getattr(self.writer, "write_many", None)
+        if write_many is not None:
+            write_many(writes, self.journal_path)
+            return
+
+        for path, data in writes:
+            self.writer.write(path, data)
+
     def get_disabled_servers(self) -> Dict[str, Any]:
         """Get all servers from the disabled file.
 
@@ -192,7 +258,8 @@ class FileMoveEnableDisableHandler:
         Returns:
             Dictionary mapping server IDs to their configurations
         """
-        if not self.disabled_file_path.exists():
+        self._recover_before_read()
+        if not path_exists(self.disabled_file_path):
             return {}
 
         try:
@@ -0,0 +1,122 @@
+"""In-memory index over a single scan of installed servers."""
+
+from typing import Dict, Iterator, List, Optional
+
+from .types import ServerInfo, ServerState
+
+
+class InventoryIndex:
+    """Lookup tables built from one ``list_servers()`` scan.
+
+    Answers "where is server X", "what is in scope Y" and "which servers are in
+    state Z" in O(1) instead of listing every scope and scanning the results
+    for each query. The index is a snapshot: owners must drop it when they
+    mutate configuration (see MCPManager.invalidate_inventory).
+    """
+
+    def __init__(self, servers: Dict[str, ServerInfo]) -> None:
+        """Build the index.
+
+        Args:
+            servers: Mapping of qualified server IDs to server information, in
+                scope priority order (as returned by list_servers)
+        """
+        self._servers: Dict[str, ServerInfo] = dict(servers)
+        self._by_id: Dict[str, List[ServerInfo]] = {}
+        self._by_scope: Dict[str, List[str]] = {}
+        self._by_state: Dict[ServerState, List[str]] = {}
+
+        for info in self._servers.values():
+            self._by_id.setdefault(info.id, []).append(info)
+            self._by_scope.setdefault(info.scope, []).append(info.id)
+            self._by_state.setdefault(info.state, []).append(info.id)
+
+    @property
+    def servers(self) -> Dict[str, ServerInfo]:
+        """All indexed servers keyed by qualified ID."""
+        return dict(self._servers)
+
+    def get(self, server_id: str) -> List[ServerInfo]:
+        """Get every installation of a server, in scope priority order.
+
+        Args:
+            server_id: Server identifier
+
+        Returns:
+            List of server information (empty if not installed)
+        """
+        return list(self._by_id.get(server_id, []))
+
+    def first(self, server_id: str) -> Optional[ServerInfo]:
+        """Get the highest-priority installation of a server.
+
+        Args:
+            server_id: Server identifier or qualified ID
+
+        Returns:
+            Server information if found, None otherwise
+        """
+        infos = self._by_id.get(server_id)
+        if infos:
+            return infos[0]
+        return self._servers.get(server_id)
+
+    def scopes_for(self, server_id: str) -> List[str]:
+        """Get the names of all scopes containing a server.
+
+        Args:
+            server_id: Server identifier
+
+        Returns:
+            List of scope names in priority order
+        """
+        return [info.scope for info in self._by_id.get(server_id, [])]
+
+    def ids_in_scope(self, scope: str) -> List[str]:
+        """Get the IDs of all servers in a scope.
+
+        Args:
+            scope: Scope name
+
+        Returns:
+            List of server IDs
+        """
+        return list(self._by_scope.get(scope, []))
+
+    def ids_with_state(self, state: ServerState) -> List[str]:
+        """Get the IDs of all servers in a given state.
+
+        Args:
+            state: Server state
+
+        Returns:
+            List of server IDs (a server may appear once per scope)
+        """
+        return list(self._by_state.get(state, []))
+
+    def get_state(self, server_id: str, scope: Optional[str] = None) -> ServerState:
+        """Get the state of a server's highest-priority installation.
+
+        Args:
+            server_id: Server identifier
+            scope: Only consider the installation in this scope
+
+        Returns:
+            Server state, or NOT_INSTALLED if the server is not indexed
+        """
+        if scope is not None:
+            for info in self._by_id.get(server_id, []):
+                if info.scope == scope:
+                    return info.state
+            return ServerState.NOT_INSTALLED
+        info = self.first(server_id)
+        return info.state if info else ServerState.NOT_INSTALLED
+
+    def __contains__(self, server_id: object) -> bool:
+        return server_id in self._by_id
+
+    def __iter__(self) -> Iterator[ServerInfo]:
+        return iter(self._servers.values())
+
+    def __len__(self) -> int:
+        return len(self._servers)
@@ -0,0 +1,189 @@
+"""Extract selected top-level keys from a JSON object without parsing the rest.
+
+``~/.claude.json`` holds Claude Code's per-project history next to the handful
+of keys mcpi cares about, and can grow to tens of megabytes. Parsing it with
+``json.loads`` builds the object graph of the whole file just to reach
+``mcpServers``. The scanner here walks the top-level object over a bytes-like
+buffer (typically an ``mmap``), skips unwanted values with C-level regex
+matches instead of materializing them, and only decodes the requested values.
+The same walk reports the byte span of each top-level value, which lets
+JSONFileWriter splice a changed section into an otherwise untouched file.
+
+Skipping uses two equivalent patterns. The fast one finds the end of a string
+with a single-byte scan and treats a quote preceded by exactly one backslash
+as escaped; that is only ambiguous when a quote follows two or more
+backslashes, so values containing ``\\\\"`` are re-scanned with the exact
+(escape-by-escape) pattern.
+"""
+
+import json
+import re
+from typing import (
+    Any,
+    Collection,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    Union,
+)
+
+Buffer = Union[bytes, bytearray, Any]  # Any: mmap.mmap
+
+# Containers nested up to this depth are skipped by a single regex match;
+# deeper ones take one extra match per bracket.
+_NESTING = 6
+
+_WS = re.compile(rb"[ \t\n\r]*")
+_SCALAR = re.compile(rb"[^,}\] \t\n\r]+")
+_STRING = re.compile(rb'"[^"\\]*+(?:\\.[^"\\]*+)*+"', re.DOTALL)
+_FAST_STRING = re.compile(rb'"[^"]*+(?:(?<=[^\\]\\)"[^"]*+)*+"')
+_AMBIGUOUS_QUOTE = b'\\\\"'
+
+_UTF8_BOM = b"\xef\xbb\xbf"
+
+
+def _next_bracket(string: Pattern[bytes]) -> Pattern[bytes]:
+    """Build a pattern that consumes strings, scalars and shallow containers
+    and stops after the next bracket it cannot balance."""
+    atom = rb'[^"\[\]{}]++|' + string.pattern
+    container = rb"[\[{](?:" + atom + rb")*+[\]}]"
+    for _ in range(_NESTING - 1):
+        container = rb"[\[{](?:" + atom + rb"|" + container + rb")*+[\]}]"
+    return re.compile(rb"(?:" + atom + rb"|" + container + rb")*+([\[\]{}])", re.DOTALL)
+
+
+_NEXT_BRACKET = _next_bracket(_STRING)
+_FAST_NEXT_BRACKET = _next_bracket(_FAST_STRING)
+
+
+def extract_top_level(buf: Buffer, keys: Collection[str]) -> Dict[str, Any]:
+    """Decode only the given keys of a top-level JSON object.
+
+    Args:
+        buf: UTF-8 encoded JSON document (bytes, bytearray or mmap)
+        keys: Top-level keys to decode
+
+    Returns:
+        Mapping of the requested keys that are present to their decoded values
+        (for duplicate keys the last occurrence wins, as with json.loads)
+
+    Raises:
+        ValueError: If the document is not a JSON object or is structurally
+            malformed (the contents of skipped values are not checked)
+    """
+    wanted = set(keys)
+    return {
+        key: json.loads(buf[start:end])
+        for key, start, end in _members(buf)
+        if key in wanted
+    }
+
+
+def top_level_spans(buf: Buffer) -> List[Tuple[str, int, int]]:
+    """Locate the values of a top-level JSON object without decoding them.
+
+    Args:
+        buf: UTF-8 encoded JSON document (bytes, bytearray or mmap)
+
+    Returns:
+        ``(key, start, end)`` for every member in document order, where
+        ``buf[start:end]`` is the member's value
+
+    Raises:
+        ValueError: If the document is not a JSON object or is structurally
+            malformed (the contents of values are not checked)
+    """
+    return list(_members(buf))
+
+
+def _members(buf: Buffer) -> Iterator[Tuple[str, int, int]]:
+    """Yield ``(key, start, end)`` for each member of the top-level object."""
+    pos = _skip_ws(buf, 3 if buf[:3] == _UTF8_BOM else 0)
+    _expect(buf, pos, b"{")
+    pos = _skip_ws(buf, pos + 1)
+
+    if buf[pos : pos + 1] == b"}":
+        _finish(buf, pos + 1)
+        return
+
+    while True:
+        match = _STRING.match(buf, pos)
+        if match is None:
+            raise _error("Expecting property name enclosed in double quotes", pos)
+        key = json.loads(match.group())
+        pos = _skip_ws(buf, match.end())
+        _expect(buf, pos, b":")
+        start = _skip_ws(buf, pos + 1)
+        end = _skip_value(buf, start)
+        yield key, start, end
+
+        pos = _skip_ws(buf, end)
+        delimiter = buf[pos : pos + 1]
+        if delimiter == b"}":
+            _finish(buf, pos + 1)
+            return
+        if delimiter != b",":
+            raise _error("Expecting ',' delimiter", pos)
+        pos = _skip_ws(buf, pos + 1)
+
+
+def _skip_value(buf: Buffer, pos: int) -> int:
+    """Return the offset just past the JSON value starting at ``pos``."""
+    end = _scan_value(buf, pos, _FAST_STRING, _FAST_NEXT_BRACKET)
+    if end is not None and buf.find(_AMBIGUOUS_QUOTE, pos, end) == -1:
+        return end
+
+    end = _scan_value(buf, pos, _STRING, _NEXT_BRACKET)
+    if end is None:
+        raise _error("Malformed or unterminated value", pos)
+    return end
+
+
+def _scan_value(
+    buf: Buffer, pos: int, string: Pattern[bytes], next_bracket: Pattern[bytes]
+) -> Optional[int]:
+    first = buf[pos : pos + 1]
+    if not first:
+        return None
+
+    if first == b'"':
+        match = string.match(buf, pos)
+        return match.end() if match else None
+
+    if first not in (b"[", b"{"):
+        match = _SCALAR.match(buf, pos)
+        return match.end() if match else None
+
+    # Only brackets outside strings change the depth. Bracket kinds are not
+    # paired up here; json.loads checks that for the values that are kept.
+    depth = 1
+    pos += 1
+    while depth:
+        match = next_bracket.match(buf, pos)
+        if match is None:
+            return None
+        depth += 1 if match.group(1) in (b"[", b"{") else -1
+        pos = match.end()
+    return pos
+
+
+def _skip_ws(buf: Buffer, pos: int) -> int:
+    return _WS.match(buf, pos).end()
+
+
+def _expect(buf: Buffer, pos: int, token: bytes) -> None:
+    if buf[pos : pos + 1] != token:
+        raise _error(f"Expecting {token.decode()!r}", pos)
+
+
+def _finish(buf: Buffer, pos: int) -> None:
+    pos = _skip_ws(buf, pos)
+    if pos != len(buf):
+        raise _error("Extra data", pos)
+
+
+def _error(message: str, pos: int) -> ValueError:
+    return ValueError(f"{message}: byte {pos}")
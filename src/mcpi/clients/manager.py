@@ -1,9 +1,18 @@
 """Main MCP manager for unified client and server management."""
 
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
+from .inventory import InventoryIndex
 from .registry import ClientRegistry
+from .session import (
+    ManagerSession,
+    WriteBuffer,
+    activate,
+    deactivate,
+    get_active_buffer,
+)
 from .types import OperationResult, ServerConfig, ServerInfo, ServerState
 
 logger = logging.getLogger(__name__)
@@ -23,6 +32,8 @@ class MCPManager:
         """
         self.registry = registry
         self._default_client = default_client
+        # Per-client inventory snapshots, built lazily and dropped on mutation
+        self._inventories: Dict[str, InventoryIndex] = {}
 
         # Auto-detect default client if not specified
         if not self._default_client:
@@ -114,6 +125,71 @@ class MCPManager:
         """
         return self.registry.get_client_info(client_name)
 
+    def get_inventory(self, client_name: Optional[str] = None) -> InventoryIndex:
+        """Get the inventory index for a client, scanning its scopes once.
+
+        The index is reused by every lookup until the manager mutates
+        configuration (add/remove/enable/disable) or invalidate_inventory()
+        is called.
+
+        Args:
+            client_name: Optional client name (uses default if not specified)
+
+        Returns:
+            InventoryIndex (empty if the client is not available)
+        """
+        if client_name is None:
+            client_name = self._default_client
+
+        if not client_name or not self.registry.has_client(client_name):
+            return InventoryIndex({})
+
+        index = self._inventories.get(client_name)
+        if index is None:
+            client = self.registry.get_client(client_name)
+            index = InventoryIndex(client.list_servers())
+            self._inventories[client_name] = index
+        return index
+
+    def invalidate_inventory(self) -> None:
+        """Drop cached inventory snapshots so the next lookup rescans."""
+        self._inventories.clear()
+
+    @contextmanager
+    def session(self) -> Iterator[ManagerSession]:
+        """Group mutations into a unit of work that writes each file once.
+
+        Operations run through the session see each other's changes, but
+        their writes are buffered and flushed when the block exits normally;
+        if it raises, nothing is written, not even files the session would
+        create. Nested sessions join the outermost one.
+
+        Example:
+            with manager.session() as session:
+                for server_id, config in servers.items():
+                    session.add_server(server_id, config, "project-mcp")
+            results = session.results
+
+        Yields:
+            ManagerSession collecting one OperationResult per operation
+        """
+        outer = get_active_buffer()
+        if outer is not None:
+            yield ManagerSession(self, outer)
+            return
+
+        buffer = WriteBuffer()
+        session = ManagerSession(self, buffer)
+        token = activate(buffer)
+        try:
+            yield session
+        except BaseException:
+            self.invalidate_inventory()
+            raise
+        finally:
+            deactivate(token)
+        session.commit()
+
     def list_servers(
         self,
         client_name: Optional[str] = None,
@@ -180,8 +256,7 @@ class MCPManager:
                 return None
 
             try:
-                client = self.registry.get_client(client_name)
-                return client.get_server_info(server_id)
+                return self.get_inventory(client_name).first(server_id)
             except Exception as e:
                 logger.error(
                     f"Error getting server info from client '{client_name}': {e}"
@@ -189,9 +264,13 @@ class MCPManager:
                 return None
         else:
             # Search across all clients
-            all_servers = self.registry.list_all_servers()
-            for qualified_id, info in all_servers.items():
-                if info.id == server_id or qualified_id == server_id:
+            for name in self.registry.get_available_clients():
+                try:
+                    info = self.get_inventory(name).first(server_id)
+                except Exception as e:
+                    logger.error(f"Error getting server info from client '{name}': {e}")
+                    continue
+                if info:
                     return info
             return None
 
@@ -222,7 +301,9 @@ class MCPManager:
                 "No client specified and no default client available"
             )
 
-        return self.registry.add_server(client_name, server_id, config, scope)
+        result = self.registry.add_server(client_name, server_id, config, scope)
+        self.invalidate_inventory()
+        return result
 
     def remove_server(
         self, server_id: str, scope: str, client_name: Optional[str] = None
@@ -246,7 +327,9 @@ class MCPManager:
                 "No client specified and no default client available"
             )
 
-        return self.registry.remove_server(client_name, server_id, scope)
+        result = self.registry.remove_server(client_name, server_id, scope)
+        self.invalidate_inventory()
+        return result
 
     def enable_server(
         self,
@@ -279,8 +362,21 @@ class MCPManager:
 
         client = self.registry.get_client(client_name)
 
+        # Resolve the scope from the inventory rather than letting the client
+        # rescan every scope to find the server
+        if scope is None:
+            try:
+                info = self.get_inventory(client_name).first(server_id)
+            except Exception as e:
+                logger.debug(f"Inventory lookup failed for '{server_id}': {e}")
+                info = None
+            if info:
+                scope = info.scope
+
         # Call enable_server with optional scope parameter
-        return client.enable_server(server_id, scope)
+        result = client.enable_server(server_id, scope)
+        self.invalidate_inventory()
+        return result
 
     def disable_server(
         self,
@@ -313,17 +409,34 @@ class MCPManager:
 
         client = self.registry.get_client(client_name)
 
+        # Resolve the scope from the inventory rather than letting the client
+        # rescan every scope to find the server
+        if scope is None:
+            try:
+                info = self.get_inventory(client_name).first(server_id)
+            except Exception as e:
+                logger.debug(f"Inventory lookup failed for '{server_id}': {e}")
+                info = None
+            if info:
+                scope = info.scope
+
         # Call disable_server with optional scope parameter
-        return client.disable_server(server_id, scope)
+        result = client.disable_server(server_id, scope)
+        self.invalidate_inventory()
+        return result
 
     def get_server_state(
-        self, server_id: str, client_name: Optional[str] = None
+        self,
+        server_id: str,
+        client_name: Optional[str] = None,
+        scope: Optional[str] = None,
     ) -> ServerState:
         """Get the current state of a server.
 
         Args:
             server_id: Server identifier
             client_name: Optional client name (uses default if not specified)
+            scope: Optional scope (default: the highest-priority installation)
 
         Returns:
             Current server state
@@ -339,8 +452,7 @@ class MCPManager:
             return ServerState.NOT_INSTALLED
 
         try:
-            client = self.registry.get_client(client_name)
-            return client.get_server_state(server_id)
+            return self.get_inventory(client_name).get_state(server_id, scope)
         except Exception as e:
             logger.error(f"Error getting server state from client '{client_name}': {e}")
             return ServerState.NOT_INSTALLED
@@ -354,14 +466,19 @@ class MCPManager:
         Returns:
             Dictionary with client and scope information if found
         """
-        all_servers = self.registry.list_all_servers()
+        for client_name in self.registry.get_available_clients():
+            try:
+                infos = self.get_inventory(client_name).get(server_id)
+            except Exception as e:
+                logger.error(f"Failed to list servers from client '{client_name}': {e}")
+                continue
 
-        for qualified_id, info in all_servers.items():
-            if info.id == server_id:
+            if infos:
+                info = infos[0]
                 return {
                     "client": info.client,
                     "scope": info.scope,
-                    "qualified_id": qualified_id,
+                    "qualified_id": info.qualified_id,
                 }
 
         return None
@@ -390,8 +507,7 @@ class MCPManager:
             return []
 
         try:
-            client = self.registry.get_client(client_name)
-            scope_names = client.find_all_server_scopes(server_id)
+            scope_names = self.get_inventory(client_name).scopes_for(server_id)
 
             # Return as list of (client, scope) tuples
             return [(client_name, scope_name) for scope_name in scope_names]
@@ -494,6 +610,7 @@ class MCPManager:
         """Refresh the manager by reloading plugins and clients."""
         logger.info("Refreshing MCP manager")
         self.registry.refresh_plugins()
+        self.invalidate_inventory()
 
         # Re-detect default client if current one is no longer available
         if self._default_client not in self.registry.get_available_clients():
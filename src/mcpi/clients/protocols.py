@@ -1,7 +1,18 @@
 """Protocol definitions for type-safe interfaces."""
 
 from pathlib import Path
-from typing import Any, Dict, List, Protocol, runtime_checkable
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Protocol,
+    Tuple,
+    runtime_checkable,
+)
+
+from .types import ServerState
 
 
 @runtime_checkable
@@ -22,6 +33,23 @@ class ConfigReader(Protocol):
         """
         ...
 
+    def read_keys(
+        self, source: Path, keys: Optional[Tuple[str, ...]] = None
+    ) -> Dict[str, Any]:
+        """Read only some top-level keys of a configuration source.
+
+        Args:
+            source: Path to configuration source
+            keys: Top-level keys to read (reader-specific default if omitted)
+
+        Returns:
+            Mapping of the requested keys present in the source to their values
+
+        Raises:
+            ValueError: If source cannot be read
+        """
+        ...
+
 
 @runtime_checkable
 class ConfigWriter(Protocol):
@@ -59,6 +87,30 @@ class SchemaValidator(Protocol):
         """
         ...
 
+    def validate_entry(
+        self,
+        collection: str,
+        entry_id: str,
+        entry: Dict[str, Any],
+        schema_path: Path,
+    ) -> bool:
+        """Validate a single entry of a top-level collection.
+
+        Checks only ``{entry_id: entry}`` against the subschema of the
+        ``collection`` property (e.g. one server under "mcpServers"), so the
+        cost is proportional to the entry rather than the whole document.
+
+        Args:
+            collection: Top-level key holding the entry (e.g. "mcpServers")
+            entry_id: Key of the entry within the collection
+            entry: Entry data
+            schema_path: Path to schema file
+
+        Returns:
+            True if validation passes, False otherwise
+        """
+        ...
+
     def get_errors(self) -> List[str]:
         """Get validation errors from last validation attempt.
 
@@ -172,3 +224,17 @@ class EnableDisableHandler(Protocol):
             True if operation succeeded, False otherwise
         """
         ...
+
+    def resolve_states(self, server_ids: Iterable[str]) -> Dict[str, ServerState]:
+        """Resolve the state of many servers in one pass.
+
+        Implementations read each backing file at most once, regardless of how
+        many servers are resolved, instead of calling is_disabled() per server.
+
+        Args:
+            server_ids: Server identifiers present in this scope
+
+        Returns:
+            Dictionary mapping each server ID to its state
+        """
+        ...
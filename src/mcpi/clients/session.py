@@ -0,0 +1,270 @@
+"""Unit-of-work sessions that coalesce configuration writes per file.
+
+While a WriteBuffer is active, JSONFileWriter.write() records the new
+document instead of writing it, and JSONFileReader reads return the pending
+document, so a sequence of operations behaves exactly as if every write had
+gone to disk. ManagerSession.commit() then writes each touched file once.
+
+Files that do not exist yet are buffered too: scope and handler code checks
+for a config file with path_exists(), which counts a pending write as the
+file existing, so nothing reaches the disk before commit. At commit each file
+is written under its file lock, and only if nobody else changed it (or, for
+a new file, created it) since the session first buffered a write to it.
+"""
+
+from contextvars import ContextVar
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from .document_cache import FileFingerprint
+from .file_lock import expect_unchanged, file_lock
+from .types import OperationResult, ServerConfig
+
+if TYPE_CHECKING:
+    from .manager import MCPManager
+
+_active_buffer: ContextVar[Optional["WriteBuffer"]] = ContextVar(
+    "mcpi_write_buffer", default=None
+)
+
+
+class WriteBuffer:
+    """Pending document writes, in the order files were first written."""
+
+    def __init__(self) -> None:
+        """Initialize an empty buffer."""
+        # path -> (document, writer, journal path for multi-file writes)
+        self._pending: Dict[Path, Tuple[Dict[str, Any], Any, Optional[Path]]] = {}
+        # Fingerprint of each file on disk when it was first buffered (None
+        # for a file the session creates)
+        self._fingerprints: Dict[Path, Optional[FileFingerprint]] = {}
+        # Every buffered write, used to attribute files to operations
+        self._log: List[Path] = []
+
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Get the pending document for a file.
+
+        Args:
+            path: File path
+
+        Returns:
+            Pending document (shared, do not mutate), or None if the file has
+            no pending write
+        """
+        pending = self._pending.get(Path(path).absolute())
+        return pending[0] if pending else None
+
+    def put(
+        self,
+        path: Path,
+        data: Dict[str, Any],
+        writer: Any,
+        journal_path: Optional[Path] = None,
+    ) -> None:
+        """Record a write.
+
+        Args:
+            path: File path
+            data: New document
+            writer: Writer to flush the document with
+            journal_path: Journal of the multi-file write this is part of;
+                files sharing a journal are flushed as one change
+        """
+        key = Path(path).absolute()
+        previous = self._pending.get(key)
+        if previous is None:
+            self._fingerprints[key] = FileFingerprint.of(key)
+        if journal_path is None and previous is not None:
+            journal_path = previous[2]
+        self._pending[key] = (data, writer, journal_path)
+        self._log.append(key)
+
+    @property
+    def write_count(self) -> int:
+        """Number of writes buffered so far."""
+        return len(self._log)
+
+    def paths_written_since(self, count: int) -> List[Path]:
+        """Get the files written after ``write_count`` was ``count``."""
+        return list(dict.fromkeys(self._log[count:]))
+
+    def fingerprint(self, path: Path) -> Optional[FileFingerprint]:
+        """Get a pending file's fingerprint from before the session changed it."""
+        return self._fingerprints.get(Path(path).absolute())
+
+    def pending(self) -> List[Tuple[Path, Dict[str, Any], Any, Optional[Path]]]:
+        """Get ``(path, document, writer, journal_path)`` for each pending file."""
+        return [(path, *pending) for path, pending in self._pending.items()]
+
+
+def get_active_buffer() -> Optional[WriteBuffer]:
+    """Get the write buffer of the current session, if any.
+
+    Returns:
+        Active WriteBuffer, or None outside a session
+    """
+    return _active_buffer.get()
+
+
+class ManagerSession:
+    """Operations recorded in one MCPManager.session().
+
+    Mutations go through the manager as usual and their results are collected
+    in ``results``; the files they touch are written once, on commit.
+    """
+
+    def __init__(self, manager: "MCPManager", buffer: WriteBuffer) -> None:
+        """Initialize a session.
+
+        Args:
+            manager: Manager performing the operations
+            buffer: Write buffer collecting the operations' writes
+        """
+        self.manager = manager
+        self.buffer = buffer
+        self.results: List[OperationResult] = []
+        self._touched: List[Tuple[OperationResult, List[Path]]] = []
+
+    def add_server(
+        self,
+        server_id: str,
+        config: ServerConfig,
+        scope: str,
+        client_name: Optional[str] = None,
+    ) -> OperationResult:
+        """Add a server (see MCPManager.add_server)."""
+        return self._record(
+            self.manager.add_server, server_id, config, scope, client_name
+        )
+
+    def remove_server(
+        self, server_id: str, scope: str, client_name: Optional[str] = None
+    ) -> OperationResult:
+        """Remove a server (see MCPManager.remove_server)."""
+        return self._record(self.manager.remove_server, server_id, scope, client_name)
+
+    def enable_server(
+        self,
+        server_id: str,
+        scope: Optional[str] = None,
+        client_name: Optional[str] = None,
+    ) -> OperationResult:
+        """Enable a server (see MCPManager.enable_server)."""
+        return self._record(self.manager.enable_server, server_id, scope, client_name)
+
+    def disable_server(
+        self,
+        server_id: str,
+        scope: Optional[str] = None,
+        client_name: Optional[str] = None,
+    ) -> OperationResult:
+        """Disable a server (see MCPManager.disable_server)."""
+        return self._record(self.manager.disable_server, server_id, scope, client_name)
+
+    def run(
+        self, operation: Callable[..., OperationResult], *args: Any
+    ) -> OperationResult:
+        """Run any other operation (e.g. a scope handler method) in the session.
+
+        Args:
+            operation: Callable returning an OperationResult
+            *args: Arguments for the operation
+
+        Returns:
+            The operation's result
+        """
+        return self._record(operation, *args)
+
+    def commit(self) -> List[OperationResult]:
+        """Write every touched file once.
+
+        Files are written in the order they were first changed. If a file
+        fails to write (including because another process changed it during
+        the session), it and the files after it are left untouched and the
+        results of the operations that touched them turn into failures (the
+        result objects are updated in place).
+
+        Returns:
+            Results of all operations in the session, in order
+        """
+        pending = self.buffer.pending()
+        token = activate(None)
+        try:
+            flushed = set()
+            for path, data, writer, journal_path in pending:
+                if path in flushed:
+                    continue
+                if journal_path is None:
+                    group = [(path, data)]
+                else:
+                    group = [(p, d) for p, d, _, j in pending if j == journal_path]
+
+                paths = [p for p, _ in group]
+                try:
+                    with (
+                        file_lock(*paths),
+                        expect_unchanged(
+                            {p: self.buffer.fingerprint(p) for p in paths}
+                        ),
+                    ):
+                        if len(group) > 1:
+                            writer.write_many(group, journal_path)
+                        else:
+                            writer.write(path, data)
+                except Exception as e:
+                    for unwritten, *_ in pending:
+                        if unwritten not in flushed:
+                            self._fail_operations_on(unwritten, e)
+                    break
+                flushed.update(paths)
+        finally:
+            deactivate(token)
+            self.manager.invalidate_inventory()
+        return self.results
+
+    def _record(
+        self, operation: Callable[..., OperationResult], *args: Any
+    ) -> OperationResult:
+        count = self.buffer.write_count
+        result = operation(*args)
+        self.results.append(result)
+        self._touched.append((result, self.buffer.paths_written_since(count)))
+        return result
+
+    def _fail_operations_on(self, path: Path, error: Exception) -> None:
+        for result, paths in self._touched:
+            if path in paths and result.success:
+                result.success = False
+                result.message = f"{result.message} (not saved: {error})"
+                result.errors.append(str(error))
+
+
+def path_exists(path: Path) -> bool:
+    """Check whether a config file exists, as seen by the current session.
+
+    Args:
+        path: File path
+
+    Returns:
+        True if the file exists on disk or the active session has a pending
+        write to it
+    """
+    buffer = _active_buffer.get()
+    return (buffer is not None and buffer.get(path) is not None) or path.exists()
+
+
+def activate(buffer: Optional[WriteBuffer]) -> Any:
+    """Make ``buffer`` the active write buffer.
+
+    Args:
+        buffer: Buffer to activate (None disables buffering)
+
+    Returns:
+        Token for deactivate()
+    """
+    return _active_buffer.set(buffer)
+
+
+def deactivate(token: Any) -> None:
+    """Restore the write buffer that was active before activate()."""
+    _active_buffer.reset(token)
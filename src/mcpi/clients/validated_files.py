@@ -0,0 +1,107 @@
+"""Records of config files that passed full schema validation.
+
+FileBasedScope only validates the changed entry of a config file that is
+unchanged since it was last fully validated and written by mcpi. The stat
+fingerprint of each such file is recorded under the user cache directory, so
+the first edit in a later command can skip full validation as well. Records
+are keyed by the SHA-256 of the file path, the schema contents and the
+validator type; a record only claims that the file was valid while it had
+that fingerprint, so an external change simply stops matching it.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Optional
+
+from platformdirs import user_cache_dir
+
+from .document_cache import FileFingerprint
+
+
+def record_key(path: Path, schema: bytes, validator_type: str) -> str:
+    """Compute the record key of a config file checked against a schema.
+
+    Args:
+        path: Config file path
+        schema: Schema file contents
+        validator_type: Qualified name of the validator class
+
+    Returns:
+        Hex SHA-256 key
+    """
+    digest = hashlib.sha256()
+    for part in (
+        str(path.absolute()).encode("utf-8"),
+        schema,
+        validator_type.encode("utf-8"),
+    ):
+        # Length-prefix each part so different splits cannot collide
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class ValidatedFiles:
+    """Fingerprints of config files that passed full validation."""
+
+    def __init__(self, cache_dir: Optional[Path] = None) -> None:
+        """Initialize the records.
+
+        Args:
+            cache_dir: Directory for records (defaults to the user cache
+                directory)
+        """
+        self.cache_dir = cache_dir or Path(user_cache_dir("mcpi")) / "validated"
+
+    def get(self, key: str) -> Optional[FileFingerprint]:
+        """Get the fingerprint a file last passed validation with.
+
+        Args:
+            key: Record key (see record_key)
+
+        Returns:
+            Recorded fingerprint, or None if there is no usable record
+        """
+        try:
+            record = json.loads((self.cache_dir / f"{key}.json").read_bytes())
+            return FileFingerprint(
+                mtime_ns=int(record["mtime_ns"]),
+                size=int(record["size"]),
+                ino=int(record["ino"]),
+            )
+        except (OSError, ValueError, TypeError, KeyError):
+            return None
+
+    def record(self, key: str, fingerprint: FileFingerprint) -> None:
+        """Record that a file passed validation (best effort).
+
+        Args:
+            key: Record key (see record_key)
+            fingerprint: Fingerprint of the validated file
+        """
+        from .atomic_files import atomic_write_bytes
+
+        record = {
+            "mtime_ns": fingerprint.mtime_ns,
+            "size": fingerprint.size,
+            "ino": fingerprint.ino,
+        }
+        try:
+            atomic_write_bytes(
+                self.cache_dir / f"{key}.json", json.dumps(record).encode("utf-8")
+            )
+        except OSError:
+            pass
+
+
+_validated_files = ValidatedFiles()
+
+
+def get_validated_files() -> ValidatedFiles:
+    """Get the process-wide validated-file records.
+
+    Returns:
+        Shared ValidatedFiles instance
+    """
+    return _validated_files
@@ -544,6 +544,7 @@ def sync_servers(
         config = load_mcpi_config()
 
     results: Dict[str, Any] = {"added": [], "skipped": [], "errors": []}
+    installed: List[Tuple[str, Any]] = []
 
     def sync_server_list(
         servers: Dict[str, Dict[str, Any]],
@@ -583,35 +584,40 @@ def sync_servers(
                 env=env,
             )
 
-            # Install
-            result = manager.add_server(
+            # Install (written when the session commits)
+            result = session.add_server(
                 server_id, server_config, target_scope, target_client
             )
-            if result.success:
-                results["added"].append(server_id)
-            else:
-                results["errors"].append(f"{server_id}: {result.message}")
+            installed.append((server_id, result))
 
-    if client:
-        # Sync only for specified client
-        servers = get_servers_from_config(config, client)
-        if servers:
-            scope = get_client_scope(config, client)
-            sync_server_list(servers, scope, client)
-    else:
-        # Sync top-level servers (with default client)
-        top_level_servers = get_servers_from_config(config, client=None)
-        if top_level_servers:
-            default_scope = config.get("default_scope", "project-mcp")
-            default_client = config.get("default_client")
-            sync_server_list(top_level_servers, default_scope, default_client)
-
-        # Sync per-client servers
-        configured_clients = get_configured_clients(config)
-        for configured_client in configured_clients:
-            servers = get_servers_from_config(config, configured_client)
+    with manager.session() as session:
+        if client:
+            # Sync only for specified client
+            servers = get_servers_from_config(config, client)
             if servers:
-                scope = get_client_scope(config, configured_client)
-                sync_server_list(servers, scope, configured_client)
+                scope = get_client_scope(config, client)
+                sync_server_list(servers, scope, client)
+        else:
+            # Sync top-level servers (with default client)
+            top_level_servers = get_servers_from_config(config, client=None)
+            if top_level_servers:
+                default_scope = config.get("default_scope", "project-mcp")
+                default_client = config.get("default_client")
+                sync_server_list(top_level_servers, default_scope, default_client)
+
+            # Sync per-client servers
+            configured_clients = get_configured_clients(config)
+            for configured_client in configured_clients:
+                servers = get_servers_from_config(config, configured_client)
+                if servers:
+                    scope = get_client_scope(config, configured_client)
+                    sync_server_list(servers, scope, configured_client)
+
+    # Results are final only once the session has written its files
+    for server_id, result in installed:
+        if result.success:
+            results["added"].append(server_id)
+        else:
+            results["errors"].append(f"{server_id}: {result.message}")
 
     return results
@@ -0,0 +1,491 @@
+"""Shell completion of server IDs from a precomputed index.
+
+The ``mcpi`` console script starts here. Click's completion scripts run
+``mcpi`` with ``_MCPI_COMPLETE`` set on every TAB press, and answering
+through the click app means importing the whole CLI (rich, pydantic,
+jsonschema, yaml, ...), detecting clients, scanning every scope and loading
+the catalog. Instead, when the word being completed is the server ID right
+after ``add``, ``info``, ``remove``, ``enable`` or ``disable``, main()
+answers from an index file and only imports standard library modules
+(plus platformdirs, to find the cache directory).
+
+The index (one per working directory, since project scopes depend on it)
+has two sections:
+
+- installed: every installation of the default client (ID, client, scope,
+  state), for remove/enable/disable
+- catalog: the default catalog's IDs with their completion help, and the
+  completion keys (ID parts, package names) of mcpi.registry.fuzzy_index
+
+Each section records the stat fingerprint (mtime_ns, size, inode) of the
+files it was built from, and is rebuilt (with the full mcpi modules) only
+when one of them changed. As in mcpi.clients.document_cache, files modified
+too shortly before a build are not trusted on their fingerprint, so the
+section is rebuilt until they settle.
+
+Everything else, including completions that need typo correction, is left
+to the click app.
+"""
+
+import marshal
+import os
+import sys
+import time
+from bisect import bisect_left
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Bump when the layout of the index changes
+INDEX_FORMAT = 1
+# Completions returned at most (as by the click completion functions)
+MAX_COMPLETIONS = 50
+# Same window as mcpi.clients.document_cache.RACY_WINDOW_NS (not imported
+# to keep the clients package out of completion)
+RACY_WINDOW_NS = 2_000_000_000
+
+# Server ID completions answered from the installed servers, with the state
+# they are filtered by
+INSTALLED_COMMANDS = {"remove": None, "enable": "DISABLED", "disable": "ENABLED"}
+# Server ID completions answered from the catalog
+CATALOG_COMMANDS = ("add", "info")
+
+STATE_LABELS = {
+    "ENABLED": "enabled",
+    "DISABLED": "disabled",
+    "UNAPPROVED": "unapproved",
+    "NOT_INSTALLED": "not installed",
+}
+STATE_COLORS = {
+    "ENABLED": "\033[32m",  # green
+    "DISABLED": "\033[33m",  # yellow
+    "UNAPPROVED": "\033[36m",  # cyan
+    "NOT_INSTALLED": "\033[31m",  # red
+}
+
+# (value, help) pairs
+Completion = Tuple[str, Optional[str]]
+Section = Dict[str, Any]
+
+
+def installed_help(server_id: str, client: str, scope: str, state: str) -> str:
+    """Format the completion help of an installed server.
+
+    The server ID is repeated so that zsh does not group servers with the
+    same help together.
+
+    Args:
+        server_id: Server identifier
+        client: Client name
+        scope: Scope name
+        state: ServerState member name
+
+    Returns:
+        Help text with ANSI colors
+    """
+    label = STATE_LABELS.get(state, state.lower())
+    color = STATE_COLORS.get(state, "\033[37m")  # default white
+    reset = "\033[0m"
+    dim = "\033[2m"
+    cyan = "\033[36m"
+    return (
+        f"{dim}{server_id}{reset} in "
+        f"{cyan}{client}:{scope}{reset} "
+        f"({color}{label}{reset})"
+    )
+
+
+def catalog_help(description: str) -> str:
+    """Format the completion help of a catalog server.
+
+    Args:
+        description: Server description
+
+    Returns:
+        Description shortened to 50 characters
+    """
+    return description[:50] + "..." if len(description) > 50 else description
+
+
+def index_path(cwd: Optional[str] = None) -> Path:
+    """Get the index file for a working directory.
+
+    Args:
+        cwd: Working directory (defaults to the current one)
+
+    Returns:
+        Path of the index file (it stores the directory it is for, so name
+        collisions only cause rebuilds)
+    """
+    from zlib import crc32
+
+    from platformdirs import user_cache_dir
+
+    cwd = cwd or os.getcwd()
+    name = f"{crc32(os.fsencode(cwd)):08x}.idx"
+    return Path(user_cache_dir("mcpi")) / "completion" / name
+
+
+def fingerprint(path: str) -> Optional[Tuple[int, int, int]]:
+    """Fingerprint a source file.
+
+    Args:
+        path: File path
+
+    Returns:
+        (mtime_ns, size, inode), or None if the file does not exist
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+def new_section(sources: List[str], **data: Any) -> Section:
+    """Build an index section, fingerprinting its source files.
+
+    Call this after reading the sources, so changes made meanwhile are
+    detected.
+
+    Args:
+        sources: Files the section is built from (missing ones included,
+            so that creating them is a change)
+        **data: Section contents
+
+    Returns:
+        Section
+    """
+    section: Section = dict(data)
+    section["built_at"] = time.time_ns()
+    section["sources"] = {path: fingerprint(path) for path in sorted(set(sources))}
+    return section
+
+
+def is_current(section: Optional[Section]) -> bool:
+    """Check whether a section's sources are unchanged since it was built."""
+    if not section:
+        return False
+    racy_after = section["built_at"] - RACY_WINDOW_NS
+    for path, recorded in section["sources"].items():
+        if fingerprint(path) != recorded:
+            return False
+        if recorded is not None and recorded[0] >= racy_after:
+            return False
+    return True
+
+
+def build_installed_section(manager: Any = None) -> Section:
+    """Build the installed section from the default client's scopes.
+
+    Args:
+        manager: MCPManager (defaults to create_default_manager())
+
+    Returns:
+        Section with "entries": [(ID, client, scope, state name), ...]
+    """
+    from mcpi.clients.document_cache import get_document_cache
+
+    if manager is None:
+        from mcpi.clients.manager import create_default_manager
+
+        manager = create_default_manager()
+
+    sources: List[str] = []
+    client_name = manager.default_client
+    if client_name and manager.registry.has_client(client_name):
+        client = manager.registry.get_client(client_name)
+        for scope in client.get_scopes():
+            handler = client.get_scope_handler(scope.name)
+            if scope.path:
+                sources.append(str(scope.path))
+            state_handler = getattr(handler, "enable_disable_handler", None)
+            sources.extend(str(path) for path in _state_files(state_handler))
+    # Start from an empty document cache, so that it ends up holding every
+    # file parsed while listing (enable/disable state files included)
+    cache = get_document_cache()
+    cache.invalidate()
+    entries = [
+        (info.id, info.client, info.scope, info.state.name)
+        for info in manager.list_servers().values()
+    ]
+    sources.extend(str(path) for path in cache.paths())
+    return new_section(sources, entries=entries)
+
+
+def _state_files(state_handler: Any) -> List[Path]:
+    """Get the files an enable/disable handler keeps server states in.
+
+    Listed whether or not they exist, so that disabling the first server of
+    a scope (which creates its disabled file) is a change.
+
+    Args:
+        state_handler: Scope's enable/disable handler, or None
+
+    Returns:
+        Disabled, tracking, approval and configuration files of the handler
+    """
+    if state_handler is None:
+        return []
+    tracker = getattr(state_handler, "tracker", None)
+    candidates = [
+        getattr(state_handler, attribute, None)
+        for attribute in (
+            "config_path",
+            "active_file_path",
+            "disabled_file_path",
+            "mcp_json_path",
+            "settings_local_path",
+        )
+    ]
+    candidates.append(getattr(tracker, "tracking_file", None))
+    return [Path(path) for path in candidates if path]
+
+
+def build_catalog_section(catalog_manager: Any = None) -> Section:
+    """Build the catalog section from the default catalog.
+
+    Args:
+        catalog_manager: CatalogManager (defaults to
+            create_default_catalog_manager())
+
+    Returns:
+        Section with the sorted "ids", their "help", and the sorted
+        completion "keys" with the IDs owning each key
+    """
+    from mcpi.config import get_global_config_path, get_project_config_path
+    from mcpi.registry.fuzzy_index import completion_keys
+
+    if catalog_manager is None:
+        from mcpi.registry.catalog_manager import create_default_catalog_manager
+
+        catalog_manager = create_default_catalog_manager()
+
+    catalog = catalog_manager.get_default_catalog()
+    servers = dict(catalog.list_servers())
+    ids = sorted(servers)
+    owners: Dict[str, List[str]] = {}
+    for server_id in ids:
+        for key in completion_keys(server_id, servers[server_id]):
+            owners.setdefault(key, []).append(server_id)
+    keys = sorted(owners)
+
+    sources = [
+        str(catalog.catalog_path),
+        # Catalog configuration
+        str(get_global_config_path()),
+        str(get_project_config_path()),
+    ]
+    return new_section(
+        sources,
+        ids=ids,
+        help={
+            server_id: catalog_help(server.description)
+            for server_id, server in servers.items()
+        },
+        keys=keys,
+        owners=[owners[key] for key in keys],
+    )
+
+
+BUILDERS: Dict[str, Callable[[], Section]] = {
+    "installed": build_installed_section,
+    "catalog": build_catalog_section,
+}
+
+
+def load_section(
+    name: str,
+    path: Optional[Path] = None,
+    builders: Optional[Dict[str, Callable[[], Section]]] = None,
+) -> Section:
+    """Get an index section, rebuilding and saving it if it is out of date.
+
+    Args:
+        name: Section name ("installed" or "catalog")
+        path: Index file (defaults to index_path())
+        builders: Section name -> function building it (defaults to
+            BUILDERS)
+
+    Returns:
+        Current section
+    """
+    path = path or index_path()
+    cwd = os.getcwd()
+    index = _read_index(path)
+    if index.get("format") != INDEX_FORMAT or index.get("cwd") != cwd:
+        index = {"format": INDEX_FORMAT, "cwd": cwd}
+
+    section = index.get(name)
+    if is_current(section):
+        return section
+
+    section = (builders or BUILDERS)[name]()
+    index[name] = section
+    _write_index(path, index)
+    return section
+
+
+def complete(
+    args: List[str],
+    incomplete: str,
+    path: Optional[Path] = None,
+    builders: Optional[Dict[str, Callable[[], Section]]] = None,
+) -> Optional[List[Completion]]:
+    """Complete a server ID from the index.
+
+    Args:
+        args: Words before the one being completed, without the program
+        incomplete: Word being completed
+        path: Index file (defaults to index_path())
+        builders: Section builders (defaults to BUILDERS)
+
+    Returns:
+        Completions, or None if the click app has to answer
+    """
+    if len(args) != 1 or incomplete.startswith("-"):
+        return None
+    command = args[0]
+
+    if command in INSTALLED_COMMANDS:
+        state = INSTALLED_COMMANDS[command]
+        section = load_section("installed", path, builders)
+        completions = [
+            (server_id, installed_help(server_id, client, scope, server_state))
+            for server_id, client, scope, server_state in section["entries"]
+            if server_id.startswith(incomplete)
+            and (state is None or server_state == state)
+        ]
+        completions.sort(key=lambda item: (item[0], item[1]))
+        return completions[:MAX_COMPLETIONS]
+
+    if command in CATALOG_COMMANDS:
+        section = load_section("catalog", path, builders)
+        found = _complete_catalog(section, incomplete)
+        if incomplete and not found:
+            return None  # Typo correction
+        return [(server_id, section["help"][server_id]) for server_id in found]
+
+    return None
+
+
+def _complete_catalog(section: Section, text: str) -> List[str]:
+    """Match catalog IDs as CompletionIndex.complete() does, without typos."""
+    found: Dict[str, None] = {}
+    ids = section["ids"]
+    for server_id in islice(ids, bisect_left(ids, text), None):
+        if not server_id.startswith(text) or len(found) == MAX_COMPLETIONS:
+            break
+        found[server_id] = None
+    if not text or len(found) == MAX_COMPLETIONS:
+        return list(found)
+
+    keys = section["keys"]
+    lowered = text.lower()
+    for number in range(bisect_left(keys, lowered), len(keys)):
+        if not keys[number].startswith(lowered):
+            break
+        for server_id in section["owners"][number]:
+            if len(found) == MAX_COMPLETIONS:
+                return list(found)
+            found[server_id] = None
+    return list(found)
+
+
+def completion_args(shell: str) -> Optional[Tuple[List[str], str]]:
+    """Read the words to complete as click's shell completion classes do.
+
+    Returns:
+        Tuple of (args, incomplete), or None for unsupported shells and
+        command lines that need shell-style unquoting
+    """
+    words = os.environ.get("COMP_WORDS", "")
+    cword = os.environ.get("COMP_CWORD", "")
+    if any(char in words + cword for char in "'\"\\"):
+        return None
+    cwords = words.split()
+
+    if shell in ("bash", "zsh"):
+        try:
+            position = int(cword)
+        except ValueError:
+            return None
+        incomplete = cwords[position] if position < len(cwords) else ""
+        return cwords[1:position], incomplete
+
+    if shell == "fish":
+        incomplete = cword.split()[0] if cword.split() else ""
+        args = cwords[1:]
+        if incomplete and args and args[-1] == incomplete:
+            args.pop()
+        return args, incomplete
+
+    return None
+
+
+def format_completions(shell: str, completions: List[Completion]) -> str:
+    """Format completions as click's shell completion classes do.
+
+    Args:
+        shell: "bash", "zsh" or "fish"
+        completions: (value, help) pairs
+
+    Returns:
+        Output for the shell's completion script
+    """
+    lines = []
+    for value, help_text in completions:
+        if shell == "bash":
+            lines.append(f"plain,{value}")
+        elif shell == "zsh":
+            # Colons separate the value from the help, except without help
+            if help_text:
+                value = value.replace(":", "\\:")
+            lines.append(f"plain\n{value}\n{help_text or '_'}")
+        elif help_text:
+            help_text = help_text.replace("\n", "\\n").replace("\t", " ")
+            lines.append(f"plain,{value}\t{help_text}")
+        else:
+            lines.append(f"plain,{value}")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    """Run mcpi, answering server ID completions from the index."""
+    mode = os.environ.get("_MCPI_COMPLETE", "")
+    if mode.endswith("_complete"):
+        shell = mode[: -len("_complete")]
+        try:
+            parsed = completion_args(shell)
+            completions = complete(*parsed) if parsed else None
+        except Exception:
+            completions = None  # Let the click app answer
+        if completions is not None:
+            sys.stdout.write(format_completions(shell, completions) + "\n")
+            sys.exit(0)
+
+    from mcpi.cli import main as cli_main
+
+    cli_main()
+
+
+def _read_index(path: Path) -> Dict[str, Any]:
+    try:
+        with open(path, "rb") as f:
+            index = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    return index if isinstance(index, dict) else {}
+
+
+def _write_index(path: Path, index: Dict[str, Any]) -> None:
+    """Write the index atomically (best effort).
+
+    Only called after rebuilding a section, which already imported mcpi.
+    """
+    from mcpi.clients.atomic_files import atomic_write_bytes
+
+    try:
+        atomic_write_bytes(path, marshal.dumps(index))
+    except OSError:
+        pass
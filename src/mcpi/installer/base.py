@@ -168,6 +168,10 @@ class BaseInstaller(ABC):
     def create_backup(self, file_path: Path) -> Optional[Path]:
         """Create backup of configuration file.
 
+        Installers do not call this on every operation: config files are
+        replaced atomically (mcpi.clients.atomic_files), so a failed save
+        cannot leave a partial file behind. Use it for an explicit snapshot.
+
         Args:
             file_path: Path to file to backup
 
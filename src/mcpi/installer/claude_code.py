@@ -6,6 +6,7 @@ import platform
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from mcpi.clients.atomic_files import atomic_write_bytes
 from mcpi.installer.base import BaseInstaller, InstallationResult
 from mcpi.registry.catalog import MCPServer
 
@@ -82,11 +83,9 @@ class ClaudeCodeInstaller(BaseInstaller):
             return True
 
         try:
-            # Ensure directory exists
-            self.config_path.parent.mkdir(parents=True, exist_ok=True)
-
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=2)
+            # Atomic replace: a failed save leaves the previous file intact
+            data = json.dumps(config, indent=2).encode("utf-8")
+            atomic_write_bytes(self.config_path, data)
             return True
         except OSError:
             return False
@@ -127,9 +126,6 @@ class ClaudeCodeInstaller(BaseInstaller):
                 already_installed=True,
             )
 
-        # Create backup of existing configuration
-        backup_path = self.create_backup(self.config_path)
-
         # Load current configuration
         config = self._load_config()
 
@@ -144,14 +140,12 @@ class ClaudeCodeInstaller(BaseInstaller):
             return self._create_failure_result(
                 server_id,
                 "Failed to save Claude Code configuration",
-                backup_path=backup_path,
             )
 
         return self._create_success_result(
             server_id,
             f"Successfully installed {server_id} for Claude Code",
             config_path=self.config_path,
-            backup_path=backup_path,
             server_config=server_config,
         )
 
@@ -196,9 +190,6 @@ class ClaudeCodeInstaller(BaseInstaller):
                 server_id, f"Server {server_id} is not installed"
             )
 
-        # Create backup
-        backup_path = self.create_backup(self.config_path)
-
         # Load configuration
         config = self._load_config()
 
@@ -211,14 +202,12 @@ class ClaudeCodeInstaller(BaseInstaller):
             return self._create_failure_result(
                 server_id,
                 "Failed to save Claude Code configuration",
-                backup_path=backup_path,
             )
 
         return self._create_success_result(
             server_id,
             f"Successfully uninstalled {server_id} from Claude Code",
             config_path=self.config_path,
-            backup_path=backup_path,
         )
 
     def is_installed(self, server_id: str) -> bool:
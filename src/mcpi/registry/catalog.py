@@ -1,14 +1,22 @@
 """MCP Server Registry Catalog and Models."""
 
 import json
+from collections.abc import MutableMapping
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
 
 import yaml
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_validator
 
-from .cue_validator import CUEValidator
+from .catalog_artifact import CatalogArtifact, artifact_path_for
+from .catalog_schema import CatalogSchemaValidator
+from .catalog_shards import ShardedCatalogStore, ShardedServerMap, is_sharded_catalog
+from .cue_validator import DEFAULT_SCHEMA_PATH
+from .facet_index import FacetIndex
+from .fuzzy_index import CompletionIndex
+from .search_index import IndexData, SearchIndex, SearchResult
+from .validation_cache import ValidationCache, get_validation_cache
 
 
 class InstallationMethod(str, Enum):
@@ -81,6 +89,76 @@ class MCPServer(BaseModel):
         return run_config
 
 
+class LazyServerMap(MutableMapping):
+    """Server mapping backed by a catalog artifact.
+
+    MCPServer objects are built on first access with ``model_construct``
+    (records were validated when the artifact was compiled). Membership and
+    iteration read only the artifact's ID table. Changes are kept in memory
+    on top of the artifact.
+    """
+
+    def __init__(self, artifact: CatalogArtifact) -> None:
+        """Initialize the mapping.
+
+        Args:
+            artifact: Compiled catalog providing the records
+        """
+        self._artifact = artifact
+        self._hydrated: Dict[str, MCPServer] = {}
+        # Added or replaced servers; None marks a removed server
+        self._overrides: Dict[str, Optional[MCPServer]] = {}
+
+    def __getitem__(self, server_id: str) -> MCPServer:
+        if server_id in self._overrides:
+            server = self._overrides[server_id]
+            if server is None:
+                raise KeyError(server_id)
+            return server
+        server = self._hydrated.get(server_id)
+        if server is None:
+            record = self._artifact.get_record(server_id)
+            if record is None:
+                raise KeyError(server_id)
+            server = MCPServer.model_construct(**record)
+            self._hydrated[server_id] = server
+        return server
+
+    def __setitem__(self, server_id: str, server: MCPServer) -> None:
+        self._overrides[server_id] = server
+
+    def __delitem__(self, server_id: str) -> None:
+        if server_id not in self:
+            raise KeyError(server_id)
+        self._overrides[server_id] = None
+
+    def __contains__(self, server_id: object) -> bool:
+        if server_id in self._overrides:
+            return self._overrides[server_id] is not None
+        return server_id in self._artifact
+
+    def __iter__(self) -> Iterator[str]:
+        for server_id in self._artifact.ids():
+            if self._overrides.get(server_id, True) is not None:
+                yield server_id
+        for server_id, server in self._overrides.items():
+            if server is not None and server_id not in self._artifact:
+                yield server_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def search_data(self) -> Optional[IndexData]:
+        """Get the artifact's search index while it describes these servers.
+
+        Returns:
+            Stored index data, or None after changes
+        """
+        if self._overrides:
+            return None
+        return self._artifact.search_data()
+
+
 class ServerRegistry(BaseModel):
     """Complete server registry."""
 
@@ -91,6 +169,22 @@ class ServerRegistry(BaseModel):
         default_factory=dict, description="Server definitions"
     )
 
+    _search_index: Optional[SearchIndex] = PrivateAttr(default=None)
+    _completion_index: Optional[CompletionIndex] = PrivateAttr(default=None)
+    _facet_index: Optional[FacetIndex] = PrivateAttr(default=None)
+
+    @classmethod
+    def from_artifact(cls, artifact: CatalogArtifact) -> "ServerRegistry":
+        """Create a registry that hydrates servers from an artifact on access.
+
+        Args:
+            artifact: Compiled catalog
+
+        Returns:
+            ServerRegistry backed by a LazyServerMap
+        """
+        return cls.model_construct(servers=LazyServerMap(artifact))
+
     def get_server(self, server_id: str) -> Optional[MCPServer]:
         """Get a server by ID."""
         return self.servers.get(server_id)
@@ -99,20 +193,110 @@ class ServerRegistry(BaseModel):
         """List all servers."""
         return sorted(self.servers.items(), key=lambda x: x[0])
 
-    def search_servers(self, query: str) -> List[tuple[str, MCPServer]]:
-        """Search servers by query."""
-        query_lower = query.lower()
-        results = []
+    def set_server(self, server_id: str, server: MCPServer) -> None:
+        """Add or replace a server, keeping the indexes in sync."""
+        self.servers[server_id] = server
+        if self._facet_index is not None:
+            self._facet_index.add(server_id, server)
+        self.invalidate_search_index()
 
-        for server_id, server in self.servers.items():
-            # Check ID and description for matches
-            if (
-                query_lower in server_id.lower()
-                or query_lower in server.description.lower()
-            ):
-                results.append((server_id, server))
+    def delete_server(self, server_id: str) -> None:
+        """Remove a server, keeping the indexes in sync.
 
-        return results
+        Raises:
+            KeyError: If the server does not exist
+        """
+        del self.servers[server_id]
+        if self._facet_index is not None:
+            self._facet_index.remove(server_id)
+        self.invalidate_search_index()
+
+    def facets(self) -> FacetIndex:
+        """Get the facet index (built on first use, then kept in sync by
+        set_server() and delete_server())."""
+        if self._facet_index is None:
+            self._facet_index = FacetIndex(self.servers)
+        return self._facet_index
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        filters: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> List[SearchResult]:
+        """Search servers with ranking and match information.
+
+        The search index is built on first use and reused until
+        invalidate_search_index() is called.
+
+        Args:
+            query: Query string (see mcpi.registry.search_index)
+            limit: Maximum number of results
+            filters: Facet name -> accepted values (see FacetIndex.matching)
+
+        Returns:
+            Results ordered by descending relevance
+        """
+        if self._search_index is None:
+            # Use a prebuilt index when the server mapping provides one
+            search_data = getattr(self.servers, "search_data", None)
+            self._search_index = SearchIndex(
+                self.servers, search_data() if search_data else None
+            )
+        within = self.facets().matching(filters) if filters else None
+        return self._search_index.search(query, limit, within)
+
+    def search_servers(
+        self,
+        query: str,
+        filters: Optional[Mapping[str, Iterable[str]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[tuple[str, MCPServer]]:
+        """Search servers by query, most relevant first."""
+        return [
+            (result.server_id, result.server)
+            for result in self.search(query, limit, filters)
+        ]
+
+    def facet_counts(
+        self, query: str = "", filters: Optional[Mapping[str, Iterable[str]]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Count the servers matching a search by facet value.
+
+        Args:
+            query: Query string (see mcpi.registry.search_index)
+            filters: Facet name -> accepted values (see FacetIndex.matching)
+
+        Returns:
+            Facet name -> value -> number of matching servers
+        """
+        facets = self.facets()
+        if not query.strip():
+            within = facets.matching(filters) if filters else None
+            return facets.counts(within)
+        return facets.counts(
+            result.server_id for result in self.search(query, filters=filters)
+        )
+
+    def complete_server_ids(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Complete a partially typed server ID, tolerating typos.
+
+        Args:
+            text: Text typed so far
+            limit: Maximum number of IDs
+
+        Returns:
+            Matching server IDs (see CompletionIndex.complete)
+        """
+        if self._completion_index is None:
+            self._completion_index = CompletionIndex(self.servers)
+        return self._completion_index.complete(text, limit)
+
+    def invalidate_search_index(self) -> None:
+        """Drop the search and completion indexes after servers were added,
+        removed or changed."""
+        self._search_index = None
+        self._completion_index = None
 
     def list_categories(self) -> Dict[str, int]:
         """List all categories with server counts.
@@ -120,41 +304,44 @@ class ServerRegistry(BaseModel):
         Returns:
             Dictionary mapping category name to count of servers in that category
         """
-        category_counts = {}
-        for server_id, server in self.servers.items():
-            for category in server.categories:
-                category_counts[category] = category_counts.get(category, 0) + 1
-        return category_counts
+        return self.facets().category_counts()
 
 
 class ServerCatalog:
     """Central catalog for MCP servers."""
 
-    def __init__(self, catalog_path: Path, validate_with_cue: bool = True):
+    def __init__(
+        self,
+        catalog_path: Path,
+        validate_with_cue: bool = True,
+        validation_cache: Optional[ValidationCache] = None,
+        schema_validator: Optional[CatalogSchemaValidator] = None,
+    ):
         """Initialize the catalog with catalog path.
 
         Args:
-            catalog_path: Path to catalog file (required for DI/testability)
-            validate_with_cue: Whether to validate with CUE schema
+            catalog_path: Path to catalog file, or to the directory of a
+                sharded catalog (see catalog_shards)
+            validate_with_cue: Whether to validate against the catalog.cue
+                schema (checked in process by CatalogSchemaValidator)
+            validation_cache: Certificates of already validated catalogs
+                (defaults to the shared cache)
+            schema_validator: Validator implementing catalog.cue's rules
         """
         self.catalog_path = catalog_path
         self._registry: Optional[ServerRegistry] = None
         self._loaded = False
         self.validate_with_cue = validate_with_cue
-
-        # Initialize CUE validator if validation is enabled
-        if self.validate_with_cue:
-            try:
-                self.cue_validator = CUEValidator()
-            except RuntimeError as e:
-                print(f"Warning: CUE validation disabled - {e}")
-                self.validate_with_cue = False
+        self.validation_cache = validation_cache or get_validation_cache()
+        self.schema_validator = schema_validator or CatalogSchemaValidator()
 
     def load_catalog(self) -> None:
         """Load servers from catalog file."""
         if not self.catalog_path.exists():
             # Start with empty registry if file doesn't exist
             self._registry = ServerRegistry()
+        elif is_sharded_catalog(self.catalog_path):
+            self._load_sharded_catalog()
         else:
             # Load based on file extension
             if self.catalog_path.suffix.lower() in [".yaml", ".yml"]:
@@ -166,32 +353,78 @@ class ServerCatalog:
         self._loaded = True
 
     def _load_json_catalog(self) -> None:
-        """Load catalog from JSON format."""
-        # Check for JSON decode errors from CUE validation first
+        """Load catalog from JSON format.
+
+        A compiled artifact next to the catalog (see catalog_artifact) is
+        used instead while it matches the catalog's contents. Catalog
+        contents that already passed validation (see validation_cache) are
+        not validated again.
+        """
+        registry = self._load_artifact()
+        if registry is not None:
+            self._registry = registry
+            return
+
+        try:
+            raw = self.catalog_path.read_bytes()
+        except OSError as e:
+            raise RuntimeError(
+                f"Failed to load catalog from {self.catalog_path}: {e}"
+            ) from None
+
         if self.validate_with_cue:
-            is_valid, error = self.cue_validator.validate_file(self.catalog_path)
-            if not is_valid:
-                # Check if it's a JSON decode error from CUE
-                if "invalid JSON" in error or "invalid character" in error:
-                    # Re-parse with json.load to get proper JSONDecodeError
-                    # This preserves the specific exception type for testing
-                    try:
-                        with open(self.catalog_path, encoding="utf-8") as f:
-                            json.load(f)  # This will raise JSONDecodeError
-                    except json.JSONDecodeError:
-                        # Let JSONDecodeError propagate as-is (don't wrap it)
-                        raise
-                raise RuntimeError(f"Catalog validation failed: {error}")
+            # Let JSONDecodeError propagate as-is (don't wrap it)
+            data = json.loads(raw)
+            schema = DEFAULT_SCHEMA_PATH.read_bytes()
+            if not self.validation_cache.is_certified(
+                raw, schema, self.schema_validator.version
+            ):
+                is_valid, error = self.schema_validator.validate(data)
+                if not is_valid:
+                    raise RuntimeError(f"Catalog validation failed: {error}")
+                self.validation_cache.certify(
+                    raw, schema, self.schema_validator.version
+                )
 
         try:
-            with open(self.catalog_path, encoding="utf-8") as f:
-                data = json.load(f)
+            if not self.validate_with_cue:
+                data = json.loads(raw)
             # Convert flat dictionary to ServerRegistry format
             servers = {k: MCPServer(**v) for k, v in data.items()}
             self._registry = ServerRegistry(servers=servers)
         except Exception as e:
             raise RuntimeError(f"Failed to load catalog from {self.catalog_path}: {e}")
 
+    def _load_artifact(self) -> Optional[ServerRegistry]:
+        """Load the compiled artifact for the catalog, if it is current.
+
+        Returns:
+            Lazily hydrated registry, or None to fall back to the JSON file
+        """
+        artifact_path = artifact_path_for(self.catalog_path)
+        if not artifact_path.exists():
+            return None
+        try:
+            artifact = CatalogArtifact.open(artifact_path)
+        except (OSError, ValueError):
+            return None
+        if not artifact.matches_source(self.catalog_path):
+            return None
+        return ServerRegistry.from_artifact(artifact)
+
+    def _load_sharded_catalog(self) -> None:
+        """Load a sharded catalog's manifest; servers are read on access.
+
+        Shards are validated when they are saved, not when loaded.
+        """
+        try:
+            servers = ShardedServerMap(ShardedCatalogStore(self.catalog_path))
+        except (OSError, ValueError) as e:
+            raise RuntimeError(
+                f"Failed to load catalog from {self.catalog_path}: {e}"
+            ) from None
+        self._registry = ServerRegistry.model_construct(servers=servers)
+
     def _load_yaml_catalog(self) -> None:
         """Load catalog from YAML format."""
         try:
@@ -208,6 +441,9 @@ class ServerCatalog:
     def save_catalog(self, format_type: str = "json") -> bool:
         """Save catalog to file."""
         try:
+            if is_sharded_catalog(self.catalog_path):
+                return self._save_sharded_catalog()
+
             self.catalog_path.parent.mkdir(parents=True, exist_ok=True)
 
             if format_type == "yaml":
@@ -224,29 +460,59 @@ class ServerCatalog:
             # Prepare data as flat dictionary
             data = {k: v.model_dump() for k, v in self._registry.servers.items()}
 
-            # Validate with CUE before writing if enabled
+            # Validate in memory before writing if enabled
             if self.validate_with_cue:
-                is_valid, error = self.cue_validator.validate(data)
+                is_valid, error = self.schema_validator.validate(data)
                 if not is_valid:
                     raise RuntimeError(
                         f"Catalog validation failed before save: {error}"
                     )
 
             # Write to file
-            with open(self.catalog_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            raw = json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+            with open(self.catalog_path, "wb") as f:
+                f.write(raw)
 
-            # Validate file after writing if enabled
+            # The written bytes are exactly what was validated
             if self.validate_with_cue:
-                is_valid, error = self.cue_validator.validate_file(self.catalog_path)
-                if not is_valid:
-                    raise RuntimeError(f"Catalog validation failed after save: {error}")
+                self.validation_cache.certify(
+                    raw, DEFAULT_SCHEMA_PATH.read_bytes(), self.schema_validator.version
+                )
 
             return True
         except Exception as e:
             print(f"Error saving JSON catalog: {e}")
             return False
 
+    def _save_sharded_catalog(self) -> bool:
+        """Save the changes to a sharded catalog: only the shards of added,
+        changed or removed servers and the manifest are written."""
+        try:
+            servers = self._registry.servers
+            changes = {
+                server_id: None if server is None else server.model_dump()
+                for server_id, server in servers.pending_changes().items()
+            }
+            if not changes:
+                return True
+
+            # The schema constrains entries independently, so validating the
+            # changed ones validates the catalog
+            if self.validate_with_cue:
+                entries = {k: v for k, v in changes.items() if v is not None}
+                is_valid, error = self.schema_validator.validate(entries)
+                if not is_valid:
+                    raise RuntimeError(
+                        f"Catalog validation failed before save: {error}"
+                    )
+
+            ShardedCatalogStore(self.catalog_path).commit(changes)
+            servers.mark_committed()
+            return True
+        except Exception as e:
+            print(f"Error saving sharded catalog: {e}")
+            return False
+
     def _save_yaml_catalog(self) -> bool:
         """Save catalog in YAML format."""
         try:
@@ -272,11 +538,94 @@ class ServerCatalog:
             self.load_catalog()
         return self._registry.list_servers()
 
-    def search_servers(self, query: str) -> List[tuple[str, MCPServer]]:
-        """Search servers by query string."""
+    def search_servers(
+        self,
+        query: str,
+        with_scores: bool = False,
+        filters: Optional[Mapping[str, Iterable[str]]] = None,
+        limit: Optional[int] = None,
+    ) -> List[tuple]:
+        """Search servers by query string, most relevant first.
+
+        Args:
+            query: Query string (see mcpi.registry.search_index)
+            with_scores: Return (server_id, server, score, matches) tuples
+                instead of (server_id, server)
+            filters: Facet name -> accepted values, e.g.
+                ``{"category": ["database"], "command": ["uvx"]}``
+            limit: Maximum number of results
+
+        Returns:
+            List of result tuples
+        """
+        if not self._loaded:
+            self.load_catalog()
+        if with_scores:
+            return [
+                (result.server_id, result.server, result.score, result.matches)
+                for result in self._registry.search(query, limit, filters)
+            ]
+        return self._registry.search_servers(query, filters, limit)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        filters: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> List[SearchResult]:
+        """Search servers with ranking and match information.
+
+        Args:
+            query: Query string (see mcpi.registry.search_index)
+            limit: Maximum number of results
+            filters: Facet name -> accepted values (see search_servers)
+
+        Returns:
+            Results ordered by descending relevance
+        """
+        if not self._loaded:
+            self.load_catalog()
+        return self._registry.search(query, limit, filters)
+
+    def facet_counts(
+        self, query: str = "", filters: Optional[Mapping[str, Iterable[str]]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Count the servers matching a search by category, command and
+        whether they have a repository.
+
+        Args:
+            query: Query string (empty for all servers)
+            filters: Facet name -> accepted values (see search_servers)
+
+        Returns:
+            Facet name -> value -> number of matching servers
+        """
+        if not self._loaded:
+            self.load_catalog()
+        return self._registry.facet_counts(query, filters)
+
+    def complete_server_ids(
+        self, text: str, limit: Optional[int] = None
+    ) -> List[tuple[str, MCPServer]]:
+        """Complete a partially typed server ID, tolerating typos.
+
+        IDs starting with the text come first, then servers whose ID parts or
+        package names start with it, then (if nothing matched) servers with a
+        close match.
+
+        Args:
+            text: Text typed so far
+            limit: Maximum number of results
+
+        Returns:
+            List of (server_id, server) tuples
+        """
         if not self._loaded:
             self.load_catalog()
-        return self._registry.search_servers(query)
+        return [
+            (server_id, self._registry.servers[server_id])
+            for server_id in self._registry.complete_server_ids(text, limit)
+        ]
 
     def list_categories(self) -> Dict[str, int]:
         """List all categories with server counts.
@@ -296,7 +645,7 @@ class ServerCatalog:
         if server_id in self._registry.servers:
             return False
 
-        self._registry.servers[server_id] = server
+        self._registry.set_server(server_id, server)
         return True
 
     def remove_server(self, server_id: str) -> bool:
@@ -307,7 +656,7 @@ class ServerCatalog:
         if server_id not in self._registry.servers:
             return False
 
-        del self._registry.servers[server_id]
+        self._registry.delete_server(server_id)
         return True
 
     def update_server(self, server_id: str, server: MCPServer) -> bool:
@@ -318,7 +667,7 @@ class ServerCatalog:
         if server_id not in self._registry.servers:
             return False
 
-        self._registry.servers[server_id] = server
+        self._registry.set_server(server_id, server)
         return True
 
 
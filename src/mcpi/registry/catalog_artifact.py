@@ -0,0 +1,360 @@
+"""Precompiled binary form of a JSON catalog.
+
+Loading ``catalog.json`` parses the whole file and builds an MCPServer for
+every entry, although most commands need one server or a handful. The
+artifact stores each validated, normalized entry as its own compact JSON
+record behind a sorted ID table, so a memory-mapped artifact answers
+lookups with a binary search and decodes only the records that are used.
+
+The artifact also stores the catalog's search index (see search_index), so
+searching the official catalog does not tokenize and score every entry on
+each run.
+
+Layout (little-endian, offsets absolute)::
+
+    header   magic "MCPICAT\\0", format version (u32), entry count (u32),
+             source size (u64), SHA-256 of the source catalog (32 bytes),
+             search index offset (u64)
+    index    per entry, sorted by UTF-8 ID bytes: ID offset, ID length,
+             record offset, record length (4 x u32)
+    data     IDs and records
+    search   term count (u32), padding (u32); per term, sorted by UTF-8
+             bytes: term offset, term length, postings offset, postings
+             count (4 x u32); term bytes; 4-byte aligned postings, each:
+             documents by descending score (u32[n]), their scores (f32[n]),
+             documents ascending (u32[n]), their scores (f32[n])
+
+An artifact is only used while its recorded source digest matches the JSON
+catalog next to it; otherwise the catalog falls back to the JSON file.
+Regenerate with ``scripts/compile-catalog.py`` after editing the catalog.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Sequence
+
+from .search_index import MemoryIndexData, PostingList
+
+MAGIC = b"MCPICAT\0"
+FORMAT_VERSION = 2
+
+_HEADER = struct.Struct("<8sIIQ32sQ")
+_ENTRY = struct.Struct("<IIII")
+_SEARCH_HEADER = struct.Struct("<II")
+
+
+def artifact_path_for(catalog_path: Path) -> Path:
+    """Get the artifact location for a JSON catalog (``catalog.bin``)."""
+    return catalog_path.with_suffix(".bin")
+
+
+def compile_catalog(
+    source: Path, target: Optional[Path] = None, validator: Any = None
+) -> Path:
+    """Compile a JSON catalog into a binary artifact.
+
+    Entries are validated against the catalog schema and normalized through
+    MCPServer, so the stored records can be hydrated without validation.
+
+    Args:
+        source: JSON catalog file
+        target: Artifact file (defaults to artifact_path_for(source))
+        validator: Catalog validator (defaults to CatalogSchemaValidator)
+
+    Returns:
+        Path of the written artifact
+
+    Raises:
+        ValueError: If the catalog is invalid
+    """
+    from mcpi.clients.atomic_files import atomic_write_bytes
+
+    from .catalog import MCPServer
+    from .catalog_schema import CatalogSchemaValidator
+
+    target = target or artifact_path_for(source)
+    raw = source.read_bytes()
+    data = json.loads(raw)
+    is_valid, error = (validator or CatalogSchemaValidator()).validate(data)
+    if not is_valid:
+        raise ValueError(f"Catalog validation failed: {error}")
+
+    servers = {server_id: MCPServer(**entry) for server_id, entry in data.items()}
+    entries = sorted(
+        (
+            server_id.encode("utf-8"),
+            json.dumps(
+                server.model_dump(mode="json"),
+                separators=(",", ":"),
+                ensure_ascii=False,
+            ).encode("utf-8"),
+        )
+        for server_id, server in servers.items()
+    )
+
+    offset = _HEADER.size + _ENTRY.size * len(entries)
+    index = bytearray()
+    blobs = bytearray()
+    for id_bytes, record in entries:
+        index += _ENTRY.pack(offset, len(id_bytes), offset + len(id_bytes), len(record))
+        blobs += id_bytes + record
+        offset += len(id_bytes) + len(record)
+
+    offset += -offset % 4
+    search = _pack_search_index(MemoryIndexData(servers), offset)
+
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        len(entries),
+        len(raw),
+        hashlib.sha256(raw).digest(),
+        offset,
+    )
+    contents = header + index + blobs
+    contents += bytes(-len(contents) % 4) + search
+    # Replaced, not rewritten, so processes mapping the old artifact keep it
+    atomic_write_bytes(target, contents)
+    return target
+
+
+def _pack_search_index(data: MemoryIndexData, offset: int) -> bytes:
+    """Serialize a search index to be stored at ``offset``."""
+    terms = [term.encode("utf-8") for term in data.vocabulary]
+    table = bytearray()
+    term_bytes = bytearray()
+    postings = bytearray()
+    term_offset = offset + _SEARCH_HEADER.size + _ENTRY.size * len(terms)
+    postings_offset = term_offset + sum(len(term) for term in terms)
+    postings_offset += -postings_offset % 4
+    for number, term in enumerate(terms):
+        posting_list = data.postings(number)
+        count = len(posting_list)
+        table += _ENTRY.pack(
+            term_offset + len(term_bytes),
+            len(term),
+            postings_offset + len(postings),
+            count,
+        )
+        term_bytes += term
+        for values, typecode in (
+            (posting_list.docs, "I"),
+            (posting_list.scores, "f"),
+            (posting_list.sorted_docs, "I"),
+            (posting_list.sorted_scores, "f"),
+        ):
+            packed = array(typecode, values)
+            if sys.byteorder != "little":
+                packed.byteswap()
+            postings += packed.tobytes()
+
+    padding = bytes(-(offset + _SEARCH_HEADER.size + len(table) + len(term_bytes)) % 4)
+    return (
+        _SEARCH_HEADER.pack(len(terms), 0)
+        + bytes(table)
+        + bytes(term_bytes)
+        + padding
+        + bytes(postings)
+    )
+
+
+class CatalogArtifact:
+    """Read-only view of a memory-mapped catalog artifact."""
+
+    def __init__(self, buffer: Any) -> None:
+        """Wrap artifact bytes.
+
+        Args:
+            buffer: Artifact contents (bytes or mmap)
+
+        Raises:
+            ValueError: If the buffer is not a supported artifact
+        """
+        if len(buffer) < _HEADER.size:
+            raise ValueError("Not a catalog artifact: truncated header")
+        magic, version, count, source_size, digest, search_offset = _HEADER.unpack_from(
+            buffer
+        )
+        if magic != MAGIC:
+            raise ValueError("Not a catalog artifact: bad magic")
+        if version != FORMAT_VERSION:
+            raise ValueError(f"Unsupported catalog artifact version {version}")
+        if len(buffer) < _HEADER.size + _ENTRY.size * count:
+            raise ValueError("Not a catalog artifact: truncated index")
+
+        self._buffer = buffer
+        self._count = count
+        self.source_size = source_size
+        self.source_digest = digest
+        self._search_offset = search_offset
+
+    @classmethod
+    def open(cls, path: Path) -> "CatalogArtifact":
+        """Memory-map an artifact file.
+
+        Args:
+            path: Artifact file
+
+        Returns:
+            CatalogArtifact over the mapped file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If the file is not a supported artifact
+        """
+        with open(path, "rb") as f:
+            try:
+                buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError:  # Empty file
+                raise ValueError("Not a catalog artifact: empty file") from None
+        return cls(buffer)
+
+    def matches_source(self, source: Path) -> bool:
+        """Check that the artifact was compiled from a JSON catalog's current
+        contents (hashes the source without parsing it).
+
+        Args:
+            source: JSON catalog file
+
+        Returns:
+            True if the source is unchanged since compilation
+        """
+        try:
+            if os.stat(source).st_size != self.source_size:
+                return False
+            with open(source, "rb") as f:
+                if self.source_size == 0:
+                    return hashlib.sha256(b"").digest() == self.source_digest
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents:
+                    return hashlib.sha256(contents).digest() == self.source_digest
+        except (OSError, ValueError):
+            return False
+
+    def __len__(self) -> int:
+        """Number of entries."""
+        return self._count
+
+    def __contains__(self, server_id: object) -> bool:
+        """Check whether an ID is present (binary search, no decoding)."""
+        return isinstance(server_id, str) and self._find(server_id) is not None
+
+    def ids(self) -> Iterator[str]:
+        """Iterate over server IDs in sorted order."""
+        for i in range(self._count):
+            yield self.id_at(i)
+
+    def id_at(self, position: int) -> str:
+        """Get the server ID at a position in sorted order."""
+        id_offset, id_length, _, _ = _ENTRY.unpack_from(
+            self._buffer, _HEADER.size + position * _ENTRY.size
+        )
+        return self._buffer[id_offset : id_offset + id_length].decode("utf-8")
+
+    def search_data(self) -> Optional["ArtifactIndexData"]:
+        """Get the stored search index.
+
+        Returns:
+            Index data for SearchIndex, or None if it cannot be used on this
+            platform
+        """
+        if sys.byteorder != "little" or array("I").itemsize != 4:
+            return None
+        return ArtifactIndexData(self, self._buffer, self._search_offset)
+
+    def get_record(self, server_id: str) -> Optional[Dict[str, Any]]:
+        """Decode one entry.
+
+        Args:
+            server_id: Server ID
+
+        Returns:
+            Normalized server record, or None if the ID is not present
+        """
+        i = self._find(server_id)
+        if i is None:
+            return None
+        _, _, record_offset, record_length = _ENTRY.unpack_from(
+            self._buffer, _HEADER.size + i * _ENTRY.size
+        )
+        return json.loads(self._buffer[record_offset : record_offset + record_length])
+
+    def _find(self, server_id: str) -> Optional[int]:
+        key = server_id.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            id_offset, id_length, _, _ = _ENTRY.unpack_from(
+                self._buffer, _HEADER.size + middle * _ENTRY.size
+            )
+            candidate = self._buffer[id_offset : id_offset + id_length]
+            if candidate < key:
+                low = middle + 1
+            elif candidate > key:
+                high = middle
+            else:
+                return middle
+        return None
+
+
+class _Strings(Sequence):
+    """Sorted strings in an artifact, decoded on access."""
+
+    def __init__(self, buffer: Any, table_offset: int, count: int) -> None:
+        self._buffer = buffer
+        self._table_offset = table_offset
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, position):  # type: ignore[override]
+        if isinstance(position, slice):
+            return [self[i] for i in range(*position.indices(self._count))]
+        if position < 0:
+            position += self._count
+        if not 0 <= position < self._count:
+            raise IndexError(position)
+        offset, length, _, _ = _ENTRY.unpack_from(
+            self._buffer, self._table_offset + position * _ENTRY.size
+        )
+        return self._buffer[offset : offset + length].decode("utf-8")
+
+
+class ArtifactIndexData:
+    """Search index stored in a catalog artifact (see search_index.IndexData).
+
+    Postings are read in place from the mapped file.
+    """
+
+    def __init__(self, artifact: CatalogArtifact, buffer: Any, offset: int) -> None:
+        """Wrap the stored index.
+
+        Args:
+            artifact: Artifact holding the index
+            buffer: Artifact contents
+            offset: Offset of the search section
+        """
+        term_count, _ = _SEARCH_HEADER.unpack_from(buffer, offset)
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+        self._table_offset = offset + _SEARCH_HEADER.size
+        self.ids = _Strings(buffer, _HEADER.size, len(artifact))
+        self.vocabulary = _Strings(buffer, self._table_offset, term_count)
+
+    def postings(self, term_number: int) -> PostingList:
+        """Get the postings of the term at a position in the vocabulary."""
+        _, _, offset, count = _ENTRY.unpack_from(
+            self._buffer, self._table_offset + term_number * _ENTRY.size
+        )
+        size = 4 * count
+        parts = [
+            self._view[offset + i * size : offset + (i + 1) * size].cast(typecode)
+            for i, typecode in enumerate(("I", "f", "I", "f"))
+        ]
+        return PostingList(*parts)
@@ -1,22 +1,78 @@
 """Multi-catalog management for MCP servers.
 
-This module provides CatalogManager for managing multiple server catalogs
-(official and local). Implements Phase 1 of multi-catalog support with
-dependency injection patterns.
+This module provides CatalogManager for managing multiple server catalogs:
+the official (built-in) catalog, the user's local catalog, and any number of
+file-backed or HTTP catalogs configured in mcpi.toml:
+
+    [catalogs.team]
+    path = "~/team/mcp-catalog.json"
+    description = "Servers vetted by the team"
+    priority = 50
+
+    [catalogs.shop]
+    url = "https://mcp.example.com/catalog.json"
+    max_age = 3600  # seconds before checking for changes
 
 Key Features:
-- Manages two catalogs: official (built-in) and local (user)
-- Lazy loading: catalogs loaded only when accessed
+- Catalogs ordered by priority (official 100, configured 50, local 0)
+- Lazy loading: catalogs loaded only when accessed, concurrently when
+  several are needed at once
 - Case-insensitive catalog lookup
-- Search across multiple catalogs with ordering
+- Search across all catalogs with a k-way merge of the per-catalog results
 - DIP-compliant: all dependencies injected via constructor
 """
 
+import heapq
+import threading
 import warnings
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
 
+from ..config import get_global_config_path, get_project_config_path, load_config_file
 from .catalog import MCPServer, ServerCatalog
+from .catalog_shards import MANIFEST_NAME
+
+# Names of the catalogs every manager has
+RESERVED_CATALOG_NAMES = ("official", "local")
+
+# Seconds a downloaded remote catalog is used before checking for changes
+# (see remote_catalog.DEFAULT_MAX_AGE, which is not imported here to keep
+# httpx out of commands that use no remote catalog)
+DEFAULT_REMOTE_MAX_AGE = 3600.0
+
+# Priority of configured catalogs that do not set one: between the official
+# catalog (100) and the local catalog (0)
+DEFAULT_CATALOG_PRIORITY = 50
+
+
+@dataclass(frozen=True)
+class CatalogSource:
+    """Where a catalog is loaded from.
+
+    Attributes:
+        name: Catalog name (lowercase)
+        path: Path to catalog file (for remote catalogs, the cached copy)
+        type: Catalog type ("builtin", "local", "file" or "remote")
+        description: Human-readable description
+        priority: Higher priority catalogs are listed and searched first, and
+            win when deduplicating servers present in several catalogs
+        validate_with_cue: Whether to validate the catalog against its schema
+        url: URL a remote catalog is downloaded from
+        max_age: Seconds a remote catalog's cached copy is used before
+            checking for changes
+    """
+
+    name: str
+    path: Path
+    type: str = "file"
+    description: str = ""
+    priority: int = DEFAULT_CATALOG_PRIORITY
+    validate_with_cue: bool = False
+    url: Optional[str] = None
+    max_age: float = DEFAULT_REMOTE_MAX_AGE
 
 
 class CatalogInfo:
@@ -48,10 +104,12 @@ class CatalogInfo:
 class CatalogManager:
     """Manages multiple MCP server catalogs.
 
-    This manager handles two catalogs:
+    This manager always handles two catalogs:
     - official: Built-in catalog from package data
     - local: User's custom catalog in ~/.mcpi/catalogs/local
 
+    plus any additional file-backed or remote catalogs passed as sources.
+
     Features:
     - Lazy loading: catalogs loaded only when first accessed
     - Case-insensitive lookup: "official", "OFFICIAL", "Official" all work
@@ -67,21 +125,83 @@ class CatalogManager:
         >>> results = manager.search_all("filesystem")
     """
 
-    def __init__(self, official_path: Path, local_path: Path):
+    def __init__(
+        self,
+        official_path: Path,
+        local_path: Path,
+        sources: Optional[Iterable[CatalogSource]] = None,
+        max_workers: Optional[int] = None,
+    ):
         """Initialize catalog manager with paths.
 
         Args:
             official_path: Path to official catalog JSON file
             local_path: Path to local catalog JSON file
+            sources: Additional catalogs (names must not be reserved)
+            max_workers: Maximum number of catalogs loaded or searched
+                concurrently (defaults to one thread per catalog)
+
+        Raises:
+            ValueError: If a source uses a reserved or duplicate name
         """
         self.official_path = official_path
         self.local_path = local_path
+        self.max_workers = max_workers
+
+        builtin = [
+            CatalogSource(
+                name="official",
+                path=official_path,
+                type="builtin",
+                description="Official MCP server catalog",
+                priority=100,
+                validate_with_cue=True,
+            ),
+            CatalogSource(
+                name="local",
+                path=local_path,
+                type="local",
+                description="Your custom MCP servers",
+                priority=0,
+                # Local catalog is user-controlled
+                validate_with_cue=False,
+            ),
+        ]
+        self._sources: Dict[str, CatalogSource] = {}
+        for source in builtin + list(sources or ()):
+            name = source.name.lower()
+            if name in self._sources:
+                raise ValueError(f"Duplicate catalog name: '{source.name}'")
+            self._sources[name] = source
+        # Searched and listed in this order; ties broken by name
+        self._order: List[str] = sorted(
+            self._sources, key=lambda name: (-self._sources[name].priority, name)
+        )
 
-        # Lazy loading: catalogs not loaded until accessed
-        self._official: Optional[ServerCatalog] = None
-        self._local: Optional[ServerCatalog] = None
+        # Lazy loading: catalogs not loaded until accessed. Each catalog has
+        # its own lock so that different catalogs load concurrently while a
+        # catalog requested by several threads is loaded once.
+        self._catalogs: Dict[str, ServerCatalog] = {}
+        self._locks: Dict[str, threading.Lock] = {
+            name: threading.Lock() for name in self._sources
+        }
         self._default_catalog = "official"
 
+    def catalog_names(self) -> List[str]:
+        """Get the names of all catalogs, highest priority first."""
+        return list(self._order)
+
+    def get_source(self, name: str) -> Optional[CatalogSource]:
+        """Get where a catalog is loaded from (case-insensitive).
+
+        Args:
+            name: Catalog name
+
+        Returns:
+            CatalogSource or None if not found
+        """
+        return self._sources.get(name.lower())
+
     def get_catalog(self, name: str) -> Optional[ServerCatalog]:
         """Get catalog by name (case-insensitive).
 
@@ -93,34 +213,39 @@ class CatalogManager:
         """
         # Normalize to lowercase for case-insensitive lookup
         name_lower = name.lower()
-
-        if name_lower == "official":
-            if self._official is None:
+        source = self._sources.get(name_lower)
+        if source is None:
+            # Unknown catalog name
+            return None
+
+        catalog = self._catalogs.get(name_lower)
+        if catalog is not None:
+            return catalog
+
+        with self._locks[name_lower]:
+            catalog = self._catalogs.get(name_lower)
+            if catalog is None:
                 # Check if official catalog exists (it should always exist)
-                if not self.official_path.exists():
+                if source.type == "builtin" and not source.path.exists():
                     raise FileNotFoundError(
-                        f"Official catalog not found at {self.official_path}"
+                        f"Official catalog not found at {source.path}"
                     )
-
-                # Lazy load official catalog
-                self._official = ServerCatalog(
-                    catalog_path=self.official_path, validate_with_cue=True
-                )
-                self._official.load_catalog()
-            return self._official
-
-        elif name_lower == "local":
-            if self._local is None:
-                # Lazy load local catalog
-                self._local = ServerCatalog(
-                    catalog_path=self.local_path,
-                    validate_with_cue=False,  # Local catalog is user-controlled
+                if source.url:
+                    from .remote_catalog import RemoteCatalog
+
+                    # Downloads only if nothing is cached; a stale copy is
+                    # refreshed in the background
+                    RemoteCatalog(
+                        source.url, source.path.parent, source.max_age
+                    ).ensure()
+
+                catalog = ServerCatalog(
+                    catalog_path=source.path,
+                    validate_with_cue=source.validate_with_cue,
                 )
-                self._local.load_catalog()
-            return self._local
-
-        # Unknown catalog name
-        return None
+                catalog.load_catalog()
+                self._catalogs[name_lower] = catalog
+        return catalog
 
     def get_default_catalog(self) -> ServerCatalog:
         """Get default catalog (official).
@@ -132,72 +257,234 @@ class CatalogManager:
         assert catalog is not None, "Default catalog should always exist"
         return catalog
 
+    def load_catalogs(
+        self, names: Optional[Sequence[str]] = None
+    ) -> List[Tuple[CatalogSource, ServerCatalog]]:
+        """Load catalogs concurrently.
+
+        Failures of the official and local catalogs propagate. Configured
+        catalogs that fail to load (including remote catalogs that were
+        never downloaded and cannot be) are skipped with a warning, so that
+        one broken source does not hide the servers of the others.
+
+        Args:
+            names: Catalog names (all catalogs if None)
+
+        Returns:
+            (source, catalog) pairs of the loaded catalogs, highest priority
+            first
+
+        Raises:
+            ValueError: If a catalog name is unknown
+        """
+        if names is None:
+            selected = list(self._order)
+        else:
+            wanted = {name.lower() for name in names}
+            unknown = wanted - set(self._sources)
+            if unknown:
+                raise ValueError(
+                    f"Unknown catalog: '{sorted(unknown)[0]}'. "
+                    f"Available catalogs: {', '.join(self._order)}"
+                )
+            selected = [name for name in self._order if name in wanted]
+
+        def load(name: str) -> Optional[ServerCatalog]:
+            try:
+                return self.get_catalog(name)
+            except Exception as e:
+                if self._sources[name].type in ("builtin", "local"):
+                    raise
+                warnings.warn(
+                    f"Skipping catalog '{name}': {e}", UserWarning, stacklevel=3
+                )
+                return None
+
+        catalogs = self._map(load, selected)
+        return [
+            (self._sources[name], catalog)
+            for name, catalog in zip(selected, catalogs)
+            if catalog is not None
+        ]
+
     def list_catalogs(self) -> list[CatalogInfo]:
         """List all available catalogs.
 
         Returns:
-            List of CatalogInfo objects (official, then local)
+            List of CatalogInfo objects, highest priority first (official
+            first, local last unless configured otherwise)
         """
-        catalogs = []
-
-        # Official catalog
-        official = self.get_catalog("official")
-        if official:
-            catalogs.append(
-                CatalogInfo(
-                    name="official",
-                    type="builtin",
-                    path=self.official_path,
-                    description="Official MCP server catalog",
-                    server_count=len(official.list_servers()),
-                )
+        return [
+            CatalogInfo(
+                name=source.name,
+                type=source.type,
+                path=source.path,
+                description=source.description,
+                server_count=len(catalog.list_servers()),
             )
+            for source, catalog in self.load_catalogs()
+        ]
 
-        # Local catalog
-        local = self.get_catalog("local")
-        if local:
-            catalogs.append(
-                CatalogInfo(
-                    name="local",
-                    type="local",
-                    path=self.local_path,
-                    description="Your custom MCP servers",
-                    server_count=len(local.list_servers()),
-                )
-            )
+    def search_all(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        dedupe: bool = False,
+        ranked: bool = False,
+        filters: Optional[Mapping[str, Iterable[str]]] = None,
+    ) -> list[tuple[str, str, MCPServer]]:
+        """Search all catalogs for servers matching query.
 
-        return catalogs
+        Catalogs are loaded and searched concurrently. Each catalog's results
+        are sorted and cut to ``limit`` in its own thread, then the sorted
+        lists are merged lazily, so the search takes about as long as the
+        slowest catalog and no more than ``limit`` results are merged.
 
-    def search_all(self, query: str) -> list[tuple[str, str, MCPServer]]:
-        """Search all catalogs for servers matching query.
+        By default results are ordered by catalog priority (official first),
+        then alphabetically by server_id within each catalog. With ``ranked``
+        they are ordered by relevance across catalogs, ties going to the
+        higher priority catalog.
 
-        Results ordered by catalog priority (official first), then alphabetically
-        by server_id within each catalog. No deduplication: same server_id in
-        multiple catalogs will appear multiple times.
+        Without ``dedupe``, the same server_id in multiple catalogs will
+        appear multiple times. With it, a server only appears from the
+        highest priority catalog containing its ID (even if that entry does
+        not match the query), as that is the entry ``mcpi add`` would use.
 
         Args:
             query: Search query string
+            limit: Maximum number of results
+            dedupe: Drop servers shadowed by a higher priority catalog
+            ranked: Order by relevance instead of by catalog
+            filters: Facet name -> accepted values (see
+                ServerCatalog.search_servers)
 
         Returns:
             List of (catalog_name, server_id, server_config) tuples
         """
-        results = []
+        loaded = self.load_catalogs()
+
+        def search(rank: int) -> List[Tuple[Any, ...]]:
+            source, catalog = loaded[rank]
+            higher = [other for _, other in loaded[:rank]] if dedupe else []
+            # The limit can only be pushed into the catalog search when the
+            # catalog order is the search order and no result is dropped
+            pushed = limit if ranked and not higher else None
+            keyed = []
+            for result in catalog.search(query, pushed, filters):
+                if any(
+                    other.get_server(result.server_id) is not None for other in higher
+                ):
+                    continue
+                key = (
+                    (-result.score, rank, result.server_id)
+                    if ranked
+                    else (rank, result.server_id)
+                )
+                keyed.append((key, source.name, result.server_id, result.server))
+            keyed.sort(key=lambda entry: entry[0])
+            return keyed[:limit] if limit is not None else keyed
+
+        merged = heapq.merge(
+            *self._map(search, range(len(loaded))), key=lambda entry: entry[0]
+        )
+        return [
+            (catalog_name, server_id, server)
+            for _, catalog_name, server_id, server in islice(merged, limit)
+        ]
 
-        # Search catalogs in priority order (official first, then local)
-        for catalog_name in ["official", "local"]:
-            catalog = self.get_catalog(catalog_name)
-            if catalog:
-                # Search this catalog
-                catalog_results = catalog.search_servers(query)
+    def _map(self, function, items: Sequence[Any]) -> List[Any]:
+        """Apply a function to items on a thread pool, in order."""
+        if len(items) <= 1:
+            return [function(item) for item in items]
+        workers = min(len(items), self.max_workers or len(items))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(pool.map(function, items))
 
-                # Sort results alphabetically by server_id within this catalog
-                sorted_results = sorted(catalog_results, key=lambda x: x[0])
 
-                # Add results with catalog name
-                for server_id, server in sorted_results:
-                    results.append((catalog_name, server_id, server))
+def catalog_sources_from_config(
+    config: Mapping[str, Any], base_dir: Path
+) -> List[CatalogSource]:
+    """Read catalog sources from an mcpi.toml ``[catalogs]`` table.
 
-        return results
+    Invalid entries are skipped with a warning.
+
+    Args:
+        config: Parsed mcpi.toml
+        base_dir: Directory relative catalog paths are resolved against (the
+            config file's directory)
+
+    Returns:
+        Configured catalog sources
+    """
+    sources = []
+    for name, entry in config.get("catalogs", {}).items():
+        if not isinstance(entry, dict) or not (entry.get("path") or entry.get("url")):
+            warnings.warn(
+                f"Ignoring catalog '{name}' in mcpi.toml: no path or url set",
+                UserWarning,
+                stacklevel=2,
+            )
+            continue
+        if name.lower() in RESERVED_CATALOG_NAMES:
+            warnings.warn(
+                f"Ignoring catalog '{name}' in mcpi.toml: the name is reserved",
+                UserWarning,
+                stacklevel=2,
+            )
+            continue
+
+        try:
+            priority = int(entry.get("priority", DEFAULT_CATALOG_PRIORITY))
+            max_age = float(entry.get("max_age", DEFAULT_REMOTE_MAX_AGE))
+        except (TypeError, ValueError):
+            warnings.warn(
+                f"Ignoring catalog '{name}' in mcpi.toml: "
+                "priority and max_age must be numbers",
+                UserWarning,
+                stacklevel=2,
+            )
+            continue
+
+        url = entry.get("url")
+        if url:
+            from .remote_catalog import remote_cache_dir
+
+            path = remote_cache_dir(url) / "catalog.json"
+            location = url
+        else:
+            path = Path(entry["path"]).expanduser()
+            if not path.is_absolute():
+                path = base_dir / path
+            location = str(path)
+        sources.append(
+            CatalogSource(
+                name=name.lower(),
+                path=path,
+                type="remote" if url else "file",
+                description=entry.get("description", f"Catalog from {location}"),
+                priority=priority,
+                validate_with_cue=bool(entry.get("validate", False)),
+                url=url,
+                max_age=max_age,
+            )
+        )
+    return sources
+
+
+def load_catalog_sources() -> List[CatalogSource]:
+    """Read the catalogs configured in the global and project mcpi.toml.
+
+    A project catalog replaces a global catalog with the same name.
+
+    Returns:
+        Configured catalog sources
+    """
+    sources: Dict[str, CatalogSource] = {}
+    for config_path in (get_global_config_path(), get_project_config_path()):
+        config = load_config_file(config_path)
+        for source in catalog_sources_from_config(config, config_path.parent):
+            sources[source.name] = source
+    return list(sources.values())
 
 
 # Factory Functions for DIP Compliance
@@ -207,7 +494,10 @@ def create_default_catalog_manager() -> CatalogManager:
     """Create CatalogManager with default paths.
 
     Official catalog: package data/catalog.json
-    Local catalog: ~/.mcpi/catalogs/local/catalog.json
+    Local catalog: ~/.mcpi/catalogs/local/catalog.json, or the directory
+    ~/.mcpi/catalogs/local once migrated to one file per server
+    Other catalogs: ``[catalogs]`` tables of ~/.config/mcpi/mcpi.toml and
+    ./mcpi.toml
 
     Auto-initializes local catalog directory and empty catalog.json if they
     don't exist. Handles errors gracefully with warnings.
@@ -232,6 +522,10 @@ def create_default_catalog_manager() -> CatalogManager:
     local_dir = Path.home() / ".mcpi" / "catalogs" / "local"
     local_path = local_dir / "catalog.json"
 
+    # Sharded local catalog (see catalog_shards and `mcpi catalog migrate`)
+    if (local_dir / MANIFEST_NAME).exists():
+        local_path = local_dir
+
     # Auto-initialize local catalog directory and file
     try:
         local_dir.mkdir(parents=True, exist_ok=True)
@@ -248,20 +542,28 @@ def create_default_catalog_manager() -> CatalogManager:
             stacklevel=2,
         )
 
-    return CatalogManager(official_path=official_path, local_path=local_path)
+    return CatalogManager(
+        official_path=official_path,
+        local_path=local_path,
+        sources=load_catalog_sources(),
+    )
 
 
 def create_test_catalog_manager(
     official_path: Path,
     local_path: Path,
+    sources: Optional[Iterable[CatalogSource]] = None,
 ) -> CatalogManager:
     """Create CatalogManager with custom paths for testing.
 
     Args:
         official_path: Path to test official catalog
         local_path: Path to test local catalog
+        sources: Additional catalogs
 
     Returns:
         CatalogManager instance
     """
-    return CatalogManager(official_path=official_path, local_path=local_path)
+    return CatalogManager(
+        official_path=official_path, local_path=local_path, sources=sources
+    )
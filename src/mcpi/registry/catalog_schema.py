@@ -0,0 +1,113 @@
+"""In-process validation of catalogs against the constraints of catalog.cue.
+
+CUEValidator runs the ``cue`` binary on a temporary file for every check.
+CatalogSchemaValidator enforces the same rules with a JSON Schema compiled
+once per process, so catalogs are validated in memory without spawning a
+process. ``tests/test_registry_catalog_schema.py`` checks both validators
+against a shared corpus of valid and invalid catalogs; keep CATALOG_SCHEMA in
+step with ``data/catalog.cue``.
+
+Correspondence with catalog.cue:
+
+- ``{[string]: #MCPServer}``: every top-level value is a server entry.
+- ``#MCPServer`` is a closed definition: unknown fields are rejected.
+- ``string & !=""``: a non-empty string.
+- ``[...string]``: a list of strings. Open lists default to ``[]`` in CUE, so
+  ``args`` and ``categories`` may be omitted.
+- ``string | null`` without a default: ``repository`` must be present.
+- ``env?: [string]: string``: optional map of strings.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from jsonschema import validators
+from jsonschema.exceptions import best_match
+
+_NON_EMPTY_STRING: Dict[str, Any] = {"type": "string", "minLength": 1}
+_STRING_LIST: Dict[str, Any] = {"type": "array", "items": {"type": "string"}}
+
+CATALOG_SCHEMA: Dict[str, Any] = {
+    "$schema": "https://json-schema.org/draft/2020-12/schema",
+    "type": "object",
+    "additionalProperties": {"$ref": "#/$defs/MCPServer"},
+    "$defs": {
+        "MCPServer": {
+            "type": "object",
+            "properties": {
+                "description": _NON_EMPTY_STRING,
+                "command": _NON_EMPTY_STRING,
+                "args": _STRING_LIST,
+                "env": {
+                    "type": "object",
+                    "additionalProperties": {"type": "string"},
+                },
+                "repository": {"type": ["string", "null"]},
+                "categories": _STRING_LIST,
+            },
+            "required": ["description", "command", "repository"],
+            "additionalProperties": False,
+        }
+    },
+}
+
+_compiled: Optional[Any] = None
+
+
+def _validator() -> Any:
+    """Get the compiled schema validator (built once per process)."""
+    global _compiled
+    if _compiled is None:
+        cls = validators.validator_for(CATALOG_SCHEMA)
+        cls.check_schema(CATALOG_SCHEMA)
+        _compiled = cls(CATALOG_SCHEMA)
+    return _compiled
+
+
+class CatalogSchemaValidator:
+    """Validate catalog data against catalog.cue's rules in process.
+
+    Drop-in replacement for CUEValidator: same ``validate``/``validate_file``
+    interface and a ``version`` identifying the ruleset.
+    """
+
+    # Changes whenever the rules change (used in validation certificates)
+    version = (
+        "mcpi-catalog-schema/"
+        + hashlib.sha256(
+            json.dumps(CATALOG_SCHEMA, sort_keys=True).encode("utf-8")
+        ).hexdigest()[:16]
+    )
+
+    def validate(self, data: Any) -> tuple[bool, Optional[str]]:
+        """Validate catalog data.
+
+        Args:
+            data: Catalog data (server ID -> server entry)
+
+        Returns:
+            (is_valid, error_message) tuple
+        """
+        error = best_match(_validator().iter_errors(data))
+        if error is None:
+            return True, None
+        location = ".".join(str(part) for part in error.absolute_path)
+        return False, f"{location}: {error.message}" if location else error.message
+
+    def validate_file(self, file_path: Path) -> tuple[bool, Optional[str]]:
+        """Validate a JSON catalog file.
+
+        Args:
+            file_path: Path to JSON file to validate
+
+        Returns:
+            (is_valid, error_message) tuple
+        """
+        try:
+            with open(file_path, encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            return False, f"invalid JSON: {e}"
+        return self.validate(data)
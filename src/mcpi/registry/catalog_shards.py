@@ -0,0 +1,256 @@
+"""Catalog stored as one file per server.
+
+A single ``catalog.json`` must be parsed whole to read one server and
+rewritten whole to add one, which gets slow as a personal catalog grows. A
+sharded catalog is a directory instead::
+
+    manifest.json        {"version": 1, "servers": {server ID: shard name}}
+    servers/<shard>.json one catalog entry
+
+Loading reads only the manifest; a server's shard is read and validated by
+MCPServer the first time the server is used. Saving writes the shards of
+the added or changed servers, deletes those of removed servers, and then
+rewrites the manifest, which is the commit point: a crash before it leaves
+the previous catalog intact (at worst with orphaned shard files). The
+manifest is updated under a file lock, re-reading it first, so concurrent
+mcpi processes do not lose each other's changes.
+
+migrate_to_shards() converts a single-file catalog.
+"""
+
+import hashlib
+import json
+import os
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, Iterator, Mapping, Optional
+
+if TYPE_CHECKING:
+    from .catalog import MCPServer
+
+MANIFEST_NAME = "manifest.json"
+SHARDS_DIR = "servers"
+MANIFEST_VERSION = 1
+
+# Suffix given to a single-file catalog after migration
+MIGRATED_SUFFIX = ".migrated"
+
+
+def is_sharded_catalog(path: Path) -> bool:
+    """Check whether a catalog path is a sharded catalog directory."""
+    return path.is_dir()
+
+
+def shard_name(server_id: str) -> str:
+    """Get the file name of a server's shard.
+
+    Names are derived from a digest of the ID, as IDs contain ``/`` and may
+    differ only in case, which some filesystems do not distinguish.
+    """
+    return hashlib.sha256(server_id.encode("utf-8")).hexdigest()[:24] + ".json"
+
+
+class ShardedCatalogStore:
+    """Reads and writes the files of a sharded catalog."""
+
+    def __init__(self, directory: Path) -> None:
+        """Initialize the store.
+
+        Args:
+            directory: Catalog directory (need not exist yet)
+        """
+        self.directory = directory
+        self.manifest_path = directory / MANIFEST_NAME
+        self.shards_dir = directory / SHARDS_DIR
+
+    def read_manifest(self) -> Dict[str, str]:
+        """Read the manifest.
+
+        Returns:
+            Server ID -> shard name (empty if there is no manifest)
+
+        Raises:
+            ValueError: If the manifest is invalid or of a newer version
+        """
+        try:
+            raw = self.manifest_path.read_bytes()
+        except FileNotFoundError:
+            return {}
+        manifest = json.loads(raw)
+        version = manifest.get("version") if isinstance(manifest, dict) else None
+        if version != MANIFEST_VERSION:
+            raise ValueError(f"Unsupported catalog manifest: {self.manifest_path}")
+        return manifest["servers"]
+
+    def read_shard(self, name: str) -> Dict[str, Any]:
+        """Read a server's catalog entry.
+
+        Args:
+            name: Shard name from the manifest
+
+        Returns:
+            Catalog entry
+        """
+        return json.loads((self.shards_dir / name).read_bytes())
+
+    def commit(self, changes: Mapping[str, Optional[Dict[str, Any]]]) -> None:
+        """Store added, changed and removed servers.
+
+        Args:
+            changes: Server ID -> new catalog entry, or None to remove it
+                (the manifest is written even if there are none)
+        """
+        # Imported here: mcpi.clients is heavy and reading needs neither
+        from mcpi.clients.atomic_files import atomic_write_bytes
+        from mcpi.clients.file_lock import file_lock
+
+        self.shards_dir.mkdir(parents=True, exist_ok=True)
+        with file_lock(self.manifest_path):
+            servers = self.read_manifest()
+            removed = []
+            for server_id, entry in changes.items():
+                if entry is None:
+                    name = servers.pop(server_id, None)
+                    if name is not None:
+                        removed.append(name)
+                    continue
+                name = servers.get(server_id) or shard_name(server_id)
+                atomic_write_bytes(
+                    self.shards_dir / name,
+                    json.dumps(entry, indent=2, ensure_ascii=False).encode("utf-8"),
+                )
+                servers[server_id] = name
+
+            manifest = {
+                "version": MANIFEST_VERSION,
+                "servers": dict(sorted(servers.items())),
+            }
+            atomic_write_bytes(
+                self.manifest_path,
+                json.dumps(manifest, indent=1, ensure_ascii=False).encode("utf-8"),
+            )
+            # Only once the manifest no longer references them
+            for name in removed:
+                try:
+                    os.unlink(self.shards_dir / name)
+                except FileNotFoundError:
+                    pass
+
+
+class ShardedServerMap(MutableMapping):
+    """Server mapping backed by a sharded catalog.
+
+    Membership and iteration read only the manifest; MCPServer objects are
+    built from their shards on first access. Changes are kept in memory
+    until ServerCatalog.save_catalog() commits them.
+    """
+
+    def __init__(self, store: ShardedCatalogStore) -> None:
+        """Initialize the mapping.
+
+        Args:
+            store: Catalog files
+
+        Raises:
+            ValueError: If the manifest is invalid
+        """
+        self._store = store
+        self._shards = store.read_manifest()
+        self._hydrated: Dict[str, MCPServer] = {}
+        # Added or replaced servers; None marks a removed server
+        self._overrides: Dict[str, Optional[MCPServer]] = {}
+
+    def __getitem__(self, server_id: str) -> "MCPServer":
+        from .catalog import MCPServer
+
+        if server_id in self._overrides:
+            server = self._overrides[server_id]
+            if server is None:
+                raise KeyError(server_id)
+            return server
+        server = self._hydrated.get(server_id)
+        if server is None:
+            name = self._shards.get(server_id)
+            if name is None:
+                raise KeyError(server_id)
+            server = MCPServer(**self._store.read_shard(name))
+            self._hydrated[server_id] = server
+        return server
+
+    def __setitem__(self, server_id: str, server: "MCPServer") -> None:
+        self._overrides[server_id] = server
+
+    def __delitem__(self, server_id: str) -> None:
+        if server_id not in self:
+            raise KeyError(server_id)
+        self._overrides[server_id] = None
+
+    def __contains__(self, server_id: object) -> bool:
+        if server_id in self._overrides:
+            return self._overrides[server_id] is not None
+        return server_id in self._shards
+
+    def __iter__(self) -> Iterator[str]:
+        for server_id in self._shards:
+            if self._overrides.get(server_id, True) is not None:
+                yield server_id
+        for server_id, server in self._overrides.items():
+            if server is not None and server_id not in self._shards:
+                yield server_id
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def pending_changes(self) -> Dict[str, Optional["MCPServer"]]:
+        """Get the changes not committed yet (None marks a removal)."""
+        return dict(self._overrides)
+
+    def mark_committed(self) -> None:
+        """Record that the pending changes were committed."""
+        for server_id, server in self._overrides.items():
+            if server is None:
+                self._shards.pop(server_id, None)
+                self._hydrated.pop(server_id, None)
+            else:
+                self._shards.setdefault(server_id, shard_name(server_id))
+                self._hydrated[server_id] = server
+        self._overrides.clear()
+
+
+def migrate_to_shards(catalog_path: Path, directory: Optional[Path] = None) -> Path:
+    """Convert a single-file JSON catalog into a sharded catalog.
+
+    Entries are validated by MCPServer. The catalog file is renamed with a
+    ``.migrated`` suffix once the sharded catalog is complete.
+
+    Args:
+        catalog_path: JSON catalog file
+        directory: Sharded catalog directory (defaults to the catalog's
+            directory)
+
+    Returns:
+        The sharded catalog directory
+
+    Raises:
+        FileExistsError: If the directory already holds a sharded catalog
+        ValueError: If the catalog is invalid
+    """
+    from .catalog import MCPServer
+
+    directory = directory or catalog_path.parent
+    store = ShardedCatalogStore(directory)
+    if store.manifest_path.exists():
+        raise FileExistsError(f"{directory} already holds a sharded catalog")
+
+    data = json.loads(catalog_path.read_bytes()) if catalog_path.exists() else {}
+    if not isinstance(data, dict):
+        raise ValueError(f"{catalog_path} is not a catalog object")
+    store.commit(
+        {
+            server_id: MCPServer(**entry).model_dump(mode="json")
+            for server_id, entry in data.items()
+        }
+    )
+    if catalog_path.exists():
+        catalog_path.rename(catalog_path.with_name(catalog_path.name + MIGRATED_SUFFIX))
+    return directory
@@ -6,6 +6,9 @@ import tempfile
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# Default schema, inside the package data directory
+DEFAULT_SCHEMA_PATH = Path(__file__).parent.parent / "data" / "catalog.cue"
+
 
 class CUEValidator:
     """Validate registry data against CUE schema."""
@@ -13,17 +16,19 @@ class CUEValidator:
     def __init__(self, schema_path: Optional[Path] = None):
         """Initialize with CUE schema path."""
         if schema_path is None:
-            # Default to package data directory (now inside the package)
-            package_dir = Path(__file__).parent.parent
-            schema_path = package_dir / "data" / "catalog.cue"
+            schema_path = DEFAULT_SCHEMA_PATH
 
         self.schema_path = schema_path
 
-        # Check if cue is available
-        self._check_cue_available()
+        # Check if cue is available (and record its version)
+        self.version = self._check_cue_available()
+
+    def _check_cue_available(self) -> str:
+        """Check if cue command is available.
 
-    def _check_cue_available(self) -> None:
-        """Check if cue command is available."""
+        Returns:
+            First line of ``cue version`` output
+        """
         try:
             result = subprocess.run(["cue", "version"], capture_output=True, text=True)
             if result.returncode != 0:
@@ -34,6 +39,8 @@ class CUEValidator:
             raise RuntimeError(
                 "CUE command not found. Please install CUE from https://cuelang.org/docs/install/"
             )
+        lines = result.stdout.strip().splitlines()
+        return lines[0] if lines else ""
 
     def _run_cue_vet(self, file_path: Path) -> tuple[bool, Optional[str]]:
         """Run cue vet on a file and return result.
@@ -0,0 +1,150 @@
+"""Facet postings for filtering catalog servers.
+
+FacetIndex maps each value of each facet (a server's categories, its
+command, and whether it has a repository) to the IDs of the servers having
+it. Filters are answered by intersecting these sets, smallest first, and
+the facet counts of the whole catalog are their sizes, so neither requires
+a pass over the catalog (counts for a result set take one pass over the
+results). The index is updated in place as servers are added, replaced or
+removed.
+"""
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Optional, Set
+
+if TYPE_CHECKING:
+    from .catalog import MCPServer
+
+# Facet names, in display order
+FACETS = ("category", "command", "repository")
+
+
+def server_facets(server: "MCPServer") -> Dict[str, List[str]]:
+    """Get a server's facet values.
+
+    Args:
+        server: Server entry
+
+    Returns:
+        Facet name -> values (``repository`` is ``yes`` or ``no``)
+    """
+    return {
+        "category": list(dict.fromkeys(server.categories)),
+        "command": [server.command],
+        "repository": ["yes" if server.repository else "no"],
+    }
+
+
+class FacetIndex:
+    """Server IDs by facet value."""
+
+    def __init__(self, servers: Mapping[str, "MCPServer"]) -> None:
+        """Build the index.
+
+        Args:
+            servers: Server ID -> server
+        """
+        self._postings: Dict[str, Dict[str, Set[str]]] = {facet: {} for facet in FACETS}
+        # Server ID -> facet values, to unindex a server that was replaced
+        self._values: Dict[str, Dict[str, List[str]]] = {}
+        for server_id, server in servers.items():
+            self.add(server_id, server)
+
+    def __len__(self) -> int:
+        """Number of indexed servers."""
+        return len(self._values)
+
+    def add(self, server_id: str, server: "MCPServer") -> None:
+        """Index a server, replacing its previous entry if any."""
+        self.remove(server_id)
+        values = server_facets(server)
+        self._values[server_id] = values
+        for facet, facet_values in values.items():
+            postings = self._postings[facet]
+            for value in facet_values:
+                ids = postings.get(value)
+                if ids is None:
+                    ids = postings[value] = set()
+                ids.add(server_id)
+
+    def remove(self, server_id: str) -> None:
+        """Unindex a server (no-op if it is not indexed)."""
+        values = self._values.pop(server_id, None)
+        if values is None:
+            return
+        for facet, facet_values in values.items():
+            postings = self._postings[facet]
+            for value in facet_values:
+                ids = postings[value]
+                ids.discard(server_id)
+                if not ids:
+                    del postings[value]
+
+    def matching(self, filters: Mapping[str, Iterable[str]]) -> Optional[Set[str]]:
+        """Find the servers matching facet filters.
+
+        A server matches if, for every filtered facet, it has one of the
+        given values. Values are compared case-insensitively.
+
+        Args:
+            filters: Facet name -> accepted values; facets without values
+                are not filtered
+
+        Returns:
+            Matching server IDs, or None if nothing is filtered
+
+        Raises:
+            ValueError: If a facet name is unknown
+        """
+        selections = []
+        for facet, accepted in filters.items():
+            if facet not in self._postings:
+                raise ValueError(
+                    f"Unknown facet '{facet}' (expected one of: {', '.join(FACETS)})"
+                )
+            wanted = {value.lower() for value in accepted}
+            if not wanted:
+                continue
+            selected: Set[str] = set()
+            for value, ids in self._postings[facet].items():
+                if value.lower() in wanted:
+                    selected |= ids
+            selections.append(selected)
+
+        if not selections:
+            return None
+        selections.sort(key=len)
+        return selections[0].intersection(*selections[1:])
+
+    def counts(
+        self, server_ids: Optional[Iterable[str]] = None
+    ) -> Dict[str, Dict[str, int]]:
+        """Count the servers having each facet value.
+
+        Args:
+            server_ids: Servers to count (all indexed servers if None)
+
+        Returns:
+            Facet name -> value -> number of servers, most common first
+        """
+        if server_ids is None:
+            counts = {
+                facet: {value: len(ids) for value, ids in postings.items()}
+                for facet, postings in self._postings.items()
+            }
+        else:
+            counts = {facet: {} for facet in FACETS}
+            for server_id in server_ids:
+                for facet, facet_values in self._values[server_id].items():
+                    facet_counts = counts[facet]
+                    for value in facet_values:
+                        facet_counts[value] = facet_counts.get(value, 0) + 1
+        return {
+            facet: dict(
+                sorted(facet_counts.items(), key=lambda item: (-item[1], item[0]))
+            )
+            for facet, facet_counts in counts.items()
+        }
+
+    def category_counts(self) -> Dict[str, int]:
+        """Count the servers in each category, in order of first appearance."""
+        return {value: len(ids) for value, ids in self._postings["category"].items()}
@@ -0,0 +1,361 @@
+"""Typo-tolerant and prefix lookup of catalog terms and server IDs.
+
+TrigramIndex maps each trigram (three-character substring) of a sorted term
+list to the terms containing it. A lookup counts the trigrams each term
+shares with the query, which only touches the postings of the query's own
+trigrams, and verifies the few terms sharing enough of them with a bounded
+edit distance. Terms within max_edits(query) edits (adjacent transpositions
+count as one) are returned, so ``postgress`` finds ``postgres``.
+
+Partially typed text is matched against term prefixes instead. Trigram
+counts bound that poorly (most terms share a trigram or two with the start
+of a prefix), so the sorted terms are walked like a trie, computing one edit
+distance row per distinct prefix and skipping every term under a prefix
+that is already more than the allowed edits away.
+
+The same postings answer substring lookups (the terms containing ``sql``):
+only terms holding every trigram of the text need to be compared with it.
+
+SearchIndex uses it for query terms that match no index term and for its
+substring fallback, and CompletionIndex for completing partial server IDs in
+the shell.
+"""
+
+from bisect import bisect_left
+from collections import Counter
+from itertools import islice
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+if TYPE_CHECKING:
+    from .catalog import MCPServer
+
+# Padding marking the start and end of a term, so that its first and last
+# characters appear in as many trigrams as the others
+_PAD = "\0\0"
+
+# Sorts after every string starting with a given prefix
+_PREFIX_END = chr(0x10FFFF)
+
+
+def max_edits(term: str) -> int:
+    """Get the number of typos tolerated in a term of this length.
+
+    Terms of up to three characters must match exactly, terms of up to seven
+    may contain one typo, and longer terms two.
+    """
+    if len(term) < 4:
+        return 0
+    if len(term) < 8:
+        return 1
+    return 2
+
+
+def trigrams(term: str) -> List[str]:
+    """Get the padded trigrams of a term, in order of occurrence."""
+    padded = _PAD + term + _PAD
+    return [padded[i : i + 3] for i in range(len(padded) - 2)]
+
+
+def edit_distance(a: str, b: str, limit: int) -> int:
+    """Compute the optimal string alignment distance of two strings.
+
+    Insertions, deletions, substitutions and transpositions of adjacent
+    characters each count as one edit. Computation stops as soon as the
+    distance is known to exceed ``limit``.
+
+    Args:
+        a: First string
+        b: Second string
+        limit: Largest distance of interest
+
+    Returns:
+        Distance, or limit + 1 if it is larger than ``limit``
+    """
+    if abs(len(a) - len(b)) > limit:
+        return limit + 1
+
+    before: List[int] = []
+    previous = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        current = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            distance = min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (a[i - 1] != b[j - 1]),
+            )
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                distance = min(distance, before[j - 2] + 1)
+            current[j] = distance
+        if min(current) > limit:
+            return limit + 1
+        before, previous = previous, current
+
+    return min(previous[-1], limit + 1)
+
+
+class TrigramIndex:
+    """Prefix and approximate lookup over a sorted sequence of terms."""
+
+    def __init__(self, terms: Sequence[str]) -> None:
+        """Initialize the index.
+
+        Args:
+            terms: Terms in sorted order (term number = position)
+        """
+        self.terms = terms
+        # Trigram -> term numbers, and the terms as a list, built on first
+        # use (prefix lookups only need the sorted terms)
+        self._postings: Optional[Dict[str, List[int]]] = None
+        self._term_list: List[str] = []
+
+    def prefixed(self, prefix: str) -> range:
+        """Get the numbers of the terms starting with ``prefix``."""
+        return range(
+            bisect_left(self.terms, prefix),
+            bisect_left(self.terms, prefix + _PREFIX_END),
+        )
+
+    def similar(self, text: str, limit: int) -> List[Tuple[int, int]]:
+        """Find the terms within ``limit`` edits of a text.
+
+        Candidates must share enough trigrams with the text to be within
+        ``limit`` edits (each edit changes at most four trigrams) and at
+        least one, which can miss matches of very short texts.
+
+        Args:
+            text: Text to look up
+            limit: Maximum edit distance
+
+        Returns:
+            (distance, term number) pairs, closest first, then in term order
+        """
+        index = self._trigram_postings()
+        grams = set(trigrams(text))
+        shared: Counter = Counter()
+        for gram in grams:
+            shared.update(index.get(gram, ()))
+        needed = max(1, len(grams) - 4 * limit)
+
+        matches = []
+        for number, count in shared.items():
+            if count < needed:
+                continue
+            distance = edit_distance(text, self._term_list[number], limit)
+            if distance <= limit:
+                matches.append((distance, number))
+        matches.sort()
+        return matches
+
+    def containing(self, text: str) -> List[int]:
+        """Find the terms containing a text.
+
+        Texts of three or more characters are looked up by their trigrams;
+        shorter ones are compared with every term.
+
+        Args:
+            text: Text to look up
+
+        Returns:
+            Numbers of the terms containing ``text``, in term order
+        """
+        index = self._trigram_postings()
+        grams = {text[i : i + 3] for i in range(len(text) - 2)}
+        if grams:
+            postings = sorted((index.get(gram, []) for gram in grams), key=len)
+            numbers: Iterable[int] = sorted(
+                set(postings[0]).intersection(*postings[1:])
+            )
+        else:
+            numbers = range(len(self._term_list))
+        return [number for number in numbers if text in self._term_list[number]]
+
+    def _trigram_postings(self) -> Dict[str, List[int]]:
+        """Get the trigram -> term numbers mapping, building it on first use."""
+        if self._postings is None:
+            self._postings = {}
+            self._term_list = list(self.terms)
+            for number, term in enumerate(self._term_list):
+                for gram in set(trigrams(term)):
+                    postings = self._postings.get(gram)
+                    if postings is None:
+                        postings = self._postings[gram] = []
+                    postings.append(number)
+        return self._postings
+
+    def similar_prefixes(self, text: str, limit: int) -> List[Tuple[int, range]]:
+        """Find the terms starting with a string within ``limit`` edits of a
+        text, for completing partially typed text.
+
+        Args:
+            text: Text typed so far
+            limit: Maximum edit distance
+
+        Returns:
+            (distance, term numbers) pairs, closest first, then in term order
+        """
+        terms = self.terms
+        depth = len(text) + limit
+        found: List[Tuple[int, range]] = []
+
+        def walk(
+            prefix: str,
+            start: int,
+            end: int,
+            before: List[int],
+            previous: List[int],
+            best: int,
+        ) -> None:
+            # previous and before are the distance rows of prefix and of
+            # prefix[:-1] against the prefixes of text; best is the smallest
+            # distance of text to any prefix of prefix
+            position = len(prefix)
+            while start < end:
+                term = terms[start]
+                if len(term) == position:
+                    if best <= limit:
+                        found.append((best, range(start, start + 1)))
+                    start += 1
+                    continue
+                char = term[position]
+                child_end = bisect_left(terms, prefix + char + _PREFIX_END, start, end)
+                row = [position + 1]
+                for j in range(1, len(text) + 1):
+                    distance = min(
+                        previous[j] + 1,
+                        row[j - 1] + 1,
+                        previous[j - 1] + (text[j - 1] != char),
+                    )
+                    if (
+                        position
+                        and j > 1
+                        and text[j - 1] == prefix[-1]
+                        and text[j - 2] == char
+                    ):
+                        distance = min(distance, before[j - 2] + 1)
+                    row.append(distance)
+                child_best = min(best, row[-1])
+                if min(row) <= limit and position + 1 < depth:
+                    walk(prefix + char, start, child_end, previous, row, child_best)
+                elif child_best <= limit:
+                    # Longer prefixes cannot come closer to text
+                    found.append((child_best, range(start, child_end)))
+                start = child_end
+
+        walk("", 0, len(terms), [], list(range(len(text) + 1)), len(text))
+        found.sort(key=lambda match: (match[0], match[1].start))
+        return found
+
+
+def package_names(args: Sequence[str]) -> List[str]:
+    """Get the package names in a server's command arguments.
+
+    Options, paths and plain words (such as docker's ``run``) are skipped;
+    version suffixes and ``github:`` prefixes are removed.
+
+    Args:
+        args: Command arguments
+
+    Returns:
+        Package names without their leading ``@``
+    """
+    names = []
+    for arg in args:
+        if arg.startswith(("-", "/", ".", "~")) or not any(c in arg for c in "-/@"):
+            continue
+        name = arg.split(":", 1)[-1]
+        version = name.find("@", 1)
+        if version > 0:
+            name = name[:version]
+        names.append(name.lstrip("@"))
+    return names
+
+
+def completion_keys(server_id: str, server: "MCPServer") -> List[str]:
+    """Get the lowercase keys a server can be completed from.
+
+    These are its ID, the parts of its ID and of its package names, and its
+    package names.
+    """
+    keys = []
+    for name in [server_id] + package_names(server.args):
+        name = name.lower()
+        keys.append(name)
+        keys.extend(part.lstrip("@") for part in name.split("/"))
+    return [key for key in dict.fromkeys(keys) if key]
+
+
+class CompletionIndex:
+    """Completion of partially typed server IDs."""
+
+    def __init__(self, servers: Mapping[str, "MCPServer"]) -> None:
+        """Initialize the index.
+
+        Args:
+            servers: Server ID -> server; the index must be rebuilt when it
+                changes
+        """
+        self._servers = servers
+        self._ids: List[str] = sorted(servers)
+        # Built on first use: most completions are answered by the IDs
+        self._keys: Optional[TrigramIndex] = None
+        self._owners: List[List[str]] = []
+
+    def complete(self, text: str, limit: Optional[int] = None) -> List[str]:
+        """Complete a partially typed server ID.
+
+        IDs starting with ``text`` come first. They are followed by servers
+        whose ID parts or package names start with it (case-insensitively)
+        and, only when nothing matches so far, by servers where one of these
+        starts with a string within max_edits(text) typos of ``text``.
+
+        Args:
+            text: Text typed so far
+            limit: Maximum number of IDs
+
+        Returns:
+            Matching server IDs
+        """
+        found: Dict[str, None] = {}
+        start = bisect_left(self._ids, text)
+        for server_id in islice(self._ids, start, None):
+            if not server_id.startswith(text) or len(found) == limit:
+                break
+            found[server_id] = None
+        if not text or len(found) == limit:
+            return list(found)
+
+        keys = self._key_index()
+        lowered = text.lower()
+        groups: List[range] = [keys.prefixed(lowered)]
+        if not groups[0] and not found and max_edits(lowered):
+            groups = [
+                numbers
+                for _, numbers in keys.similar_prefixes(lowered, max_edits(lowered))
+            ]
+        for numbers in groups:
+            for number in numbers:
+                for server_id in self._owners[number]:
+                    if len(found) == limit:
+                        return list(found)
+                    found[server_id] = None
+        return list(found)
+
+    def _key_index(self) -> TrigramIndex:
+        if self._keys is None:
+            owners: Dict[str, List[str]] = {}
+            for server_id in self._ids:
+                for key in completion_keys(server_id, self._servers[server_id]):
+                    owners.setdefault(key, []).append(server_id)
+            self._keys = TrigramIndex(sorted(owners))
+            self._owners = [owners[key] for key in self._keys.terms]
+        return self._keys
@@ -0,0 +1,269 @@
+"""Catalogs published over HTTP, mirrored into the user cache directory.
+
+A remote catalog is downloaded to ``<user cache>/catalogs/<url hash>/``,
+together with the response's validators (``ETag`` and ``Last-Modified``).
+Within the freshness window (``max_age``) the cached copy is used without
+any network access. Once it is stale, the copy is still used and a refresh
+runs in a background thread: a conditional request (``If-None-Match`` /
+``If-Modified-Since``) that usually costs a 304 response and no download.
+Only the first use of a catalog waits for the network.
+
+A failed refresh (offline, server error, a body that is not a catalog
+of valid server entries) keeps the last good copy. After a failed
+background refresh the copy counts as fresh again, so that commands run
+offline do not retry (and wait for the retry at exit) until ``max_age``
+passes. Cached files are replaced atomically, so a refresh interrupted by
+the process exiting leaves the previous copy intact; at exit, running
+refreshes get a short grace period to finish.
+"""
+
+import atexit
+import hashlib
+import json
+import logging
+import threading
+import time
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import httpx
+from platformdirs import user_cache_dir
+
+logger = logging.getLogger(__name__)
+
+# Seconds a downloaded catalog is used before it is checked for changes
+DEFAULT_MAX_AGE = 3600.0
+# Seconds to wait for the catalog server
+DEFAULT_TIMEOUT = 10.0
+# Seconds a command waits at exit for background refreshes to finish
+EXIT_GRACE_SECONDS = 2.0
+
+_refreshes: List[threading.Thread] = []
+_refreshes_lock = threading.Lock()
+
+
+def remote_cache_dir(url: str) -> Path:
+    """Get the directory a remote catalog is cached in.
+
+    Args:
+        url: Catalog URL
+
+    Returns:
+        Per-URL directory under the user cache directory
+    """
+    digest = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+    return Path(user_cache_dir("mcpi")) / "catalogs" / digest
+
+
+class RemoteCatalog:
+    """A catalog URL and its cached copy."""
+
+    def __init__(
+        self,
+        url: str,
+        cache_dir: Optional[Path] = None,
+        max_age: float = DEFAULT_MAX_AGE,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        """Initialize the remote catalog.
+
+        Args:
+            url: Catalog URL (serving catalog JSON)
+            cache_dir: Directory for the cached copy (defaults to
+                remote_cache_dir(url))
+            max_age: Seconds a copy is used before checking for changes
+            timeout: Seconds to wait for the server
+        """
+        self.url = url
+        self.cache_dir = cache_dir or remote_cache_dir(url)
+        self.max_age = max_age
+        self.timeout = timeout
+        self.catalog_path = self.cache_dir / "catalog.json"
+        self.metadata_path = self.cache_dir / "metadata.json"
+        self._refresh_lock = threading.Lock()
+
+    def metadata(self) -> Dict[str, Any]:
+        """Get the validators and fetch time of the cached copy.
+
+        Returns:
+            Dict with ``url``, ``etag``, ``last_modified`` and ``fetched_at``
+            (seconds since the epoch), or an empty dict if nothing is cached
+        """
+        try:
+            metadata = json.loads(self.metadata_path.read_bytes())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(metadata, dict) or metadata.get("url") != self.url:
+            return {}
+        return metadata
+
+    def is_cached(self) -> bool:
+        """Check whether a copy of the catalog was downloaded."""
+        return self.catalog_path.exists() and bool(self.metadata())
+
+    def is_fresh(self) -> bool:
+        """Check whether the cached copy is within the freshness window."""
+        fetched_at = self.metadata().get("fetched_at")
+        return (
+            isinstance(fetched_at, (int, float))
+            and self.catalog_path.exists()
+            and time.time() - fetched_at < self.max_age
+        )
+
+    def refresh(self) -> bool:
+        """Download the catalog if it changed since the cached copy.
+
+        Returns:
+            True if a new copy was stored, False if the server reported it
+            unchanged
+
+        Raises:
+            httpx.HTTPError: If the request fails
+            ValueError: If the response is not a valid JSON catalog
+        """
+        from pydantic import ValidationError
+
+        from .catalog import MCPServer
+
+        with self._refresh_lock:
+            metadata = self.metadata() if self.catalog_path.exists() else {}
+            headers = {"Accept": "application/json"}
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
+
+            with httpx.Client(timeout=self.timeout, follow_redirects=True) as client:
+                response = client.get(self.url, headers=headers)
+
+            if response.status_code == 304 and metadata:
+                metadata["fetched_at"] = time.time()
+                self._write(self.metadata_path, json.dumps(metadata).encode("utf-8"))
+                return False
+            response.raise_for_status()
+
+            body = response.content
+            try:
+                data = json.loads(body)
+            except ValueError as e:
+                raise ValueError(f"{self.url} did not return JSON: {e}") from e
+            if not isinstance(data, dict) or not all(
+                isinstance(entry, dict) for entry in data.values()
+            ):
+                raise ValueError(f"{self.url} did not return a catalog object")
+            for server_id, entry in data.items():
+                try:
+                    MCPServer.model_validate(entry)
+                except ValidationError as e:
+                    raise ValueError(
+                        f"{self.url} returned an invalid entry {server_id!r}: {e}"
+                    ) from e
+
+            # Body first: metadata with validators of a body that was never
+            # written would make the server report it unchanged
+            self._write(self.catalog_path, body)
+            metadata = {
+                "url": self.url,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+                "fetched_at": time.time(),
+            }
+            self._write(self.metadata_path, json.dumps(metadata).encode("utf-8"))
+            return True
+
+    def ensure(self, background: bool = True) -> Path:
+        """Get a usable copy of the catalog.
+
+        The cached copy is returned as is while fresh. A stale copy is
+        returned too, after starting a refresh in the background (or, with
+        ``background=False``, after refreshing it; if that fails the stale
+        copy is used with a warning). Without a cached copy the catalog is
+        downloaded first.
+
+        Args:
+            background: Refresh a stale copy without waiting for it
+
+        Returns:
+            Path of the cached catalog file
+
+        Raises:
+            httpx.HTTPError: If nothing is cached and the download fails
+            ValueError: If nothing is cached and the response is invalid
+        """
+        if not self.is_cached():
+            self.refresh()
+        elif not self.is_fresh():
+            if background:
+                self.refresh_in_background()
+            else:
+                try:
+                    self.refresh()
+                except (httpx.HTTPError, ValueError, OSError) as e:
+                    warnings.warn(
+                        f"Could not refresh catalog from {self.url}, "
+                        f"using cached copy: {e}",
+                        UserWarning,
+                        stacklevel=2,
+                    )
+        return self.catalog_path
+
+    def refresh_in_background(self) -> Optional[threading.Thread]:
+        """Start refreshing the cached copy in a daemon thread.
+
+        Returns:
+            The refresh thread, or None if a refresh is already running
+        """
+        if self._refresh_lock.locked():
+            return None
+
+        def run() -> None:
+            try:
+                self.refresh()
+            except (httpx.HTTPError, ValueError, OSError) as e:
+                logger.info("Background refresh of %s failed: %s", self.url, e)
+                self._postpone_refresh()
+
+        thread = threading.Thread(
+            target=run, name=f"mcpi-catalog-refresh {self.url}", daemon=True
+        )
+        with _refreshes_lock:
+            _refreshes.append(thread)
+        thread.start()
+        return thread
+
+    def _postpone_refresh(self) -> None:
+        """Mark the cached copy as checked now, so that it is not refreshed
+        again before ``max_age`` passes."""
+        with self._refresh_lock:
+            metadata = self.metadata()
+            if not metadata or not self.catalog_path.exists():
+                return
+            metadata["fetched_at"] = time.time()
+            try:
+                self._write(self.metadata_path, json.dumps(metadata).encode("utf-8"))
+            except OSError as e:
+                logger.info("Could not update metadata of %s: %s", self.url, e)
+
+    def _write(self, target: Path, data: bytes) -> None:
+        """Atomically replace a cached file."""
+        from mcpi.clients.atomic_files import atomic_write_bytes
+
+        atomic_write_bytes(target, data)
+
+
+def wait_for_refreshes(timeout: float = EXIT_GRACE_SECONDS) -> None:
+    """Wait for background refreshes to finish.
+
+    Args:
+        timeout: Longest total time to wait, in seconds
+    """
+    deadline = time.monotonic() + timeout
+    with _refreshes_lock:
+        threads = list(_refreshes)
+        _refreshes.clear()
+    for thread in threads:
+        thread.join(max(0.0, deadline - time.monotonic()))
+
+
+atexit.register(wait_for_refreshes)
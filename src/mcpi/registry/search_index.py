@@ -0,0 +1,630 @@
+"""Ranked full-text search over catalog servers.
+
+SearchIndex keeps an inverted index (term -> servers) over each server's ID,
+description, categories, package arguments and repository path, so a query
+only touches the postings of its terms instead of scanning every server.
+Scores are BM25F: term frequencies are weighted per field (FIELD_WEIGHTS),
+normalized by field length and saturated, then multiplied by the term's
+inverse document frequency. A posting's score does not depend on the query,
+so it is computed when the index is built and postings are stored best
+first. Top-k queries use the threshold algorithm: postings are read in score
+order and reading stops once no unread server can enter the top k.
+
+The index of the official catalog is built at compile time and stored in the
+catalog artifact (see catalog_artifact); other catalogs are indexed in memory
+on first search.
+
+Query syntax: whitespace-separated terms must all match (AND); ``OR``
+separates alternatives, e.g. ``postgres OR mysql``. A term of at least
+MIN_PREFIX_LENGTH characters also matches the index terms it is a prefix of
+(``file`` matches ``filesystem``), scored at PREFIX_WEIGHT. A term that
+matches no index term either way matches the index terms within a few typos
+of it (see fuzzy_index), scored at FUZZY_WEIGHT divided by the number of
+typos. Servers whose ID or description contains the query as a substring
+(``sql`` in ``PostgreSQL``) follow the ranked results with a score of 0, so
+every server found by a plain substring scan is still found. Each term of
+such a query lies inside one of the server's index terms, so only servers
+with index terms containing every query term (found through the trigram
+postings of the vocabulary) are checked. An empty query matches every
+server.
+"""
+
+import heapq
+import math
+import re
+from bisect import bisect_left
+from collections import Counter
+from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING,
+    Collection,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Protocol,
+    Sequence,
+    Set,
+    Tuple,
+)
+
+from .fuzzy_index import TrigramIndex, max_edits
+
+if TYPE_CHECKING:
+    from .catalog import MCPServer
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+# Scheme and host of a repository URL, which nearly every server shares
+_URL_HOST = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*://[^/]*")
+
+# Relative importance of a term occurrence in each field
+FIELD_WEIGHTS: Dict[str, float] = {
+    "id": 3.0,
+    "categories": 2.0,
+    "args": 1.5,
+    "description": 1.0,
+    "repository": 0.5,
+}
+
+# Score multiplier for index terms matched by prefix rather than exactly
+PREFIX_WEIGHT = 0.5
+
+# Score multiplier for index terms one typo away from an unmatched query term
+FUZZY_WEIGHT = 0.4
+
+# Shorter query terms only match exactly; a term matches at most
+# MAX_EXPANSIONS index terms by prefix (the most frequent ones) or by
+# similarity (the closest ones)
+MIN_PREFIX_LENGTH = 3
+MAX_EXPANSIONS = 32
+
+# Postings per wanted result: queries with fewer postings are scored in full;
+# otherwise the threshold algorithm reads at most this many before scoring
+# every match instead
+TA_BUDGET = 20
+
+# BM25 term frequency saturation and length normalization
+K1 = 1.2
+B = 0.75
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase alphanumeric terms."""
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def server_fields(server_id: str, server: "MCPServer") -> Dict[str, str]:
+    """Get the searchable text of a server, by field.
+
+    Repository URLs are indexed without their scheme and host.
+
+    Args:
+        server_id: Server ID
+        server: Server entry
+
+    Returns:
+        Field name -> text
+    """
+    return {
+        "id": server_id,
+        "description": server.description,
+        "categories": " ".join(server.categories),
+        "args": " ".join(server.args),
+        "repository": _URL_HOST.sub("", server.repository or ""),
+    }
+
+
+def parse_query(query: str) -> List[List[str]]:
+    """Parse a query into alternatives of required terms.
+
+    Args:
+        query: Query string
+
+    Returns:
+        List of clauses (OR), each a list of terms (AND); empty for a query
+        without terms
+    """
+    clauses: List[List[str]] = [[]]
+    for word in query.split():
+        if word == "OR":
+            clauses.append([])
+        elif word != "AND":
+            clauses[-1].extend(tokenize(word))
+    return [clause for clause in clauses if clause]
+
+
+def highlight_spans(text: str, terms: Set[str]) -> List[Tuple[int, int]]:
+    """Find the character spans of matched terms in a text.
+
+    Args:
+        text: Displayed text
+        terms: Matched index terms (see SearchResult.matches)
+
+    Returns:
+        (start, end) spans of the tokens in ``terms``
+    """
+    return [
+        match.span()
+        for match in TOKEN_PATTERN.finditer(text.lower())
+        if match.group() in terms
+    ]
+
+
+@dataclass(frozen=True)
+class SearchResult:
+    """A server matching a search query."""
+
+    server_id: str
+    server: "MCPServer"
+    score: float
+    # Field name -> index terms that matched in that field
+    matches: Dict[str, List[str]]
+
+
+class PostingList:
+    """Servers containing a term, with their scores for it.
+
+    Servers are identified by their position in the sorted server IDs.
+    """
+
+    def __init__(
+        self,
+        docs: Sequence[int],
+        scores: Sequence[float],
+        sorted_docs: Sequence[int],
+        sorted_scores: Sequence[float],
+    ) -> None:
+        """Initialize the list.
+
+        Args:
+            docs: Servers by descending score
+            scores: Scores matching ``docs``
+            sorted_docs: Servers in ascending order (for lookups)
+            sorted_scores: Scores matching ``sorted_docs``
+        """
+        self.docs = docs
+        self.scores = scores
+        self.sorted_docs = sorted_docs
+        self.sorted_scores = sorted_scores
+
+    def __len__(self) -> int:
+        return len(self.docs)
+
+    def score(self, doc: int) -> float:
+        """Get a server's score for the term (0.0 if it does not contain it)."""
+        i = bisect_left(self.sorted_docs, doc)
+        if i < len(self.sorted_docs) and self.sorted_docs[i] == doc:
+            return self.sorted_scores[i]
+        return 0.0
+
+
+class IndexData(Protocol):
+    """Storage of an inverted index."""
+
+    # Server IDs in sorted order (position = document number)
+    ids: Sequence[str]
+    # Index terms in sorted order
+    vocabulary: Sequence[str]
+
+    def postings(self, term_number: int) -> PostingList:
+        """Get the postings of the term at a position in the vocabulary."""
+        ...
+
+
+class MemoryIndexData:
+    """Inverted index built in memory from server entries."""
+
+    def __init__(self, servers: Mapping[str, "MCPServer"]) -> None:
+        """Build the index.
+
+        Args:
+            servers: Server ID -> server
+        """
+        self.ids: List[str] = sorted(servers)
+
+        # Term counts per field of each document, and field lengths
+        documents = []
+        total_lengths: Counter = Counter()
+        for server_id in self.ids:
+            fields = []
+            for field, text in server_fields(server_id, servers[server_id]).items():
+                tokens = tokenize(text)
+                if tokens:
+                    fields.append((field, len(tokens), Counter(tokens)))
+                    total_lengths[field] += len(tokens)
+            documents.append(fields)
+
+        count = len(self.ids)
+        average = {field: total / count for field, total in total_lengths.items()}
+
+        # Length-normalized, field-weighted term frequencies, in document order
+        frequencies: Dict[str, Tuple[List[int], List[float]]] = {}
+        for doc, fields in enumerate(documents):
+            weighted: Dict[str, float] = {}
+            for field, length, counts in fields:
+                weight = FIELD_WEIGHTS[field]
+                norm = 1 - B + B * length / average[field]
+                for term, frequency in counts.items():
+                    weighted[term] = weighted.get(term, 0.0) + weight * frequency / norm
+            for term, value in weighted.items():
+                entry = frequencies.get(term)
+                if entry is None:
+                    entry = frequencies[term] = ([], [])
+                entry[0].append(doc)
+                entry[1].append(value)
+
+        self.vocabulary: List[str] = sorted(frequencies)
+        self._postings: List[PostingList] = []
+        for term in self.vocabulary:
+            docs, values = frequencies[term]
+            # Saturate and apply inverse document frequency
+            idf = math.log(1 + (count - len(docs) + 0.5) / (len(docs) + 0.5))
+            scores = [idf * value * (K1 + 1) / (value + K1) for value in values]
+            order = sorted(range(len(docs)), key=lambda i: (-scores[i], docs[i]))
+            self._postings.append(
+                PostingList(
+                    [docs[i] for i in order], [scores[i] for i in order], docs, scores
+                )
+            )
+
+    def postings(self, term_number: int) -> PostingList:
+        """Get the postings of the term at a position in the vocabulary."""
+        return self._postings[term_number]
+
+
+class SearchIndex:
+    """Ranked search over a mapping of servers."""
+
+    def __init__(
+        self, servers: Mapping[str, "MCPServer"], data: Optional[IndexData] = None
+    ) -> None:
+        """Initialize the index.
+
+        Args:
+            servers: Server ID -> server; the index must be rebuilt when it
+                changes
+            data: Prebuilt index of exactly these servers (built in memory
+                if not given)
+        """
+        self._servers = servers
+        self._data = data if data is not None else MemoryIndexData(servers)
+        # Trigram index of the vocabulary, built on the first query term that
+        # matches no index term or the first substring lookup
+        self._trigrams: Optional[TrigramIndex] = None
+
+    def __len__(self) -> int:
+        """Number of indexed servers."""
+        return len(self._data.ids)
+
+    def search(
+        self,
+        query: str,
+        limit: Optional[int] = None,
+        within: Optional[Collection[str]] = None,
+    ) -> List[SearchResult]:
+        """Find servers matching a query, best first.
+
+        Args:
+            query: Query string (see module docstring)
+            limit: Maximum number of results
+            within: Only return these servers (e.g. the result of a facet
+                filter)
+
+        Returns:
+            Results ordered by descending score, then server ID
+        """
+        ids = self._data.ids
+        docs = None if within is None else self._documents_of(within)
+        clauses = parse_query(query)
+        if not clauses:
+            listed: Sequence[int] = range(len(ids)) if docs is None else sorted(docs)
+            return [
+                SearchResult(ids[doc], self._servers[ids[doc]], 0.0, {})
+                for doc in listed[:limit]
+            ]
+
+        # Each clause: list of terms, each a list of (weight, postings, term)
+        resolved = []
+        for clause in clauses:
+            terms = [self._expand(term) for term in clause]
+            if all(terms):
+                resolved.append(terms)
+        if limit == 0:
+            return []
+
+        matched_terms = {
+            term
+            for terms in resolved
+            for expansions in terms
+            for _, _, term in expansions
+        }
+        results = []
+        for score, doc in self._top(resolved, limit, docs) if resolved else []:
+            server_id = ids[doc]
+            server = self._servers[server_id]
+            matches = {}
+            for field, text in server_fields(server_id, server).items():
+                found = sorted(set(tokenize(text)) & matched_terms)
+                if found:
+                    matches[field] = found
+            results.append(SearchResult(server_id, server, score, matches))
+        if limit is None or len(results) < limit:
+            found_ids = {result.server_id for result in results}
+            text = query.strip().lower()
+            for doc in self._substring_candidates(text, docs):
+                if limit is not None and len(results) >= limit:
+                    break
+                server_id = ids[doc]
+                if server_id not in found_ids and self._contains(server_id, text):
+                    server = self._servers[server_id]
+                    results.append(SearchResult(server_id, server, 0.0, {}))
+        return results
+
+    def _contains(self, server_id: str, text: str) -> bool:
+        """Check whether a server's ID or description contains a lowercase
+        text."""
+        return (
+            text in server_id.lower()
+            or text in self._servers[server_id].description.lower()
+        )
+
+    def _substring_candidates(
+        self, text: str, docs: Optional[Set[int]] = None
+    ) -> List[int]:
+        """Find the documents that may contain a text in their ID or
+        description.
+
+        Args:
+            text: Lowercase text
+            docs: Only consider these documents
+
+        Returns:
+            Documents having, for each term of ``text``, an index term
+            containing it, in ascending order
+        """
+        candidates = docs
+        for term in tokenize(text):
+            found: Set[int] = set()
+            for number in self._trigram_index().containing(term):
+                found.update(self._data.postings(number).sorted_docs)
+            candidates = found if candidates is None else candidates & found
+            if not candidates:
+                return []
+        return sorted(candidates or ())
+
+    def _trigram_index(self) -> TrigramIndex:
+        """Get the trigram index of the vocabulary, building it on first use."""
+        if self._trigrams is None:
+            self._trigrams = TrigramIndex(self._data.vocabulary)
+        return self._trigrams
+
+    def _expand(self, term: str) -> List[Tuple[float, PostingList, str]]:
+        """Find the index terms a query term matches.
+
+        Exact and prefix matches are used if there are any, otherwise index
+        terms similar to the query term.
+
+        Returns:
+            (weight, postings, index term) for each match; empty if none
+        """
+        vocabulary = self._data.vocabulary
+        i = bisect_left(vocabulary, term)
+        expansions = []
+        if i < len(vocabulary) and vocabulary[i] == term:
+            expansions.append((1.0, self._data.postings(i), term))
+            i += 1
+        if len(term) < MIN_PREFIX_LENGTH:
+            return expansions
+
+        prefixed = []
+        while i < len(vocabulary):
+            candidate = vocabulary[i]
+            if not candidate.startswith(term):
+                break
+            prefixed.append((PREFIX_WEIGHT, self._data.postings(i), candidate))
+            i += 1
+        if len(prefixed) > MAX_EXPANSIONS:
+            prefixed.sort(key=lambda expansion: -len(expansion[1]))
+            del prefixed[MAX_EXPANSIONS:]
+        return expansions + prefixed or self._similar(term)
+
+    def _documents_of(self, server_ids: Collection[str]) -> Set[int]:
+        """Get the document numbers of indexed servers."""
+        ids = self._data.ids
+        docs = set()
+        for server_id in server_ids:
+            doc = bisect_left(ids, server_id)
+            if doc < len(ids) and ids[doc] == server_id:
+                docs.add(doc)
+        return docs
+
+    def _similar(self, term: str) -> List[Tuple[float, PostingList, str]]:
+        """Find the index terms within max_edits(term) typos of a query term."""
+        limit = max_edits(term)
+        if not limit:
+            return []
+        vocabulary = self._data.vocabulary
+        similar = self._trigram_index().similar(term, limit)
+        return [
+            (FUZZY_WEIGHT / distance, self._data.postings(number), vocabulary[number])
+            for distance, number in similar[:MAX_EXPANSIONS]
+        ]
+
+    def _top(
+        self, resolved: list, limit: Optional[int], docs: Optional[Set[int]] = None
+    ) -> List[Tuple[float, int]]:
+        """Find the best scoring documents.
+
+        Args:
+            resolved: Clauses of expanded terms (see search)
+            limit: Number of documents wanted, or None for all matches
+            docs: Only consider these documents
+
+        Returns:
+            (score, document) pairs by descending score, then document
+        """
+        if docs is not None:
+            return self._exhaustive_top(resolved, limit, docs)
+        postings = sum(
+            len(p)
+            for terms in resolved
+            for expansions in terms
+            for _, p, _ in expansions
+        )
+        if limit is not None and postings > TA_BUDGET * limit:
+            top = self._threshold_top(resolved, limit)
+            if top is not None:
+                return top
+        return self._exhaustive_top(resolved, limit)
+
+    @staticmethod
+    def _threshold_top(resolved: list, limit: int) -> Optional[List[Tuple[float, int]]]:
+        """Find the top documents with the threshold algorithm.
+
+        Reads postings in score order until no unseen document can beat the
+        current top ``limit``. Gives up after TA_BUDGET postings per wanted
+        result, which happens when many documents score alike.
+
+        Returns:
+            (score, document) pairs, or None if the budget ran out
+        """
+        budget = TA_BUDGET * limit
+
+        def score(doc: int) -> float:
+            total = 0.0
+            for terms in resolved:
+                clause_score = 0.0
+                for expansions in terms:
+                    best = _best_score(expansions, doc)
+                    if not best:
+                        break
+                    clause_score += best
+                else:
+                    total += clause_score
+            return total
+
+        # Min-heap of the best (score, -document) found so far
+        heap: List[Tuple[float, int]] = []
+        seen: Set[int] = set()
+        depth = 0
+        while True:
+            # Upper bound for documents not seen yet: each term scores at
+            # most its postings' score at the current depth
+            bound = 0.0
+            advanced = False
+            for terms in resolved:
+                for expansions in terms:
+                    frontier = 0.0
+                    for weight, postings, _ in expansions:
+                        if depth >= len(postings):
+                            continue
+                        advanced = True
+                        frontier = max(frontier, weight * postings.scores[depth])
+                        doc = postings.docs[depth]
+                        if doc in seen:
+                            continue
+                        seen.add(doc)
+                        doc_score = score(doc)
+                        if not doc_score:
+                            continue
+                        if len(heap) < limit:
+                            heapq.heappush(heap, (doc_score, -doc))
+                        elif (doc_score, -doc) > heap[0]:
+                            heapq.heapreplace(heap, (doc_score, -doc))
+                    bound += frontier
+            depth += 1
+            if not advanced:
+                break
+            if len(heap) == limit and heap[0][0] >= bound:
+                break
+            if len(seen) > budget:
+                return None
+
+        return [(doc_score, -doc) for doc_score, doc in sorted(heap, reverse=True)]
+
+    @staticmethod
+    def _exhaustive_top(
+        resolved: list, limit: Optional[int], docs: Optional[Set[int]] = None
+    ) -> List[Tuple[float, int]]:
+        """Score every matching document.
+
+        Args:
+            resolved: Clauses of expanded terms (see search)
+            limit: Number of documents wanted, or None for all matches
+            docs: Only consider these documents
+
+        Returns:
+            (score, document) pairs by descending score, then document
+        """
+        totals: Dict[int, float] = {}
+        for terms in resolved:
+            if len(terms) == 1:
+                clause = _merge_max(terms[0])
+            else:
+                # Intersect the document sets, then look up the scores of
+                # the (usually few) documents matching every term
+                sets = sorted((_documents(expansions) for expansions in terms), key=len)
+                candidates = sets[0].intersection(*sets[1:])
+                if len(candidates) < TA_BUDGET * 10:
+                    clause = {
+                        doc: sum(_best_score(expansions, doc) for expansions in terms)
+                        for doc in candidates
+                    }
+                else:
+                    maps = [_merge_max(expansions) for expansions in terms]
+                    clause = {
+                        doc: sum(scores[doc] for scores in maps) for doc in candidates
+                    }
+            totals = _merge_sum(totals, clause)
+
+        if docs is not None:
+            totals = {doc: score for doc, score in totals.items() if doc in docs}
+        if limit is None or limit >= len(totals):
+            top = totals
+        else:
+            top = heapq.nlargest(limit, totals, key=totals.__getitem__)
+        return sorted(((totals[doc], doc) for doc in top), key=_rank_key)
+
+
+def _rank_key(pair: Tuple[float, int]) -> Tuple[float, int]:
+    """Order (score, document) pairs by descending score, then document."""
+    return -pair[0], pair[1]
+
+
+def _documents(expansions: list) -> Set[int]:
+    """Get the documents matching any of a term's expansions."""
+    documents: Set[int] = set()
+    for _, postings, _ in expansions:
+        documents.update(postings.sorted_docs)
+    return documents
+
+
+def _best_score(expansions: list, doc: int) -> float:
+    """Get a document's best weighted score among a term's expansions."""
+    return max(weight * postings.score(doc) for weight, postings, _ in expansions)
+
+
+def _merge_max(expansions: list) -> Dict[int, float]:
+    """Combine the postings of a term's expansions, keeping each document's
+    best weighted score."""
+    scores: Dict[int, float] = {}
+    for weight, postings, _ in expansions:
+        if not scores and weight == 1.0:
+            scores = dict(zip(postings.sorted_docs, postings.sorted_scores))
+            continue
+        for doc, doc_score in zip(postings.sorted_docs, postings.sorted_scores):
+            doc_score *= weight
+            if doc_score > scores.get(doc, 0.0):
+                scores[doc] = doc_score
+    return scores
+
+
+def _merge_sum(first: Dict[int, float], second: Dict[int, float]) -> Dict[int, float]:
+    """Add up two document -> score mappings."""
+    if not first or not second:
+        return first or second
+    merged = {**first, **second}
+    for doc in first.keys() & second.keys():
+        merged[doc] = first[doc] + second[doc]
+    return merged
@@ -0,0 +1,166 @@
+"""Validation certificates that let catalog loads skip schema validation.
+
+The official catalog only changes between releases, yet it used to be
+validated on every load. Once a catalog passes, a certificate is recorded
+under the user cache directory, keyed by the SHA-256 of the catalog bytes,
+the schema bytes and the version of the validator that checked them (the
+CUE version or the in-process ruleset version). Any later load of identical
+content is accepted without validating again.
+
+The packaged catalog ships a certificate produced at release time by
+``cue vet`` (``scripts/certify-catalog.py``), which is accepted for its exact
+catalog and schema bytes whatever validator is used locally.
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from platformdirs import user_cache_dir
+
+CERTIFICATE_VERSION = 1
+
+# Certificate shipped next to the official catalog
+PACKAGED_CERTIFICATE_PATH = (
+    Path(__file__).parent.parent / "data" / "catalog.certificate.json"
+)
+
+
+def sha256_hex(data: bytes) -> str:
+    """Get the hex SHA-256 digest of some bytes."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def certificate_key(catalog: bytes, schema: bytes, validator_version: str) -> str:
+    """Compute the certificate key for a catalog checked by a validator.
+
+    Args:
+        catalog: Catalog file contents
+        schema: CUE schema file contents
+        validator_version: Version of the validator (e.g. ``cue version``
+            output or CatalogSchemaValidator.version)
+
+    Returns:
+        Hex SHA-256 key
+    """
+    digest = hashlib.sha256()
+    for part in (catalog, schema, validator_version.encode("utf-8")):
+        # Length-prefix each part so different splits cannot collide
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+def certificate_record(
+    catalog: bytes, schema: bytes, validator_version: str
+) -> Dict[str, Any]:
+    """Build the certificate stored for validated content.
+
+    Args:
+        catalog: Catalog file contents that passed
+        schema: CUE schema file contents used
+        validator_version: Version of the validator that passed it
+
+    Returns:
+        JSON-serializable certificate
+    """
+    return {
+        "version": CERTIFICATE_VERSION,
+        "catalog_sha256": sha256_hex(catalog),
+        "schema_sha256": sha256_hex(schema),
+        "validator": validator_version,
+    }
+
+
+class ValidationCache:
+    """Certificates of catalogs that passed validation."""
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        packaged_certificate: Optional[Path] = PACKAGED_CERTIFICATE_PATH,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            cache_dir: Directory for certificates (defaults to the user cache
+                directory)
+            packaged_certificate: Certificate shipped with the package, or
+                None to ignore it
+        """
+        self.cache_dir = cache_dir or Path(user_cache_dir("mcpi")) / "validation"
+        self.packaged_certificate = packaged_certificate
+        self._packaged: Optional[Dict[str, Any]] = None
+
+    def is_certified(
+        self, catalog: bytes, schema: bytes, validator_version: str
+    ) -> bool:
+        """Check whether identical content already passed validation.
+
+        Args:
+            catalog: Catalog file contents
+            schema: CUE schema file contents
+            validator_version: Version of the validator that would be used
+
+        Returns:
+            True if the packaged certificate or a certificate from the same
+            validator covers this content
+        """
+        if self._matches_packaged(catalog, schema):
+            return True
+        key = certificate_key(catalog, schema, validator_version)
+        return (self.cache_dir / f"{key}.cert").exists()
+
+    def certify(self, catalog: bytes, schema: bytes, validator_version: str) -> None:
+        """Record that content passed validation (best effort).
+
+        Args:
+            catalog: Catalog file contents that passed
+            schema: CUE schema file contents used
+            validator_version: Version of the validator that passed it
+        """
+        key = certificate_key(catalog, schema, validator_version)
+        self._write(
+            f"{key}.cert", certificate_record(catalog, schema, validator_version)
+        )
+
+    def _matches_packaged(self, catalog: bytes, schema: bytes) -> bool:
+        if self.packaged_certificate is None:
+            return False
+        if self._packaged is None:
+            try:
+                self._packaged = json.loads(self.packaged_certificate.read_bytes())
+            except (OSError, ValueError):
+                self._packaged = {}
+        certificate = self._packaged
+        return (
+            isinstance(certificate, dict)
+            and certificate.get("version") == CERTIFICATE_VERSION
+            and certificate.get("catalog_sha256") == sha256_hex(catalog)
+            and certificate.get("schema_sha256") == sha256_hex(schema)
+        )
+
+    def _write(self, name: str, record: Dict[str, Any]) -> None:
+        """Atomically write a record; the cache is an optimization, so
+        failures are ignored."""
+        from mcpi.clients.atomic_files import atomic_write_bytes
+
+        try:
+            atomic_write_bytes(
+                self.cache_dir / name, json.dumps(record, indent=2).encode("utf-8")
+            )
+        except OSError:
+            pass
+
+
+_validation_cache = ValidationCache()
+
+
+def get_validation_cache() -> ValidationCache:
+    """Get the process-wide validation cache.
+
+    Returns:
+        Shared ValidationCache instance
+    """
+    return _validation_cache
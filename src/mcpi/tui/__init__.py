@@ -6,6 +6,7 @@ It uses a plugin architecture to support multiple TUI backends (fzf, InquirerPy,
 Public API:
 - get_tui_adapter(): Factory function to create TUI adapter instances
 - launch_fzf_interface(): Backward compatibility wrapper for fzf
+- join_server_states(): Catalog servers with their installation states
 
 Internal Components:
 - protocol: TUIAdapter protocol definition
@@ -19,6 +20,7 @@ from mcpi.clients import MCPManager
 from mcpi.clients.types import ServerState
 from mcpi.registry.catalog import MCPServer, ServerCatalog
 from mcpi.tui.factory import get_tui_adapter
+from mcpi.tui.server_list import ServerRow, join_server_states
 
 # Re-export standalone functions for console scripts
 from mcpi.tui.adapters.fzf import cycle_scope_and_reload, reload_server_list
@@ -26,6 +28,8 @@ from mcpi.tui.adapters.fzf import cycle_scope_and_reload, reload_server_list
 __all__ = [
     "get_tui_adapter",
     "launch_fzf_interface",
+    "join_server_states",
+    "ServerRow",
     "reload_server_list",
     "cycle_scope_and_reload",
     # Backward compatibility exports for tests
@@ -6,14 +6,12 @@ server preview, and scope cycling.
 """
 
 import os
+import shlex
 import subprocess
 import sys
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
-# File to store current scope (needed because fzf subprocesses don't share env vars)
-SCOPE_FILE = Path.home() / ".mcpi_fzf_scope"
-
 from rich.console import Console
 
 from mcpi.clients.manager import MCPManager, create_default_manager
@@ -23,6 +21,11 @@ from mcpi.registry.catalog import (
     ServerCatalog,
 )
 from mcpi.registry.catalog_manager import create_default_catalog_manager
+from mcpi.tui.fzf_backend import FzfBackend, backend_supported, client_command
+from mcpi.tui.server_list import join_server_states
+
+# File to store current scope (needed because fzf subprocesses don't share env vars)
+SCOPE_FILE = Path.home() / ".mcpi_fzf_scope"
 
 console = Console()
 
@@ -41,6 +44,7 @@ class FzfAdapter:
     - Keyboard shortcuts for operations (add, remove, enable, disable)
     - Scope cycling (ctrl-s)
     - Automatic reload after operations
+    - Bindings served by a resident backend (see mcpi.tui.fzf_backend)
 
     Environment Variables:
     - MCPI_FZF_SCOPE: Current target scope for operations
@@ -91,13 +95,23 @@ class FzfAdapter:
             console.print("[yellow]No servers found in registry[/yellow]")
             return
 
-        # Build fzf command with current scope
-        fzf_cmd = self._build_fzf_command(initial_scope)
-
-        # Prepare input for fzf
-        input_data = "\n".join(server_lines)
+        # Serve the bindings from this process, which has everything loaded
+        backend = None
+        if backend_supported():
+            backend = FzfBackend(manager, catalog, initial_scope, self)
+            backend.start()
 
         try:
+            # Build fzf command with current scope
+            fzf_cmd = self._build_fzf_command(
+                initial_scope,
+                backend.socket_path if backend else None,
+                backend.preview_path if backend else None,
+            )
+
+            # Prepare input for fzf
+            input_data = "\n".join(server_lines)
+
             # Launch fzf
             result = subprocess.run(
                 fzf_cmd,
@@ -119,6 +133,9 @@ class FzfAdapter:
         except Exception as e:
             console.print(f"[red]Error launching fzf: {e}[/red]")
             raise
+        finally:
+            if backend is not None:
+                backend.close()
 
     def get_name(self) -> str:
         """Return human-readable name of this TUI adapter.
@@ -252,29 +269,16 @@ class FzfAdapter:
         Returns:
             List of formatted server lines
         """
-        servers = catalog.list_servers()
-
-        # Build list with status
-        server_lines = []
-        for server_id, server in servers:
-            status = self._get_server_status(manager, server_id)
-            line = self._format_server_line(server_id, server, status)
-            server_lines.append((status["state"], line))
-
-        # Sort by state (enabled=1, disabled=2, not_installed=3)
-        def sort_key(item):
-            state, line = item
-            if state == ServerState.ENABLED:
-                return (1, line)
-            elif state == ServerState.DISABLED:
-                return (2, line)
-            else:
-                return (3, line)
 
-        server_lines.sort(key=sort_key)
+        def format_row(server_id, server, state, info):
+            status = {
+                "installed": state is not ServerState.NOT_INSTALLED,
+                "state": state,
+                "info": info,
+            }
+            return self._format_server_line(server_id, server, status)
 
-        # Return just the formatted lines
-        return [line for _, line in server_lines]
+        return join_server_states(catalog, manager, make_row=format_row)
 
     def _write_scope(self, scope: str) -> None:
         """Write current scope to file for fzf subprocess access.
@@ -334,11 +338,20 @@ class FzfAdapter:
         self._write_scope(next_scope)
         return next_scope
 
-    def _build_fzf_command(self, current_scope: Optional[str] = None) -> List[str]:
+    def _build_fzf_command(
+        self,
+        current_scope: Optional[str] = None,
+        socket_path: Optional[Path] = None,
+        preview_path: Optional[Path] = None,
+    ) -> List[str]:
         """Build the fzf command with all options and bindings.
 
         Args:
             current_scope: Current target scope to display in header (optional)
+            socket_path: Socket of a running FzfBackend; bindings then send
+                their requests to it instead of running mcpi (optional)
+            preview_path: Directory of the backend's pre-rendered previews,
+                read before asking the backend (optional)
 
         Returns:
             List of command arguments for subprocess
@@ -361,7 +374,47 @@ class FzfAdapter:
             "^I/Enter:Info  Esc:Exit"
         )
 
-        return [
+        if socket_path is not None:
+            # The backend tracks the scope itself and answers in milliseconds
+            client = client_command(socket_path)
+            preview = f'id={{1}}; [ -n "$id" ] && {client} preview "$id" 2>/dev/null'
+            if preview_path is not None:
+                # A plain file read: no Python at all
+                preview = (
+                    f'id={{1}}; [ -n "$id" ] && '
+                    f'{{ cat {shlex.quote(str(preview_path))}/"$id" 2>/dev/null '
+                    f'|| {client} preview "$id" 2>/dev/null; }}'
+                )
+            bindings = [
+                f"ctrl-s:reload({client} cycle-scope)+clear-query",
+                _action_binding("ctrl-a", "add", client),
+                _action_binding("ctrl-r", "remove", client),
+                _action_binding("ctrl-e", "enable", client),
+                _action_binding("ctrl-d", "disable", client),
+                f"ctrl-i:execute({client} preview {{1}} | less -R)",
+                f"enter:execute({client} preview {{1}} | less -R)",
+            ]
+        else:
+            # {1} is the server-id (field 1 before the tab)
+            preview = 'id={1}; [ -n "$id" ] && mcpi info "$id" --plain 2>/dev/null'
+            bindings = [
+                # Scope cycling binding (ctrl-s)
+                "ctrl-s:reload(mcpi-tui-cycle-scope)+clear-query",
+                # Operation bindings - {1} extracts server-id directly
+                # Read scope from file so scope changes are reflected immediately
+                'ctrl-a:execute(mcpi add {1} --scope "$(cat ~/.mcpi_fzf_scope)")'
+                "+reload(mcpi-tui-reload)",
+                "ctrl-r:execute(mcpi remove {1})+reload(mcpi-tui-reload)",
+                'ctrl-e:execute(mcpi enable {1} --scope "$(cat ~/.mcpi_fzf_scope)")'
+                "+reload(mcpi-tui-reload)",
+                'ctrl-d:execute(mcpi disable {1} --scope "$(cat ~/.mcpi_fzf_scope)")'
+                "+reload(mcpi-tui-reload)",
+                # Info bindings
+                "ctrl-i:execute(mcpi info {1} | less)",
+                "enter:execute(mcpi info {1} | less)",
+            ]
+
+        command = [
             "fzf",
             "--ansi",  # Enable ANSI color codes
             "--delimiter=\t",  # Split on tab
@@ -371,28 +424,31 @@ class FzfAdapter:
             "--layout=reverse",
             "--border",
             "--preview",
-            # {1} is the server-id (field 1 before the tab)
-            'id={1}; [ -n "$id" ] && mcpi info "$id" --plain 2>/dev/null || echo \'Select a server to view details\'',
+            preview + " || echo 'Select a server to view details'",
             "--preview-window=right:50%:wrap",
-            # Scope cycling binding (ctrl-s)
-            "--bind",
-            "ctrl-s:reload(mcpi-tui-cycle-scope)+clear-query",
-            # Operation bindings - {1} extracts server-id directly
-            # Read scope from file so scope changes are reflected immediately
-            "--bind",
-            'ctrl-a:execute(mcpi add {1} --scope "$(cat ~/.mcpi_fzf_scope)")+reload(mcpi-tui-reload)',
-            "--bind",
-            "ctrl-r:execute(mcpi remove {1})+reload(mcpi-tui-reload)",
-            "--bind",
-            'ctrl-e:execute(mcpi enable {1} --scope "$(cat ~/.mcpi_fzf_scope)")+reload(mcpi-tui-reload)',
-            "--bind",
-            'ctrl-d:execute(mcpi disable {1} --scope "$(cat ~/.mcpi_fzf_scope)")+reload(mcpi-tui-reload)',
-            # Info bindings
-            "--bind",
-            "ctrl-i:execute(mcpi info {1} | less)",
-            "--bind",
-            "enter:execute(mcpi info {1} | less)",
         ]
+        for binding in bindings:
+            command += ["--bind", binding]
+        return command
+
+
+def _action_binding(key: str, action: str, client: str) -> str:
+    """Build the binding running an action through the fzf backend.
+
+    The action's output is only shown (in less) when it fails, then the
+    list is reloaded.
+
+    Args:
+        key: fzf key name
+        action: Backend action (add, remove, enable, disable)
+        client: Backend client command
+
+    Returns:
+        fzf --bind argument
+    """
+    run = f"out=$({client} {action} {{1}} 2>&1) || printf '%s\\n' \"$out\" | less -R"
+    # Brackets, as fzf would end execute(...) at the parenthesis in $(...)
+    return f"{key}:execute[{run}]+reload({client} reload)"
 
 
 # =============================================================================
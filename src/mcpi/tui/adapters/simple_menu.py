@@ -5,15 +5,17 @@ Uses simple-term-menu for fuzzy search and selection.
 """
 
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple
 
 from rich.console import Console
 from simple_term_menu import TerminalMenu
 
+from mcpi.clients.inventory import InventoryIndex
 from mcpi.clients.manager import MCPManager
-from mcpi.clients.types import ServerState
+from mcpi.clients.types import OperationResult, ServerInfo, ServerState
 from mcpi.config import load_mcpi_config
 from mcpi.registry.catalog import MCPServer, ServerCatalog
+from mcpi.tui.server_list import ServerRow, join_server_states
 
 console = Console()
 
@@ -26,6 +28,11 @@ class SimpleMenuAdapter:
     2. Select server (with fuzzy search)
     3. Select action
     4. Execute
+
+    The server list is read once per session. After an action succeeds,
+    only the affected server is re-read, from the scopes it is installed in
+    and the scope the action targeted, and its row is moved to its new
+    state group.
     """
 
     def __init__(self, manager: MCPManager, catalog: ServerCatalog):
@@ -37,6 +44,12 @@ class SimpleMenuAdapter:
         """
         self.manager = manager
         self.catalog = catalog
+        # Server list model (None until loaded, or after it went stale)
+        self._rows: Optional[List[ServerRow]] = None
+        # Installations of each listed server in priority order (None when
+        # the manager keeps no inventory, so rows cannot be refreshed alone)
+        self._installations: Optional[Dict[str, List[ServerInfo]]] = None
+        self._catalog_order: Dict[str, int] = {}
 
     def launch(self, initial_scope: Optional[str] = None) -> None:
         """Launch interactive menu.
@@ -185,24 +198,90 @@ class SimpleMenuAdapter:
         Returns:
             List of (server_id, server, state) tuples, sorted by state
         """
-        servers = self.catalog.list_servers()
-        result = []
+        if self._rows is None:
+            self._load_rows()
+        return [(row.server_id, row.server, row.state) for row in self._rows]
+
+    def _load_rows(self) -> None:
+        """Build the server list model from one inventory snapshot."""
+        self._rows = join_server_states(self.catalog, self.manager)
+        # Groups list the catalog in ID order
+        server_ids = sorted(row.server_id for row in self._rows)
+        self._catalog_order = {
+            server_id: position for position, server_id in enumerate(server_ids)
+        }
+
+        self._installations = None
+        get_inventory = getattr(self.manager, "get_inventory", None)
+        if get_inventory is None:
+            return
+        try:
+            # Cached: the snapshot the join just used
+            inventory = get_inventory()
+        except Exception:
+            return
+        if isinstance(inventory, InventoryIndex):
+            self._installations = {
+                row.server_id: inventory.get(row.server_id) for row in self._rows
+            }
 
-        for server_id, server in servers:
-            state = self.manager.get_server_state(server_id)
-            result.append((server_id, server, state))
+    def _installed_scope(self, server_id: str) -> Optional[str]:
+        """Get the scope of a server's highest-priority installation.
 
-        # Sort: enabled first, then disabled, then not installed
-        def sort_key(item):
-            _, _, state = item
-            if state == ServerState.ENABLED:
-                return 0
-            elif state == ServerState.DISABLED:
-                return 1
-            return 2
+        Returns:
+            Scope name, or None if unknown
+        """
+        installations = (self._installations or {}).get(server_id)
+        return installations[0].scope if installations else None
 
-        result.sort(key=sort_key)
-        return result
+    def _refresh_server(self, server_id: str, scope: Optional[str]) -> None:
+        """Re-read one server's installations after an action changed them.
+
+        Reads only the scopes the server was installed in plus the scope
+        the action targeted, then updates and regroups its row. Without
+        per-server data the whole list is reloaded on next display.
+
+        Args:
+            server_id: Server the action targeted
+            scope: Scope the action targeted (None if unknown)
+        """
+        if self._rows is None or self._installations is None:
+            self._rows = None
+            return
+
+        previous = self._installations.get(server_id, [])
+        scopes = [info.scope for info in previous]
+        if scope and scope not in scopes:
+            scopes.append(scope)
+
+        installations: List[ServerInfo] = []
+        try:
+            for scope_name in scopes:
+                servers = self.manager.list_servers(scope=scope_name)
+                installations.extend(
+                    info for info in servers.values() if info.id == server_id
+                )
+        except Exception:
+            self._rows = None
+            return
+        installations.sort(key=lambda info: info.priority)
+        self._installations[server_id] = installations
+
+        info = installations[0] if installations else None
+        state = info.state if info else ServerState.NOT_INSTALLED
+        rank = {ServerState.ENABLED: 0, ServerState.DISABLED: 1}
+        self._rows = sorted(
+            (
+                row._replace(state=state, info=info)
+                if row.server_id == server_id
+                else row
+                for row in self._rows
+            ),
+            key=lambda row: (
+                rank.get(row.state, 2),
+                self._catalog_order.get(row.server_id, 0),
+            ),
+        )
 
     def _handle_server_action(
         self, server_id: str, server: MCPServer, state: ServerState, scope: str
@@ -253,17 +332,26 @@ class SimpleMenuAdapter:
         self._execute_action(action, server_id, scope)
         return "continue"
 
-    def _execute_action(self, action: str, server_id: str, scope: str) -> None:
+    def _execute_action(
+        self, action: str, server_id: str, scope: str
+    ) -> Optional[OperationResult]:
         """Execute the selected action.
 
+        A successful action refreshes the server's row in the list.
+
         Args:
             action: Action to execute (add, remove, enable, disable, info)
             server_id: Target server
             scope: Target scope
+
+        Returns:
+            Result of the operation, or None if none was run
         """
         if action == "info":
             self._show_info(server_id)
-            return
+            return None
+
+        result = None
 
         console.print(f"\n[dim]Executing: {action} {server_id} in {scope}[/dim]")
 
@@ -281,19 +369,26 @@ class SimpleMenuAdapter:
                     result = self.manager.add_server(server_id, config, scope)
                 else:
                     console.print(f"[red]No config found for {server_id}[/red]")
-                    return
+                    return None
+                target_scope = scope
             elif action == "remove":
                 result = self.manager.remove_server(server_id, scope)
-            elif action == "enable":
-                result = self.manager.enable_server(server_id)
-            elif action == "disable":
-                result = self.manager.disable_server(server_id)
+                target_scope = scope
+            elif action in ("enable", "disable"):
+                # The installed scope is known, so the manager need not look
+                # it up (its inventory is dropped after every change)
+                target_scope = self._installed_scope(server_id)
+                if action == "enable":
+                    result = self.manager.enable_server(server_id, target_scope)
+                else:
+                    result = self.manager.disable_server(server_id, target_scope)
             else:
                 console.print(f"[red]Unknown action: {action}[/red]")
-                return
+                return None
 
             if result.success:
                 console.print(f"[green]✓ {result.message}[/green]")
+                self._refresh_server(server_id, target_scope)
             else:
                 console.print(f"[red]✗ {result.message}[/red]")
                 for error in result.errors:
@@ -301,10 +396,13 @@ class SimpleMenuAdapter:
 
         except Exception as e:
             console.print(f"[red]Error: {e}[/red]")
+            # The action may have partly applied
+            self._rows = None
 
         # Pause to let user see result
         console.print("\n[dim]Press Enter to continue...[/dim]")
         input()
+        return result
 
     def _show_info(self, server_id: str) -> None:
         """Display server information.
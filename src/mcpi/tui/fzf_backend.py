@@ -0,0 +1,312 @@
+"""Resident backend for the fzf interface.
+
+fzf runs its reload, preview and action bindings as shell commands. When
+those commands are ``mcpi ...``, every keystroke and every cursor move
+starts an interpreter that imports the CLI and rebuilds the client
+registry, the catalog and the inventory. Instead, ``mcpi fzf`` serves them
+from a Unix socket for the length of the session, using the manager and
+catalog it has already loaded, and the bindings run fzf_client.py: a
+standard-library-only script that forwards a request and prints the reply.
+
+Protocol: the client sends one line of tab-separated words (a command and
+its arguments) and closes its side; the backend replies with a status line
+(``0`` on success) followed by the output.
+
+Commands:
+    reload                           Server list lines
+    cycle-scope                      Switch to the next writable scope, then
+                                     reload
+    preview ID                       Output of ``mcpi info ID --plain``
+    add|remove|enable|disable ID     Output of the mcpi command (all but
+                                     ``remove`` target the current scope);
+                                     status 1 if the server did not end up
+                                     in the requested state
+
+Requests are handled one at a time. The inventory stays cached between
+requests; the manager drops it when an action changes configuration.
+
+Previews are also pre-rendered into files (see mcpi.tui.preview_cache),
+which the preview binding reads directly; the ``preview`` command is the
+fallback for servers without a file. The first rendering runs in the
+background, so fzf starts without waiting for it, and previews are brought
+up to date after every action.
+"""
+
+import shlex
+import shutil
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Optional, Tuple
+
+from mcpi.clients.manager import MCPManager
+from mcpi.registry.catalog import ServerCatalog
+from mcpi.tui.preview_cache import PreviewCache, preview_width
+from mcpi.tui.server_list import join_server_states
+
+if TYPE_CHECKING:
+    from mcpi.tui.adapters.fzf import FzfAdapter
+
+CLIENT_SCRIPT = Path(__file__).with_name("fzf_client.py")
+
+# Commands run as the mcpi command of the same name
+ACTIONS = ("add", "remove", "enable", "disable")
+
+
+def backend_supported() -> bool:
+    """Check whether the platform supports Unix sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def client_command(socket_path: Path) -> str:
+    """Build the shell command that sends a request to a backend.
+
+    The script runs with ``-S``: it needs no site-packages, and skipping
+    them keeps interpreter startup to a few milliseconds.
+
+    Args:
+        socket_path: Backend socket
+
+    Returns:
+        Command to which the request words are appended
+    """
+    return " ".join(
+        shlex.quote(str(part))
+        for part in (sys.executable, "-S", CLIENT_SCRIPT, socket_path)
+    )
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Reads a request line and writes the backend's reply."""
+
+    def handle(self) -> None:
+        line = self.rfile.readline().decode("utf-8").rstrip("\n")
+        status, output = self.server.backend.handle(line.split("\t") if line else [])
+        try:
+            self.wfile.write(f"{status}\n{output}".encode())
+        except OSError:
+            pass  # fzf kills previews that are no longer needed
+
+
+class FzfBackend:
+    """Serves fzf binding requests for one ``mcpi fzf`` session.
+
+    Example:
+        with FzfBackend(manager, catalog, "user-mcp", adapter) as backend:
+            command = client_command(backend.socket_path)
+    """
+
+    def __init__(
+        self,
+        manager: MCPManager,
+        catalog: ServerCatalog,
+        scope: str,
+        adapter: "FzfAdapter",
+        preview_cache_root: Optional[Path] = None,
+    ) -> None:
+        """Initialize the backend.
+
+        Args:
+            manager: MCPManager instance for server operations
+            catalog: ServerCatalog instance listed by reload
+            scope: Scope that add targets
+            adapter: Adapter formatting the server list
+            preview_cache_root: Directory for pre-rendered previews
+                (defaults to preview_cache.preview_cache_root())
+        """
+        self.manager = manager
+        self.catalog = catalog
+        self.scope = scope
+        self._adapter = adapter
+        self._preview_cache_root = preview_cache_root
+        self._previews: Optional[PreviewCache] = None
+        # Held by handle() and by the background preview sync, as neither
+        # the manager's inventory nor the preview cache is thread-safe
+        self._lock = threading.RLock()
+        self._previews_thread: Optional[threading.Thread] = None
+        # Context object reused by every in-process mcpi command, so the
+        # catalog manager they create is loaded once
+        self._obj = {"mcp_manager": manager}
+        self._directory: Optional[Path] = None
+        self._server: Optional[socketserver.BaseServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def socket_path(self) -> Path:
+        """Path of the backend socket (set by start())."""
+        if self._directory is None:
+            raise RuntimeError("Backend is not running")
+        return self._directory / "backend.sock"
+
+    @property
+    def preview_path(self) -> Path:
+        """Directory of pre-rendered previews, one file per server ID."""
+        if self._directory is None:
+            raise RuntimeError("Backend is not running")
+        return self._directory / "previews"
+
+    def start(self) -> Path:
+        """Start serving requests and rendering previews in daemon threads.
+
+        The socket is created in a new private temporary directory.
+
+        Returns:
+            Path of the backend socket
+        """
+        self._directory = Path(tempfile.mkdtemp(prefix="mcpi-fzf-"))
+        self._previews = PreviewCache(
+            self.preview_path, preview_width(), self._preview_cache_root
+        )
+        self._previews_thread = threading.Thread(
+            target=self._sync_previews, name="mcpi-fzf-previews", daemon=True
+        )
+        self._previews_thread.start()
+        self._server = socketserver.UnixStreamServer(
+            str(self.socket_path), _RequestHandler
+        )
+        self._server.backend = self
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            kwargs={"poll_interval": 0.05},
+            name="mcpi-fzf-backend",
+            daemon=True,
+        )
+        self._thread.start()
+        return self.socket_path
+
+    def close(self) -> None:
+        """Stop serving and remove the socket and previews."""
+        if self._previews_thread is not None:
+            self._previews_thread.join()
+            self._previews_thread = None
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._directory is not None:
+            shutil.rmtree(self._directory, ignore_errors=True)
+            self._directory = None
+
+    def __enter__(self) -> "FzfBackend":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def handle(self, request: List[str]) -> Tuple[int, str]:
+        """Handle one request.
+
+        Args:
+            request: Command followed by its arguments
+
+        Returns:
+            Tuple of (status, output); status is 0 on success
+        """
+        command, args = (request[0], request[1:]) if request else ("", [])
+        with self._lock:
+            return self._handle(command, args)
+
+    def _handle(self, command: str, args: List[str]) -> Tuple[int, str]:
+        """Handle one request while holding the backend lock."""
+        try:
+            if command == "reload" and not args:
+                return 0, self._server_list()
+            if command == "cycle-scope" and not args:
+                available = self._adapter._get_available_scopes(self.manager)
+                self.scope = self._adapter._set_next_scope(self.scope, available)
+                return 0, self._server_list()
+            if command == "preview" and len(args) == 1:
+                return self._run_mcpi(["info", args[0], "--plain"])
+            if command in ACTIONS and len(args) == 1:
+                server_id = args[0]
+                # Every action but remove targets the scope shown in the header
+                argv = [command, server_id]
+                if command != "remove":
+                    argv += ["--scope", self.scope]
+                before = self._installed_scopes(server_id)
+                status, output = self._run_mcpi(argv)
+                # mcpi commands report most failures but still exit 0
+                if status == 0 and not self._took_effect(command, server_id, before):
+                    status = 1
+                self._sync_previews()
+                return status, output
+        except Exception as e:
+            return 1, f"Error: {e}\n"
+        return 1, f"Unknown request: {' '.join([command, *args])}\n"
+
+    def _installed_scopes(self, server_id: str) -> List[str]:
+        """Get the scopes a server is installed in."""
+        return self.manager.get_inventory().scopes_for(server_id)
+
+    def _took_effect(self, command: str, server_id: str, before: List[str]) -> bool:
+        """Check that an action left the server in the state it asked for.
+
+        Args:
+            command: Action that ran
+            server_id: Server it ran on
+            before: Scopes the server was installed in before the action
+
+        Returns:
+            True if the action succeeded (or there was nothing to do)
+        """
+        from mcpi.clients import ServerState
+
+        if command == "remove":
+            return self._installed_scopes(server_id) != before
+        state = self.manager.get_server_state(server_id, scope=self.scope)
+        if command == "enable":
+            return state == ServerState.ENABLED
+        if command == "disable":
+            return state == ServerState.DISABLED
+        return state != ServerState.NOT_INSTALLED
+
+    def _sync_previews(self) -> None:
+        """Bring the pre-rendered previews up to date (best effort)."""
+        try:
+            with self._lock:
+                entries = join_server_states(
+                    self.catalog,
+                    self.manager,
+                    make_row=lambda server_id, server, state, info: (
+                        server_id,
+                        server,
+                        info,
+                    ),
+                )
+                self._previews.sync(entries)
+        except Exception:
+            pass  # The preview binding falls back to the preview command
+
+    def _server_list(self) -> str:
+        """Format the server list as fzf input."""
+        lines = self._adapter._build_server_list(self.catalog, self.manager)
+        return "".join(f"{line}\n" for line in lines)
+
+    def _run_mcpi(self, argv: List[str]) -> Tuple[int, str]:
+        """Run an mcpi command in this process, capturing its output.
+
+        Args:
+            argv: Command line arguments after ``mcpi``
+
+        Returns:
+            Tuple of (exit status, output)
+        """
+        import click
+
+        from mcpi.cli import console, main
+
+        with console.capture() as capture:
+            try:
+                status = main.main(
+                    argv, prog_name="mcpi", obj=self._obj, standalone_mode=False
+                )
+            except click.ClickException as e:
+                console.print(e.format_message(), markup=False)
+                status = e.exit_code
+            except SystemExit as e:
+                status = e.code if isinstance(e.code, int) else 1
+        return (status if isinstance(status, int) else 0), capture.get()
@@ -0,0 +1,58 @@
+"""Client for the fzf backend, run by the fzf bindings.
+
+This file is executed as a script (``python -S fzf_client.py SOCKET
+COMMAND [ARG...]``), not imported: it must start in milliseconds, so it
+never imports mcpi and keeps to modules that are built in or already loaded
+at startup. That is why it uses _socket rather than socket (which imports
+enum and selectors) and has no typing annotations.
+
+It sends the command to the backend of the running ``mcpi fzf`` session and
+prints the reply (see mcpi.tui.fzf_backend for the protocol).
+"""
+
+import _socket
+import sys
+
+
+def main(argv=None) -> int:
+    """Send one request to the fzf backend.
+
+    Args:
+        argv: List of socket path, command and arguments (defaults to
+            sys.argv[1:])
+
+    Returns:
+        Exit status: 0 on success, 1 on failure, 2 on bad usage
+    """
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) < 2:
+        print("usage: fzf_client.py SOCKET COMMAND [ARG...]", file=sys.stderr)
+        return 2
+    path, request = argv[0], argv[1:]
+
+    chunks = []
+    sock = _socket.socket(_socket.AF_UNIX, _socket.SOCK_STREAM)
+    try:
+        sock.connect(path)
+        sock.sendall(("\t".join(request) + "\n").encode("utf-8"))
+        sock.shutdown(_socket.SHUT_WR)
+        while True:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError as e:
+        print(f"mcpi fzf backend is not available: {e}", file=sys.stderr)
+        return 1
+    finally:
+        sock.close()
+
+    status, _, output = b"".join(chunks).partition(b"\n")
+    stream = sys.stdout if status == b"0" else sys.stderr
+    stream.buffer.write(output)
+    stream.flush()
+    return 0 if status == b"0" else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Pre-rendered previews for the fzf interface.
+
+The fzf preview pane shows ``mcpi info ID --plain`` for the server under
+the cursor. Rather than computing it on every cursor move, the fzf backend
+renders the preview of every catalog server into a cache directory, and
+the ``--preview`` binding just reads a file (``cat``), with no Python
+involved.
+
+A cache directory holds one file per server, at the server ID's path (so
+``@acme/files`` is ``@acme/files``), and is keyed by:
+
+- a hash of the catalog entries (and of this module's rendering version),
+- the width the text is wrapped to,
+- a fingerprint of the installations shown (client, scope, state and
+  environment of each installed catalog server).
+
+Directories are built in a staging directory and renamed into place
+complete, then never modified, so concurrent sessions can share them. A
+session reaches the current one through a symlink it owns, which is
+repointed after each sync. When an action changes the inventory, the new
+directory re-renders only the servers whose installation changed and
+hard-links the other files from the previous directory.
+
+IDs that cannot be used as paths (``..`` segments, or a clash with another
+ID, e.g. differing only in case) get no file, and the preview binding
+falls back to asking the backend.
+"""
+
+import hashlib
+import io
+import json
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path, PurePosixPath
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from platformdirs import user_cache_dir
+
+from mcpi.clients.types import ServerInfo
+from mcpi.registry.catalog import MCPServer
+
+# Bump when the preview text changes, to stop using older directories
+RENDER_VERSION = 1
+# Cache directories kept (most recently used first)
+KEEP_DIRECTORIES = 8
+# Seconds after which a staging directory is assumed abandoned
+STAGING_MAX_AGE = 3600.0
+STAGING_PREFIX = ".staging-"
+
+# (server ID, catalog entry, installation or None)
+PreviewEntry = Tuple[str, MCPServer, Optional[ServerInfo]]
+
+
+def preview_cache_root() -> Path:
+    """Get the directory holding preview cache directories."""
+    return Path(user_cache_dir("mcpi")) / "previews"
+
+
+def preview_width() -> int:
+    """Estimate the width of the fzf preview pane (half the terminal)."""
+    return max(20, shutil.get_terminal_size().columns // 2 - 4)
+
+
+def installation_fingerprint(info: Optional[ServerInfo]) -> str:
+    """Summarize the parts of an installation that a preview shows.
+
+    Args:
+        info: Installation, or None if not installed
+
+    Returns:
+        Fingerprint (empty if not installed)
+    """
+    if info is None:
+        return ""
+    env = sorted((info.env or {}).items())
+    return json.dumps([info.client, info.scope, info.state.name, env], default=str)
+
+
+def _digest(parts: Iterable[str]) -> str:
+    """Hash strings, length-prefixed so different splits cannot collide."""
+    digest = hashlib.sha256()
+    for part in parts:
+        data = part.encode("utf-8")
+        digest.update(len(data).to_bytes(8, "big"))
+        digest.update(data)
+    return digest.hexdigest()[:16]
+
+
+def _preview_paths(server_ids: Iterable[str]) -> Dict[str, PurePosixPath]:
+    """Map server IDs to the relative paths of their preview files.
+
+    IDs with empty, dot-prefixed or backslash-containing segments are left
+    out, as are IDs whose path clashes with another's on a case-insensitive
+    filesystem (including one ID being a directory of another).
+
+    Args:
+        server_ids: Catalog server IDs
+
+    Returns:
+        Server ID -> relative path
+    """
+    paths: Dict[str, PurePosixPath] = {}
+    owners: Dict[str, List[str]] = {}
+    directories = set()
+    for server_id in server_ids:
+        parts = server_id.split("/")
+        if any(not part or part.startswith(".") or "\\" in part for part in parts):
+            continue
+        if "\0" in server_id:
+            continue
+        paths[server_id] = PurePosixPath(*parts)
+        owners.setdefault(server_id.lower(), []).append(server_id)
+        for end in range(1, len(parts)):
+            directories.add("/".join(parts[:end]).lower())
+
+    return {
+        server_id: path
+        for server_id, path in paths.items()
+        if len(owners[server_id.lower()]) == 1 and server_id.lower() not in directories
+    }
+
+
+class PreviewCache:
+    """Preview files of one fzf session, kept in step with the inventory."""
+
+    def __init__(self, link: Path, width: int, root: Optional[Path] = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            link: Symlink to point at the current cache directory (in a
+                directory owned by the session)
+            width: Width to wrap previews to
+            root: Directory for cache directories (defaults to
+                preview_cache_root())
+        """
+        self.link = link
+        self.width = width
+        self.root = root or preview_cache_root()
+        self.directory: Optional[Path] = None
+        # Previews rendered by the last sync (the rest were reused)
+        self.rendered = 0
+        self._fingerprints: Dict[str, str] = {}
+        self._catalog_key: Optional[str] = None
+
+    def sync(self, entries: List[PreviewEntry]) -> Path:
+        """Point the link at previews of the given servers.
+
+        Reuses an existing directory for the same catalog, width and
+        installations; otherwise builds it, rendering only the servers
+        whose installation differs from the previous sync.
+
+        Args:
+            entries: Every catalog server with its installation
+
+        Returns:
+            The cache directory
+        """
+        catalog_key = _digest(
+            [str(RENDER_VERSION)]
+            + [
+                part
+                for server_id, server, _ in entries
+                for part in (server_id, server.model_dump_json())
+            ]
+        )
+        fingerprints = {
+            server_id: installation_fingerprint(info) for server_id, _, info in entries
+        }
+        inventory_key = _digest(
+            part
+            for server_id, fingerprint in fingerprints.items()
+            if fingerprint
+            for part in (server_id, fingerprint)
+        )
+        directory = self.root / f"{catalog_key}-{self.width}-{inventory_key}"
+
+        self.rendered = 0
+        if directory.is_dir():
+            os.utime(directory)  # Keep it among the most recently used
+        else:
+            previous = self.directory if catalog_key == self._catalog_key else None
+            self._build(directory, entries, fingerprints, previous)
+            self._prune(keep=directory)
+
+        self._point_link(directory)
+        self.directory = directory
+        self._fingerprints = fingerprints
+        self._catalog_key = catalog_key
+        return directory
+
+    def _build(
+        self,
+        directory: Path,
+        entries: List[PreviewEntry],
+        fingerprints: Dict[str, str],
+        previous: Optional[Path],
+    ) -> None:
+        """Build a cache directory and rename it into place."""
+        from rich.console import Console
+
+        from mcpi.cli import plain_server_info
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = Path(tempfile.mkdtemp(prefix=STAGING_PREFIX, dir=self.root))
+        # Renders as `mcpi info --plain` prints when not writing to a terminal
+        # (highlighting only adds colors, so it is skipped)
+        buffer = io.StringIO()
+        console = Console(
+            file=buffer, width=self.width, color_system=None, highlight=False
+        )
+        try:
+            paths = _preview_paths(server_id for server_id, _, _ in entries)
+            for server_id, server, info in entries:
+                path = paths.get(server_id)
+                if path is None:
+                    continue
+                target = staging / path
+                target.parent.mkdir(parents=True, exist_ok=True)
+                if previous is not None and (
+                    self._fingerprints.get(server_id) == fingerprints[server_id]
+                ):
+                    try:
+                        os.link(previous / path, target)
+                        continue
+                    except OSError:
+                        pass  # Pruned meanwhile, or no hard links here
+
+                buffer.seek(0)
+                buffer.truncate()
+                console.print(plain_server_info(server_id, server, info))
+                target.write_text(buffer.getvalue(), encoding="utf-8")
+                self.rendered += 1
+
+            try:
+                os.rename(staging, directory)
+            except OSError:
+                # Another session published the same directory first
+                shutil.rmtree(staging, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+
+    def _point_link(self, directory: Path) -> None:
+        """Atomically repoint the session's symlink."""
+        self.link.parent.mkdir(parents=True, exist_ok=True)
+        staged = self.link.with_name(self.link.name + ".new")
+        if staged.is_symlink():
+            staged.unlink()
+        os.symlink(directory, staged, target_is_directory=True)
+        os.replace(staged, self.link)
+
+    def _prune(self, keep: Path) -> None:
+        """Delete least recently used directories beyond KEEP_DIRECTORIES.
+
+        Also deletes staging directories left behind by crashed sessions.
+        """
+        now = time.time()
+        directories = []
+        for path in self.root.iterdir():
+            try:
+                mtime = path.stat().st_mtime
+            except OSError:
+                continue
+            if path.name.startswith(STAGING_PREFIX):
+                if now - mtime > STAGING_MAX_AGE:
+                    shutil.rmtree(path, ignore_errors=True)
+            elif path.is_dir() and path != keep:
+                directories.append((mtime, path))
+
+        directories.sort(reverse=True)
+        for _, path in directories[KEEP_DIRECTORIES - 1 :]:
+            shutil.rmtree(path, ignore_errors=True)
@@ -0,0 +1,107 @@
+"""Catalog × inventory join behind the TUI server lists.
+
+The TUI lists show every catalog server with its installation state.
+Asking the manager for each server's state repeats the client and scope
+lookups for every row. join_server_states() instead takes one inventory
+snapshot and one catalog listing and hash-joins them on server ID: the
+installed servers (the small side) go into a dict, and a single pass over
+the catalog probes it, builds each row (a formatted line, for fzf) and
+groups the rows by state.
+"""
+
+import logging
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from mcpi.clients.inventory import InventoryIndex
+from mcpi.clients.manager import MCPManager
+from mcpi.clients.types import ServerInfo, ServerState
+from mcpi.registry.catalog import MCPServer, ServerCatalog
+
+logger = logging.getLogger(__name__)
+
+
+class ServerRow(NamedTuple):
+    """A catalog server and its installation state."""
+
+    server_id: str
+    server: MCPServer
+    state: ServerState
+    # Highest-priority installation (None if not installed or unknown)
+    info: Optional[ServerInfo] = None
+
+
+def join_server_states(
+    catalog: ServerCatalog,
+    manager: MCPManager,
+    client: Optional[str] = None,
+    make_row: Callable[
+        [str, MCPServer, ServerState, Optional[ServerInfo]], Any
+    ] = ServerRow,
+) -> List[Any]:
+    """Pair every catalog server with its installation state.
+
+    Rows list enabled servers first, then disabled ones, then those not
+    installed, each group in catalog order (by ID). A manager that cannot
+    provide an inventory snapshot is asked for each server's state instead.
+
+    Args:
+        catalog: Server catalog
+        manager: MCP manager
+        client: Client whose installations are shown (defaults to the
+            manager's default client)
+        make_row: Builds a row from the server ID, catalog entry, state and
+            installation (None if not installed or unknown)
+
+    Returns:
+        List of rows (ServerRow by default)
+    """
+    enabled: List[Any] = []
+    disabled: List[Any] = []
+    not_installed: List[Any] = []
+
+    installed = _installed_servers(manager, client)
+    for server_id, server in catalog.list_servers():
+        if installed is not None:
+            info = installed.get(server_id)
+            state = info.state if info else ServerState.NOT_INSTALLED
+        else:
+            info = None
+            state = manager.get_server_state(server_id, client)
+        # Identity tests: hashing enum members is comparatively slow
+        if state is ServerState.ENABLED:
+            enabled.append(make_row(server_id, server, state, info))
+        elif state is ServerState.DISABLED:
+            disabled.append(make_row(server_id, server, state, info))
+        else:
+            not_installed.append(make_row(server_id, server, state, info))
+
+    return enabled + disabled + not_installed
+
+
+def _installed_servers(
+    manager: MCPManager, client: Optional[str]
+) -> Optional[Dict[str, ServerInfo]]:
+    """Map each installed server's ID to its highest-priority installation.
+
+    Returns:
+        The mapping (empty if the client is unavailable or its scopes cannot
+        be read), or None if the manager does not keep an inventory
+    """
+    get_inventory = getattr(manager, "get_inventory", None)
+    if get_inventory is None:
+        return None
+    try:
+        inventory = get_inventory(client)
+    except Exception as e:
+        logger.error(f"Error reading server inventory: {e}")
+        return {}
+    if inventory is None:
+        return {}
+    if not isinstance(inventory, InventoryIndex):
+        return None
+
+    installed: Dict[str, ServerInfo] = {}
+    # The inventory iterates in scope priority order
+    for info in inventory:
+        installed.setdefault(info.id, info)
+    return installed
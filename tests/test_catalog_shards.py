@@ -0,0 +1,145 @@
+"""Tests for catalogs stored as one file per server."""
+
+import json
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from mcpi.cli import main
+from mcpi.registry.catalog import MCPServer, ServerCatalog
+from mcpi.registry.catalog_manager import create_default_catalog_manager
+from mcpi.registry.catalog_shards import (
+    MANIFEST_NAME,
+    ShardedCatalogStore,
+    ShardedServerMap,
+    migrate_to_shards,
+    shard_name,
+)
+
+ENTRIES = {
+    "acme/postgres": {
+        "description": "PostgreSQL databases",
+        "command": "npx",
+        "args": ["-y", "acme-postgres"],
+        "repository": None,
+        "categories": ["database"],
+    },
+    "acme/files": {
+        "description": "Local files",
+        "command": "uvx",
+        "args": ["acme-files"],
+        "repository": None,
+        "categories": ["files"],
+    },
+}
+
+
+@pytest.fixture
+def sharded(tmp_path: Path) -> Path:
+    catalog_path = tmp_path / "local" / "catalog.json"
+    catalog_path.parent.mkdir()
+    catalog_path.write_text(json.dumps(ENTRIES))
+    return migrate_to_shards(catalog_path)
+
+
+class TestMigration:
+    def test_migrate(self, sharded: Path):
+        store = ShardedCatalogStore(sharded)
+
+        assert store.read_manifest() == {
+            server_id: shard_name(server_id) for server_id in sorted(ENTRIES)
+        }
+        assert store.read_shard(shard_name("acme/files")) == ENTRIES["acme/files"]
+        assert not (sharded / "catalog.json").exists()
+        assert (sharded / "catalog.json.migrated").exists()
+
+        with pytest.raises(FileExistsError):
+            migrate_to_shards(sharded / "catalog.json.migrated", sharded)
+
+    def test_invalid_catalog_is_not_migrated(self, tmp_path: Path):
+        catalog_path = tmp_path / "catalog.json"
+        catalog_path.write_text(json.dumps({"broken": {"description": "x"}}))
+
+        with pytest.raises(ValueError):
+            migrate_to_shards(catalog_path)
+        assert not (tmp_path / MANIFEST_NAME).exists()
+        assert catalog_path.exists()
+
+
+class TestShardedCatalog:
+    def test_loads_shards_lazily(self, sharded: Path):
+        catalog = ServerCatalog(sharded, validate_with_cue=False)
+        catalog.load_catalog()
+        servers = catalog._registry.servers
+
+        assert isinstance(servers, ShardedServerMap)
+        assert "acme/files" in servers
+        assert servers._hydrated == {}
+        assert catalog.get_server("acme/files").command == "uvx"
+        assert list(servers._hydrated) == ["acme/files"]
+        assert [server_id for server_id, _ in catalog.search_servers("files")] == [
+            "acme/files"
+        ]
+
+    def test_save_writes_only_changed_shards(self, sharded: Path):
+        catalog = ServerCatalog(sharded, validate_with_cue=True)
+        catalog.add_server(
+            "acme/redis",
+            MCPServer(description="Redis", command="npx", args=["redis-mcp"]),
+        )
+        catalog.remove_server("acme/postgres")
+
+        with patch("mcpi.clients.atomic_files.atomic_write_bytes") as write:
+            write.side_effect = lambda path, data: path.write_bytes(data)
+            assert catalog.save_catalog()
+        written = [call.args[0].name for call in write.call_args_list]
+
+        assert written == [shard_name("acme/redis"), MANIFEST_NAME]
+        assert not (sharded / "servers" / shard_name("acme/postgres")).exists()
+
+        reloaded = ServerCatalog(sharded, validate_with_cue=False)
+        assert [server_id for server_id, _ in reloaded.list_servers()] == [
+            "acme/files",
+            "acme/redis",
+        ]
+
+    def test_invalid_change_is_not_saved(self, sharded: Path):
+        catalog = ServerCatalog(sharded, validate_with_cue=True)
+        catalog.update_server(
+            "acme/files", MCPServer.model_construct(description="Files", command="")
+        )
+
+        assert not catalog.save_catalog()
+        assert ShardedCatalogStore(sharded).read_shard(shard_name("acme/files")) == (
+            ENTRIES["acme/files"]
+        )
+
+    def test_concurrent_catalogs_keep_each_others_changes(self, sharded: Path):
+        first = ServerCatalog(sharded, validate_with_cue=False)
+        second = ServerCatalog(sharded, validate_with_cue=False)
+        first.add_server("acme/a", MCPServer(description="A", command="npx"))
+        second.add_server("acme/b", MCPServer(description="B", command="npx"))
+
+        assert first.save_catalog() and second.save_catalog()
+        assert set(ShardedCatalogStore(sharded).read_manifest()) == {
+            "acme/a",
+            "acme/b",
+            *ENTRIES,
+        }
+
+
+def test_cli_migrate_local_catalog(tmp_path: Path):
+    local_path = tmp_path / ".mcpi" / "catalogs" / "local" / "catalog.json"
+    local_path.parent.mkdir(parents=True)
+    local_path.write_text(json.dumps(ENTRIES))
+
+    with patch.object(Path, "home", return_value=tmp_path):
+        result = CliRunner().invoke(main, ["catalog", "migrate"])
+        assert result.exit_code == 0, result.output
+        assert "Migrated 2 servers" in result.output
+
+        manager = create_default_catalog_manager()
+        assert manager.local_path == local_path.parent
+        assert manager.get_catalog("local").get_server("acme/postgres") is not None
@@ -0,0 +1,237 @@
+"""Tests for configured catalogs and merged search across catalogs."""
+
+import json
+import threading
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from mcpi.cli import main
+from mcpi.registry import catalog_manager as catalog_manager_module
+from mcpi.registry.catalog import ServerCatalog
+from mcpi.registry.catalog_manager import (
+    CatalogManager,
+    CatalogSource,
+    catalog_sources_from_config,
+    load_catalog_sources,
+)
+
+
+def write_catalog(path: Path, descriptions: dict) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(
+        json.dumps(
+            {
+                server_id: {
+                    "description": description,
+                    "command": "npx",
+                    "args": ["-y", server_id],
+                    "categories": ["test"],
+                    "repository": None,
+                }
+                for server_id, description in descriptions.items()
+            }
+        )
+    )
+    return path
+
+
+@pytest.fixture
+def manager(tmp_path: Path) -> CatalogManager:
+    official = write_catalog(
+        tmp_path / "official.json",
+        {
+            "postgres": "PostgreSQL database",
+            "filesystem": "Local files",
+            "shared": "Shared server, official entry",
+        },
+    )
+    local = write_catalog(
+        tmp_path / "local.json",
+        {"aaa-database": "Database database database", "shared": "Shared database"},
+    )
+    team = write_catalog(
+        tmp_path / "team.json",
+        {"mysql": "MySQL database", "shared": "Shared server, team entry"},
+    )
+    return CatalogManager(
+        official_path=official,
+        local_path=local,
+        sources=[CatalogSource(name="team", path=team)],
+    )
+
+
+class TestConfiguredSources:
+    def test_reads_catalogs_table(self, tmp_path: Path):
+        config = {
+            "catalogs": {
+                "Team": {"path": "catalogs/team.json", "priority": 70},
+                "home": {"path": "~/mcp.json", "validate": True},
+            }
+        }
+
+        team, home = catalog_sources_from_config(config, tmp_path)
+
+        assert team.name == "team"
+        assert team.path == tmp_path / "catalogs" / "team.json"
+        assert team.priority == 70
+        assert home.path == Path.home() / "mcp.json"
+        assert home.priority == 50
+        assert home.validate_with_cue
+
+    def test_skips_invalid_entries(self, tmp_path: Path):
+        config = {
+            "catalogs": {
+                "official": {"path": "other.json"},
+                "nopath": {"description": "Missing path"},
+                "badpriority": {"path": "x.json", "priority": "high"},
+            }
+        }
+
+        with pytest.warns(UserWarning) as record:
+            assert catalog_sources_from_config(config, tmp_path) == []
+        assert len(record) == 3
+
+    def test_project_config_overrides_global(self, tmp_path: Path, monkeypatch):
+        global_config = tmp_path / "global" / "mcpi.toml"
+        project_config = tmp_path / "project" / "mcpi.toml"
+        global_config.parent.mkdir()
+        project_config.parent.mkdir()
+        global_config.write_text(
+            '[catalogs.team]\npath = "team.json"\n\n'
+            '[catalogs.vendor]\npath = "vendor.json"\n'
+        )
+        project_config.write_text('[catalogs.team]\npath = "team.json"\n')
+        monkeypatch.setattr(
+            catalog_manager_module, "get_global_config_path", lambda: global_config
+        )
+        monkeypatch.setattr(
+            catalog_manager_module, "get_project_config_path", lambda: project_config
+        )
+
+        sources = {source.name: source.path for source in load_catalog_sources()}
+
+        assert sources == {
+            "team": project_config.parent / "team.json",
+            "vendor": global_config.parent / "vendor.json",
+        }
+
+
+class TestCatalogManagerSources:
+    def test_priority_order(self, manager: CatalogManager):
+        assert manager.catalog_names() == ["official", "team", "local"]
+        assert [info.name for info in manager.list_catalogs()] == [
+            "official",
+            "team",
+            "local",
+        ]
+        assert manager.get_catalog("TEAM").get_server("mysql") is not None
+
+    def test_reserved_names_rejected(self, tmp_path: Path):
+        with pytest.raises(ValueError, match="Duplicate catalog name"):
+            CatalogManager(
+                official_path=tmp_path / "a.json",
+                local_path=tmp_path / "b.json",
+                sources=[CatalogSource(name="Local", path=tmp_path / "c.json")],
+            )
+
+    def test_concurrent_access_loads_once(self, manager: CatalogManager, monkeypatch):
+        loads = []
+        load_catalog = ServerCatalog.load_catalog
+
+        def counting_load(catalog):
+            loads.append(catalog.catalog_path)
+            load_catalog(catalog)
+
+        monkeypatch.setattr(ServerCatalog, "load_catalog", counting_load)
+        found = []
+        threads = [
+            threading.Thread(target=lambda: found.append(manager.get_catalog("team")))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(loads) == 1
+        assert all(catalog is found[0] for catalog in found)
+
+    def test_broken_configured_catalog_is_skipped(self, tmp_path: Path):
+        broken = tmp_path / "broken.json"
+        broken.write_text("{not json")
+        manager = CatalogManager(
+            official_path=write_catalog(tmp_path / "o.json", {"a": "A server"}),
+            local_path=tmp_path / "missing.json",
+            sources=[CatalogSource(name="broken", path=broken)],
+        )
+
+        with pytest.warns(UserWarning, match="Skipping catalog 'broken'"):
+            results = manager.search_all("")
+        assert [server_id for _, server_id, _ in results] == ["a"]
+
+
+class TestSearchAll:
+    def test_catalog_order(self, manager: CatalogManager):
+        results = manager.search_all("")
+
+        assert [(name, server_id) for name, server_id, _ in results] == [
+            ("official", "filesystem"),
+            ("official", "postgres"),
+            ("official", "shared"),
+            ("team", "mysql"),
+            ("team", "shared"),
+            ("local", "aaa-database"),
+            ("local", "shared"),
+        ]
+        assert manager.search_all("", limit=4) == results[:4]
+
+    def test_ranked(self, manager: CatalogManager):
+        results = manager.search_all("database", ranked=True)
+
+        scores = {
+            (name, result.server_id): result.score
+            for name in manager.catalog_names()
+            for result in manager.get_catalog(name).search("database")
+        }
+        ranked = [scores[name, server_id] for name, server_id, _ in results]
+        assert ranked == sorted(ranked, reverse=True)
+        assert {server_id for _, server_id, _ in results} == {
+            "aaa-database",
+            "postgres",
+            "mysql",
+            "shared",
+        }
+        assert manager.search_all("database", limit=2, ranked=True) == results[:2]
+
+    def test_dedupe_prefers_higher_priority(self, manager: CatalogManager):
+        results = manager.search_all("shared", dedupe=True)
+
+        assert [(name, server_id) for name, server_id, _ in results] == [
+            ("official", "shared")
+        ]
+        # The official entry shadows the local one even where it does not
+        # match the query
+        assert [
+            server_id
+            for _, server_id, _ in manager.search_all(
+                "database", ranked=True, dedupe=True
+            )
+        ] == [
+            server_id
+            for name, server_id, _ in manager.search_all("database", ranked=True)
+            if server_id != "shared"
+        ]
+
+    def test_cli_all_catalogs(self, manager: CatalogManager, monkeypatch):
+        monkeypatch.setattr("mcpi.cli.get_catalog_manager", lambda ctx: manager)
+
+        result = CliRunner().invoke(
+            main, ["search", "-q", "mysql", "--all-catalogs", "--json"]
+        )
+
+        assert result.exit_code == 0, result.output
+        assert [(r["catalog"], r["id"]) for r in json.loads(result.output)] == [
+            ("team", "mysql")
+        ]
@@ -0,0 +1,73 @@
+"""Import-time budget for ``mcpi --help``.
+
+Commands import what they need when they run, so showing the help must not
+load rich, pydantic, the client plugins or the catalogs. The budget is on
+the time spent importing modules that a bare interpreter does not import
+(``python -X importtime``), and can be raised for slow machines with
+MCPI_HELP_IMPORT_BUDGET_MS.
+"""
+
+import os
+import subprocess
+import sys
+from typing import Dict
+
+HELP_IMPORT_BUDGET_MS = float(os.environ.get("MCPI_HELP_IMPORT_BUDGET_MS", "150"))
+
+# Modules only commands that use them may import
+DEFERRED_MODULES = (
+    "rich",
+    "pydantic",
+    "jsonschema",
+    "yaml",
+    "httpx",
+    "mcpi.bundles",
+    "mcpi.clients",
+    "mcpi.registry",
+    "mcpi.tui",
+)
+
+
+def _import_times(code: str) -> Dict[str, int]:
+    """Run Python code and get the self time (us) of each module it imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stderr
+    times = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            self_us, _, name = line[len("import time:") :].split("|")
+            times[name.strip()] = int(self_us)
+    return times
+
+
+def test_help_imports_within_budget():
+    baseline = _import_times("pass")
+    imported = _import_times(
+        "import sys; sys.argv = ['mcpi', '--help']\n"
+        "from mcpi.fast_completion import main\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+    )
+
+    deferred = sorted(
+        name
+        for name in imported
+        if any(
+            name == module or name.startswith(f"{module}.")
+            for module in DEFERRED_MODULES
+        )
+    )
+    assert deferred == []
+    assert "mcpi.cli" in imported
+
+    added_ms = sum(us for name, us in imported.items() if name not in baseline) / 1000
+    assert added_ms <= HELP_IMPORT_BUDGET_MS, (
+        f"mcpi --help spends {added_ms:.0f} ms importing modules "
+        f"(budget {HELP_IMPORT_BUDGET_MS:.0f} ms)"
+    )
@@ -0,0 +1,222 @@
+"""Tests for crash-safe file replacement and the multi-file intent journal."""
+
+import json
+import os
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from mcpi.clients import atomic_files
+from mcpi.clients.atomic_files import (
+    atomic_write_bytes,
+    commit_files,
+    recover_journal,
+)
+from mcpi.clients.file_based import JSONFileReader, JSONFileWriter
+from mcpi.clients.file_move_enable_disable_handler import (
+    FileMoveEnableDisableHandler,
+)
+
+
+def _leftovers(directory: Path):
+    return sorted(p.name for p in directory.iterdir() if p.name.endswith(".tmp"))
+
+
+class TestAtomicWriteBytes:
+    """Test atomic_write_bytes()."""
+
+    def test_replaces_contents(self, tmp_path):
+        target = tmp_path / "sub" / "config.json"
+        atomic_write_bytes(target, b"{}")
+        atomic_write_bytes(target, b'{"a": 1}')
+        assert target.read_bytes() == b'{"a": 1}'
+        assert _leftovers(target.parent) == []
+
+    def test_preserves_mode(self, tmp_path):
+        target = tmp_path / "config.json"
+        target.write_text("{}")
+        target.chmod(0o600)
+        atomic_write_bytes(target, b"[]")
+        assert target.stat().st_mode & 0o777 == 0o600
+
+    def test_follows_symlink(self, tmp_path):
+        real = tmp_path / "real.json"
+        real.write_text("{}")
+        link = tmp_path / "link.json"
+        link.symlink_to(real)
+
+        atomic_write_bytes(link, b"[]")
+
+        assert link.is_symlink()
+        assert real.read_bytes() == b"[]"
+
+    def test_failed_rename_keeps_original(self, tmp_path):
+        target = tmp_path / "config.json"
+        target.write_text("old")
+        with patch("mcpi.clients.atomic_files.os.replace", side_effect=OSError):
+            with pytest.raises(OSError):
+                atomic_write_bytes(target, b"new")
+        assert target.read_text() == "old"
+        assert _leftovers(tmp_path) == []
+
+
+class TestCommitFiles:
+    """Test journaled multi-file commits and recovery."""
+
+    def _files(self, tmp_path):
+        a, b = tmp_path / "a.json", tmp_path / "b.json"
+        a.write_text("old a")
+        b.write_text("old b")
+        return a, b, tmp_path / ".journal"
+
+    def test_commit(self, tmp_path):
+        a, b, journal = self._files(tmp_path)
+        commit_files({a: b"new a", b: b"new b"}, journal)
+        assert (a.read_text(), b.read_text()) == ("new a", "new b")
+        assert not journal.exists()
+        assert _leftovers(tmp_path) == []
+
+    def test_crash_after_commit_point_rolls_forward(self, tmp_path):
+        a, b, journal = self._files(tmp_path)
+        real_replace = os.replace
+        renames = []
+
+        def crash_on_second_target(src, dst):
+            if str(dst).endswith(("a.json", "b.json")):
+                renames.append(dst)
+                if len(renames) == 2:
+                    raise OSError("crash")
+            real_replace(src, dst)
+
+        with patch("mcpi.clients.atomic_files.os.replace", crash_on_second_target):
+            with pytest.raises(OSError):
+                commit_files({a: b"new a", b: b"new b"}, journal)
+
+        assert json.loads(journal.read_text())["state"] == "commit"
+        assert recover_journal(journal)
+        assert (a.read_text(), b.read_text()) == ("new a", "new b")
+        assert not journal.exists()
+        assert _leftovers(tmp_path) == []
+
+    def test_crash_before_commit_point_rolls_back(self, tmp_path):
+        a, b, journal = self._files(tmp_path)
+        real_open = open
+        staged = []
+
+        def crash_on_second_stage(file, mode="r", *args, **kwargs):
+            if mode == "xb" and str(file).endswith(".tmp"):
+                staged.append(file)
+                if len(staged) == 2:
+                    raise KeyboardInterrupt  # Not cleaned up, like a crash
+            return real_open(file, mode, *args, **kwargs)
+
+        with patch("builtins.open", crash_on_second_stage):
+            with pytest.raises(KeyboardInterrupt):
+                commit_files({a: b"new a", b: b"new b"}, journal)
+
+        assert json.loads(journal.read_text())["state"] == "prepare"
+        assert recover_journal(journal)
+        assert (a.read_text(), b.read_text()) == ("old a", "old b")
+        assert _leftovers(tmp_path) == []
+
+    def test_recover_without_journal(self, tmp_path):
+        assert recover_journal(tmp_path / ".journal") is False
+
+    def test_torn_journal_discarded(self, tmp_path):
+        journal = tmp_path / ".journal"
+        journal.write_text('{"state": "comm')
+        assert recover_journal(journal)
+        assert not journal.exists()
+
+
+class TestFileMoveHandlerJournal:
+    """The file-move handler writes both files as one recoverable change."""
+
+    def _handler(self, tmp_path):
+        active = tmp_path / "claude.json"
+        disabled = tmp_path / "disabled.json"
+        active.write_text(json.dumps({"mcpServers": {"a": {"command": "npx"}}}))
+        return FileMoveEnableDisableHandler(
+            active, disabled, JSONFileReader(), JSONFileWriter()
+        )
+
+    def test_disable_uses_one_commit(self, tmp_path):
+        handler = self._handler(tmp_path)
+        with patch(
+            "mcpi.clients.file_based.commit_files", wraps=commit_files
+        ) as commit:
+            assert handler.disable_server("a")
+
+        commit.assert_called_once()
+        assert json.loads(handler.active_file_path.read_text()) == {"mcpServers": {}}
+        assert handler.is_disabled("a")
+
+    def test_interrupted_move_finished_on_next_run(self, tmp_path):
+        handler = self._handler(tmp_path)
+        real_replace = os.replace
+
+        def crash_on_disabled_file(src, dst):
+            if str(dst).endswith("disabled.json"):
+                raise OSError("crash")
+            real_replace(src, dst)
+
+        with patch("mcpi.clients.atomic_files.os.replace", crash_on_disabled_file):
+            assert not handler.disable_server("a")
+
+        # Server is in neither file until the journal is replayed
+        assert handler.journal_path.exists()
+
+        handler = FileMoveEnableDisableHandler(
+            handler.active_file_path,
+            handler.disabled_file_path,
+            JSONFileReader(),
+            JSONFileWriter(),
+        )
+        assert handler.is_disabled("a")
+        assert not handler.journal_path.exists()
+        assert json.loads(handler.active_file_path.read_text()) == {"mcpServers": {}}
+
+    def test_move_in_progress_is_not_recovered_by_another_handler(self, tmp_path):
+        first = self._handler(tmp_path)
+        real_stage = atomic_files._stage
+        staged = threading.Event()
+        resume = threading.Event()
+
+        def pause_after_first_target(target, data, path=None):
+            result = real_stage(target, data, path)
+            if path is not None and not staged.is_set():  # Not the journal
+                staged.set()
+                assert resume.wait(5)
+            return result
+
+        results = {}
+        with patch("mcpi.clients.atomic_files._stage", pause_after_first_target):
+            mover = threading.Thread(
+                target=lambda: results.update(moved=first.disable_server("a"))
+            )
+            mover.start()
+            assert staged.wait(5)
+
+            def read_through_second_handler():
+                second = FileMoveEnableDisableHandler(
+                    first.active_file_path,
+                    first.disabled_file_path,
+                    JSONFileReader(),
+                    JSONFileWriter(),
+                )
+                results["disabled"] = second.get_disabled_servers()
+
+            reader = threading.Thread(target=read_through_second_handler)
+            reader.start()
+            reader.join(0.2)
+            # The reader waits for the move instead of rolling it back
+            assert reader.is_alive()
+            resume.set()
+            mover.join(5)
+            reader.join(5)
+
+        assert results == {"moved": True, "disabled": {"a": {"command": "npx"}}}
+        assert json.loads(first.active_file_path.read_text()) == {"mcpServers": {}}
+        assert _leftovers(tmp_path) == []
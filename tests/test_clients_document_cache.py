@@ -0,0 +1,193 @@
+"""Tests for the shared parsed-document cache."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from mcpi.clients.document_cache import FileFingerprint, ParsedDocumentCache
+from mcpi.clients.file_based import JSONFileReader, JSONFileWriter
+from mcpi.clients.file_move_enable_disable_handler import (
+    FileMoveEnableDisableHandler,
+)
+
+
+def _age(path: Path, seconds: int = 60) -> None:
+    """Backdate a file so its fingerprint is outside the racy window."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - seconds * 1_000_000_000))
+
+
+class TestFileFingerprint:
+    """Test FileFingerprint."""
+
+    def test_missing_file(self, tmp_path):
+        assert FileFingerprint.of(tmp_path / "missing.json") is None
+
+    def test_changes_with_content(self, tmp_path):
+        path = tmp_path / "a.json"
+        path.write_text("{}")
+        before = FileFingerprint.of(path)
+        path.write_text('{"a": 1}')
+        assert FileFingerprint.of(path) != before
+
+
+class TestParsedDocumentCache:
+    """Test ParsedDocumentCache."""
+
+    def test_parses_once_per_version(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"mcpServers": {"a": {}}}))
+        _age(path)
+        cache = ParsedDocumentCache()
+        calls = []
+
+        def parse(raw):
+            calls.append(raw)
+            return json.loads(raw)
+
+        first = cache.load(path, parse)
+        second = cache.load(path, parse)
+
+        assert first is second
+        assert len(calls) == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_reparses_when_fingerprint_changes(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"v": 1}))
+        _age(path)
+        cache = ParsedDocumentCache()
+
+        assert cache.load(path, json.loads) == {"v": 1}
+        path.write_text(json.dumps({"v": 22}))
+        assert cache.load(path, json.loads) == {"v": 22}
+        assert cache.stats()["misses"] == 2
+
+    def test_racy_entry_detects_same_size_rewrite(self, tmp_path):
+        """A rewrite inside the same timestamp tick must not serve stale data."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"v": 1}))
+        cache = ParsedDocumentCache()
+        assert cache.load(path, json.loads) == {"v": 1}
+
+        # Same size, same inode, and force the same mtime
+        st = path.stat()
+        path.write_text(json.dumps({"v": 2}))
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+
+        assert cache.load(path, json.loads) == {"v": 2}
+
+    def test_racy_entry_hit_without_reparse(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"v": 1}))
+        cache = ParsedDocumentCache()
+        first = cache.load(path, json.loads)
+        assert cache.load(path, json.loads) is first
+        assert cache.stats() == {
+            "hits": 1,
+            "misses": 1,
+            "invalidations": 0,
+            "entries": 1,
+        }
+
+    def test_missing_file_raises_and_drops_entry(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        cache = ParsedDocumentCache()
+        cache.load(path, json.loads)
+        path.unlink()
+
+        with pytest.raises(FileNotFoundError):
+            cache.load(path, json.loads)
+        assert cache.stats()["entries"] == 0
+
+    def test_peek(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text('{"v": 1}')
+        cache = ParsedDocumentCache()
+        assert cache.peek(path) is None
+
+        document = cache.load(path, json.loads)
+        assert cache.peek(path) == (document, b'{"v": 1}')
+
+        # Same-size rewrite inside the racy window is caught by the digest
+        st = path.stat()
+        path.write_text('{"v": 2}')
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns))
+        assert cache.peek(path) is None
+        assert cache.stats()["misses"] == 1
+
+    def test_invalidate(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        _age(path)
+        cache = ParsedDocumentCache()
+        cache.load(path, json.loads)
+
+        cache.invalidate(path)
+        cache.load(path, json.loads)
+
+        stats = cache.stats()
+        assert stats["invalidations"] == 1
+        assert stats["misses"] == 2
+
+    def test_invalidate_all(self, tmp_path):
+        cache = ParsedDocumentCache()
+        for name in ("a.json", "b.json"):
+            (tmp_path / name).write_text("{}")
+            cache.load(tmp_path / name, json.loads)
+
+        cache.invalidate()
+        assert cache.stats()["entries"] == 0
+        assert cache.stats()["invalidations"] == 2
+
+
+class TestReaderWriterSharing:
+    """Test that readers, writers and handlers share one parse per file."""
+
+    def test_reader_returns_private_owned_keys(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"mcpServers": {"a": {"command": "x"}}}))
+        reader = JSONFileReader(cache=ParsedDocumentCache())
+
+        data = reader.read(path)
+        data["mcpServers"]["b"] = {"command": "y"}
+        data["mcpServers"]["a"]["disabled"] = True
+        data["extra"] = 1
+
+        assert reader.read(path) == {"mcpServers": {"a": {"command": "x"}}}
+
+    def test_writer_invalidates(self, tmp_path):
+        path = tmp_path / "config.json"
+        cache = ParsedDocumentCache()
+        reader = JSONFileReader(cache=cache)
+        writer = JSONFileWriter(cache=cache)
+
+        writer.write(path, {"mcpServers": {}})
+        assert reader.read(path) == {"mcpServers": {}}
+        writer.write(path, {"mcpServers": {"a": {}}})
+        assert reader.read(path) == {"mcpServers": {"a": {}}}
+
+    def test_handler_and_reader_share_parse(self, tmp_path):
+        active = tmp_path / "claude.json"
+        disabled = tmp_path / "disabled.json"
+        active.write_text(json.dumps({"mcpServers": {"a": {}, "b": {}}}))
+        disabled.write_text(json.dumps({"mcpServers": {"c": {}}}))
+        _age(active)
+        _age(disabled)
+
+        cache = ParsedDocumentCache()
+        reader = JSONFileReader(cache=cache)
+        handler = FileMoveEnableDisableHandler(
+            active, disabled, reader, JSONFileWriter(cache=cache)
+        )
+
+        reader.read(active)
+        for server_id in ("a", "b", "c"):
+            handler.is_disabled(server_id)
+        handler.get_disabled_servers()
+
+        assert cache.stats()["misses"] == 2
@@ -1,22 +1,31 @@
 """Tests for file-based scope handlers."""
 
+import hashlib
 import json
+import os
 import tempfile
 from pathlib import Path
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 
 import pytest
 import yaml
 
+from mcpi.clients import file_based
+from mcpi.clients.document_cache import ParsedDocumentCache
 from mcpi.clients.file_based import (
+    SCHEMA_SOURCE_HASH_KEY,
     CommandBasedScope,
     CommandLineExecutor,
     FileBasedScope,
     JSONFileReader,
     JSONFileWriter,
     YAMLSchemaValidator,
+    compile_schema,
+    load_schema,
 )
+from mcpi.clients.session import WriteBuffer, activate, deactivate
 from mcpi.clients.types import ScopeConfig, ServerConfig
+from mcpi.clients.validated_files import ValidatedFiles
 
 
 class TestJSONFileReader:
@@ -103,6 +112,89 @@ class TestJSONFileWriter:
             writer.write(invalid_path, data)
 
 
+class TestJSONFileWriterSplice:
+    """Test that writes only replace the top-level values that changed."""
+
+    ORIGINAL = (
+        '{\n  "projects" :{"/a": {"history": ["keep   me"]}},\n'
+        '  "mcpServers": {\n    "a": {"command": "npx"}\n  },\n'
+        '  "tips": [1,2,3]\n}\n'
+    )
+
+    def _setup(self, tmp_path, text=ORIGINAL):
+        path = tmp_path / "claude.json"
+        path.write_text(text)
+        cache = ParsedDocumentCache()
+        return path, JSONFileReader(cache=cache), JSONFileWriter(cache=cache)
+
+    def test_splices_changed_section(self, tmp_path):
+        path, reader, writer = self._setup(tmp_path)
+        data = reader.read(path)
+        data["mcpServers"]["b"] = {"command": "uvx"}
+
+        assert writer.write(path, data)
+
+        assert path.read_text() == (
+            '{\n  "projects" :{"/a": {"history": ["keep   me"]}},\n'
+            '  "mcpServers": {\n    "a": {\n      "command": "npx"\n    },\n'
+            '    "b": {\n      "command": "uvx"\n    }\n  },\n'
+            '  "tips": [1,2,3]\n}\n'
+        )
+        assert reader.read(path) == data
+
+    def test_unchanged_data_leaves_file_alone(self, tmp_path):
+        path, reader, writer = self._setup(tmp_path)
+        st = path.stat()
+        os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns - 10**10))
+        before = path.stat().st_mtime_ns
+
+        assert writer.write(path, reader.read(path))
+
+        assert path.stat().st_mtime_ns == before
+        assert path.read_text() == self.ORIGINAL
+
+    def test_compact_file(self, tmp_path):
+        path, reader, writer = self._setup(tmp_path, '{"x":{"y":1},"mcpServers":{}}')
+        data = reader.read(path)
+        data["mcpServers"]["a"] = {"command": "npx"}
+        writer.write(path, data)
+        assert (
+            path.read_text() == '{"x":{"y":1},"mcpServers":{"a": {"command": "npx"}}}'
+        )
+
+    @pytest.mark.parametrize(
+        "change",
+        [
+            lambda data: data.update(enabledMcpjsonServers=["a"]),  # New key
+            lambda data: data.pop("tips"),  # Removed key
+        ],
+    )
+    def test_key_set_change_rewrites(self, tmp_path, change):
+        path, reader, writer = self._setup(tmp_path)
+        data = reader.read(path)
+        change(data)
+        writer.write(path, data)
+        assert path.read_text() == json.dumps(data, indent=2)
+
+    def test_external_change_rewrites(self, tmp_path):
+        path, reader, writer = self._setup(tmp_path)
+        data = reader.read(path)
+        path.write_text(self.ORIGINAL.replace("keep   me", "changed!!"))
+
+        data["mcpServers"] = {}
+        writer.write(path, data)
+        assert path.read_text() == json.dumps(data, indent=2)
+
+    def test_duplicate_keys_rewrite(self, tmp_path):
+        path, reader, writer = self._setup(
+            tmp_path, '{"mcpServers": {}, "mcpServers": {"a": {}}}'
+        )
+        data = reader.read(path)
+        data["mcpServers"]["b"] = {}
+        writer.write(path, data)
+        assert json.loads(path.read_text()) == {"mcpServers": {"a": {}, "b": {}}}
+
+
 class TestYAMLSchemaValidator:
     """Test YAMLSchemaValidator class."""
 
@@ -163,6 +255,136 @@ class TestYAMLSchemaValidator:
         assert len(errors) > 0
         assert "not found" in errors[0]
 
+    def test_validator_compiled_once(self, tmp_path):
+        """Test that the schema is loaded and compiled once per process."""
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text(yaml.dump({"type": "object"}))
+
+        validator = YAMLSchemaValidator()
+        with patch(
+            "mcpi.clients.file_based.load_schema", side_effect=load_schema
+        ) as mock_load:
+            for _ in range(5):
+                assert validator.validate({}, schema_path) is True
+            assert YAMLSchemaValidator().validate([], schema_path) is False
+
+        assert mock_load.call_count == 1
+
+    def test_validator_recompiled_when_schema_changes(self, tmp_path):
+        """Test that editing the schema file takes effect."""
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text(yaml.dump({"type": "object"}))
+        validator = YAMLSchemaValidator()
+        assert validator.validate({}, schema_path) is True
+
+        schema_path.write_text(yaml.dump({"type": "object", "required": ["x"]}))
+        st = schema_path.stat()
+        os.utime(schema_path, ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+        assert validator.validate({}, schema_path) is False
+
+    def test_invalid_schema_reported(self, tmp_path):
+        """Test that a schema failing its metaschema check is reported."""
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text(yaml.dump({"type": 12}))
+
+        validator = YAMLSchemaValidator()
+        assert validator.validate({}, schema_path) is False
+        assert "Schema validation failed" in validator.get_errors()[0]
+
+    def test_stale_compiled_schema_ignored(self, tmp_path):
+        """Test that a compiled JSON schema is not used once its YAML changes."""
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text(yaml.dump({"type": "object"}))
+        compile_schema(schema_path)
+        assert load_schema(schema_path)["type"] == "object"
+
+        schema_path.write_text(yaml.dump({"type": "array"}))
+        assert load_schema(schema_path) == {"type": "array"}
+
+
+class TestValidateEntry:
+    """Test YAMLSchemaValidator.validate_entry."""
+
+    SCHEMA = {
+        "type": "object",
+        "required": ["mcpServers"],
+        "properties": {
+            "mcpServers": {
+                "type": "object",
+                "additionalProperties": {"$ref": "#/definitions/server"},
+            }
+        },
+        "definitions": {
+            "server": {
+                "type": "object",
+                "required": ["command"],
+                "properties": {"command": {"type": "string"}},
+            }
+        },
+    }
+
+    def _schema_path(self, tmp_path, schema=None):
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text(yaml.dump(schema or self.SCHEMA))
+        return schema_path
+
+    def test_valid_entry(self, tmp_path):
+        schema_path = self._schema_path(tmp_path)
+        validator = YAMLSchemaValidator()
+        assert validator.validate_entry(
+            "mcpServers", "a", {"command": "npx"}, schema_path
+        )
+        assert validator.get_errors() == []
+
+    def test_invalid_entry_resolves_root_refs(self, tmp_path):
+        schema_path = self._schema_path(tmp_path)
+        validator = YAMLSchemaValidator()
+        assert not validator.validate_entry(
+            "mcpServers", "a", {"command": 1}, schema_path
+        )
+        assert "Validation error" in validator.get_errors()[0]
+
+    def test_unconstrained_collection(self, tmp_path):
+        schema_path = self._schema_path(tmp_path, {"type": "object"})
+        validator = YAMLSchemaValidator()
+        assert validator.validate_entry("mcpServers", "a", {"x": 1}, schema_path)
+
+    def test_nonexistent_schema(self):
+        validator = YAMLSchemaValidator()
+        assert not validator.validate_entry(
+            "mcpServers", "a", {}, Path("/nonexistent/schema.yaml")
+        )
+        assert "not found" in validator.get_errors()[0]
+
+
+class TestPackagedSchemas:
+    """Test the precompiled JSON schemas shipped with the package."""
+
+    SCHEMAS_DIR = Path(file_based.__file__).parent / "schemas"
+
+    @pytest.mark.parametrize(
+        "name",
+        ["mcp-config-schema", "claude-settings-schema", "internal-config-schema"],
+    )
+    def test_compiled_schema_matches_yaml(self, name):
+        """Compiled JSON must be regenerated (scripts/compile-schemas.py) on edit."""
+        yaml_path = self.SCHEMAS_DIR / f"{name}.yaml"
+        compiled = json.loads((yaml_path.with_suffix(".json")).read_text())
+
+        assert compiled.pop(SCHEMA_SOURCE_HASH_KEY) == (
+            hashlib.sha256(yaml_path.read_bytes()).hexdigest()
+        )
+        assert compiled == yaml.safe_load(yaml_path.read_text())
+
+    def test_packaged_schema_does_not_parse_yaml(self):
+        """Test that loading a packaged schema uses the compiled JSON."""
+        yaml_path = self.SCHEMAS_DIR / "mcp-config-schema.yaml"
+        with patch("mcpi.clients.file_based.yaml.safe_load") as mock_yaml:
+            schema = load_schema(yaml_path)
+
+        mock_yaml.assert_not_called()
+        assert schema["title"] == "MCP Configuration Schema"
+
 
 class TestCommandLineExecutor:
     """Test CommandLineExecutor class."""
@@ -426,6 +648,129 @@ class TestFileBasedScope:
             temp_path.unlink()
 
 
+class TestFileBasedScopeIncrementalValidation:
+    """Edits to a file mcpi wrote itself only validate the changed entry."""
+
+    def _scope(self, tmp_path, validator, schema=TestValidateEntry.SCHEMA):
+        schema_path = tmp_path / "schema.yaml"
+        schema_path.write_text(yaml.dump(schema))
+        config = ScopeConfig(
+            name="test-scope",
+            description="Test scope",
+            priority=1,
+            path=tmp_path / "config.json",
+        )
+        return FileBasedScope(
+            config,
+            validator=validator,
+            schema_path=schema_path,
+            validated_files=ValidatedFiles(tmp_path / "validated"),
+        )
+
+    def _spy(self):
+        validator = YAMLSchemaValidator()
+        validate = patch.object(validator, "validate", wraps=validator.validate)
+        validate_entry = patch.object(
+            validator, "validate_entry", wraps=validator.validate_entry
+        )
+        return validator, validate, validate_entry
+
+    def test_only_first_edit_validates_whole_document(self, tmp_path):
+        validator, validate, validate_entry = self._spy()
+        scope = self._scope(tmp_path, validator)
+
+        with validate as full, validate_entry as entry:
+            for i in range(5):
+                assert scope.add_server(f"s{i}", ServerConfig(command="npx")).success
+            assert scope.remove_server("s0").success
+            assert scope.update_server("s1", ServerConfig(command="uvx")).success
+
+        assert full.call_count == 1
+        assert entry.call_count == 5
+
+    def test_validation_is_remembered_across_processes(self, tmp_path):
+        assert (
+            self._scope(tmp_path, YAMLSchemaValidator())
+            .add_server("a", ServerConfig(command="npx"))
+            .success
+        )
+
+        # A new scope stands in for the next command
+        validator, validate, validate_entry = self._spy()
+        scope = self._scope(tmp_path, validator)
+        with validate as full, validate_entry as entry:
+            assert scope.add_server("b", ServerConfig(command="npx")).success
+
+        assert full.call_count == 0
+        assert entry.call_count == 1
+
+        # Changing the schema invalidates the record
+        schema = dict(TestValidateEntry.SCHEMA, title="changed")
+        validator, validate, validate_entry = self._spy()
+        scope = self._scope(tmp_path, validator, schema)
+        with validate as full, validate_entry as entry:
+            assert scope.add_server("c", ServerConfig(command="npx")).success
+
+        assert full.call_count == 1
+
+    def test_session_validates_new_file_once(self, tmp_path):
+        validator, validate, validate_entry = self._spy()
+        scope = self._scope(tmp_path, validator)
+
+        token = activate(WriteBuffer())
+        try:
+            with validate as full, validate_entry as entry:
+                for i in range(3):
+                    assert scope.add_server(
+                        f"s{i}", ServerConfig(command="npx")
+                    ).success
+        finally:
+            deactivate(token)
+
+        assert full.call_count == 1
+        assert entry.call_count == 2
+        assert not scope.config.path.exists()
+
+    def test_invalid_entry_rejected(self, tmp_path):
+        validator = YAMLSchemaValidator()
+        scope = self._scope(tmp_path, validator)
+        assert scope.add_server("a", ServerConfig(command="npx")).success
+
+        with (
+            patch.object(validator, "validate_entry", return_value=False),
+            patch.object(validator, "get_errors", return_value=["bad entry"]),
+        ):
+            result = scope.add_server("b", ServerConfig(command="npx"))
+
+        assert not result.success
+        assert "b" not in json.loads(scope.config.path.read_text())["mcpServers"]
+
+    def test_external_change_triggers_full_validation(self, tmp_path):
+        validator, validate, validate_entry = self._spy()
+        scope = self._scope(tmp_path, validator)
+        assert scope.add_server("a", ServerConfig(command="npx")).success
+
+        # Another tool rewrites the file with an invalid entry
+        path = scope.config.path
+        path.write_text(json.dumps({"mcpServers": {"a": {"command": 1}}}) + "\n")
+
+        with validate as full, validate_entry as entry:
+            result = scope.add_server("b", ServerConfig(command="npx"))
+
+        assert not result.success
+        assert full.call_count == 1
+        assert entry.call_count == 0
+
+    def test_validator_without_validate_entry(self, tmp_path):
+        validator = Mock(spec=["validate", "get_errors"])
+        validator.validate.return_value = True
+        scope = self._scope(tmp_path, validator)
+
+        assert scope.add_server("a", ServerConfig(command="npx")).success
+        assert scope.add_server("b", ServerConfig(command="npx")).success
+        assert validator.validate.call_count == 2
+
+
 class TestCommandBasedScope:
     """Test CommandBasedScope class."""
 
@@ -0,0 +1,201 @@
+"""Tests for advisory file locks and optimistic write conflict detection."""
+
+import json
+import multiprocessing
+import threading
+import time
+
+import pytest
+
+from mcpi.clients.atomic_files import atomic_write_bytes
+from mcpi.clients.document_cache import ParsedDocumentCache
+from mcpi.clients.file_based import FileBasedScope, JSONFileReader, JSONFileWriter
+from mcpi.clients.file_lock import (
+    WriteConflict,
+    expect_unchanged,
+    file_lock,
+    lock_stats,
+    reset_lock_stats,
+    run_locked,
+)
+from mcpi.clients.types import ScopeConfig, ServerConfig
+
+fcntl = pytest.importorskip("fcntl")
+
+
+def _scope(path, cache=None):
+    config = ScopeConfig(name="project-mcp", description="", priority=1, path=path)
+    cache = cache or ParsedDocumentCache()
+    return FileBasedScope(
+        config, reader=JSONFileReader(cache=cache), writer=JSONFileWriter(cache=cache)
+    )
+
+
+def _add_many(path, worker, count):
+    scope = _scope(path)
+    for i in range(count):
+        result = scope.add_server(f"w{worker}-{i}", ServerConfig(command="npx"))
+        assert result.success, result.message
+
+
+@pytest.fixture(autouse=True)
+def _reset_stats():
+    reset_lock_stats()
+
+
+class TestFileLock:
+    """Test file_lock() and its metrics."""
+
+    def test_reentrant(self, tmp_path):
+        path = tmp_path / "config.json"
+        with file_lock(path):
+            with file_lock(path, tmp_path / "other.json"):
+                pass
+        assert lock_stats()["acquisitions"] == 2
+
+    def test_waits_for_holder(self, tmp_path):
+        path = tmp_path / "config.json"
+        held = threading.Event()
+
+        def hold():
+            with file_lock(path):
+                held.set()
+                time.sleep(0.2)
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        held.wait()
+        with file_lock(path):
+            pass
+        thread.join()
+
+        stats = lock_stats()
+        assert stats["contended"] == 1
+        assert stats["max_wait_seconds"] >= 0.1
+        assert stats["timeouts"] == 0
+
+    def test_bounded_wait(self, tmp_path):
+        path = tmp_path / "config.json"
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold():
+            with file_lock(path):
+                held.set()
+                release.wait()
+
+        thread = threading.Thread(target=hold)
+        thread.start()
+        held.wait()
+        start = time.monotonic()
+        with file_lock(path, timeout=0.05):
+            elapsed = time.monotonic() - start
+        release.set()
+        thread.join()
+
+        assert elapsed < 1
+        assert lock_stats()["timeouts"] == 1
+
+
+class TestOptimisticConcurrency:
+    """Test conflict detection and retries."""
+
+    def test_write_refused_after_external_change(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text("{}")
+        with expect_unchanged({path: None}) as expectations:
+            with pytest.raises(WriteConflict):
+                atomic_write_bytes(path, b"[]")
+        assert expectations.conflicted
+        assert path.read_text() == "{}"
+
+    def test_own_writes_do_not_conflict(self, tmp_path):
+        path = tmp_path / "config.json"
+
+        def write_twice():
+            atomic_write_bytes(path, b"1")
+            atomic_write_bytes(path, b"2")
+
+        run_locked([path], write_twice)
+        assert path.read_text() == "2"
+        assert lock_stats()["conflicts"] == 0
+
+    def test_scope_retries_on_concurrent_change(self, tmp_path):
+        path = tmp_path / ".mcp.json"
+        path.write_text(json.dumps({"mcpServers": {}}))
+        scope = _scope(path)
+        read = scope.reader.read
+        calls = []
+
+        def racing_read(source):
+            data = read(source)
+            if not calls:
+                # Another process adds a server after this one read the file
+                path.write_text(
+                    json.dumps({"mcpServers": {"theirs": {"command": "x"}}})
+                )
+            calls.append(source)
+            return data
+
+        scope.reader.read = racing_read
+        result = scope.add_server("ours", ServerConfig(command="npx"))
+
+        assert result.success
+        assert len(calls) == 2
+        servers = json.loads(path.read_text())["mcpServers"]
+        assert sorted(servers) == ["ours", "theirs"]
+        assert lock_stats()["conflicts"] == 1
+
+    def test_gives_up_after_max_attempts(self, tmp_path):
+        path = tmp_path / ".mcp.json"
+        path.write_text(json.dumps({"mcpServers": {}}))
+        scope = _scope(path)
+        read = scope.reader.read
+
+        def always_racing_read(source):
+            data = read(source)
+            path.write_text(json.dumps({"mcpServers": {}, "n": time.time_ns()}))
+            return data
+
+        scope.reader.read = always_racing_read
+        result = scope.add_server("ours", ServerConfig(command="npx"))
+
+        assert not result.success
+        assert "changed by another process" in result.message
+        assert "ours" not in json.loads(path.read_text())["mcpServers"]
+
+    def test_parallel_processes_lose_no_updates(self, tmp_path):
+        path = tmp_path / ".mcp.json"
+        path.write_text(json.dumps({"mcpServers": {}}))
+
+        context = multiprocessing.get_context("fork")
+        workers = [
+            context.Process(target=_add_many, args=(path, worker, 5))
+            for worker in range(6)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        servers = json.loads(path.read_text())["mcpServers"]
+        assert len(servers) == 30
+
+
+class TestSessionCommitConflict:
+    """A session does not overwrite files changed while it was open."""
+
+    def test_commit_refuses_externally_changed_file(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file("project-mcp", {"mcpServers": {}})
+
+        with manager.session() as session:
+            result = session.add_server("a", ServerConfig(command="npx"), "project-mcp")
+            harness.prepopulate_file(
+                "project-mcp", {"mcpServers": {"b": {"command": "b"}}}
+            )
+
+        assert not result.success
+        assert "changed by another process" in result.message
+        assert list(harness.read_scope_file("project-mcp")["mcpServers"]) == ["b"]
@@ -0,0 +1,142 @@
+"""Tests for InventoryIndex and MCPManager inventory lookups."""
+
+from unittest.mock import patch
+
+from mcpi.clients.claude_code import ClaudeCodePlugin
+from mcpi.clients.inventory import InventoryIndex
+from mcpi.clients.types import ServerConfig, ServerInfo, ServerState
+
+
+def _info(server_id, scope, state=ServerState.ENABLED, priority=0):
+    return ServerInfo(
+        id=server_id,
+        client="claude-code",
+        scope=scope,
+        config={"command": "npx"},
+        state=state,
+        priority=priority,
+    )
+
+
+def _index(*infos):
+    return InventoryIndex({info.qualified_id: info for info in infos})
+
+
+class TestInventoryIndex:
+    """Test InventoryIndex lookups."""
+
+    def test_lookup_by_id_keeps_scope_order(self):
+        index = _index(
+            _info("a", "project-mcp", priority=1),
+            _info("b", "user-local"),
+            _info("a", "user-internal", ServerState.DISABLED, priority=4),
+        )
+
+        assert [i.scope for i in index.get("a")] == ["project-mcp", "user-internal"]
+        assert index.first("a").scope == "project-mcp"
+        assert index.scopes_for("a") == ["project-mcp", "user-internal"]
+        assert index.get("missing") == []
+        assert index.first("missing") is None
+
+    def test_state_in_scope(self):
+        index = _index(
+            _info("a", "project-mcp", priority=1),
+            _info("a", "user-internal", ServerState.DISABLED, priority=4),
+        )
+
+        assert index.get_state("a") == ServerState.ENABLED
+        assert index.get_state("a", "user-internal") == ServerState.DISABLED
+        assert index.get_state("a", "user-local") == ServerState.NOT_INSTALLED
+
+    def test_lookup_by_qualified_id(self):
+        index = _index(_info("a", "user-local"))
+        assert index.first("claude-code:user-local:a").id == "a"
+
+    def test_lookup_by_scope_and_state(self):
+        index = _index(
+            _info("a", "user-local"),
+            _info("b", "user-local", ServerState.DISABLED),
+            _info("c", "project-mcp"),
+        )
+
+        assert index.ids_in_scope("user-local") == ["a", "b"]
+        assert index.ids_with_state(ServerState.ENABLED) == ["a", "c"]
+        assert index.ids_with_state(ServerState.UNAPPROVED) == []
+        assert index.get_state("b") == ServerState.DISABLED
+        assert index.get_state("zzz") == ServerState.NOT_INSTALLED
+        assert "a" in index
+        assert len(index) == 3
+
+
+class TestManagerInventory:
+    """MCPManager answers lookups from one scan per command."""
+
+    def _prepopulate(self, harness):
+        harness.prepopulate_file(
+            "user-local",
+            {"mcpServers": {"a": {"command": "npx"}, "b": {"command": "npx"}}},
+        )
+        harness.prepopulate_file(
+            "user-internal", {"mcpServers": {"a": {"command": "uvx"}}}
+        )
+
+    def test_lookups_share_one_scan(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        self._prepopulate(harness)
+
+        with patch.object(
+            ClaudeCodePlugin,
+            "list_servers",
+            autospec=True,
+            side_effect=ClaudeCodePlugin.list_servers,
+        ) as list_servers:
+            assert manager.get_server_info("a").scope == "user-local"
+            assert manager.get_server_state("b") == ServerState.ENABLED
+            assert manager.get_server_state("zzz") == ServerState.NOT_INSTALLED
+            assert manager.find_server_location("a")["scope"] == "user-local"
+            assert manager.find_all_server_scopes("a") == [
+                ("claude-code", "user-local"),
+                ("claude-code", "user-internal"),
+            ]
+
+        assert list_servers.call_count == 1
+
+    def test_unknown_client_has_empty_inventory(self, mcp_manager_with_harness):
+        manager, _ = mcp_manager_with_harness
+
+        inventory = manager.get_inventory("no-such-client")
+
+        assert len(inventory) == 0
+        assert inventory.scopes_for("a") == []
+
+    def test_mutations_invalidate_inventory(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        self._prepopulate(harness)
+
+        assert manager.get_server_info("c") is None
+
+        result = manager.add_server("c", ServerConfig(command="npx"), "user-local")
+        assert result.success
+        assert manager.get_server_info("c").scope == "user-local"
+
+        assert manager.disable_server("c").success
+        assert manager.get_server_state("c") == ServerState.DISABLED
+
+        assert manager.enable_server("c").success
+        assert manager.get_server_state("c") == ServerState.ENABLED
+
+        assert manager.remove_server("c", "user-local").success
+        assert manager.get_server_state("c") == ServerState.NOT_INSTALLED
+
+    def test_enable_uses_inventory_scope(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        self._prepopulate(harness)
+        manager.get_inventory()
+
+        with patch.object(
+            ClaudeCodePlugin, "enable_server", autospec=True
+        ) as enable_server:
+            manager.enable_server("a")
+
+        enable_server.assert_called_once()
+        assert enable_server.call_args.args[1:] == ("a", "user-local")
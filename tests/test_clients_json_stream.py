@@ -0,0 +1,154 @@
+"""Tests for streaming extraction of top-level JSON keys."""
+
+import json
+import mmap
+
+import pytest
+
+from mcpi.clients.document_cache import ParsedDocumentCache
+from mcpi.clients.file_based import FileBasedScope, JSONFileReader
+from mcpi.clients.json_stream import extract_top_level
+from mcpi.clients.types import ScopeConfig
+
+TRICKY_STRINGS = [
+    "",
+    "plain",
+    'say "hi"',
+    "ends with backslash \\",
+    'backslash then quote \\"',
+    "brackets ] } [ { inside",
+    "line\nbreak\ttab",
+    "unicode é ☃",
+]
+
+
+def _document():
+    return {
+        "numStartups": 3,
+        "projects": {
+            f"/p{i}": {
+                "history": [
+                    {"display": s, "pastedContents": {}} for s in TRICKY_STRINGS
+                ],
+                "nested": [[[[[[[["deep"]]]]]]]],
+                "lastCost": 0.5,
+                "trusted": True,
+                "note": None,
+            }
+            for i in range(3)
+        },
+        "mcpServers": {"a": {"command": "npx", "args": ["-y", 'q"uote']}},
+        "tips": TRICKY_STRINGS,
+        "disabledMcpjsonServers": ["b"],
+    }
+
+
+class TestExtractTopLevel:
+    """extract_top_level() must agree with json.loads on the keys it returns."""
+
+    @pytest.mark.parametrize("indent", [None, 2])
+    @pytest.mark.parametrize("ensure_ascii", [True, False])
+    def test_matches_json_loads(self, indent, ensure_ascii):
+        doc = _document()
+        raw = json.dumps(doc, indent=indent, ensure_ascii=ensure_ascii).encode()
+        keys = ["mcpServers", "disabledMcpjsonServers", "enabledMcpjsonServers"]
+
+        assert extract_top_level(raw, keys) == {
+            "mcpServers": doc["mcpServers"],
+            "disabledMcpjsonServers": ["b"],
+        }
+
+    @pytest.mark.parametrize("value", TRICKY_STRINGS + [[], {}, 1, -2.5e3, None])
+    def test_skips_any_value(self, value):
+        raw = json.dumps({"skip": value, "keep": [value]}).encode()
+        assert extract_top_level(raw, ["keep"]) == {"keep": [value]}
+
+    def test_empty_object_and_bom(self):
+        assert extract_top_level(b"\xef\xbb\xbf { } \n", ["a"]) == {}
+
+    def test_duplicate_keys_last_wins(self):
+        assert extract_top_level(b'{"a": 1, "a": 2}', ["a"]) == {"a": 2}
+
+    def test_reads_mmap(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(_document()))
+        with (
+            path.open("rb") as f,
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as contents,
+        ):
+            result = extract_top_level(contents, ["mcpServers"])
+        assert result == {"mcpServers": _document()["mcpServers"]}
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            b"",
+            b"[]",
+            b'{"a": 1',
+            b'{"a": [1, 2}',
+            b'{"b": [1, 2}',
+            b'{"a": 1} x',
+            b'{"a" 1}',
+            b"{a: 1}",
+            b'{"b": "unterminated}',
+        ],
+    )
+    def test_malformed(self, raw):
+        with pytest.raises(ValueError):
+            extract_top_level(raw, ["a"])
+
+
+class TestReadKeys:
+    """Test JSONFileReader.read_keys()."""
+
+    def test_small_file_uses_full_parse(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(_document()))
+        cache = ParsedDocumentCache()
+        reader = JSONFileReader(cache=cache)
+
+        assert reader.read_keys(path)["disabledMcpjsonServers"] == ["b"]
+        reader.read(path)
+        assert cache.stats()["entries"] == 1
+
+    def test_large_file_streams(self, tmp_path):
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps(_document()))
+        cache = ParsedDocumentCache()
+        reader = JSONFileReader(cache=cache, stream_threshold=0)
+
+        data = reader.read_keys(path)
+        assert data == {
+            "mcpServers": _document()["mcpServers"],
+            "disabledMcpjsonServers": ["b"],
+        }
+
+        # Returned values are private copies
+        data["mcpServers"]["a"]["command"] = "changed"
+        assert reader.read_keys(path)["mcpServers"]["a"]["command"] == "npx"
+
+        # The partial view is cached next to (not instead of) the full parse
+        assert "projects" in reader.read(path)
+        assert cache.stats()["entries"] == 2
+        cache.invalidate(path)
+        assert cache.stats()["entries"] == 0
+
+    def test_missing_and_malformed(self, tmp_path):
+        reader = JSONFileReader(cache=ParsedDocumentCache(), stream_threshold=0)
+        assert reader.read_keys(tmp_path / "missing.json") == {}
+
+        path = tmp_path / "bad.json"
+        path.write_text('{"mcpServers": {')
+        with pytest.raises(ValueError, match="Failed to read"):
+            reader.read_keys(path)
+
+    def test_scope_get_servers_streams(self, tmp_path):
+        path = tmp_path / "claude.json"
+        path.write_text(json.dumps(_document()))
+        config = ScopeConfig(
+            name="user-internal", description="", priority=1, path=path
+        )
+        reader = JSONFileReader(cache=ParsedDocumentCache(), stream_threshold=0)
+        scope = FileBasedScope(config, reader=reader)
+
+        assert scope.get_servers() == _document()["mcpServers"]
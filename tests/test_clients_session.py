@@ -0,0 +1,184 @@
+"""Tests for MCPManager.session() write coalescing."""
+
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcpi.bundles.installer import BundleInstaller
+from mcpi.bundles.models import Bundle, BundleServer
+from mcpi.clients import file_based
+from mcpi.clients.session import get_active_buffer
+from mcpi.clients.types import ServerConfig
+
+
+def _config(name: str) -> ServerConfig:
+    return ServerConfig(command="npx", args=["-y", name])
+
+
+def _server_ids(manager):
+    servers = manager.list_servers(scope="project-mcp")
+    return sorted(info.id for info in servers.values())
+
+
+@pytest.fixture
+def counted_writes():
+    """Count atomic file replacements per file name."""
+    writes = Counter()
+    real = file_based.atomic_write_bytes
+
+    def counting(target, data):
+        writes[target.name] += 1
+        return real(target, data)
+
+    with patch.object(file_based, "atomic_write_bytes", side_effect=counting):
+        yield writes
+
+
+class TestManagerSession:
+    """Test the unit-of-work session."""
+
+    def test_many_adds_write_file_once(self, mcp_manager_with_harness, counted_writes):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file("project-mcp", {"mcpServers": {}})
+
+        with manager.session() as session:
+            for i in range(10):
+                session.add_server(f"server{i}", _config(f"pkg{i}"), "project-mcp")
+            # Nothing is on disk yet
+            assert harness.read_scope_file("project-mcp") == {"mcpServers": {}}
+
+        assert all(result.success for result in session.results)
+        assert len(session.results) == 10
+        assert sum(counted_writes.values()) == 1
+        servers = harness.read_scope_file("project-mcp")["mcpServers"]
+        assert sorted(servers) == [f"server{i}" for i in range(10)]
+        assert get_active_buffer() is None
+
+    def test_operations_see_pending_state(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file("project-mcp", {"mcpServers": {}})
+
+        with manager.session() as session:
+            session.add_server("a", _config("a"), "project-mcp")
+            duplicate = session.add_server("a", _config("a"), "project-mcp")
+            assert _server_ids(manager) == ["a"]
+            removed = session.remove_server("a", "project-mcp")
+
+        assert not duplicate.success
+        assert removed.success
+        assert harness.read_scope_file("project-mcp")["mcpServers"] == {}
+
+    def test_exception_discards_writes(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file("project-mcp", {"mcpServers": {}})
+
+        with pytest.raises(RuntimeError):
+            with manager.session() as session:
+                session.add_server("a", _config("a"), "project-mcp")
+                raise RuntimeError("abort")
+
+        assert harness.read_scope_file("project-mcp") == {"mcpServers": {}}
+        assert _server_ids(manager) == []
+
+    def test_flush_failure_fails_results(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file("project-mcp", {"mcpServers": {}})
+
+        with patch.object(
+            file_based, "atomic_write_bytes", side_effect=OSError("disk full")
+        ):
+            with manager.session() as session:
+                result = session.add_server("a", _config("a"), "project-mcp")
+                assert result.success
+
+        assert not result.success
+        assert "disk full" in result.message
+        assert harness.read_scope_file("project-mcp") == {"mcpServers": {}}
+
+    def test_nested_session_joins_outer(self, mcp_manager_with_harness, counted_writes):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file("project-mcp", {"mcpServers": {}})
+
+        with manager.session() as outer:
+            outer.add_server("a", _config("a"), "project-mcp")
+            with manager.session() as inner:
+                inner.add_server("b", _config("b"), "project-mcp")
+            assert sum(counted_writes.values()) == 0
+
+        assert sum(counted_writes.values()) == 1
+        servers = harness.read_scope_file("project-mcp")["mcpServers"]
+        assert sorted(servers) == ["a", "b"]
+
+    def test_bundle_install_writes_once(self, mcp_manager_with_harness, counted_writes):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file("project-mcp", {"mcpServers": {}})
+
+        catalog = MagicMock()
+        catalog.get_server.side_effect = lambda server_id: MagicMock(
+            get_run_command=lambda: {"command": "npx", "args": ["-y", server_id]}
+        )
+        bundle = Bundle(
+            name="many",
+            description="Many servers",
+            servers=[BundleServer(id=f"server{i}") for i in range(5)],
+        )
+
+        results = BundleInstaller(manager, catalog).install_bundle(
+            bundle, scope="project-mcp", client_name="claude-code"
+        )
+
+        assert [r.success for r in results] == [True] * 5
+        assert sum(counted_writes.values()) == 1
+        assert len(harness.read_scope_file("project-mcp")["mcpServers"]) == 5
+
+    def test_move_between_files_keeps_earlier_edits(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file(
+            "user-internal", {"mcpServers": {"x": {"command": "x", "args": []}}}
+        )
+        harness.prepopulate_file("user-internal-disabled", {"mcpServers": {}})
+
+        with manager.session() as session:
+            session.add_server("y", _config("y"), "user-internal")
+            disabled = session.disable_server("x", "user-internal")
+
+        assert disabled.success
+        assert sorted(harness.read_scope_file("user-internal")["mcpServers"]) == ["y"]
+        assert "x" in harness.read_scope_file("user-internal-disabled")["mcpServers"]
+
+    def test_new_files_are_written_on_commit(
+        self, mcp_manager_with_harness, counted_writes
+    ):
+        manager, harness = mcp_manager_with_harness
+        path = harness.path_overrides["project-mcp"]
+
+        with manager.session() as session:
+            session.add_server("a", _config("a"), "project-mcp")
+            session.add_server("b", _config("b"), "project-mcp")
+            # The file is created only on commit
+            assert not path.exists()
+            assert _server_ids(manager) == ["a", "b"]
+
+        assert [result.success for result in session.results] == [True, True]
+        assert sum(counted_writes.values()) == 1
+        assert sorted(harness.read_scope_file("project-mcp")["mcpServers"]) == [
+            "a",
+            "b",
+        ]
+
+    def test_exception_discards_created_files(self, mcp_manager_with_harness):
+        manager, harness = mcp_manager_with_harness
+        harness.prepopulate_file(
+            "user-internal", {"mcpServers": {"x": {"command": "x", "args": []}}}
+        )
+        disabled_path = harness.path_overrides["user-internal-disabled"]
+        assert not disabled_path.exists()
+
+        with pytest.raises(RuntimeError):
+            with manager.session() as session:
+                assert session.disable_server("x", "user-internal").success
+                raise RuntimeError("abort")
+
+        assert not disabled_path.exists()
+        assert "x" in harness.read_scope_file("user-internal")["mcpServers"]
@@ -0,0 +1,163 @@
+"""Tests for batch state resolution in enable/disable handlers."""
+
+import json
+from unittest.mock import patch
+
+from mcpi.clients.claude_code import ClaudeCodePlugin
+from mcpi.clients.disabled_tracker import DisabledServersTracker
+from mcpi.clients.enable_disable_handlers import (
+    ApprovalRequiredEnableDisableHandler,
+    ArrayBasedEnableDisableHandler,
+    FileTrackedEnableDisableHandler,
+    InlineEnableDisableHandler,
+)
+from mcpi.clients.file_based import JSONFileReader, JSONFileWriter
+from mcpi.clients.file_move_enable_disable_handler import (
+    FileMoveEnableDisableHandler,
+)
+from mcpi.clients.types import ServerState
+
+
+def _write(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data))
+
+
+class TestResolveStates:
+    """Each handler's resolve_states() must agree with its per-server checks."""
+
+    def test_array_based(self, tmp_path):
+        config = tmp_path / "settings.local.json"
+        _write(
+            config, {"disabledMcpjsonServers": ["b"], "enabledMcpjsonServers": ["a"]}
+        )
+        handler = ArrayBasedEnableDisableHandler(
+            config, JSONFileReader(), JSONFileWriter()
+        )
+
+        assert handler.resolve_states(["a", "b", "c"]) == {
+            "a": ServerState.ENABLED,
+            "b": ServerState.DISABLED,
+            "c": ServerState.ENABLED,
+        }
+
+    def test_array_based_missing_file(self, tmp_path):
+        handler = ArrayBasedEnableDisableHandler(
+            tmp_path / "missing.json", JSONFileReader(), JSONFileWriter()
+        )
+        assert handler.resolve_states(["a"]) == {"a": ServerState.ENABLED}
+
+    def test_file_tracked(self, tmp_path):
+        tracker = DisabledServersTracker(tmp_path / "disabled.json")
+        tracker.disable("b")
+        handler = FileTrackedEnableDisableHandler(tracker)
+
+        assert handler.resolve_states(["a", "b"]) == {
+            "a": ServerState.ENABLED,
+            "b": ServerState.DISABLED,
+        }
+
+    def test_file_move(self, tmp_path):
+        active = tmp_path / "active.json"
+        disabled = tmp_path / "disabled.json"
+        _write(active, {"mcpServers": {"a": {"command": "x"}}})
+        _write(disabled, {"mcpServers": {"b": {"command": "y"}}})
+        handler = FileMoveEnableDisableHandler(
+            active, disabled, JSONFileReader(), JSONFileWriter()
+        )
+
+        assert handler.resolve_states(["a", "b"]) == {
+            "a": ServerState.ENABLED,
+            "b": ServerState.DISABLED,
+        }
+
+    def test_inline(self, tmp_path):
+        config = tmp_path / ".mcp.json"
+        _write(config, {"mcpServers": {"a": {}, "b": {"disabled": True}}})
+        handler = InlineEnableDisableHandler(config, JSONFileReader(), JSONFileWriter())
+
+        assert handler.resolve_states(["a", "b"]) == {
+            "a": ServerState.ENABLED,
+            "b": ServerState.DISABLED,
+        }
+
+    def test_approval_required(self, tmp_path):
+        mcp_json = tmp_path / ".mcp.json"
+        settings = tmp_path / ".claude" / "settings.local.json"
+        _write(
+            mcp_json,
+            {"mcpServers": {"a": {}, "b": {}, "c": {}, "d": {"disabled": True}}},
+        )
+        _write(
+            settings,
+            {"enabledMcpjsonServers": ["a", "d"], "disabledMcpjsonServers": ["b"]},
+        )
+        handler = ApprovalRequiredEnableDisableHandler(
+            mcp_json, settings, JSONFileReader(), JSONFileWriter()
+        )
+
+        states = handler.resolve_states(["a", "b", "c", "d"])
+
+        assert states == {
+            "a": ServerState.ENABLED,
+            "b": ServerState.DISABLED,
+            "c": ServerState.DISABLED,  # Unapproved
+            "d": ServerState.DISABLED,  # Inline disabled wins over approval
+        }
+        for server_id, state in states.items():
+            assert handler.is_disabled(server_id) == (state == ServerState.DISABLED)
+
+    def test_approval_required_without_settings_file(self, tmp_path):
+        handler = ApprovalRequiredEnableDisableHandler(
+            tmp_path / ".mcp.json",
+            tmp_path / "settings.local.json",
+            JSONFileReader(),
+            JSONFileWriter(),
+        )
+        assert handler.resolve_states(["a"]) == {"a": ServerState.DISABLED}
+
+
+class TestListServersUsesBatchResolution:
+    """ClaudeCodePlugin.list_servers resolves states once per scope."""
+
+    def test_is_disabled_not_called_per_server(self, mcp_harness):
+        mcp_harness.prepopulate_file(
+            "user-local",
+            {
+                "mcpServers": {f"s{i}": {"command": "npx"} for i in range(20)},
+                "disabledMcpjsonServers": ["s3", "s7"],
+            },
+        )
+        plugin = ClaudeCodePlugin(path_overrides=mcp_harness.path_overrides)
+
+        with (
+            patch.object(ArrayBasedEnableDisableHandler, "is_disabled") as is_disabled,
+            patch.object(
+                ArrayBasedEnableDisableHandler,
+                "resolve_states",
+                autospec=True,
+                side_effect=ArrayBasedEnableDisableHandler.resolve_states,
+            ) as resolve_states,
+        ):
+            servers = plugin.list_servers(scope="user-local")
+
+        assert is_disabled.call_count == 0
+        assert resolve_states.call_count == 1
+
+        states = {info.id: info.state for info in servers.values()}
+        assert states["s3"] == ServerState.DISABLED
+        assert states["s7"] == ServerState.DISABLED
+        assert states["s0"] == ServerState.ENABLED
+
+    def test_inline_disabled_takes_precedence(self, mcp_harness):
+        mcp_harness.prepopulate_file(
+            "user-local",
+            {
+                "mcpServers": {"a": {"command": "npx", "disabled": True}},
+                "enabledMcpjsonServers": ["a"],
+            },
+        )
+        plugin = ClaudeCodePlugin(path_overrides=mcp_harness.path_overrides)
+
+        info = plugin.get_server_info("a", scope="user-local")
+        assert info.state == ServerState.DISABLED
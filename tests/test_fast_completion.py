@@ -0,0 +1,180 @@
+"""Tests for server ID completion from the precomputed index."""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+from click.shell_completion import ShellComplete
+
+from mcpi.cli import main
+from mcpi.fast_completion import (
+    build_catalog_section,
+    build_installed_section,
+    complete,
+    index_path,
+    load_section,
+)
+from mcpi.registry.catalog_manager import create_test_catalog_manager
+
+CATALOG = {
+    "filesystem": {
+        "description": "Read and write files in allowed directories of the host",
+        "command": "npx",
+        "args": ["-y", "@modelcontextprotocol/server-filesystem"],
+        "repository": None,
+    },
+    "github": {"description": "GitHub API", "command": "npx", "repository": None},
+    "fetch": {
+        "description": "Fetch URLs",
+        "command": "uvx",
+        "args": ["mcp-fetch"],
+        "repository": None,
+    },
+}
+
+# Modules the completion fast path must not import
+HEAVY_MODULES = ("click", "rich", "pydantic", "jsonschema", "yaml", "httpx")
+
+
+@pytest.fixture
+def sources(prepopulated_harness, mcp_manager_with_harness, tmp_path: Path):
+    """Manager, catalog manager and index path, with settled source files."""
+    manager, harness = mcp_manager_with_harness
+    official = tmp_path / "catalog.json"
+    official.write_text(json.dumps(CATALOG))
+    local = tmp_path / "local.json"
+    local.write_text("{}")
+    # Files modified just before a build are not trusted, so age them
+    settled = time.time() - 60
+    for path in [official, local, *harness.path_overrides.values()]:
+        if path.exists():
+            os.utime(path, (settled, settled))
+
+    builds = []
+
+    def builder(name, build):
+        def run():
+            builds.append(name)
+            return build()
+
+        return run
+
+    catalog_manager = create_test_catalog_manager(official, local)
+    builders = {
+        "installed": builder("installed", lambda: build_installed_section(manager)),
+        "catalog": builder("catalog", lambda: build_catalog_section(catalog_manager)),
+    }
+    return {
+        "obj": {"mcp_manager": manager, "catalog_manager": catalog_manager},
+        "harness": harness,
+        "index": tmp_path / "cache" / "index.idx",
+        "builders": builders,
+        "builds": builds,
+    }
+
+
+@pytest.mark.parametrize(
+    "command, incomplete",
+    [
+        ("remove", ""),
+        ("remove", "g"),
+        ("disable", ""),
+        ("enable", ""),
+        ("add", ""),
+        ("add", "fi"),
+        ("info", "modelcontext"),  # Package name
+    ],
+)
+def test_completions_match_the_click_app(sources, command, incomplete):
+    completer = ShellComplete(
+        main, {"obj": dict(sources["obj"])}, "mcpi", "_MCPI_COMPLETE"
+    )
+    expected = [
+        (item.value, item.help)
+        for item in completer.get_completions([command], incomplete)
+    ]
+
+    completions = complete([command], incomplete, sources["index"], sources["builders"])
+
+    assert completions == expected
+    assert completions or command == "enable"
+
+
+def test_typos_and_other_words_are_left_to_the_click_app(sources):
+    args = (sources["index"], sources["builders"])
+    assert complete(["add"], "fjlesystem", *args) is None
+    assert complete(["list"], "", *args) is None
+    assert complete(["add", "x"], "", *args) is None
+    assert complete(["add"], "--", *args) is None
+
+
+def test_sections_are_rebuilt_when_their_sources_change(sources):
+    args = (sources["index"], sources["builders"])
+    complete(["remove"], "", *args)
+    complete(["add"], "", *args)
+    complete(["remove"], "", *args)
+    complete(["add"], "", *args)
+    assert sources["builds"] == ["installed", "catalog"]
+
+    harness = sources["harness"]
+    harness.prepopulate_file("user-mcp", {"mcpServers": {"redis": {"command": "x"}}})
+
+    assert [value for value, _ in complete(["remove"], "r", *args)] == ["redis"]
+    complete(["add"], "", *args)
+    assert sources["builds"] == ["installed", "catalog", "installed"]
+
+
+def test_creating_a_disabled_file_rebuilds_the_installed_section(sources):
+    args = (sources["index"], sources["builders"])
+    disabled_file = sources["harness"].path_overrides["user-mcp-disabled"]
+    assert not disabled_file.exists()
+    complete(["enable"], "", *args)
+
+    disabled_file.write_text(json.dumps({"mcpServers": {"redis": {"command": "x"}}}))
+
+    assert [value for value, _ in complete(["enable"], "r", *args)] == ["redis"]
+    assert sources["builds"] == ["installed", "installed"]
+
+
+def test_completion_imports_only_the_index_reader(sources, tmp_path, monkeypatch):
+    cache = tmp_path / "xdg-cache"
+    monkeypatch.setenv("XDG_CACHE_HOME", str(cache))
+    monkeypatch.chdir(tmp_path)
+    load_section("installed", index_path(), sources["builders"])
+
+    env = dict(
+        os.environ,
+        _MCPI_COMPLETE="bash_complete",
+        COMP_WORDS="mcpi remove fi",
+        COMP_CWORD="2",
+    )
+    result = subprocess.run(
+        [
+            sys.executable,
+            "-X",
+            "importtime",
+            "-c",
+            "from mcpi.fast_completion import main; main()",
+        ],
+        env=env,
+        cwd=tmp_path,
+        capture_output=True,
+        text=True,
+    )
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "plain,filesystem\n"
+    imported = {
+        line.split("|")[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+    assert {name for name in imported if name.startswith("mcpi")} == {
+        "mcpi",
+        "mcpi.fast_completion",
+    }
+    assert not {name for name in imported if name.split(".")[0] in HEAVY_MODULES}
@@ -0,0 +1,136 @@
+"""Tests for the compiled binary catalog artifact."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from mcpi.registry.catalog import LazyServerMap, MCPServer, ServerCatalog
+from mcpi.registry.catalog_artifact import (
+    CatalogArtifact,
+    artifact_path_for,
+    compile_catalog,
+)
+from mcpi.registry.validation_cache import ValidationCache
+
+REGISTRY_PATH = Path(__file__).parent.parent / "src" / "mcpi" / "data" / "catalog.json"
+
+CATALOG = {
+    "zeta": {
+        "description": "Last",
+        "command": " npx ",
+        "args": ["-y", "zeta"],
+        "repository": None,
+    },
+    "alpha": {
+        "description": "First",
+        "command": "uvx",
+        "args": ["alpha"],
+        "repository": "https://x.dev/alpha",
+        "categories": ["files"],
+    },
+    "ünïcode": {"description": "Non-ASCII", "command": "node", "repository": None},
+}
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(CATALOG, indent=2))
+    compile_catalog(path)
+    return path
+
+
+def _catalog(catalog_path, tmp_path):
+    return ServerCatalog(
+        catalog_path,
+        validate_with_cue=True,
+        validation_cache=ValidationCache(tmp_path / "cache", None),
+    )
+
+
+class TestCatalogArtifact:
+    def test_round_trip(self, catalog_path):
+        artifact = CatalogArtifact.open(artifact_path_for(catalog_path))
+
+        assert len(artifact) == 3
+        assert list(artifact.ids()) == sorted(CATALOG, key=lambda s: s.encode())
+        assert artifact.get_record("missing") is None
+        for server_id, entry in CATALOG.items():
+            assert artifact.get_record(server_id) == MCPServer(**entry).model_dump(
+                mode="json"
+            )
+        # Records are stored normalized
+        assert artifact.get_record("zeta")["command"] == "npx"
+
+    def test_invalid_catalog_is_rejected(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps({"bad": {"command": "npx"}}))
+
+        with pytest.raises(ValueError, match="Catalog validation failed"):
+            compile_catalog(path)
+
+    @pytest.mark.parametrize("contents", [b"", b"NOTACAT\0" + bytes(60)])
+    def test_bad_file_is_rejected(self, tmp_path, contents):
+        path = tmp_path / "catalog.bin"
+        path.write_bytes(contents)
+
+        with pytest.raises(ValueError, match="Not a catalog artifact"):
+            CatalogArtifact.open(path)
+
+    def test_packaged_artifact_is_current(self):
+        artifact = CatalogArtifact.open(artifact_path_for(REGISTRY_PATH))
+        assert artifact.matches_source(REGISTRY_PATH), "Run scripts/compile-catalog.py"
+
+
+class TestLazyCatalog:
+    def test_hydrates_only_accessed_servers(self, catalog_path, tmp_path):
+        catalog = _catalog(catalog_path, tmp_path)
+        server = catalog.get_server("alpha")
+
+        servers = catalog._registry.servers
+        assert isinstance(servers, LazyServerMap)
+        assert server == MCPServer(**CATALOG["alpha"])
+        assert "zeta" in servers
+        assert list(servers._hydrated) == ["alpha"]
+        assert catalog.get_server("missing") is None
+
+    def test_stale_artifact_falls_back_to_json(self, catalog_path, tmp_path):
+        catalog_path.write_text(json.dumps({"other": CATALOG["alpha"]}))
+        catalog = _catalog(catalog_path, tmp_path)
+
+        assert [server_id for server_id, _ in catalog.list_servers()] == ["other"]
+        assert not isinstance(catalog._registry.servers, LazyServerMap)
+
+    def test_corrupt_artifact_falls_back_to_json(self, catalog_path, tmp_path):
+        artifact_path_for(catalog_path).write_bytes(b"garbage")
+        catalog = _catalog(catalog_path, tmp_path)
+
+        assert len(catalog.list_servers()) == 3
+
+    def test_changes_and_save(self, catalog_path, tmp_path):
+        catalog = _catalog(catalog_path, tmp_path)
+        git = MCPServer(description="Git", command="uvx")
+
+        assert catalog.add_server("git", git)
+        assert not catalog.add_server("alpha", git)
+        assert catalog.remove_server("zeta")
+        assert not catalog.remove_server("zeta")
+        assert catalog.update_server("alpha", git)
+        assert [server_id for server_id, _ in catalog.list_servers()] == [
+            "alpha",
+            "git",
+            "ünïcode",
+        ]
+        assert catalog.get_server("alpha") == git
+
+        assert catalog.save_catalog()
+        # The artifact no longer matches, so the saved JSON is loaded
+        reloaded = _catalog(catalog_path, tmp_path)
+        assert sorted(json.loads(catalog_path.read_text())) == [
+            "alpha",
+            "git",
+            "ünïcode",
+        ]
+        assert reloaded.get_server("zeta") is None
+        assert reloaded.get_server("git") == git
@@ -0,0 +1,116 @@
+"""Tests for the in-process catalog validator.
+
+The same corpus is checked with ``cue vet`` when the cue binary is installed,
+so the two validators cannot drift apart unnoticed.
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+import pytest
+
+from mcpi.registry.catalog import MCPServer, ServerCatalog
+from mcpi.registry.catalog_schema import CatalogSchemaValidator
+from mcpi.registry.cue_validator import CUEValidator
+from mcpi.registry.validation_cache import ValidationCache
+
+REGISTRY_PATH = Path(__file__).parent.parent / "src" / "mcpi" / "data" / "catalog.json"
+
+
+def _server(**overrides):
+    server = {
+        "description": "File access",
+        "command": "npx",
+        "args": ["-y", "server"],
+        "repository": None,
+        "categories": ["files"],
+    }
+    server.update(overrides)
+    return {key: value for key, value in server.items() if value is not ...}
+
+
+# Catalogs and whether ``cue vet`` accepts them
+CORPUS = {
+    "empty": ({}, True),
+    "full": ({"server": _server()}, True),
+    "repository-url": ({"server": _server(repository="https://x.dev/y")}, True),
+    "env": ({"server": _server(env={"TOKEN": "x"})}, True),
+    "open-lists-default-empty": ({"server": _server(args=..., categories=...)}, True),
+    "root-array": ([], False),
+    "server-not-object": ({"server": "x"}, False),
+    "missing-description": ({"server": _server(description=...)}, False),
+    "empty-description": ({"server": _server(description="")}, False),
+    "null-description": ({"server": _server(description=None)}, False),
+    "empty-command": ({"server": _server(command="")}, False),
+    "command-not-string": ({"server": _server(command=1)}, False),
+    "args-not-list": ({"server": _server(args="-y")}, False),
+    "args-not-strings": ({"server": _server(args=["-y", 1])}, False),
+    "categories-not-strings": ({"server": _server(categories=[None])}, False),
+    "env-not-object": ({"server": _server(env=["TOKEN"])}, False),
+    "env-value-not-string": ({"server": _server(env={"PORT": 8080})}, False),
+    "missing-repository": ({"server": _server(repository=...)}, False),
+    "repository-number": ({"server": _server(repository=1)}, False),
+    "unknown-field": ({"server": _server(homepage="https://x.dev")}, False),
+}
+
+
+@pytest.fixture(scope="module")
+def cue():
+    try:
+        return CUEValidator()
+    except RuntimeError:
+        pytest.skip("CUE binary not installed")
+
+
+class TestCatalogSchemaValidator:
+    @pytest.mark.parametrize("name", sorted(CORPUS))
+    def test_corpus(self, name):
+        data, valid = CORPUS[name]
+        is_valid, error = CatalogSchemaValidator().validate(data)
+        assert is_valid == valid
+        assert (error is None) == valid
+
+    def test_error_names_location(self):
+        _, error = CatalogSchemaValidator().validate(
+            {"server": _server(description="")}
+        )
+        assert error.startswith("server.description:")
+
+    def test_packaged_catalog_is_valid(self):
+        assert CatalogSchemaValidator().validate_file(REGISTRY_PATH) == (True, None)
+
+    def test_invalid_json_file(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text("{")
+        is_valid, error = CatalogSchemaValidator().validate_file(path)
+        assert not is_valid
+        assert "invalid JSON" in error
+
+    def test_catalog_load_and_save_spawn_no_process(self, tmp_path, monkeypatch):
+        def no_subprocess(*args, **kwargs):
+            raise AssertionError("subprocess spawned")
+
+        monkeypatch.setattr(subprocess, "run", no_subprocess)
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps({"server": _server()}))
+        catalog = ServerCatalog(
+            path,
+            validate_with_cue=True,
+            validation_cache=ValidationCache(tmp_path / "cache", None),
+        )
+
+        catalog.add_server("git", MCPServer(description="Git", command="uvx"))
+        assert catalog.save_catalog()
+        assert "git" in json.loads(path.read_text())
+
+
+class TestAgreesWithCue:
+    """Check the corpus expectations against the real ``cue vet``."""
+
+    @pytest.mark.parametrize("name", sorted(CORPUS))
+    def test_corpus(self, cue, name, tmp_path):
+        data, valid = CORPUS[name]
+        path = tmp_path / "catalog.json"
+        path.write_text(json.dumps(data))
+        assert cue.validate_file(path)[0] == valid
@@ -0,0 +1,126 @@
+"""Tests for facet filtering of catalog servers."""
+
+import json
+
+import pytest
+from click.testing import CliRunner
+
+from mcpi.cli import main
+from mcpi.registry.catalog import MCPServer, create_in_memory_catalog
+from mcpi.registry.facet_index import FacetIndex
+
+SERVERS = {
+    "acme/postgres": MCPServer(
+        description="PostgreSQL databases",
+        command="npx",
+        repository="https://github.com/acme/postgres",
+        categories=["database"],
+    ),
+    "acme/sqlite": MCPServer(
+        description="SQLite databases",
+        command="uvx",
+        categories=["database", "files"],
+    ),
+    "acme/files": MCPServer(
+        description="Local files",
+        command="uvx",
+        repository="https://github.com/acme/files",
+        categories=["files"],
+    ),
+}
+
+
+class TestFacetIndex:
+    def test_counts(self):
+        index = FacetIndex(SERVERS)
+
+        assert index.counts() == {
+            "category": {"database": 2, "files": 2},
+            "command": {"uvx": 2, "npx": 1},
+            "repository": {"yes": 2, "no": 1},
+        }
+        assert index.counts(["acme/sqlite"])["category"] == {"database": 1, "files": 1}
+
+    def test_matching_intersects_facets(self):
+        index = FacetIndex(SERVERS)
+
+        assert index.matching({"category": ["Database"], "command": ["uvx"]}) == {
+            "acme/sqlite"
+        }
+        assert index.matching({"category": ["database", "files"]}) == set(SERVERS)
+        assert index.matching({"repository": ["no"], "command": ["npx"]}) == set()
+        assert index.matching({"category": []}) is None
+
+        with pytest.raises(ValueError, match="Unknown facet"):
+            index.matching({"license": ["mit"]})
+
+    def test_add_and_remove(self):
+        index = FacetIndex(SERVERS)
+        index.add(
+            "acme/sqlite",
+            MCPServer(description="SQLite", command="npx", categories=["database"]),
+        )
+        index.remove("acme/files")
+
+        assert index.counts() == {
+            "category": {"database": 2},
+            "command": {"npx": 2},
+            "repository": {"no": 1, "yes": 1},
+        }
+
+
+class TestCatalogFacets:
+    def test_filtered_search_and_counts(self):
+        catalog = create_in_memory_catalog(dict(SERVERS))
+        filters = {"command": ["uvx"]}
+
+        assert [
+            server_id
+            for server_id, _ in catalog.search_servers("databases", filters=filters)
+        ] == ["acme/sqlite"]
+        assert [r.server_id for r in catalog.search("", filters=filters)] == [
+            "acme/files",
+            "acme/sqlite",
+        ]
+        assert catalog.facet_counts("databases")["command"] == {"npx": 1, "uvx": 1}
+
+    def test_facets_follow_catalog_changes(self):
+        catalog = create_in_memory_catalog(dict(SERVERS))
+        assert catalog.list_categories() == {"database": 2, "files": 2}
+
+        catalog.add_server(
+            "acme/redis",
+            MCPServer(description="Redis", command="docker", categories=["cache"]),
+        )
+        catalog.remove_server("acme/files")
+        catalog.update_server(
+            "acme/sqlite", MCPServer(description="SQLite", command="npx")
+        )
+
+        assert catalog.list_categories() == {"database": 1, "cache": 1}
+        assert [
+            server_id
+            for server_id, _ in catalog.search_servers("", filters={"command": ["npx"]})
+        ] == ["acme/postgres", "acme/sqlite"]
+
+    def test_cli_filters(self, monkeypatch):
+        catalog = create_in_memory_catalog(dict(SERVERS))
+        monkeypatch.setattr("mcpi.cli.get_catalog", lambda ctx, name=None: catalog)
+
+        result = CliRunner().invoke(
+            main,
+            ["search", "--category", "files", "--no-repository", "--facets", "--json"],
+        )
+
+        assert result.exit_code == 0, result.output
+        output = json.loads(result.output)
+        assert [server["id"] for server in output["results"]] == ["acme/sqlite"]
+        assert output["facets"]["category"] == {"database": 1, "files": 1}
+
+    def test_cli_rejects_facets_across_catalogs(self):
+        result = CliRunner().invoke(
+            main, ["search", "--category", "files", "--facets", "--all-catalogs"]
+        )
+
+        assert result.exit_code == 2
+        assert "--facets cannot be combined with --all-catalogs" in result.output
@@ -0,0 +1,160 @@
+"""Tests for typo-tolerant lookup of catalog terms and server IDs."""
+
+import pytest
+
+from mcpi.registry.catalog import MCPServer, create_in_memory_catalog
+from mcpi.registry.fuzzy_index import (
+    CompletionIndex,
+    TrigramIndex,
+    edit_distance,
+    max_edits,
+    package_names,
+)
+from mcpi.registry.search_index import SearchIndex
+
+SERVERS = {
+    "modelcontextprotocol/postgres": MCPServer(
+        description="Query and manage PostgreSQL databases",
+        command="npx",
+        args=["-y", "@modelcontextprotocol/server-postgres"],
+    ),
+    "modelcontextprotocol/github": MCPServer(
+        description="GitHub repositories and issues",
+        command="npx",
+        args=["-y", "@modelcontextprotocol/server-github"],
+    ),
+    "ahujasid/blender-mcp": MCPServer(
+        description="Blender 3D modeling",
+        command="uvx",
+        args=["blender-mcp"],
+    ),
+    "ckreiling/docker": MCPServer(
+        description="Manage Docker containers",
+        command="npx",
+        args=["-y", "mcp-server-docker@1.2.0"],
+    ),
+}
+
+
+class TestEditDistance:
+    @pytest.mark.parametrize(
+        "a, b, expected",
+        [
+            ("postgres", "postgres", 0),
+            ("postgress", "postgres", 1),
+            ("psotgres", "postgres", 1),
+            ("postgrse", "postgres", 1),
+            ("pstgrs", "postgres", 2),
+            ("mysql", "postgres", 3),
+        ],
+    )
+    def test_distance(self, a, b, expected):
+        assert edit_distance(a, b, 2) == expected
+
+    def test_stops_past_limit(self):
+        assert edit_distance("postgr", "postgresql", 1) == 2
+        assert edit_distance("abcdef", "uvwxyz", 2) == 3
+
+    def test_max_edits(self):
+        assert [max_edits("x" * n) for n in (3, 4, 7, 8)] == [0, 1, 1, 2]
+
+
+class TestTrigramIndex:
+    TERMS = sorted(["database", "databases", "postgres", "postgresql", "docker"])
+
+    def test_similar(self):
+        index = TrigramIndex(self.TERMS)
+
+        found = [(d, self.TERMS[n]) for d, n in index.similar("postgress", 2)]
+        assert found == [(1, "postgres"), (2, "postgresql")]
+        assert [self.TERMS[n] for _, n in index.similar("databse", 1)] == ["database"]
+        assert index.similar("kubernetes", 2) == []
+
+    def test_prefixed(self):
+        index = TrigramIndex(self.TERMS)
+
+        assert [self.TERMS[n] for n in index.prefixed("data")] == [
+            "database",
+            "databases",
+        ]
+        assert not index.prefixed("zzz")
+
+    def test_containing(self):
+        index = TrigramIndex(self.TERMS)
+
+        assert [self.TERMS[n] for n in index.containing("gres")] == [
+            "postgres",
+            "postgresql",
+        ]
+        assert [self.TERMS[n] for n in index.containing("as")] == [
+            "database",
+            "databases",
+        ]
+        assert index.containing("sqlx") == []
+
+    def test_similar_prefixes(self):
+        index = TrigramIndex(self.TERMS)
+
+        def similar_prefixes(text, limit):
+            return [
+                (distance, self.TERMS[number])
+                for distance, numbers in index.similar_prefixes(text, limit)
+                for number in numbers
+            ]
+
+        assert similar_prefixes("psotg", 1) == [(1, "postgres"), (1, "postgresql")]
+        assert similar_prefixes("dtabase", 2) == [(1, "database"), (1, "databases")]
+        assert similar_prefixes("databsae", 2)[0] == (1, "database")
+        assert similar_prefixes("xyzw", 1) == []
+
+
+def test_package_names():
+    assert package_names(
+        ["-y", "@steipete/peekaboo-mcp@beta", "github:owner/repo", "run", "/tmp/x"]
+    ) == ["steipete/peekaboo-mcp", "owner/repo"]
+
+
+class TestCompletion:
+    def test_id_prefix_comes_first(self):
+        index = CompletionIndex(SERVERS)
+
+        assert index.complete("model") == [
+            "modelcontextprotocol/github",
+            "modelcontextprotocol/postgres",
+        ]
+        assert index.complete("", limit=2) == sorted(SERVERS)[:2]
+
+    def test_matches_id_parts_and_package_names(self):
+        index = CompletionIndex(SERVERS)
+
+        assert index.complete("post") == ["modelcontextprotocol/postgres"]
+        assert index.complete("mcp-server-d") == ["ckreiling/docker"]
+        assert index.complete("Blender") == ["ahujasid/blender-mcp"]
+
+    def test_tolerates_typos(self):
+        index = CompletionIndex(SERVERS)
+
+        assert index.complete("psotgres") == ["modelcontextprotocol/postgres"]
+        assert index.complete("gihtub") == ["modelcontextprotocol/github"]
+        assert index.complete("zzzz") == []
+
+
+class TestCatalogIntegration:
+    def test_search_tolerates_typos(self):
+        index = SearchIndex(SERVERS)
+
+        (result,) = index.search("postgress")
+        assert result.server_id == "modelcontextprotocol/postgres"
+        assert "postgres" in result.matches["id"]
+        assert result.score < index.search("postgres")[0].score
+        assert [r.server_id for r in index.search("dokcer containers")] == [
+            "ckreiling/docker"
+        ]
+
+    def test_catalog_completion_follows_changes(self):
+        catalog = create_in_memory_catalog(dict(SERVERS))
+        assert catalog.complete_server_ids("redsi") == []
+
+        redis = MCPServer(description="Redis", command="npx", args=["redis-mcp"])
+        catalog.add_server("acme/redis", redis)
+        assert catalog.complete_server_ids("redsi") == [("acme/redis", redis)]
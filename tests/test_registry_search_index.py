@@ -0,0 +1,236 @@
+"""Tests for ranked catalog search."""
+
+import json
+
+import pytest
+
+from mcpi.registry.catalog import (
+    LazyServerMap,
+    MCPServer,
+    ServerCatalog,
+    create_in_memory_catalog,
+)
+from mcpi.registry.catalog_artifact import compile_catalog
+from mcpi.registry.search_index import (
+    SearchIndex,
+    highlight_spans,
+    parse_query,
+    tokenize,
+)
+
+SERVERS = {
+    "modelcontextprotocol/postgres": MCPServer(
+        description="Query and manage PostgreSQL databases",
+        command="npx",
+        args=["-y", "@modelcontextprotocol/server-postgres"],
+        repository="https://github.com/modelcontextprotocol/servers",
+        categories=["database"],
+    ),
+    "acme/sqlite": MCPServer(
+        description="Local database files, works alongside postgres dumps",
+        command="uvx",
+        args=["mcp-server-sqlite"],
+        categories=["database"],
+    ),
+    "@anthropic/filesystem": MCPServer(
+        description="Access and manage local filesystem operations",
+        command="npx",
+        args=["-y", "@modelcontextprotocol/server-filesystem"],
+        repository="https://github.com/modelcontextprotocol/servers",
+    ),
+    "acme/mysql": MCPServer(
+        description="Query MySQL databases",
+        command="docker",
+        args=["run", "acme/mysql-mcp"],
+    ),
+}
+
+
+@pytest.fixture
+def index():
+    return SearchIndex(SERVERS)
+
+
+def _ids(results):
+    return [result.server_id for result in results]
+
+
+class TestQueryParsing:
+    def test_tokenize(self):
+        assert tokenize("@anthropic/File-System v2") == [
+            "anthropic",
+            "file",
+            "system",
+            "v2",
+        ]
+
+    def test_and_or(self):
+        assert parse_query("postgres OR my-sql AND local") == [
+            ["postgres"],
+            ["my", "sql", "local"],
+        ]
+        assert parse_query("  ") == []
+
+
+class TestSearchIndex:
+    def test_id_match_outranks_description_match(self, index):
+        results = index.search("postgres")
+
+        assert _ids(results) == ["modelcontextprotocol/postgres", "acme/sqlite"]
+        assert results[0].score > results[1].score
+
+    def test_terms_are_anded(self, index):
+        assert _ids(index.search("database local")) == ["acme/sqlite"]
+        assert index.search("database filesystem") == []
+
+    def test_or(self, index):
+        assert set(_ids(index.search("mysql OR sqlite"))) == {
+            "acme/mysql",
+            "acme/sqlite",
+        }
+
+    def test_prefix_match_scores_below_exact(self, index):
+        results = index.search("file")
+
+        assert set(_ids(results)) == {"acme/sqlite", "@anthropic/filesystem"}
+        assert results[1].matches == {"description": ["files"]}
+        exact = index.search("filesystem")[0]
+        assert exact.server_id == "@anthropic/filesystem"
+        assert exact.score > results[0].score
+
+    def test_searches_categories_args_and_repository_path(self, index):
+        assert _ids(index.search("mcp server sqlite")) == ["acme/sqlite"]
+        assert len(index.search("database")) == 3
+        assert "modelcontextprotocol/postgres" in _ids(index.search("servers"))
+        # The repository host is not indexed
+        assert index.search("github") == []
+
+    def test_matches_and_highlighting(self, index):
+        result = index.search("postgres")[0]
+
+        assert result.matches == {
+            "id": ["postgres"],
+            "description": ["postgresql"],
+            "args": ["postgres"],
+        }
+        text = "modelcontextprotocol/postgres"
+        assert [text[a:b] for a, b in highlight_spans(text, {"postgres"})] == [
+            "postgres"
+        ]
+
+    def test_substring_matches_follow_ranked_results(self, index):
+        results = index.search("sql")
+
+        # "sql" is a prefix of "sqlite" only; PostgreSQL and MySQL contain it
+        assert _ids(results) == [
+            "acme/sqlite",
+            "acme/mysql",
+            "modelcontextprotocol/postgres",
+        ]
+        assert results[0].score > 0
+        assert [(r.score, r.matches) for r in results[1:]] == [(0.0, {})] * 2
+        assert _ids(index.search("sql", limit=2)) == _ids(results)[:2]
+
+    @pytest.mark.parametrize(
+        "query, expected",
+        [
+            ("fi", ["@anthropic/filesystem", "acme/sqlite"]),
+            ("base", ["acme/mysql", "acme/sqlite", "modelcontextprotocol/postgres"]),
+            ("GreSQL", ["modelcontextprotocol/postgres"]),
+        ],
+    )
+    def test_short_and_infix_queries_match_substrings(self, index, query, expected):
+        assert _ids(index.search(query)) == expected
+
+    def test_substring_spanning_terms(self, index):
+        assert _ids(index.search("ql datab")) == [
+            "acme/mysql",
+            "modelcontextprotocol/postgres",
+        ]
+        assert _ids(index.search("ver-file")) == []
+
+    def test_substring_fallback_reads_only_candidates(self):
+        read = []
+
+        class RecordingMap(dict):
+            def __getitem__(self, server_id):
+                read.append(server_id)
+                return super().__getitem__(server_id)
+
+        index = SearchIndex(RecordingMap(SERVERS))
+        read.clear()
+
+        assert _ids(index.search("gresql")) == ["modelcontextprotocol/postgres"]
+        assert read == ["modelcontextprotocol/postgres"] * len(read)
+
+    def test_empty_query_and_limit(self, index):
+        assert _ids(index.search("")) == sorted(SERVERS)
+        assert len(index.search("database", limit=2)) == 2
+        assert (
+            _ids(index.search("database", limit=1))
+            == _ids(index.search("database"))[:1]
+        )
+
+
+class TestCatalogSearch:
+    def test_index_follows_catalog_changes(self):
+        catalog = create_in_memory_catalog(dict(SERVERS))
+        assert catalog.search_servers("redis") == []
+
+        redis = MCPServer(description="Redis cache", command="npx")
+        catalog.add_server("acme/redis", redis)
+        assert catalog.search_servers("redis") == [("acme/redis", redis)]
+
+        catalog.remove_server("acme/redis")
+        assert catalog.search_servers("redis") == []
+
+    def test_with_scores(self):
+        catalog = create_in_memory_catalog(dict(SERVERS))
+
+        ((server_id, server, score, matches),) = catalog.search_servers(
+            "mysql", with_scores=True
+        )
+        assert server_id == "acme/mysql"
+        assert server is SERVERS["acme/mysql"]
+        assert score > 0
+        assert matches["id"] == ["mysql"]
+
+
+class TestStoredIndex:
+    @pytest.fixture
+    def catalog_path(self, tmp_path):
+        path = tmp_path / "catalog.json"
+        path.write_text(
+            json.dumps(
+                {
+                    server_id: server.model_dump(mode="json")
+                    for server_id, server in SERVERS.items()
+                }
+            )
+        )
+        compile_catalog(path)
+        return path
+
+    @pytest.mark.parametrize(
+        "query",
+        ["postgres", "database local", "mysql OR file", "data", "databse", "sql", ""],
+    )
+    def test_matches_index_built_in_memory(self, catalog_path, index, query):
+        catalog = ServerCatalog(catalog_path, validate_with_cue=False)
+        stored = catalog.search(query)
+
+        assert isinstance(catalog._registry.servers, LazyServerMap)
+        expected = index.search(query)
+        assert _ids(stored) == _ids(expected)
+        assert [r.matches for r in stored] == [r.matches for r in expected]
+        assert [r.score for r in stored] == pytest.approx(
+            [r.score for r in expected], rel=1e-6
+        )
+
+    def test_changes_switch_to_memory_index(self, catalog_path):
+        catalog = ServerCatalog(catalog_path, validate_with_cue=False)
+        assert catalog.search_servers("redis") == []
+
+        redis = MCPServer(description="Redis cache", command="npx")
+        catalog.add_server("acme/redis", redis)
+        assert catalog.search_servers("redis") == [("acme/redis", redis)]
@@ -0,0 +1,148 @@
+"""Tests for catalog validation certificates."""
+
+import json
+
+import pytest
+
+from mcpi.registry.catalog import MCPServer, ServerCatalog
+from mcpi.registry.catalog_schema import CatalogSchemaValidator
+from mcpi.registry.cue_validator import DEFAULT_SCHEMA_PATH
+from mcpi.registry.validation_cache import (
+    ValidationCache,
+    certificate_key,
+    certificate_record,
+)
+
+CATALOG = {
+    "filesystem": {
+        "description": "File access",
+        "command": "npx",
+        "args": ["-y", "@modelcontextprotocol/server-filesystem"],
+        "repository": None,
+        "categories": ["files"],
+    }
+}
+
+
+class CountingValidator(CatalogSchemaValidator):
+    """In-process validator that counts validations."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def validate(self, data):
+        self.calls += 1
+        return super().validate(data)
+
+
+@pytest.fixture
+def catalog_path(tmp_path):
+    path = tmp_path / "catalog.json"
+    path.write_text(json.dumps(CATALOG, indent=2))
+    return path
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ValidationCache(tmp_path / "cache", packaged_certificate=None)
+
+
+def _load(catalog_path, cache, validator=None):
+    catalog = ServerCatalog(
+        catalog_path,
+        validate_with_cue=True,
+        validation_cache=cache,
+        schema_validator=validator,
+    )
+    catalog.load_catalog()
+    return catalog
+
+
+class TestCertificateKey:
+    def test_every_part_matters(self):
+        key = certificate_key(b"catalog", b"schema", "v1")
+        assert key != certificate_key(b"catalog2", b"schema", "v1")
+        assert key != certificate_key(b"catalog", b"schema2", "v1")
+        assert key != certificate_key(b"catalog", b"schema", "v2")
+        # Parts are length-prefixed, so moving bytes between them changes the key
+        assert key != certificate_key(b"catalo", b"gschema", "v1")
+
+
+class TestValidationCache:
+    def test_second_load_skips_validation(self, catalog_path, cache):
+        first = CountingValidator()
+        _load(catalog_path, cache, first)
+        assert first.calls == 1
+
+        second = CountingValidator()
+        catalog = _load(catalog_path, cache, second)
+        assert second.calls == 0
+        assert catalog.get_server("filesystem") is not None
+
+    def test_changed_catalog_is_validated_again(self, catalog_path, cache):
+        _load(catalog_path, cache)
+
+        catalog_path.write_text(json.dumps(CATALOG))
+        validator = CountingValidator()
+        _load(catalog_path, cache, validator)
+        assert validator.calls == 1
+
+    def test_certificates_are_per_validator_version(self, catalog_path, cache):
+        _load(catalog_path, cache)
+        raw = catalog_path.read_bytes()
+        schema = DEFAULT_SCHEMA_PATH.read_bytes()
+
+        assert cache.is_certified(raw, schema, CatalogSchemaValidator.version)
+        assert not cache.is_certified(raw, schema, "cue version v0.0.0")
+
+    def test_invalid_catalog_is_not_certified(self, catalog_path, cache):
+        catalog_path.write_text(json.dumps({"bad": {"command": "npx"}}))
+
+        with pytest.raises(RuntimeError, match="Catalog validation failed"):
+            _load(catalog_path, cache)
+        assert not cache.is_certified(
+            catalog_path.read_bytes(),
+            DEFAULT_SCHEMA_PATH.read_bytes(),
+            CatalogSchemaValidator.version,
+        )
+
+    def test_packaged_certificate(self, tmp_path, catalog_path):
+        packaged = tmp_path / "catalog.certificate.json"
+        packaged.write_text(
+            json.dumps(
+                certificate_record(
+                    catalog_path.read_bytes(),
+                    DEFAULT_SCHEMA_PATH.read_bytes(),
+                    "cue version v0.0.0-release",
+                )
+            )
+        )
+        cache = ValidationCache(tmp_path / "cache", packaged_certificate=packaged)
+
+        # Accepted whatever validator is used locally
+        validator = CountingValidator()
+        _load(catalog_path, cache, validator)
+        assert validator.calls == 0
+        assert not cache.is_certified(
+            b"{}", DEFAULT_SCHEMA_PATH.read_bytes(), validator.version
+        )
+
+    def test_save_certifies_written_catalog(self, catalog_path, cache):
+        catalog = _load(catalog_path, cache)
+        catalog.add_server("git", MCPServer(description="Git", command="uvx"))
+        assert catalog.save_catalog()
+
+        validator = CountingValidator()
+        reloaded = _load(catalog_path, cache, validator)
+        assert validator.calls == 0
+        assert reloaded.get_server("git") is not None
+
+    def test_unwritable_cache_is_ignored(self, tmp_path, catalog_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        cache = ValidationCache(blocker / "cache", packaged_certificate=None)
+
+        validator = CountingValidator()
+        _load(catalog_path, cache, validator)
+        _load(catalog_path, cache, validator)
+        assert validator.calls == 2
@@ -0,0 +1,221 @@
+"""Tests for catalogs fetched over HTTP."""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+from mcpi.registry.catalog_manager import (
+    CatalogManager,
+    CatalogSource,
+    catalog_sources_from_config,
+)
+from mcpi.registry.remote_catalog import RemoteCatalog, wait_for_refreshes
+
+SERVERS = {
+    "acme/postgres": {
+        "description": "PostgreSQL databases",
+        "command": "npx",
+        "args": ["-y", "acme-postgres"],
+        "categories": ["database"],
+    }
+}
+
+
+class CatalogServer:
+    """Local stand-in for a catalog server supporting ETags."""
+
+    def __init__(self) -> None:
+        self.body = json.dumps(SERVERS).encode("utf-8")
+        self.requests = []
+        self.status = None
+        self.delay = 0.0
+        catalog_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                catalog_server.requests.append(dict(self.headers))
+                time.sleep(catalog_server.delay)
+                if catalog_server.status:
+                    self.send_error(catalog_server.status)
+                    return
+                etag = f'"{hash(catalog_server.body) & 0xFFFFFFFF:x}"'
+                if self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("ETag", etag)
+                self.send_header("Last-Modified", "Mon, 05 Oct 2026 10:00:00 GMT")
+                self.send_header("Content-Length", str(len(catalog_server.body)))
+                self.end_headers()
+                self.wfile.write(catalog_server.body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/catalog.json"
+        self.thread = threading.Thread(
+            target=self.httpd.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        )
+        self.thread.start()
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    catalog_server = CatalogServer()
+    yield catalog_server
+    catalog_server.close()
+
+
+def make_stale(remote: RemoteCatalog) -> None:
+    metadata = remote.metadata()
+    metadata["fetched_at"] -= remote.max_age + 1
+    remote.metadata_path.write_text(json.dumps(metadata))
+
+
+class TestRemoteCatalog:
+    def test_download_then_serve_from_cache(self, server, tmp_path: Path):
+        remote = RemoteCatalog(server.url, tmp_path / "cache")
+
+        path = remote.ensure()
+        assert json.loads(path.read_text()) == SERVERS
+        assert remote.metadata()["last_modified"] == "Mon, 05 Oct 2026 10:00:00 GMT"
+
+        # Fresh copies are used without a request
+        assert remote.ensure() == path
+        assert len(server.requests) == 1
+
+    def test_conditional_refresh(self, server, tmp_path: Path):
+        remote = RemoteCatalog(server.url, tmp_path / "cache")
+        assert remote.refresh()
+        etag = remote.metadata()["etag"]
+
+        assert not remote.refresh()
+        assert server.requests[-1]["If-None-Match"] == etag
+        assert "If-Modified-Since" in server.requests[-1]
+
+        server.body = json.dumps({}).encode("utf-8")
+        assert remote.refresh()
+        assert json.loads(remote.catalog_path.read_text()) == {}
+        assert remote.metadata()["etag"] != etag
+
+    def test_stale_copy_refreshed_in_background(self, server, tmp_path: Path):
+        remote = RemoteCatalog(server.url, tmp_path / "cache")
+        remote.ensure()
+        make_stale(remote)
+        server.body = json.dumps({}).encode("utf-8")
+        server.delay = 0.2
+
+        started = time.monotonic()
+        path = remote.ensure()
+        assert time.monotonic() - started < 0.2
+        # The stale copy is served while the refresh runs
+        assert json.loads(path.read_text()) == SERVERS
+
+        wait_for_refreshes(timeout=5)
+        assert json.loads(path.read_text()) == {}
+        assert remote.is_fresh()
+
+    def test_offline_falls_back_to_last_good_copy(self, server, tmp_path: Path):
+        remote = RemoteCatalog(server.url, tmp_path / "cache")
+        remote.ensure()
+        make_stale(remote)
+        server.status = 503
+
+        with pytest.warns(UserWarning, match="using cached copy"):
+            path = remote.ensure(background=False)
+        assert json.loads(path.read_text()) == SERVERS
+        assert not remote.is_fresh()
+
+    def test_invalid_body_is_not_cached(self, server, tmp_path: Path):
+        remote = RemoteCatalog(server.url, tmp_path / "cache")
+        remote.ensure()
+        server.body = b"<html>maintenance</html>"
+
+        with pytest.raises(ValueError, match="did not return JSON"):
+            remote.refresh()
+        assert json.loads(remote.catalog_path.read_text()) == SERVERS
+
+    def test_entries_failing_the_schema_are_not_cached(self, server, tmp_path: Path):
+        remote = RemoteCatalog(server.url, tmp_path / "cache")
+        remote.ensure()
+        server.body = json.dumps({"acme/broken": {"description": 42}}).encode()
+
+        with pytest.raises(ValueError, match="invalid entry 'acme/broken'"):
+            remote.refresh()
+        assert json.loads(remote.catalog_path.read_text()) == SERVERS
+
+    def test_failed_background_refresh_is_not_retried(self, server, tmp_path: Path):
+        remote = RemoteCatalog(server.url, tmp_path / "cache")
+        remote.ensure()
+        make_stale(remote)
+        server.status = 503
+
+        remote.ensure()
+        wait_for_refreshes(timeout=5)
+        assert remote.is_fresh()
+        assert json.loads(remote.catalog_path.read_text()) == SERVERS
+
+        remote.ensure()
+        wait_for_refreshes(timeout=5)
+        assert len(server.requests) == 2
+
+    def test_unreachable_without_cache_raises(self, tmp_path: Path):
+        remote = RemoteCatalog("http://127.0.0.1:9/catalog.json", tmp_path / "cache")
+
+        with pytest.raises(httpx.HTTPError):
+            remote.ensure()
+
+
+class TestRemoteCatalogSources:
+    def test_config(self, tmp_path: Path):
+        config = {"url": "https://example.com/c.json", "max_age": 60}
+        (source,) = catalog_sources_from_config(
+            {"catalogs": {"shop": config}}, tmp_path
+        )
+
+        assert source.type == "remote"
+        assert source.url == "https://example.com/c.json"
+        assert source.max_age == 60
+        assert source.path.name == "catalog.json"
+
+    def test_manager_loads_remote_catalog(self, server, tmp_path: Path):
+        unreachable = "http://127.0.0.1:9/catalog.json"
+        manager = CatalogManager(
+            official_path=tmp_path / "official.json",
+            local_path=tmp_path / "local.json",
+            sources=[
+                CatalogSource(
+                    name="shop",
+                    path=tmp_path / "shop" / "catalog.json",
+                    type="remote",
+                    url=server.url,
+                ),
+                CatalogSource(
+                    name="down",
+                    path=tmp_path / "down" / "catalog.json",
+                    type="remote",
+                    url=unreachable,
+                ),
+            ],
+        )
+        (tmp_path / "official.json").write_text("{}")
+
+        with pytest.warns(UserWarning, match="Skipping catalog 'down'"):
+            results = manager.search_all("postgres")
+        assert [(name, server_id) for name, server_id, _ in results] == [
+            ("shop", "acme/postgres")
+        ]
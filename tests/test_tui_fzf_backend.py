@@ -0,0 +1,197 @@
+"""Tests for the resident backend serving the fzf bindings."""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from mcpi.clients.types import ServerState
+from mcpi.registry.catalog import MCPServer
+from mcpi.registry.catalog_manager import create_test_catalog_manager
+from mcpi.tui.adapters.fzf import FzfAdapter
+from mcpi.tui.fzf_backend import (
+    CLIENT_SCRIPT,
+    FzfBackend,
+    backend_supported,
+    client_command,
+)
+
+pytestmark = pytest.mark.skipif(
+    not backend_supported(), reason="Unix sockets are not available"
+)
+
+
+@pytest.fixture
+def manager():
+    manager = Mock()
+    manager.default_client = "claude-code"
+    manager.get_scopes_for_client.return_value = [
+        {"name": "project-mcp"},
+        {"name": "plugin", "readonly": True},
+        {"name": "user-mcp"},
+    ]
+    manager.get_server_state.return_value = ServerState.NOT_INSTALLED
+    manager.get_server_info.return_value = None
+    return manager
+
+
+@pytest.fixture
+def catalog():
+    catalog = Mock()
+    catalog.list_servers.return_value = [
+        ("acme/files", MCPServer(description="Local files", command="uvx")),
+        ("acme/postgres", MCPServer(description="PostgreSQL", command="npx")),
+    ]
+    return catalog
+
+
+@pytest.fixture
+def backend(manager, catalog, tmp_path: Path):
+    with patch("mcpi.tui.adapters.fzf.SCOPE_FILE", tmp_path / "scope"):
+        with FzfBackend(
+            manager, catalog, "project-mcp", FzfAdapter(), tmp_path / "previews"
+        ) as backend:
+            yield backend
+
+
+def run_client(backend: FzfBackend, *request: str) -> subprocess.CompletedProcess:
+    # The client runs without site-packages, so it cannot import mcpi
+    command = " ".join([client_command(backend.socket_path), *request])
+    return subprocess.run(command, shell=True, capture_output=True, text=True)
+
+
+def test_reload_through_client(backend, manager, catalog):
+    result = run_client(backend, "reload")
+
+    assert result.returncode == 0, result.stderr
+    expected = FzfAdapter()._build_server_list(catalog, manager)
+    assert result.stdout.splitlines() == expected
+
+
+def test_failed_request_exits_nonzero(backend):
+    result = run_client(backend, "frobnicate", "acme/files")
+
+    assert result.returncode == 1
+    assert result.stdout == ""
+    assert "Unknown request: frobnicate acme/files" in result.stderr
+
+
+def test_client_without_backend(tmp_path: Path):
+    command = client_command(tmp_path / "missing.sock") + " reload"
+    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+
+    assert result.returncode == 1
+    assert "backend is not available" in result.stderr
+
+
+def test_client_imports_nothing_heavy(tmp_path: Path):
+    result = subprocess.run(
+        [sys.executable, "-S", "-X", "importtime", CLIENT_SCRIPT, tmp_path, "reload"],
+        capture_output=True,
+        text=True,
+    )
+    imported = {
+        line.rsplit("|", 1)[-1].strip()
+        for line in result.stderr.splitlines()
+        if line.startswith("import time:")
+    }
+
+    assert "_socket" in imported
+    assert not imported & {"socket", "typing", "enum", "mcpi"}
+
+
+def test_cycle_scope_skips_readonly_scopes(backend):
+    assert backend.handle(["cycle-scope"])[0] == 0
+    assert backend.scope == "user-mcp"
+    backend.handle(["cycle-scope"])
+    assert backend.scope == "project-mcp"
+
+
+def test_preview_runs_info_in_process(backend, tmp_path: Path):
+    official = tmp_path / "official.json"
+    official.write_text(
+        '{"acme/files": {"description": "Local files", "command": "uvx",'
+        ' "args": ["acme-files"], "repository": null}}'
+    )
+    catalog_manager = create_test_catalog_manager(official, tmp_path / "local.json")
+
+    with patch("mcpi.cli.get_catalog_manager", return_value=catalog_manager):
+        status, output = backend.handle(["preview", "acme/files"])
+
+    assert status == 0
+    assert "ID: acme/files" in output
+    assert "Arguments: acme-files" in output
+    assert "Status: Not Installed" in output
+
+
+@pytest.fixture
+def harness_backend(
+    prepopulated_harness, mcp_manager_with_harness, catalog, tmp_path: Path, monkeypatch
+):
+    manager, _ = mcp_manager_with_harness
+    monkeypatch.chdir(tmp_path)
+    with patch("mcpi.tui.adapters.fzf.SCOPE_FILE", tmp_path / "scope"):
+        with FzfBackend(
+            manager, catalog, "user-mcp", FzfAdapter(), tmp_path / "previews"
+        ) as backend:
+            yield backend
+
+
+def test_actions_target_current_scope(harness_backend):
+    backend = harness_backend
+    manager = backend.manager
+
+    assert backend.handle(["disable", "filesystem"])[0] == 0
+    assert manager.get_server_state("filesystem", scope="user-mcp") == (
+        ServerState.DISABLED
+    )
+    assert backend.handle(["enable", "filesystem"])[0] == 0
+    assert manager.get_server_state("filesystem", scope="user-mcp") == (
+        ServerState.ENABLED
+    )
+
+
+def test_failed_actions_report_an_error_status(harness_backend):
+    backend = harness_backend
+
+    # Installed, but not in the header's scope
+    status, output = backend.handle(["disable", "project-tool"])
+    assert status == 1
+    assert "not installed in scope 'user-mcp'" in output
+    # mcpi add reports an unknown server but exits 0
+    status, output = backend.handle(["add", "acme/no-such-server"])
+    assert status == 1
+    assert "not found" in output
+    assert backend.handle(["remove", "acme/no-such-server"])[0] == 1
+
+
+def test_requests_wait_for_preview_sync(backend):
+    backend._previews_thread.join()
+    done = threading.Event()
+    worker = threading.Thread(
+        target=lambda: (backend.handle(["reload"]), done.set()), daemon=True
+    )
+
+    with backend._lock:
+        worker.start()
+        assert not done.wait(0.1)
+
+    assert done.wait(5)
+
+
+def test_bindings_use_client(tmp_path: Path):
+    socket_path = tmp_path / "backend.sock"
+    command = FzfAdapter()._build_fzf_command("project-mcp", socket_path)
+    bindings = [command[i + 1] for i, arg in enumerate(command) if arg == "--bind"]
+    client = client_command(socket_path)
+
+    assert f"ctrl-s:reload({client} cycle-scope)+clear-query" in bindings
+    assert (
+        f"ctrl-a:execute[out=$({client} add {{1}} 2>&1)"
+        f" || printf '%s\\n' \"$out\" | less -R]+reload({client} reload)" in bindings
+    )
+    assert not any("mcpi " in binding for binding in bindings)
+    assert f"{client} preview" in command[command.index("--preview") + 1]
@@ -0,0 +1,139 @@
+"""Tests for the pre-rendered fzf previews."""
+
+import os
+import subprocess
+from pathlib import Path
+from unittest.mock import Mock
+
+import pytest
+from click.testing import CliRunner
+
+from mcpi.cli import main
+from mcpi.clients.inventory import InventoryIndex
+from mcpi.clients.types import ServerInfo, ServerState
+from mcpi.registry.catalog import MCPServer
+from mcpi.registry.catalog_manager import create_test_catalog_manager
+from mcpi.tui.adapters.fzf import FzfAdapter
+from mcpi.tui.fzf_backend import FzfBackend, backend_supported
+from mcpi.tui.preview_cache import PreviewCache, _preview_paths
+
+SERVERS = {
+    "@acme/files": MCPServer(description="Local files", command="uvx"),
+    "@acme/postgres": MCPServer(
+        description="PostgreSQL", command="npx", args=["-y", "acme-postgres"]
+    ),
+    "redis": MCPServer(description="Redis", command="npx"),
+}
+
+
+def _info(server_id, state=ServerState.ENABLED, env=None):
+    config = {"command": "npx", "env": env} if env else {"command": "npx"}
+    return ServerInfo(
+        id=server_id, client="claude-code", scope="user-mcp", config=config, state=state
+    )
+
+
+def _entries(**infos):
+    return [
+        (server_id, server, infos.get(server_id.strip("@").replace("/", "_")))
+        for server_id, server in sorted(SERVERS.items())
+    ]
+
+
+@pytest.fixture
+def cache(tmp_path: Path) -> PreviewCache:
+    return PreviewCache(tmp_path / "session" / "previews", 60, tmp_path / "cache")
+
+
+class TestPreviewCache:
+    def test_previews_match_info_plain(self, cache, tmp_path: Path):
+        catalog_path = tmp_path / "catalog.json"
+        catalog_path.write_text(
+            '{"@acme/postgres": {"description": "PostgreSQL", "command": "npx",'
+            ' "args": ["-y", "acme-postgres"], "repository": null}}'
+        )
+        catalog_manager = create_test_catalog_manager(catalog_path, tmp_path / "l.json")
+        manager = Mock()
+        manager.get_server_info.return_value = None
+        runner = CliRunner()
+
+        cache.sync(_entries())
+        result = runner.invoke(
+            main,
+            ["info", "@acme/postgres", "--plain"],
+            obj={"catalog_manager": catalog_manager, "mcp_manager": manager},
+        )
+
+        assert result.exit_code == 0, result.output
+        preview = (cache.link / "@acme" / "postgres").read_text()
+        assert preview == result.output
+        assert "Arguments: -y acme-postgres" in preview
+        assert cache.rendered == 3
+
+    def test_only_changed_installations_are_rendered(self, cache):
+        first = cache.sync(_entries())
+        second = cache.sync(_entries(acme_files=_info("@acme/files")))
+
+        assert cache.rendered == 1
+        assert second != first
+        assert cache.link.resolve() == second
+        assert "State: ENABLED" in (cache.link / "@acme" / "files").read_text()
+        # Unchanged previews are shared with the previous directory
+        assert os.path.samefile(first / "redis", second / "redis")
+
+        # Environment changes count too
+        cache.sync(_entries(acme_files=_info("@acme/files", env={"TOKEN": "x"})))
+        assert cache.rendered == 1
+        assert "TOKEN=x" in (cache.link / "@acme" / "files").read_text()
+
+    def test_directories_are_reused_across_sessions(self, cache, tmp_path: Path):
+        directory = cache.sync(_entries())
+        other = PreviewCache(tmp_path / "other" / "previews", 60, cache.root)
+
+        assert other.sync(_entries()) == directory
+        assert other.rendered == 0
+        # Another width is another directory
+        narrow = PreviewCache(tmp_path / "narrow" / "previews", 30, cache.root)
+        assert narrow.sync(_entries()) != directory
+
+    def test_unusable_ids_get_no_file(self):
+        paths = _preview_paths(["a/../b", ".hidden", "Acme", "acme", "x", "x/y"])
+
+        # "x" would have to be both a file and the directory of "x/y"
+        assert {server_id: str(path) for server_id, path in paths.items()} == {
+            "x/y": "x/y"
+        }
+
+
+@pytest.mark.skipif(not backend_supported(), reason="Unix sockets are not available")
+def test_backend_refreshes_previews_after_actions(tmp_path: Path):
+    installed = {}
+    manager = Mock()
+    manager.get_inventory.side_effect = lambda client=None: InventoryIndex(
+        {info.qualified_id: info for info in installed.values()}
+    )
+    catalog = Mock()
+    catalog.list_servers.return_value = sorted(SERVERS.items())
+
+    with FzfBackend(
+        manager, catalog, "user-mcp", FzfAdapter(), tmp_path / "cache"
+    ) as backend:
+        backend._previews_thread.join()  # Initial rendering
+        preview = backend.preview_path / "redis"
+        assert "Status: Not Installed" in preview.read_text()
+
+        def install(argv):
+            installed["redis"] = _info("redis")
+            return 0, ""
+
+        backend._run_mcpi = install
+        backend.handle(["add", "redis"])
+        assert "Status: Installed" in preview.read_text()
+
+        # The binding is a plain file read
+        command = FzfAdapter()._build_fzf_command(
+            "user-mcp", backend.socket_path, backend.preview_path
+        )
+        script = command[command.index("--preview") + 1].replace("{1}", "'redis'")
+        result = subprocess.run(script, shell=True, capture_output=True, text=True)
+        assert result.stdout == preview.read_text()
@@ -0,0 +1,142 @@
+"""Tests for the catalog × inventory join behind the TUI server lists."""
+
+from unittest.mock import Mock
+
+from mcpi.clients.inventory import InventoryIndex
+from mcpi.clients.types import OperationResult, ServerInfo, ServerState
+from mcpi.registry.catalog import MCPServer
+from mcpi.tui import build_server_list, join_server_states
+from mcpi.tui.adapters.simple_menu import SimpleMenuAdapter
+
+
+def _info(server_id, scope, state):
+    return ServerInfo(
+        id=server_id,
+        client="claude-code",
+        scope=scope,
+        config={"command": "npx"},
+        state=state,
+    )
+
+
+def _catalog(*server_ids):
+    catalog = Mock()
+    catalog.list_servers.return_value = [
+        (server_id, MCPServer(description=server_id.upper(), command="npx"))
+        for server_id in sorted(server_ids)
+    ]
+    return catalog
+
+
+def _manager(*infos):
+    manager = Mock()
+    manager.get_inventory.return_value = InventoryIndex(
+        {info.qualified_id: info for info in infos}
+    )
+    return manager
+
+
+def test_join_uses_one_inventory_snapshot():
+    catalog = _catalog("a", "b", "c", "d")
+    manager = _manager(
+        _info("c", "project-mcp", ServerState.ENABLED),
+        _info("b", "project-mcp", ServerState.DISABLED),
+        _info("b", "user-mcp", ServerState.ENABLED),
+        _info("d", "user-mcp", ServerState.DISABLED),
+        _info("not-in-catalog", "user-mcp", ServerState.ENABLED),
+    )
+
+    rows = join_server_states(catalog, manager)
+
+    # Highest-priority installation wins; groups keep catalog order
+    assert [(row.server_id, row.state) for row in rows] == [
+        ("c", ServerState.ENABLED),
+        ("b", ServerState.DISABLED),
+        ("d", ServerState.DISABLED),
+        ("a", ServerState.NOT_INSTALLED),
+    ]
+    assert rows[1].info.scope == "project-mcp"
+    assert rows[3].info is None
+    manager.get_inventory.assert_called_once_with(None)
+    manager.get_server_state.assert_not_called()
+    manager.get_server_info.assert_not_called()
+
+
+def test_unavailable_client_lists_nothing_installed():
+    manager = Mock()
+    manager.get_inventory.return_value = None
+
+    rows = join_server_states(_catalog("a", "b"), manager, client="missing")
+
+    assert {row.state for row in rows} == {ServerState.NOT_INSTALLED}
+    manager.get_inventory.assert_called_once_with("missing")
+
+
+def test_manager_without_inventory_is_asked_per_server():
+    manager = Mock(spec=["get_server_state"])
+    manager.get_server_state.side_effect = lambda server_id, client=None: (
+        ServerState.ENABLED if server_id == "b" else ServerState.NOT_INSTALLED
+    )
+
+    rows = join_server_states(_catalog("a", "b"), manager)
+
+    assert [row.server_id for row in rows] == ["b", "a"]
+
+
+def test_adapters_list_the_join():
+    catalog = _catalog("a", "b")
+    manager = _manager(_info("b", "user-mcp", ServerState.DISABLED))
+
+    lines = build_server_list(catalog, manager)
+    menu_rows = SimpleMenuAdapter(manager, catalog)._get_servers_with_status()
+
+    assert [line.split("\t")[0] for line in lines] == ["b", "a"]
+    assert "[✗] b" in lines[0]
+    assert [(server_id, state) for server_id, _, state in menu_rows] == [
+        ("b", ServerState.DISABLED),
+        ("a", ServerState.NOT_INSTALLED),
+    ]
+
+
+def test_menu_refreshes_only_the_changed_server(monkeypatch):
+    monkeypatch.setattr("builtins.input", lambda: "")
+    scopes = {"project-mcp": {}, "user-mcp": {}}
+    scopes["user-mcp"]["b"] = _info("b", "user-mcp", ServerState.DISABLED)
+    catalog = _catalog("a", "b", "c")
+    manager = _manager(*scopes["user-mcp"].values())
+    manager.list_servers.side_effect = lambda scope: {
+        info.qualified_id: info for info in scopes[scope].values()
+    }
+
+    def enable(server_id, scope):
+        scopes[scope][server_id] = _info(server_id, scope, ServerState.ENABLED)
+        return OperationResult.success_result("Enabled")
+
+    def add(server_id, config, scope):
+        scopes[scope][server_id] = _info(server_id, scope, ServerState.ENABLED)
+        return OperationResult.success_result("Added")
+
+    manager.enable_server.side_effect = enable
+    manager.add_server.side_effect = add
+    menu = SimpleMenuAdapter(manager, catalog)
+    catalog.get_server.side_effect = dict(catalog.list_servers.return_value).get
+
+    assert [row[0] for row in menu._get_servers_with_status()] == ["b", "a", "c"]
+    snapshots = manager.get_inventory.call_count
+    menu._execute_action("enable", "b", "project-mcp")
+    menu._execute_action("add", "c", "project-mcp")
+
+    assert [
+        (server_id, state) for server_id, _, state in menu._get_servers_with_status()
+    ] == [
+        ("b", ServerState.ENABLED),
+        ("c", ServerState.ENABLED),
+        ("a", ServerState.NOT_INSTALLED),
+    ]
+    # The installed scope is passed on, and no full rescan happens
+    manager.enable_server.assert_called_once_with("b", "user-mcp")
+    assert manager.get_inventory.call_count == snapshots
+    assert [call.kwargs["scope"] for call in manager.list_servers.call_args_list] == [
+        "user-mcp",
+        "project-mcp",
+    ]